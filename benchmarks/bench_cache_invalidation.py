@@ -0,0 +1,104 @@
+"""Measure webhook-driven cache invalidation throughput.
+
+Fills a ``ResponseCache`` with cached organizations, users, directory users,
+organization feature flags and list pages, then replays events through a
+``CacheInvalidator`` and reports events per second for two kinds of rule:
+
+* concrete paths (``organization.updated``, ``user.updated``,
+  ``dsync.user.updated``), which only touch the keys they remove;
+* wildcard paths (``flag.updated`` invalidates ``organizations/*/feature-flags``),
+  which scan every cached key under ``organizations/``.
+
+Usage:
+    python benchmarks/bench_cache_invalidation.py [--entries 100000] [--events 20000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List
+
+from workos import CacheInvalidator, InMemoryLRUCache, ResponseCache
+
+NAMESPACE = ResponseCache.namespace("sk_test_bench", "https://api.workos.com")
+
+
+def _fill(cache: ResponseCache, entries: int) -> int:
+    families = (
+        "organizations/org_{}",
+        "user_management/users/user_{}",
+        "directory_users/directory_user_{}",
+        "organizations/org_{}/feature-flags",
+    )
+    per_family = entries // (len(families) + 1)
+    for family in families:
+        for i in range(per_family):
+            path = family.format(i)
+            cache.store(
+                ResponseCache.key(path, None, NAMESPACE), path, b"{}", cache.generation
+            )
+    for i in range(per_family):
+        path = families[i % 3].rsplit("/", 1)[0]
+        key = ResponseCache.key(path, {"after": f"cursor_{i}"}, NAMESPACE)
+        cache.store(key, path, b"{}", cache.generation)
+    return per_family
+
+
+def _resource_events(count: int, ids: int) -> List[Dict[str, Any]]:
+    rng = random.Random(0)
+    kinds = (
+        ("organization.updated", "org_{}"),
+        ("user.updated", "user_{}"),
+        ("dsync.user.updated", "directory_user_{}"),
+    )
+    events: List[Dict[str, Any]] = []
+    for _ in range(count):
+        event, id_format = rng.choice(kinds)
+        data = {"id": id_format.format(rng.randrange(ids)), "external_id": None}
+        events.append({"event": event, "data": data})
+    return events
+
+
+def _flag_events(count: int) -> List[Dict[str, Any]]:
+    return [
+        {"event": "flag.updated", "data": {"slug": f"flag_{i}"}} for i in range(count)
+    ]
+
+
+def _replay(label: str, cache: ResponseCache, events: List[Dict[str, Any]]) -> None:
+    invalidator = CacheInvalidator(cache)
+    backend = cache.backend
+    assert isinstance(backend, InMemoryLRUCache)
+    size = len(backend)
+    started = time.perf_counter()
+    invalidator.handle_many(events)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{label:>9}: {len(events) / elapsed:9.0f} events/s  "
+        f"({elapsed / len(events) * 1e6:8.1f} us/event, "
+        f"{size} entries before, {invalidator.invalidated} removed)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--events", type=int, default=20_000)
+    args = parser.parse_args()
+
+    for label in ("concrete", "wildcard"):
+        cache = ResponseCache(maxsize=args.entries * 2)
+        ids = _fill(cache, args.entries)
+        if label == "concrete":
+            events = _resource_events(args.events, ids)
+        else:
+            # Each flag event clears every organization's flags, so replaying
+            # more than a few against one cache measures an emptier cache.
+            events = _flag_events(max(1, args.events // 1000))
+        _replay(label, cache, events)
+
+
+if __name__ == "__main__":
+    main()
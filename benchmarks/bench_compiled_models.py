@@ -0,0 +1,75 @@
+"""Compare the generated ``from_dict`` with the compiled deserializers.
+
+For every ``(model, fixture)`` pair exercised by ``tests/test_*_round_trip.py``
+this deserializes the fixture ``--rounds`` times with ``Model.from_dict`` and
+with ``compiled_loader(Model)``, and reports items per second per model for
+the ``--top`` slowest models, followed by the total over all pairs. The time
+taken to set up every loader from ``workos/_model_loaders.py`` is reported
+separately.
+
+Usage:
+    python benchmarks/bench_compiled_models.py [--rounds 2000] [--top 15]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from tests.generated_helpers import load_fixture, round_trip_cases  # noqa: E402
+from workos._compiled import compiled_loader  # noqa: E402
+
+
+def _rate(
+    load: Callable[[Dict[str, Any]], Any], data: Dict[str, Any], rounds: int
+) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        load(data)
+    return rounds / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=2000)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    cases = [(model, load_fixture(fixture)) for model, fixture in round_trip_cases()]
+    started = time.perf_counter()
+    compiled = sum(compiled_loader(model) != model.from_dict for model, _ in cases)
+    elapsed = time.perf_counter() - started
+    print(
+        f"compiled {compiled} of {len(cases)} models in {elapsed * 1000:.0f} ms "
+        f"(the rest keep from_dict)"
+    )
+
+    rows: List[Tuple[str, float, float]] = []
+    for model, data in cases:
+        rows.append(
+            (
+                model.__name__,
+                _rate(model.from_dict, data, args.rounds),
+                _rate(compiled_loader(model), data, args.rounds),
+            )
+        )
+    rows.sort(key=lambda row: row[1])
+    print(f"{'model':<44} {'from_dict':>12} {'compiled':>12} {'speedup':>8}")
+    for name, eager, fast in rows[: args.top]:
+        print(f"{name:<44} {eager:10,.0f}/s {fast:10,.0f}/s {fast / eager:7.2f}x")
+    eager_total = len(rows) / sum(1 / eager for _, eager, _ in rows)
+    fast_total = len(rows) / sum(1 / fast for _, _, fast in rows)
+    print(
+        f"{'all ' + str(len(rows)) + ' fixtures':<44} {eager_total:10,.0f}/s "
+        f"{fast_total:10,.0f}/s {fast_total / eager_total:7.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Measure first-webhook latency and memory for a process that only sees ``user.*`` events.
+
+Each sample runs in a fresh interpreter that verifies and parses one signed
+``user.created`` webhook with ``workos.webhooks._verification.verify_event``,
+then parses a burst of ``user.created``/``user.updated``/``user.deleted``
+events. It reports the time to the first parsed event, the steady-state cost
+per event, the number of event model modules loaded, and peak resident memory.
+
+The ``eager`` mode imports the generated ``EventSchema``, which imports every
+event model, before the first webhook; ``lazy`` is what webhook verification
+does, importing only the variants that are seen.
+
+Peak resident memory comes from ``resource.getrusage`` and is only reported
+on Unix.
+
+Usage:
+    python benchmarks/bench_event_dispatch.py [--runs 7] [--events 10000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+
+SAMPLE = """
+import hashlib, hmac, json, sys, time
+started = time.perf_counter()
+from workos.webhooks._verification import verify_event
+if {eager!r}:
+    from workos.events.models import EventSchema
+payloads = {payloads!r}
+body = payloads[0].encode()
+timestamp = str(int(time.time() * 1000))
+digest = hmac.new(b"secret", f"{{timestamp}}.{{payloads[0]}}".encode(), hashlib.sha256)
+signature = f"t={{timestamp}}, v1={{digest.hexdigest()}}"
+verify_event(event_body=body, event_signature=signature, secret="secret")
+first = time.perf_counter()
+
+from workos._event_dispatch import parse_event
+events = [json.loads(payload) for payload in payloads]
+burst_started = time.perf_counter()
+for i in range({events}):
+    parse_event(events[i % len(events)])
+burst = time.perf_counter() - burst_started
+
+try:
+    import resource
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    rss_mb = rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+except ImportError:
+    rss_mb = float("nan")
+print(json.dumps({{
+    "first_ms": (first - started) * 1000,
+    "per_event_us": burst / {events} * 1e6,
+    "models": sum(1 for name in sys.modules if name.startswith("workos.common.models.")),
+    "rss_mb": rss_mb,
+}}))
+"""
+
+
+def _sample(eager: bool, payloads: list[str], events: int) -> dict[str, float]:
+    code = SAMPLE.format(eager=eager, payloads=payloads, events=events)
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--events", type=int, default=10_000)
+    args = parser.parse_args()
+
+    payloads = [
+        (FIXTURES / f"{name}.json").read_text()
+        for name in ("user_created", "user_updated", "user_deleted")
+    ]
+    _sample(False, payloads, 1)  # warm the filesystem and bytecode caches
+    for label, eager in (("eager", True), ("lazy", False)):
+        samples = [_sample(eager, payloads, args.events) for _ in range(args.runs)]
+        print(
+            f"{label:>5}: first webhook {statistics.median(s['first_ms'] for s in samples):7.1f} ms  "
+            f"then {statistics.median(s['per_event_us'] for s in samples):5.1f} us/event  "
+            f"{int(samples[0]['models']):3d} model modules  "
+            f"peak RSS {statistics.median(s['rss_mb'] for s in samples):6.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
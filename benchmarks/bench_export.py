@@ -0,0 +1,121 @@
+"""Export synthetic ``User`` records with ``SyncPage.export``.
+
+Serves ``user_management.list_users`` from an in-process
+``httpx.MockTransport`` in pages of ``MAX_PAGE_SIZE`` users (the same page
+body with a new cursor each time) and exports ``--records`` users to each
+format, reporting the time, records per second, file size and the peak RSS
+of the process so far. For comparison, ``naive jsonl`` is the loop this
+replaces: ``auto_paging_iter()``, ``to_dict()`` and ``json.dumps`` per user.
+Parquet is skipped unless pyarrow is installed.
+
+Usage:
+    python benchmarks/bench_export.py [--records 1000000] [--batch-size 10000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import os
+import resource
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+import httpx
+
+from workos import MAX_PAGE_SIZE, TransportConfig, WorkOSClient
+from workos._pagination import SyncPage
+
+FIXTURE = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "user.json"
+
+
+def _client(records: int) -> WorkOSClient:
+    template = json.loads(FIXTURE.read_text())
+    data = json.dumps(
+        [{**template, "id": f"user_{i}"} for i in range(MAX_PAGE_SIZE)]
+    ).encode()
+    pages = (records + MAX_PAGE_SIZE - 1) // MAX_PAGE_SIZE
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        index = int(request.url.params.get("after") or 0) + 1
+        after = b'"%d"' % index if index < pages else b"null"
+        body = b'{"data":' + data + b',"list_metadata":{"after":' + after + b"}}"
+        return httpx.Response(200, content=body)
+
+    return WorkOSClient(
+        api_key="sk_test_bench",
+        transport_config=TransportConfig(transport=httpx.MockTransport(handler)),
+        auto_paging_page_size=MAX_PAGE_SIZE,
+    )
+
+
+def _naive(page: SyncPage, path: str) -> int:
+    count = 0
+    with open(path, "w") as f:
+        for user in page.auto_paging_iter():
+            f.write(json.dumps(user.to_dict()) + "\n")
+            count += 1
+    return count
+
+
+def _peak_rss_mib() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux and bytes on macOS.
+    return peak / 1024 / (1024 if os.uname().sysname == "Darwin" else 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    runs: List[Tuple[str, str, Callable[[SyncPage, str], int]]] = [
+        ("naive jsonl", "users.jsonl", _naive),
+        (
+            "jsonl",
+            "users.jsonl",
+            lambda page, path: page.export(path, batch_size=args.batch_size),
+        ),
+        (
+            "csv",
+            "users.csv",
+            lambda page, path: page.export(path, batch_size=args.batch_size),
+        ),
+    ]
+    if importlib.util.find_spec("pyarrow") is not None:
+        runs.append(
+            (
+                "parquet",
+                "users.parquet",
+                lambda page, path: page.export(path, batch_size=args.batch_size),
+            )
+        )
+    else:
+        print("pyarrow is not installed; skipping parquet")
+
+    print(f"{args.records:,} users, batches of {args.batch_size:,}")
+    with tempfile.TemporaryDirectory() as directory:
+        for label, name, run in runs:
+            path = os.path.join(directory, name)
+            client = _client(args.records)
+            try:
+                started = time.perf_counter()
+                count = run(
+                    client.user_management.list_users(limit=MAX_PAGE_SIZE), path
+                )
+                elapsed = time.perf_counter() - started
+            finally:
+                client.close()
+            size = os.path.getsize(path) / 1024 / 1024
+            print(
+                f"  {label:>12}: {elapsed:6.1f} s  {count / elapsed:9,.0f} records/s  "
+                f"{size:7.1f} MiB  peak RSS {_peak_rss_mib():6.0f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
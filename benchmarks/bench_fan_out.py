@@ -0,0 +1,145 @@
+"""Compare nested serial loops with ``client.fan_out`` for per-scope lists.
+
+Serves ``list_organization_memberships`` from an in-process
+``httpx.MockTransport`` that sleeps ``--latency-ms`` per request. Each of
+``--scopes`` organizations has ``--pages`` pages of memberships. The job is
+run as the nested loop it replaces (one list after another) and with
+``fan_out`` at each ``--concurrency`` level, for ``WorkOSClient`` (threads)
+and ``AsyncWorkOSClient`` (tasks), and the wall time and items per second are
+reported.
+
+Usage:
+    python benchmarks/bench_fan_out.py [--scopes 40] [--pages 3] [--latency-ms 20] [--concurrency 4 8 16]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import List
+
+import httpx
+
+from workos import MAX_PAGE_SIZE, AsyncWorkOSClient, TransportConfig, WorkOSClient
+
+FIXTURE = (
+    Path(__file__).resolve().parent.parent
+    / "tests"
+    / "fixtures"
+    / "user_organization_membership.json"
+)
+
+
+def _bodies(pages: int) -> List[bytes]:
+    template = json.loads(FIXTURE.read_text())
+    data = [{**template, "id": f"om_{i}"} for i in range(MAX_PAGE_SIZE)]
+    return [
+        json.dumps(
+            {
+                "data": data,
+                "list_metadata": {"after": str(index + 1)} if index + 1 < pages else {},
+            }
+        ).encode()
+        for index in range(pages)
+    ]
+
+
+def _transport(pages: int, latency: float, use_async: bool) -> TransportConfig:
+    bodies = _bodies(pages)
+
+    def body(request: httpx.Request) -> bytes:
+        return bodies[int(request.url.params.get("after") or 0)]
+
+    if use_async:
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(latency)
+            return httpx.Response(200, content=body(request))
+
+        return TransportConfig(transport=httpx.MockTransport(handler))
+
+    def sync_handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(latency)
+        return httpx.Response(200, content=body(request))
+
+    return TransportConfig(transport=httpx.MockTransport(sync_handler))
+
+
+def _run_sync(scopes: List[str], pages: int, latency: float, concurrency: int) -> int:
+    client = WorkOSClient(
+        api_key="sk_test_bench", transport_config=_transport(pages, latency, False)
+    )
+
+    def list_page(organization_id: str):
+        return client.organization_membership.list_organization_memberships(
+            organization_id=organization_id, limit=MAX_PAGE_SIZE
+        )
+
+    try:
+        if concurrency == 0:
+            return sum(1 for scope in scopes for _ in list_page(scope))
+        return sum(
+            1 for _ in client.fan_out(scopes, list_page, concurrency=concurrency)
+        )
+    finally:
+        client.close()
+
+
+async def _run_async(
+    scopes: List[str], pages: int, latency: float, concurrency: int
+) -> int:
+    client = AsyncWorkOSClient(
+        api_key="sk_test_bench", transport_config=_transport(pages, latency, True)
+    )
+    async with client:
+
+        def list_page(organization_id: str):
+            return client.organization_membership.list_organization_memberships(
+                organization_id=organization_id, limit=MAX_PAGE_SIZE
+            )
+
+        count = 0
+        if concurrency == 0:
+            for scope in scopes:
+                async for _ in await list_page(scope):
+                    count += 1
+            return count
+        async for _ in client.fan_out(scopes, list_page, concurrency=concurrency):
+            count += 1
+        return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scopes", type=int, default=40)
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[4, 8, 16])
+    args = parser.parse_args()
+
+    scopes = [f"org_{i}" for i in range(args.scopes)]
+    latency = args.latency_ms / 1000
+    print(
+        f"{args.scopes} organizations x {args.pages} pages of {MAX_PAGE_SIZE}, "
+        f"{args.latency_ms:g} ms per request"
+    )
+    for label, run in (
+        ("sync", lambda c: _run_sync(scopes, args.pages, latency, c)),
+        ("async", lambda c: asyncio.run(_run_async(scopes, args.pages, latency, c))),
+    ):
+        for concurrency in [0, *args.concurrency]:
+            started = time.perf_counter()
+            count = run(concurrency)
+            elapsed = time.perf_counter() - started
+            name = "nested loop" if concurrency == 0 else f"fan_out({concurrency})"
+            print(
+                f"  {label:>5} {name:<14} {elapsed:6.2f} s  "
+                f"{count / elapsed:9,.0f} items/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
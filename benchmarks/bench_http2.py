@@ -0,0 +1,193 @@
+"""Compare HTTP/1.1 and HTTP/2 throughput of AsyncWorkOSClient.
+
+Starts a local TLS stand-in for the WorkOS API (hypercorn, self-signed
+certificate) and fans out concurrent ``user_management.get_user`` calls with
+``asyncio.gather`` over each protocol.
+
+Requires ``pip install hypercorn "httpx[http2]"``.
+
+Usage:
+    python benchmarks/bench_http2.py [--requests 2000] [--concurrency 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+from hypercorn.typing import ASGIReceiveCallable, ASGISendCallable, Scope
+
+from workos import AsyncWorkOSClient, TransportConfig
+
+USER = {
+    "object": "user",
+    "id": "user_01E4ZCR3C56J083X43JQXF3JK5",
+    "email": "marcelina.davis@example.com",
+    "first_name": "Marcelina",
+    "last_name": "Davis",
+    "email_verified": True,
+    "profile_picture_url": None,
+    "last_sign_in_at": "2021-06-25T19:07:33.155Z",
+    "external_id": None,
+    "metadata": {},
+    "locale": None,
+    "created_at": "2021-06-25T19:07:33.155Z",
+    "updated_at": "2021-06-25T19:07:33.155Z",
+}
+BODY = json.dumps(USER).encode()
+
+
+async def app(
+    scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable
+) -> None:
+    if scope["type"] != "http":
+        return
+    # Simulate API processing time so connection reuse matters.
+    await asyncio.sleep(0.005)
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        }
+    )
+    await send({"type": "http.response.body", "body": BODY, "more_body": False})
+
+
+def _write_self_signed_cert(directory: str) -> tuple[str, str]:
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName([x509.DNSName("localhost")]), critical=False
+        )
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = os.path.join(directory, "cert.pem")
+    key_path = os.path.join(directory, "key.pem")
+    with open(cert_path, "wb") as f:
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as f:
+        f.write(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+    return cert_path, key_path
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return int(s.getsockname()[1])
+
+
+def _start_server(cert_path: str, key_path: str, port: int) -> threading.Event:
+    config = Config()
+    config.bind = [f"127.0.0.1:{port}"]
+    config.certfile = cert_path
+    config.keyfile = key_path
+    config.alpn_protocols = ["h2", "http/1.1"]
+    config.loglevel = "ERROR"
+    # Hypercorn closes a connection after 1000 requests by default.
+    config.keep_alive_max_requests = 1_000_000
+    stop = threading.Event()
+
+    def run() -> None:
+        async def main() -> None:
+            loop = asyncio.get_running_loop()
+            await serve(
+                app,
+                config,
+                shutdown_trigger=lambda: loop.run_in_executor(None, stop.wait),
+            )
+
+        asyncio.run(main())
+
+    threading.Thread(target=run, daemon=True).start()
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            break
+        except OSError:
+            time.sleep(0.05)
+    return stop
+
+
+async def _run(base_url: str, http2: bool, requests: int, concurrency: int) -> None:
+    client = AsyncWorkOSClient(
+        api_key="sk_test_bench",
+        base_url=base_url,
+        max_retries=0,
+        transport_config=TransportConfig(http2=http2),
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with semaphore:
+            await client.user_management.get_user(USER["id"])
+
+    try:
+        await one()  # warm up TLS and the pool
+        client.transport_stats.reset()
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+        stats = client.transport_stats
+        print(
+            f"{'HTTP/2' if http2 else 'HTTP/1.1':>8}: "
+            f"{requests / elapsed:8.0f} req/s  "
+            f"negotiated={stats.http_versions}  "
+            f"avg pool wait={stats.average_pool_wait * 1000:.2f} ms"
+        )
+    finally:
+        await client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cert_path, key_path = _write_self_signed_cert(tmp)
+        # httpx honours SSL_CERT_FILE, so the SDK-built client trusts the stand-in.
+        os.environ["SSL_CERT_FILE"] = cert_path
+        port = _free_port()
+        stop = _start_server(cert_path, key_path, port)
+        base_url = f"https://localhost:{port}"
+        try:
+            for http2 in (False, True):
+                asyncio.run(_run(base_url, http2, args.requests, args.concurrency))
+        finally:
+            stop.set()
+
+
+if __name__ == "__main__":
+    main()
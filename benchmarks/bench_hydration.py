@@ -0,0 +1,123 @@
+"""Measure cached datetime parsing and enum lookups when hydrating models.
+
+Builds ``--count`` ``DirectoryUser`` dicts from the fixture whose
+``created_at``/``updated_at`` come from ``--distinct`` different timestamps
+and whose ``state`` alternates, as in a page of users provisioned in
+batches. It reports the time per 1,000 objects for:
+
+* ``_parse_datetime`` without and with its LRU cache;
+* ``DirectoryUserState(value)`` vs the precomputed value-to-member map;
+* ``DirectoryUser.from_dict`` before (uncached datetimes) and after, and the
+  compiled loader the client uses with ``compiled_models=True``, which also uses the member map.
+
+Usage:
+    python benchmarks/bench_hydration.py [--count 1000] [--distinct 50] [--rounds 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from workos._compiled import _enum_members, compiled_loader
+from workos._types import _parse_datetime
+from workos.common.models import DirectoryUser, DirectoryUserState
+from workos.common.models import directory_user
+
+FIXTURE = (
+    Path(__file__).resolve().parent.parent
+    / "tests"
+    / "fixtures"
+    / "directory_user.json"
+)
+
+
+def _users(count: int, distinct: int) -> List[Dict[str, Any]]:
+    template = json.loads(FIXTURE.read_text())
+    states = ["active", "inactive"]
+    users = []
+    for i in range(count):
+        timestamp = (
+            f"2026-01-{1 + i % distinct % 28:02d}T12:{i % distinct // 28:02d}:00.000Z"
+        )
+        users.append(
+            {
+                **template,
+                "id": f"directory_user_{i}",
+                "state": states[i % 2],
+                "created_at": timestamp,
+                "updated_at": timestamp,
+            }
+        )
+    return users
+
+
+def _per_thousand(run: Callable[[], Any], count: int, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        _parse_datetime.cache_clear()
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best / count * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--distinct", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    users = _users(args.count, args.distinct)
+    timestamps = [user["created_at"] for user in users]
+    states = [user["state"] for user in users]
+    uncached = _parse_datetime.__wrapped__
+    members = _enum_members(DirectoryUserState)
+    load = compiled_loader(DirectoryUser)
+
+    def before() -> None:
+        directory_user._parse_datetime = uncached
+        try:
+            for user in users:
+                DirectoryUser.from_dict(user)
+        finally:
+            directory_user._parse_datetime = _parse_datetime
+
+    rows = [
+        (
+            "parse timestamps",
+            lambda: [uncached(t) for t in timestamps],
+            lambda: [_parse_datetime(t) for t in timestamps],
+        ),
+        (
+            "convert states",
+            lambda: [DirectoryUserState(s) for s in states],
+            lambda: [members[s] for s in states],
+        ),
+        (
+            "DirectoryUser.from_dict",
+            before,
+            lambda: [DirectoryUser.from_dict(u) for u in users],
+        ),
+        ("compiled loader", before, lambda: [load(u) for u in users]),
+    ]
+    print(
+        f"{args.count} DirectoryUser objects, {args.distinct} distinct timestamps; "
+        f"ms per 1,000"
+    )
+    print(f"{'':<26} {'before':>9} {'after':>9}")
+    for label, old, new in rows:
+        old_time = _per_thousand(old, args.count, args.rounds)
+        new_time = _per_thousand(new, args.count, args.rounds)
+        print(
+            f"{label:<26} {old_time * 1000:9.3f} {new_time * 1000:9.3f}  "
+            f"({old_time / new_time:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Measure cold-start import cost of the SDK.
+
+Each sample runs in a fresh interpreter and reports how long ``import workos``
+takes, how many ``workos`` modules it loads, and the cost of the first access
+to a service accessor (``client.user_management`` by default). Pass
+``--budget-ms`` to exit non-zero when the median ``import workos`` time exceeds
+the budget, e.g. in CI as an import-time regression check.
+
+Usage:
+    python benchmarks/bench_import_time.py [--runs 15] [--service user_management] [--budget-ms 400]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+SAMPLE = """
+import json, sys, time
+started = time.perf_counter()
+import workos
+imported = time.perf_counter()
+modules = sum(1 for name in sys.modules if name.startswith("workos"))
+client = workos.WorkOSClient(api_key="sk_test_bench", client_id="client_bench")
+started_service = time.perf_counter()
+getattr(client, {service!r})
+accessed = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (imported - started) * 1000,
+    "modules": modules,
+    "service_ms": (accessed - started_service) * 1000,
+    "service_modules": sum(1 for name in sys.modules if name.startswith("workos")),
+}}))
+"""
+
+
+def _sample(service: str) -> dict[str, float]:
+    output = subprocess.run(
+        [sys.executable, "-c", SAMPLE.format(service=service)],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--service", default="user_management")
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    _sample(args.service)  # warm the filesystem and bytecode caches
+    samples = [_sample(args.service) for _ in range(args.runs)]
+    import_ms = statistics.median(s["import_ms"] for s in samples)
+    service_ms = statistics.median(s["service_ms"] for s in samples)
+    service_label = f"client.{args.service}"
+    width = len(service_label)
+    print(
+        f"{'import workos':<{width}}: {import_ms:7.1f} ms median "
+        f"({int(samples[0]['modules'])} workos modules loaded)"
+    )
+    print(
+        f"{service_label}: {service_ms:7.1f} ms median on first access "
+        f"({int(samples[0]['service_modules'])} workos modules loaded after)"
+    )
+    if args.budget_ms is not None and import_ms > args.budget_ms:
+        sys.exit(
+            f"import workos took {import_ms:.1f} ms, over the {args.budget_ms:.0f} ms budget"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Compare the SDK's JSON codecs on the payloads in ``tests/fixtures``.
+
+For every installed codec (the standard library, orjson, msgspec) this
+measures:
+
+* ``fixtures``: decode and re-encode every fixture file once per round;
+* ``list page``: decode a 100-item ``list_users`` page and build the models,
+  as ``auto_paging_iter`` does for every page;
+* ``webhooks``: decode a burst of webhook events and dispatch them through
+  ``EventSchema.from_dict``;
+* ``request bodies``: encode the request-body fixtures (``create_*`` and
+  ``update_*``).
+
+Usage:
+    python benchmarks/bench_json.py [--rounds 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from workos import set_json_codec
+from workos._json import JSONCodec, MsgspecCodec, OrjsonCodec, StdlibJSONCodec
+from workos.events.models import EventSchema
+from workos.user_management.models import User
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+
+
+def _codecs() -> List[JSONCodec]:
+    codecs: List[JSONCodec] = [StdlibJSONCodec()]
+    for codec in (OrjsonCodec, MsgspecCodec):
+        try:
+            codecs.append(codec())
+        except ImportError:
+            pass
+    return codecs
+
+
+def _workloads() -> Dict[str, tuple[int, Callable[[JSONCodec], None]]]:
+    raw = [path.read_bytes() for path in sorted(FIXTURES.glob("*.json"))]
+    user = json.loads((FIXTURES / "user.json").read_bytes())
+    page = json.dumps(
+        {
+            "object": "list",
+            "data": [dict(user, id=f"user_{i}") for i in range(100)],
+            "list_metadata": {"before": None, "after": "user_99"},
+        }
+    ).encode()
+    events = [
+        payload
+        for payload in raw
+        if str(json.loads(payload).get("event")) in EventSchema._DISPATCH
+    ]
+    bodies = [
+        json.loads(path.read_bytes())
+        for path in sorted(FIXTURES.glob("*.json"))
+        if path.name.startswith(("create_", "update_"))
+    ]
+
+    def fixtures(codec: JSONCodec) -> None:
+        for payload in raw:
+            codec.dumps(codec.loads(payload))
+
+    def list_page(codec: JSONCodec) -> None:
+        for item in codec.loads(page)["data"]:
+            User.from_dict(item)
+
+    def webhooks(codec: JSONCodec) -> None:
+        for payload in events:
+            EventSchema.from_dict(codec.loads(payload))
+
+    def request_bodies(codec: JSONCodec) -> None:
+        for body in bodies:
+            codec.dumps(body)
+
+    return {
+        "fixtures": (sum(map(len, raw)), fixtures),
+        "list page": (len(page), list_page),
+        "webhooks": (sum(map(len, events)), webhooks),
+        "request bodies": (sum(len(json.dumps(b)) for b in bodies), request_bodies),
+    }
+
+
+def _measure(run: Callable[[JSONCodec], None], codec: JSONCodec, rounds: int) -> float:
+    run(codec)  # warm up
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        run(codec)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    codecs = _codecs()
+    print(f"{'workload':<15}" + "".join(f"{c.name:>22}" for c in codecs))
+    for label, (size, run) in _workloads().items():
+        results: List[Any] = []
+        for codec in codecs:
+            set_json_codec(codec)
+            results.append(_measure(run, codec, args.rounds))
+        baseline = results[0]
+        cells = [
+            f"{size / seconds / 1e6:8.1f} MB/s ({baseline / seconds:4.1f}x)"
+            for seconds in results
+        ]
+        print(f"{label:<15}" + "".join(f"{cell:>22}" for cell in cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Compare eager and lazy model deserialization on the round-trip fixtures.
+
+For every ``(model, fixture)`` pair exercised by ``tests/test_*_round_trip.py``
+this builds each model ``--rounds`` times and reports, summed over all pairs:
+
+* ``construct``: building the model only;
+* ``read id``: building it and reading ``id`` (or the first field);
+* ``read all``: building it and calling ``to_dict()``, which reads every field;
+* ``retained``: bytes still allocated per model kept alive, parsing a fresh
+  dict for each one (``tracemalloc``). Lazy models keep their raw dict alive;
+  eager ones only keep the parts they reference, such as ``metadata``.
+
+Usage:
+    python benchmarks/bench_lazy_models.py [--rounds 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from tests.generated_helpers import load_fixture, round_trip_cases  # noqa: E402
+from workos._lazy import lazy_loader  # noqa: E402
+
+Case = Tuple[Callable[[Dict[str, Any]], Any], Dict[str, Any], str]
+
+
+def _cases(lazy: bool) -> List[Case]:
+    cases: List[Case] = []
+    for model, fixture in round_trip_cases():
+        data = load_fixture(fixture)
+        eager = model.from_dict(data)
+        field = "id" if hasattr(eager, "id") else dataclasses.fields(eager)[0].name
+        load = lazy_loader(model) if lazy else model.from_dict
+        cases.append((load, data, field))
+    return cases
+
+
+def _time(cases: List[Case], rounds: int, read: str) -> float:
+    started = time.perf_counter()
+    for load, data, field in cases:
+        for _ in range(rounds):
+            instance = load(data)
+            if read == "one":
+                getattr(instance, field)
+            elif read == "all":
+                instance.to_dict()
+    return time.perf_counter() - started
+
+
+def _retained(cases: List[Case], rounds: int) -> float:
+    bodies = [(load, json.dumps(data)) for load, data, _ in cases]
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [load(json.loads(body)) for load, body in bodies for _ in range(rounds)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(kept)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    results = {}
+    for label, lazy in (("eager", False), ("lazy", True)):
+        cases = _cases(lazy)
+        results[label] = (
+            _time(cases, args.rounds, "none"),
+            _time(cases, args.rounds, "one"),
+            _time(cases, args.rounds, "all"),
+            _retained(cases, min(args.rounds, 50)),
+        )
+    count = len(_cases(False)) * args.rounds
+    print(f"{count} models per column ({count // args.rounds} fixtures)")
+    print(
+        f"{'':>6} {'construct':>12} {'read id':>12} {'read all':>12} {'retained':>10}"
+    )
+    for label, (construct, one, full, retained) in results.items():
+        print(
+            f"{label:>6} {construct / count * 1e6:9.2f} us {one / count * 1e6:9.2f} us "
+            f"{full / count * 1e6:9.2f} us {retained:7.0f} B"
+        )
+
+
+if __name__ == "__main__":
+    main()
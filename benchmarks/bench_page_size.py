@@ -0,0 +1,86 @@
+"""Count the requests auto-pagination makes to walk 10k items.
+
+Serves ``list_organizations`` from an in-process ``httpx.MockTransport`` that
+honours ``limit`` (defaulting to 10 like the API) and sleeps ``--latency-ms``
+per request, then walks every item with ``auto_paging_iter()`` using the
+default page size and with ``auto_paging_page_size=MAX_PAGE_SIZE``.
+
+Usage:
+    python benchmarks/bench_page_size.py [--items 10000] [--latency-ms 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from workos import MAX_PAGE_SIZE, TransportConfig, WorkOSClient
+
+DEFAULT_LIMIT = 10
+
+
+def _handler(items: int, latency: float, requests: List[int]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(latency)
+        limit = int(request.url.params.get("limit") or DEFAULT_LIMIT)
+        start = int(request.url.params.get("after") or 0)
+        end = min(start + limit, items)
+        requests.append(limit)
+        data: List[Dict[str, Any]] = [
+            {
+                "object": "organization",
+                "id": str(i),
+                "name": f"Org {i}",
+                "domains": [],
+                "metadata": {},
+                "external_id": None,
+                "created_at": "2024-01-01T00:00:00Z",
+                "updated_at": "2024-01-01T00:00:00Z",
+            }
+            for i in range(start, end)
+        ]
+        metadata = {"after": str(end)} if end < items else {}
+        body = {"data": data, "list_metadata": metadata}
+        return httpx.Response(200, content=json.dumps(body).encode())
+
+    return handler
+
+
+def _walk(items: int, latency: float, page_size: Optional[int]) -> None:
+    requests: List[int] = []
+    client = WorkOSClient(
+        api_key="sk_test_bench",
+        transport_config=TransportConfig(
+            transport=httpx.MockTransport(_handler(items, latency, requests))
+        ),
+        auto_paging_page_size=page_size,
+    )
+    started = time.perf_counter()
+    try:
+        seen = sum(1 for _ in client.organizations.list_organizations())
+    finally:
+        client.close()
+    elapsed = time.perf_counter() - started
+    label = "default" if page_size is None else f"page size {page_size}"
+    print(
+        f"{label:>14}: {len(requests):5d} requests for {seen} items "
+        f"({len(requests) * 10_000 / seen:6.0f} per 10k), {elapsed * 1000:8.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    for page_size in (None, MAX_PAGE_SIZE):
+        _walk(args.items, args.latency_ms / 1000, page_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Measure auto-pagination wall time with and without page prefetching.
+
+Serves ``list_organizations`` pages from an in-process ``httpx.MockTransport``
+that sleeps ``--latency-ms`` per request, and walks every page with
+``auto_paging_iter(prefetch=N)`` while spending ``--work-ms`` of simulated
+processing on each page. With prefetching the next request overlaps the
+caller's work, so the total approaches ``pages * max(latency, work)`` instead
+of ``pages * (latency + work)``.
+
+Usage:
+    python benchmarks/bench_prefetch.py [--pages 20] [--latency-ms 20] [--work-ms 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Dict, List
+
+import httpx
+
+from workos import AsyncWorkOSClient, TransportConfig, WorkOSClient
+
+PAGE_SIZE = 10
+
+
+def _page(after: str | None, pages: int) -> bytes:
+    index = int(after or 0)
+    data: List[Dict[str, Any]] = [
+        {
+            "object": "organization",
+            "id": f"org_{index}_{i}",
+            "name": f"Org {index}.{i}",
+            "domains": [],
+            "metadata": {},
+            "external_id": None,
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+        }
+        for i in range(PAGE_SIZE)
+    ]
+    metadata = {"after": str(index + 1)} if index + 1 < pages else {}
+    return json.dumps({"data": data, "list_metadata": metadata}).encode()
+
+
+def _run_sync(pages: int, latency: float, work: float, prefetch: int) -> float:
+    def handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(latency)
+        return httpx.Response(
+            200, content=_page(request.url.params.get("after"), pages)
+        )
+
+    client = WorkOSClient(
+        api_key="sk_test_bench",
+        transport_config=TransportConfig(transport=httpx.MockTransport(handler)),
+    )
+    started = time.perf_counter()
+    try:
+        page = client.organizations.list_organizations()
+        for count, _ in enumerate(page.auto_paging_iter(prefetch=prefetch), 1):
+            if count % PAGE_SIZE == 0:
+                time.sleep(work)
+    finally:
+        client.close()
+    return time.perf_counter() - started
+
+
+async def _run_async(pages: int, latency: float, work: float, prefetch: int) -> float:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency)
+        return httpx.Response(
+            200, content=_page(request.url.params.get("after"), pages)
+        )
+
+    client = AsyncWorkOSClient(
+        api_key="sk_test_bench",
+        transport_config=TransportConfig(transport=httpx.MockTransport(handler)),
+    )
+    started = time.perf_counter()
+    try:
+        page = await client.organizations.list_organizations()
+        count = 0
+        async for _ in page.auto_paging_iter(prefetch=prefetch):
+            count += 1
+            if count % PAGE_SIZE == 0:
+                await asyncio.sleep(work)
+    finally:
+        await client.close()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--work-ms", type=float, default=20.0)
+    args = parser.parse_args()
+    latency, work = args.latency_ms / 1000, args.work_ms / 1000
+
+    for prefetch in (0, 1, 2, 4):
+        sync = _run_sync(args.pages, latency, work, prefetch)
+        async_ = asyncio.run(_run_async(args.pages, latency, work, prefetch))
+        print(
+            f"prefetch={prefetch}: sync {sync * 1000:7.1f} ms  "
+            f"async {async_ * 1000:7.1f} ms  ({args.pages} pages)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Compare list throughput with models, raw dicts and field projections.
+
+Serves 100-item pages of users (``user_management.list_users``),
+organization memberships (``organization_membership.list_organization_memberships``)
+and directory users (``directory_sync.list_users``) from an in-process
+``httpx.MockTransport`` with no latency, so the numbers are the SDK's own
+cost per page: sending the request, parsing the body and building the items.
+Each page is listed with the default models, ``RequestOptions(raw=True)``
+and ``RequestOptions(fields=("id", "email"))``, and the script reports items
+per second (best of ``--rounds``).
+
+Usage:
+    python benchmarks/bench_projection.py [--items 100] [--pages 200] [--rounds 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+
+import httpx
+
+from workos import RequestOptions, TransportConfig, WorkOSClient
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+
+ListCall = Callable[[WorkOSClient, RequestOptions], Any]
+
+
+def _body(fixture: str, items: int) -> bytes:
+    template = json.loads((FIXTURES / fixture).read_text())["data"][0]
+    data = [{**template, "id": f"{template['id']}_{i}"} for i in range(items)]
+    return json.dumps({"data": data, "list_metadata": {"after": None}}).encode()
+
+
+def _client(body: bytes) -> WorkOSClient:
+    return WorkOSClient(
+        api_key="sk_test_bench",
+        transport_config=TransportConfig(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, content=body)
+            )
+        ),
+    )
+
+
+def _throughput(
+    body: bytes, items: int, pages: int, call: ListCall, options: RequestOptions
+) -> float:
+    client = _client(body)
+    try:
+        started = time.perf_counter()
+        for _ in range(pages):
+            assert len(call(client, options).data) == items
+        elapsed = time.perf_counter() - started
+    finally:
+        client.close()
+    return items * pages / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    cases: List[Tuple[str, str, ListCall]] = [
+        (
+            "users",
+            "list_user.json",
+            lambda client, options: client.user_management.list_users(
+                request_options=options
+            ),
+        ),
+        (
+            "organization memberships",
+            "list_user_organization_membership.json",
+            lambda client, options: (
+                client.organization_membership.list_organization_memberships(
+                    user_id="user_123", request_options=options
+                )
+            ),
+        ),
+        (
+            "directory users",
+            "list_directory_user_with_groups.json",
+            lambda client, options: client.directory_sync.list_users(
+                request_options=options
+            ),
+        ),
+    ]
+    modes: List[Tuple[str, RequestOptions]] = [
+        ("models", RequestOptions()),
+        ("raw", RequestOptions(raw=True)),
+        ("fields", RequestOptions(fields=("id", "email"))),
+    ]
+    for label, fixture, call in cases:
+        body = _body(fixture, args.items)
+        print(f"{label}: {args.pages} pages of {args.items} items")
+        baseline = 0.0
+        for mode, options in modes:
+            rate = max(
+                _throughput(body, args.items, args.pages, call, options)
+                for _ in range(args.rounds)
+            )
+            baseline = baseline or rate
+            print(f"  {mode:>6}: {rate:10,.0f} items/s  ({rate / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Measure session cookie seal and unseal throughput.
+
+Seals and unseals a session payload shaped like a real one (an access token
+of about 1 KB, a refresh token and a user) for ``--seconds`` per variant on
+one thread:
+
+* ``Fernet per call``: a new ``Fernet(key)`` on every call, as before ciphers
+  were cached;
+* ``seal_data/unseal_data``: the cached cipher for one password;
+* ``rotation, new cookie``: a ``[new, old]`` password list unsealing a cookie
+  sealed with the newest password;
+* ``rotation, old cookie``: the same list unsealing a cookie sealed with the
+  older password, which fails the first key before the second succeeds.
+
+Usage:
+    python benchmarks/bench_seal.py [--seconds 1]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any, Callable, Dict
+
+from cryptography.fernet import Fernet
+
+from workos import _json
+from workos.session import seal_data, unseal_data
+
+PAYLOAD: Dict[str, Any] = {
+    "access_token": "eyJ" + "x" * 1000,
+    "refresh_token": "r" * 32,
+    "user": {
+        "id": "user_01H5JQDV7R7ATEYZDEG0W5PRYS",
+        "email": "marcelina@example.com",
+        "first_name": "Marcelina",
+        "last_name": "Davis",
+        "email_verified": True,
+    },
+}
+
+
+def _rate(operation: Callable[[], Any], seconds: float) -> float:
+    count = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            operation()
+        count += 100
+    return count / (time.perf_counter() - started)
+
+
+def _seal_per_call(key: str) -> str:
+    return Fernet(key).encrypt(_json.dumps(PAYLOAD)).decode("utf-8")
+
+
+def _unseal_per_call(sealed: str, key: str) -> Dict[str, Any]:
+    return _json.loads(Fernet(key).decrypt(sealed.encode("utf-8")))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    old = Fernet.generate_key().decode()
+    new = Fernet.generate_key().decode()
+    passwords = [new, old]
+    old_cookie = seal_data(PAYLOAD, old)
+    new_cookie = seal_data(PAYLOAD, new)
+    variants = [
+        (
+            "Fernet per call",
+            lambda: _seal_per_call(old),
+            lambda: _unseal_per_call(old_cookie, old),
+        ),
+        (
+            "seal_data/unseal_data",
+            lambda: seal_data(PAYLOAD, old),
+            lambda: unseal_data(old_cookie, old),
+        ),
+        (
+            "rotation, new cookie",
+            lambda: seal_data(PAYLOAD, passwords),
+            lambda: unseal_data(new_cookie, passwords),
+        ),
+        (
+            "rotation, old cookie",
+            None,
+            lambda: unseal_data(old_cookie, passwords),
+        ),
+    ]
+    print(f"{len(old_cookie)}-byte cookie, one thread")
+    for name, seal, unseal in variants:
+        sealed = f"{_rate(seal, args.seconds):10,.0f}" if seal else f"{'-':>10}"
+        print(
+            f"  {name:<22} seal {sealed} ops/s  "
+            f"unseal {_rate(unseal, args.seconds):10,.0f} ops/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
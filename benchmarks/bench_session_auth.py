@@ -0,0 +1,104 @@
+"""Measure sealed session cookie authentications per second on one core.
+
+Seals ``--cookies`` distinct sessions, each holding an RS256 access token
+valid for an hour, and authenticates them round-robin with
+``Session.authenticate`` for ``--seconds`` per variant on a single thread:
+without a cache (Fernet decryption, JSON parsing and signature verification
+every time) and with a ``SessionCache`` of ``--maxsize`` entries on the
+client. Signing keys come from a warm in-memory ``JWKSKeyStore``, so no
+variant touches the network.
+
+Usage:
+    python benchmarks/bench_session_auth.py [--cookies 100] [--seconds 2] [--maxsize 1024]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import List, Optional, Tuple
+
+import jwt
+from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from workos import SessionCache, WorkOSClient
+from workos._jwks import JWKSKeyStore
+from workos.session import Session, seal_data
+
+
+def _cookies(count: int, password: str) -> Tuple[List[str], JWKSKeyStore]:
+    private_key = rsa.generate_private_key(65537, 2048)
+    jwk = RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+    keys = {"keys": [{**jwk, "kid": "key_1", "alg": "RS256"}]}
+    store = JWKSKeyStore("https://example.com/jwks", fetch=lambda: keys)
+    store.refresh()
+    exp = int(time.time()) + 3600
+    cookies = []
+    for i in range(count):
+        token = jwt.encode(
+            {"sid": f"session_{i}", "org_id": "org_01", "exp": exp},
+            private_key,
+            algorithm="RS256",
+            headers={"kid": "key_1"},
+        )
+        cookies.append(
+            seal_data(
+                {"access_token": token, "refresh_token": "rt", "user": {"id": i}},
+                password,
+            )
+        )
+    return cookies, store
+
+
+def _run(
+    cookies: List[str],
+    store: JWKSKeyStore,
+    password: str,
+    cache: Optional[SessionCache],
+    seconds: float,
+) -> float:
+    client = WorkOSClient(
+        api_key="sk_test_bench", client_id="client_bench", session_cache=cache
+    )
+    sessions = []
+    for cookie in cookies:
+        session = Session(client=client, session_data=cookie, cookie_password=password)
+        session.jwks = store
+        sessions.append(session)
+    count = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    try:
+        while time.perf_counter() < deadline:
+            for session in sessions:
+                session.authenticate()
+            count += len(sessions)
+        return count / (time.perf_counter() - started)
+    finally:
+        client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cookies", type=int, default=100)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--maxsize", type=int, default=1024)
+    args = parser.parse_args()
+
+    password = Fernet.generate_key().decode()
+    cookies, store = _cookies(args.cookies, password)
+    print(f"{args.cookies} cookies, round-robin on one thread")
+    baseline = _run(cookies, store, password, None, args.seconds)
+    print(f"  {'no cache':<22} {baseline:12,.0f} auth/s")
+    cache = SessionCache(maxsize=args.maxsize)
+    cached = _run(cookies, store, password, cache, args.seconds)
+    print(
+        f"  {f'SessionCache({args.maxsize})':<22} {cached:12,.0f} auth/s  "
+        f"x{cached / baseline:.1f}  hit rate {cache.stats().hit_rate:.1%}"
+    )
+
+
+if __name__ == "__main__":
+    main()
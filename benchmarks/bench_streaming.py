@@ -0,0 +1,121 @@
+"""Compare buffered and streamed list pages for heavy objects.
+
+Serves 100-item pages of ``DirectoryUserWithGroups`` (``directory_sync.list_users``)
+and events (``events.list_events``) from an in-process ``httpx.MockTransport``
+that sends the body in 16 KiB chunks, sleeping ``--chunk-ms`` before each
+one to stand in for the network. Each page is consumed one item at a time,
+without keeping the models, and the script reports:
+
+* time to first item, measured from the start of the list call;
+* total time for the page;
+* peak Python heap allocation during the call and iteration (``tracemalloc``).
+
+Buffered pages hold the raw body, the parsed dicts and every model at once;
+``RequestOptions(stream=True)`` parses items out of the body as it arrives.
+
+Usage:
+    python benchmarks/bench_streaming.py [--items 100] [--chunk-ms 1] [--rounds 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Tuple
+
+import httpx
+
+from workos import RequestOptions, TransportConfig, WorkOSClient
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+CHUNK = 16 * 1024
+
+
+def _body(fixture: str, items: int) -> bytes:
+    template = json.loads((FIXTURES / fixture).read_text())["data"][0]
+    data = [{**template, "id": f"{template['id']}_{i}"} for i in range(items)]
+    return json.dumps({"data": data, "list_metadata": {"after": None}}).encode()
+
+
+def _client(body: bytes, chunk_delay: float) -> WorkOSClient:
+    def chunks() -> Iterator[bytes]:
+        for start in range(0, len(body), CHUNK):
+            time.sleep(chunk_delay)
+            yield body[start : start + CHUNK]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=chunks())
+
+    return WorkOSClient(
+        api_key="sk_test_bench",
+        transport_config=TransportConfig(transport=httpx.MockTransport(handler)),
+    )
+
+
+def _measure(
+    body: bytes, chunk_delay: float, list_page: Callable[[WorkOSClient], Any]
+) -> Tuple[float, float, int]:
+    client = _client(body, chunk_delay)
+    try:
+        tracemalloc.start()
+        started = time.perf_counter()
+        first = 0.0
+        for count, _ in enumerate(list_page(client), 1):
+            if count == 1:
+                first = time.perf_counter() - started
+        total = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        client.close()
+    return first, total, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--chunk-ms", type=float, default=1.0)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    cases: List[Tuple[str, str, Callable[[WorkOSClient, RequestOptions], Any]]] = [
+        (
+            "directory users",
+            "list_directory_user_with_groups.json",
+            lambda client, options: client.directory_sync.list_users(
+                request_options=options
+            ),
+        ),
+        (
+            "events",
+            "list_event_schema.json",
+            lambda client, options: client.events.list_events(
+                events=["user.created"], request_options=options
+            ),
+        ),
+    ]
+    for label, fixture, call in cases:
+        body = _body(fixture, args.items)
+        print(f"{label}: {args.items} items, {len(body) / 1024:.0f} KiB body")
+        for mode, options in (
+            ("buffered", RequestOptions()),
+            ("streamed", RequestOptions(stream=True)),
+        ):
+            runs = [
+                _measure(body, args.chunk_ms / 1000, lambda c, o=options: call(c, o))
+                for _ in range(args.rounds)
+            ]
+            first = min(run[0] for run in runs)
+            total = min(run[1] for run in runs)
+            peak = min(run[2] for run in runs)
+            print(
+                f"  {mode}: first item {first * 1000:7.2f} ms  "
+                f"page {total * 1000:7.2f} ms  peak heap {peak / 1024:8.0f} KiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,407 @@
+"""Generate src/workos/_model_loaders.py from the generated models.
+
+The generated ``from_dict`` methods are written to be read: they call
+``cast()`` on nested values, convert enums through ``Enum.__call__`` and pass
+every field to the constructor by keyword. For each model whose
+``from_dict`` is a single ``try: return cls(field=expr, ...)`` block, this
+script writes a specialized version of it that
+
+* drops ``cast()``, which does nothing at runtime;
+* looks enum values up in the enum's value-to-member map;
+* calls the compiled loaders of nested models directly, with ``map()`` for
+  lists of them;
+* passes the fields to the constructor positionally.
+
+It also writes one loader per field, which evaluates the same specialized
+expression inside the model's ``except`` clauses. The output is what
+``compiled_models=True`` and lazy models use (see ``workos._compiled`` and
+``workos._lazy``).
+Re-run this script whenever the models are regenerated; a test checks that
+the committed file matches its output.
+
+Usage:
+    python scripts/generate_model_loaders.py [--check]
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import builtins
+import copy
+import dataclasses
+import enum
+import importlib
+import inspect
+import pkgutil
+import shutil
+import subprocess
+import sys
+import textwrap
+import typing
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+OUTPUT = ROOT / "src" / "workos" / "_model_loaders.py"
+
+HEADER = '''\
+# @oagen-ignore-file
+# Generated by scripts/generate_model_loaders.py from the generated models.
+# Do not edit; re-run the script after regenerating the models.
+
+"""Specialized ``from_dict`` functions and per-field loaders for the models.
+
+Each factory takes the model class followed by the dependencies listed next
+to it in :data:`LOADERS`. It returns the model's compiled loader, used with
+``compiled_models=True`` (see ``workos._compiled``), and one loader per
+field, used by lazy models (see ``workos._lazy``).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Tuple
+'''
+
+
+@dataclasses.dataclass
+class FieldPlan:
+    """What a generated ``from_dict`` does for each field of its model."""
+
+    model: type
+    expressions: Dict[str, ast.expr]
+    """The expression passed for each constructor keyword, in call order."""
+    handlers: List[ast.ExceptHandler]
+    """The ``except`` clauses wrapping the constructor call."""
+
+
+def field_plan(model: type) -> Optional[FieldPlan]:
+    """Read the field plan of ``model`` from the source of its ``from_dict``.
+
+    Returns:
+        The plan, or None if ``from_dict`` is not a ``try: return
+        cls(field=expr, ...)`` block.
+    """
+    source = textwrap.dedent(inspect.getsource(getattr(model, "from_dict")))
+    function = ast.parse(source).body[0]
+    if not isinstance(function, ast.FunctionDef):
+        return None
+    body = function.body
+    if body and isinstance(body[0], ast.Expr):
+        body = body[1:]
+    if len(body) != 1 or not isinstance(body[0], ast.Try):
+        return None
+    block = body[0]
+    if len(block.body) != 1 or not isinstance(block.body[0], ast.Return):
+        return None
+    call = block.body[0].value
+    if (
+        not isinstance(call, ast.Call)
+        or not isinstance(call.func, ast.Name)
+        or call.func.id != "cls"
+        or call.args
+        or any(keyword.arg is None for keyword in call.keywords)
+    ):
+        return None
+    return FieldPlan(
+        model=model,
+        expressions={
+            typing.cast(str, keyword.arg): keyword.value for keyword in call.keywords
+        },
+        handlers=list(block.handlers),
+    )
+
+
+def _nested_model(node: ast.Call, namespace: Dict[str, Any]) -> Optional[str]:
+    """The model name of a ``Model.from_dict(value)`` call."""
+    func = node.func
+    if (
+        isinstance(func, ast.Attribute)
+        and func.attr == "from_dict"
+        and isinstance(func.value, ast.Name)
+        and len(node.args) == 1
+        and not node.keywords
+        and isinstance(namespace.get(func.value.id), type)
+    ):
+        return func.value.id
+    return None
+
+
+def _enum_class(node: ast.Call, namespace: Dict[str, Any]) -> Optional[str]:
+    """The enum name of an ``Enum(value)`` call."""
+    if isinstance(node.func, ast.Name) and len(node.args) == 1 and not node.keywords:
+        target = namespace.get(node.func.id)
+        if isinstance(target, type) and issubclass(target, enum.Enum):
+            return node.func.id
+    return None
+
+
+class Specializer(ast.NodeTransformer):
+    """Rewrites ``from_dict`` expressions into their specialized form."""
+
+    def __init__(self, namespace: Dict[str, Any]) -> None:
+        self.namespace = namespace
+        # Parameter name -> (kind, name in the model's module).
+        self.dependencies: Dict[str, Tuple[str, str]] = {}
+
+    def _bind(self, kind: str, name: str) -> str:
+        parameter = f"_{kind}_{name}"
+        self.dependencies[parameter] = (kind, name)
+        return parameter
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        self.generic_visit(node)
+        func = node.func
+        if (
+            isinstance(func, ast.Name)
+            and func.id == "cast"
+            and self.namespace.get("cast") is typing.cast
+            and len(node.args) == 2
+            and not node.keywords
+        ):
+            return node.args[1]
+        nested = _nested_model(node, self.namespace)
+        if nested is not None:
+            parameter = self._bind("loader", nested)
+            return ast.Call(ast.Name(parameter, ast.Load()), node.args, [])
+        enum_class = _enum_class(node, self.namespace)
+        if enum_class is not None:
+            parameter = self._bind("members", enum_class)
+            return ast.Subscript(
+                ast.Name(parameter, ast.Load()), node.args[0], ast.Load()
+            )
+        return node
+
+    def visit_ListComp(self, node: ast.ListComp) -> ast.AST:
+        self.generic_visit(node)
+        # [_loader(item) for item in values] -> list(map(_loader, values))
+        if len(node.generators) != 1:
+            return node
+        generator = node.generators[0]
+        element = node.elt
+        if (
+            not generator.ifs
+            and not generator.is_async
+            and isinstance(generator.target, ast.Name)
+            and isinstance(element, ast.Call)
+            and isinstance(element.func, ast.Name)
+            and element.func.id in self.dependencies
+            and len(element.args) == 1
+            and not element.keywords
+            and isinstance(element.args[0], ast.Name)
+            and element.args[0].id == generator.target.id
+        ):
+            mapped = ast.Call(
+                ast.Name("map", ast.Load()), [element.func, generator.iter], []
+            )
+            return ast.Call(ast.Name("list", ast.Load()), [mapped], [])
+        return node
+
+
+def _globals(nodes: List[ast.AST], namespace: Dict[str, Any]) -> Set[str]:
+    """Names the nodes read from the model's module."""
+    bound = {"data", "cls"}
+    loaded: Set[str] = set()
+    for tree in nodes:
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name):
+                if isinstance(node.ctx, ast.Store):
+                    bound.add(node.id)
+                else:
+                    loaded.add(node.id)
+            elif isinstance(node, ast.ExceptHandler) and node.name:
+                bound.add(node.name)
+    return {
+        name
+        for name in loaded - bound
+        if name in namespace or not hasattr(builtins, name)
+    }
+
+
+def _constructor_order(plan: FieldPlan) -> Optional[List[str]]:
+    """The fields in positional order, if ``cls(*values)`` is equivalent."""
+    model = plan.model
+    if not dataclasses.is_dataclass(model) or "__init__" not in vars(model):
+        return None
+    names = [field.name for field in dataclasses.fields(model) if field.init]
+    if set(names) != set(plan.expressions) or len(names) != len(plan.expressions):
+        return None
+    return names
+
+
+def _factory_name(model: type) -> str:
+    package = model.__module__.split(".")[1]
+    return f"_{package}__{model.__qualname__}"
+
+
+def _required(plan: FieldPlan) -> Tuple[str, ...]:
+    """Keys the generated ``from_dict`` reads with ``data[key]``."""
+    required: List[str] = []
+    for expression in plan.expressions.values():
+        for node in ast.walk(expression):
+            if (
+                isinstance(node, ast.Subscript)
+                and isinstance(node.value, ast.Name)
+                and node.value.id == "data"
+                and isinstance(node.slice, ast.Constant)
+                and isinstance(node.slice.value, str)
+            ):
+                required.append(node.slice.value)
+    return tuple(dict.fromkeys(required))
+
+
+def _uses_members(expression: ast.expr) -> bool:
+    return any(
+        isinstance(node, ast.Name) and node.id.startswith("_members_")
+        for node in ast.walk(expression)
+    )
+
+
+def render_model(model: type) -> Optional[Tuple[str, str, List[Tuple[str, str]]]]:
+    """The factory of ``model``'s compiled and lazy loaders.
+
+    Returns:
+        The factory's name, its source, and the dependencies passed to it
+        after the model class; or None if the model keeps its ``from_dict``.
+    """
+    plan = field_plan(model)
+    if plan is None:
+        return None
+    namespace = vars(sys.modules[model.__module__])
+    specializer = Specializer(namespace)
+    fast = {
+        name: specializer.visit(copy.deepcopy(expression))
+        for name, expression in plan.expressions.items()
+    }
+    # Only an enum member map raises where the generated code would not: a
+    # TypeError for an unhashable value, where the enum raises ValueError.
+    # Those fields fall back to the generated expression.
+    fallbacks = {name for name, expression in fast.items() if _uses_members(expression)}
+    used = _globals(
+        [
+            *fast.values(),
+            *(plan.expressions[name] for name in fallbacks),
+            *plan.handlers,
+        ],
+        namespace,
+    )
+    for name in sorted(used - set(specializer.dependencies)):
+        specializer.dependencies[name] = ("value", name)
+
+    order = _constructor_order(plan)
+    if order is not None:
+        arguments = [ast.unparse(fast[name]) for name in order]
+    else:
+        arguments = [f"{name}={ast.unparse(value)}" for name, value in fast.items()]
+    handlers = textwrap.indent(
+        "\n".join(ast.unparse(handler) for handler in plan.handlers), "        "
+    )
+    fallback = ""
+    if fallbacks:
+        fallback = "        except TypeError:\n            return cls.from_dict(data)\n"
+    lines = [
+        f"def {_factory_name(model)}({', '.join(['cls', *specializer.dependencies])}):",
+        "    def from_dict(data):",
+        "        try:",
+        f"            return cls({', '.join(arguments)})",
+        f"{fallback}{handlers}",
+    ]
+    for name, expression in fast.items():
+        lines.append(f"    def field_{name}(data):")
+        if name in fallbacks:
+            original = ast.unparse(plan.expressions[name])
+            lines.append(
+                "        try:\n"
+                "            try:\n"
+                f"                return {ast.unparse(expression)}\n"
+                "            except TypeError:\n"
+                f"                return {original}\n"
+                f"{handlers}"
+            )
+        else:
+            lines.append(
+                f"        try:\n            return {ast.unparse(expression)}\n{handlers}"
+            )
+    fields = ", ".join(f"{name!r}: field_{name}" for name in fast)
+    lines.append(f"    return from_dict, {{{fields}}}")
+    dependencies = list(specializer.dependencies.values())
+    return _factory_name(model), "\n".join(lines) + "\n", dependencies
+
+
+def models() -> List[type]:
+    """Every generated model class, in module order."""
+    import workos
+
+    found: List[type] = []
+    for info in pkgutil.walk_packages(workos.__path__, "workos."):
+        if ".models." not in info.name:
+            continue
+        module = importlib.import_module(info.name)
+        for value in vars(module).values():
+            if (
+                isinstance(value, type)
+                and value.__module__ == module.__name__
+                and "from_dict" in vars(value)
+            ):
+                found.append(value)
+    return sorted(found, key=lambda model: (model.__module__, model.__qualname__))
+
+
+def render() -> str:
+    """The source of ``workos/_model_loaders.py``."""
+    factories: List[str] = []
+    entries: List[str] = []
+    for model in models():
+        rendered = render_model(model)
+        if rendered is None:
+            continue
+        name, source, dependencies = rendered
+        factories.append(source)
+        key = f"{model.__module__}.{model.__qualname__}"
+        required = _required(typing.cast(FieldPlan, field_plan(model)))
+        entries.append(f"    {key!r}: ({name}, {tuple(dependencies)!r}, {required!r}),")
+    registry = (
+        "# Model (module.qualname) -> (factory, dependencies, required keys). Each\n"
+        "# dependency is (kind, name): the value of ``name`` in the model's module,\n"
+        '# its compiled loader ("loader") or its enum member map ("members").\n'
+        "LOADERS: Dict[\n"
+        "    str, Tuple[Callable[..., Any], Tuple[Tuple[str, str], ...], Tuple[str, ...]]\n"
+        "] = {\n" + "\n".join(entries) + "\n}\n"
+    )
+    return "\n\n".join([HEADER, *factories, registry])
+
+
+def _format(source: str) -> str:
+    ruff = shutil.which("ruff")
+    if ruff is None:
+        return source
+    return subprocess.run(
+        [ruff, "format", "--stdin-filename", str(OUTPUT), "-"],
+        input=source,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+
+def is_up_to_date() -> bool:
+    """Whether the committed output matches what this script generates."""
+    current = ast.dump(ast.parse(OUTPUT.read_text()))
+    return current == ast.dump(ast.parse(render()))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--check", action="store_true", help="fail if the output is out of date"
+    )
+    args = parser.parse_args()
+    if args.check:
+        if not is_up_to_date():
+            sys.exit(f"{OUTPUT} is out of date; run {Path(__file__).name}")
+        return
+    OUTPUT.write_text(_format(render()))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,22 +2,136 @@
 
 """WorkOS Python SDK."""
 
-from ._client import AsyncWorkOSClient, WorkOSClient
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Imported first: it replaces the generated model barrels with lazy ones
+# before anything imports ``workos.common``.
+from . import _lazy_models  # noqa: F401
+
+if TYPE_CHECKING:
+    from ._client import AsyncWorkOSClient, WorkOSClient
+else:
+    # Same accessors as the generated clients, importing services on first use.
+    from ._lazy_client import AsyncWorkOSClient, WorkOSClient
 from ._errors import (
     WorkOSError,
     AuthenticationError,
     AuthorizationError,
     BadRequestError,
+    CircuitOpenError,
     ConflictError,
     NotFoundError,
     RateLimitExceededError,
     ServerError,
     UnprocessableEntityError,
 )
-from ._pagination import AsyncPage, ListMetadata, SyncPage
+from ._pagination import (
+    MAX_PAGE_SIZE,
+    AsyncPage,
+    AsyncPageIterator,
+    ListMetadata,
+    SyncPage,
+    SyncPageIterator,
+)
 from .public_client import create_public_client
+from ._transport import TransportConfig, TransportStats
+from ._rate_limit import RateLimit, RateLimiter
+from ._resilience import CircuitBreaker, CircuitState, RetryBudget
 from ._types import NOT_GIVEN, NotGiven, RequestOptions
 
+if TYPE_CHECKING:
+    from ._cache import (
+        CacheBackend as CacheBackend,
+        CacheStats as CacheStats,
+        InMemoryLRUCache as InMemoryLRUCache,
+        ResponseCache as ResponseCache,
+    )
+    from ._cache_invalidation import CacheInvalidator as CacheInvalidator
+    from ._checkpoint import (
+        CheckpointStore as CheckpointStore,
+        FileCheckpoint as FileCheckpoint,
+        MemoryCheckpoint as MemoryCheckpoint,
+        SQLiteCheckpoint as SQLiteCheckpoint,
+    )
+    from ._json import (
+        JSONCodec as JSONCodec,
+        get_json_codec as get_json_codec,
+        set_json_codec as set_json_codec,
+    )
+    from ._lazy import lazy_from_dict as lazy_from_dict
+    from ._refresh import (
+        InMemoryRefreshStore as InMemoryRefreshStore,
+        RefreshCoordinator as RefreshCoordinator,
+        RefreshStats as RefreshStats,
+        RefreshStore as RefreshStore,
+    )
+    from ._session_cache import (
+        SessionCache as SessionCache,
+        SessionCacheStats as SessionCacheStats,
+    )
+
+# Opt-in features are imported on first use, so ``import workos`` does not
+# pay for sqlite3 or the caches when they are not used.
+_MODULES = {
+    "CacheBackend": "._cache",
+    "CacheStats": "._cache",
+    "InMemoryLRUCache": "._cache",
+    "ResponseCache": "._cache",
+    "CacheInvalidator": "._cache_invalidation",
+    "CheckpointStore": "._checkpoint",
+    "FileCheckpoint": "._checkpoint",
+    "MemoryCheckpoint": "._checkpoint",
+    "SQLiteCheckpoint": "._checkpoint",
+    "JSONCodec": "._json",
+    "get_json_codec": "._json",
+    "set_json_codec": "._json",
+    "lazy_from_dict": "._lazy",
+    "InMemoryRefreshStore": "._refresh",
+    "RefreshCoordinator": "._refresh",
+    "RefreshStats": "._refresh",
+    "RefreshStore": "._refresh",
+    "SessionCache": "._session_cache",
+    "SessionCacheStats": "._session_cache",
+}
+
+# Subpackages that ``import workos`` used to load as a side effect of
+# importing every service, so ``workos.sso`` and the like keep working.
+_SUBMODULES = frozenset(
+    {
+        "actions",
+        "admin_portal",
+        "agents",
+        "api_keys",
+        "audit_logs",
+        "authorization",
+        "client_api",
+        "common",
+        "connect",
+        "directory_sync",
+        "events",
+        "feature_flags",
+        "groups",
+        "multi_factor_auth",
+        "organization_domains",
+        "organization_membership",
+        "organizations",
+        "passwordless",
+        "pipes",
+        "pipes_provider",
+        "pkce",
+        "radar",
+        "session",
+        "sso",
+        "user_management",
+        "vault",
+        "webhooks",
+        "widgets",
+    }
+)
+
 __all__ = [
     "WorkOSClient",
     "AsyncWorkOSClient",
@@ -25,6 +139,7 @@ __all__ = [
     "AuthenticationError",
     "AuthorizationError",
     "BadRequestError",
+    "CircuitOpenError",
     "ConflictError",
     "NotFoundError",
     "RateLimitExceededError",
@@ -32,9 +147,54 @@ __all__ = [
     "UnprocessableEntityError",
     "SyncPage",
     "AsyncPage",
+    "SyncPageIterator",
+    "AsyncPageIterator",
     "ListMetadata",
+    "MAX_PAGE_SIZE",
+    "CheckpointStore",
+    "MemoryCheckpoint",
+    "FileCheckpoint",
+    "SQLiteCheckpoint",
     "RequestOptions",
     "NOT_GIVEN",
     "NotGiven",
     "create_public_client",
+    "TransportConfig",
+    "TransportStats",
+    "RateLimit",
+    "RateLimiter",
+    "CircuitBreaker",
+    "CircuitState",
+    "RetryBudget",
+    "ResponseCache",
+    "CacheBackend",
+    "CacheStats",
+    "InMemoryLRUCache",
+    "CacheInvalidator",
+    "SessionCache",
+    "SessionCacheStats",
+    "RefreshCoordinator",
+    "RefreshStore",
+    "InMemoryRefreshStore",
+    "RefreshStats",
+    "JSONCodec",
+    "get_json_codec",
+    "set_json_codec",
+    "lazy_from_dict",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        # Importing a submodule also binds it in globals().
+        return importlib.import_module(f".{name}", __name__)
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_MODULES) | _SUBMODULES)
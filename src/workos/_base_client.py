@@ -2,18 +2,38 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import dataclasses
 import os
 import platform
 import time
 import uuid
 import random
-from datetime import datetime, timezone
-from email.utils import parsedate_to_datetime
-from typing import Any, Dict, Optional, Sequence, Type, cast, overload
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 from urllib.parse import quote
 
 import httpx
 
+from ._coalesce import AsyncRequestCoalescer, RequestCoalescer, coalesce_key
+from . import _json
 from ._errors import (
     APIError,
     WorkOSError,
@@ -25,9 +45,20 @@ from ._errors import (
     STATUS_CODE_TO_ERROR,
     _AUTH_CODE_TO_ERROR,
 )
-from ._pagination import AsyncPage, ListMetadata, SyncPage
+from ._fan_out import DEFAULT_FAN_OUT_CONCURRENCY, afan_out, fan_out
+from ._pagination import MAX_PAGE_SIZE, AsyncPage, ListMetadata, SyncPage
+from ._rate_limit import RateLimiter, parse_retry_after
+from ._resilience import CircuitBreaker, CircuitState, RetryBudget
+from ._streaming import AsyncPageStream, SyncPageStream
+from ._transport import TransportConfig, TransportStats
 from ._types import D, Deserializable, RequestOptions
 
+if TYPE_CHECKING:
+    from ._cache import ResponseCache
+    from ._jwks import AsyncJWKSKeyStore
+    from ._refresh import RefreshCoordinator
+    from ._session_cache import SessionCache
+
 try:
     from importlib.metadata import version as _pkg_version
 
@@ -35,6 +66,8 @@ try:
 except Exception:
     VERSION = "0.0.0"
 
+S = TypeVar("S")
+
 RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
 MAX_RETRIES = 3
 INITIAL_RETRY_DELAY = 1
@@ -42,6 +75,22 @@ MAX_RETRY_DELAY = 30
 RETRY_MULTIPLIER = 2
 
 
+def _raw_item(data: Dict[str, Any]) -> Dict[str, Any]:
+    return data
+
+
+def _projection(fields: Sequence[str]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Build a loader that keeps only ``fields`` of each item (None if absent)."""
+    if isinstance(fields, str):
+        raise TypeError("fields must be a sequence of field names, not a str")
+    keys = tuple(fields)
+
+    def project(data: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: data.get(key) for key in keys}
+
+    return project
+
+
 class _BaseWorkOSClient:
     """Shared WorkOS client implementation."""
 
@@ -55,6 +104,17 @@ class _BaseWorkOSClient:
         jwt_leeway: float = 0.0,
         max_retries: int = MAX_RETRIES,
         is_public: bool = False,
+        transport_config: Optional[TransportConfig] = None,
+        http2: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        response_cache: Optional[ResponseCache] = None,
+        auto_paging_page_size: Optional[int] = None,
+        lazy_models: bool = False,
+        compiled_models: bool = False,
+        session_cache: Optional[SessionCache] = None,
+        refresh_coordinator: Optional[RefreshCoordinator] = None,
     ) -> None:
         self._is_public = is_public
         # Public clients (PKCE / browser / mobile / CLI) must never attach
@@ -82,12 +142,141 @@ class _BaseWorkOSClient:
         )
         self._max_retries = max_retries
         self._jwt_leeway = jwt_leeway
+        self._transport_config = transport_config or TransportConfig()
+        if http2 and not self._transport_config.http2:
+            self._transport_config = dataclasses.replace(
+                self._transport_config, http2=True
+            )
+        self._transport_stats = TransportStats()
+        self._rate_limiter = rate_limiter
+        self._circuit_breaker = circuit_breaker
+        self._retry_budget = retry_budget
+        self._response_cache = response_cache
+        if auto_paging_page_size is not None and not (
+            1 <= auto_paging_page_size <= MAX_PAGE_SIZE
+        ):
+            raise ValueError(
+                f"auto_paging_page_size must be between 1 and {MAX_PAGE_SIZE}"
+            )
+        self._auto_paging_page_size = auto_paging_page_size
+        self._lazy_models = lazy_models
+        self._compiled_models = compiled_models
+        self._session_cache = session_cache
+        self._refresh_coordinator = refresh_coordinator
+        # Per-phase timeouts used when a request does not override ``timeout``.
+        self._timeout: httpx.Timeout = self._transport_config.build_timeout(
+            float(self._request_timeout)
+        )
 
     @property
     def base_url(self) -> str:
         """The base URL for API requests."""
         return self._base_url
 
+    @property
+    def transport_config(self) -> TransportConfig:
+        """The connection pool and timeout configuration for this client."""
+        return self._transport_config
+
+    @property
+    def transport_stats(self) -> TransportStats:
+        """Connection pool wait statistics for requests made by this client."""
+        return self._transport_stats
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """The client-side rate limiter, if one is configured."""
+        return self._rate_limiter
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """The circuit breaker guarding this client, if one is configured."""
+        return self._circuit_breaker
+
+    @property
+    def retry_budget(self) -> Optional[RetryBudget]:
+        """The retry budget shared by this client's requests, if configured."""
+        return self._retry_budget
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        """The response cache for GET requests, if one is configured."""
+        return self._response_cache
+
+    @property
+    def session_cache(self) -> Optional[SessionCache]:
+        """The verified session cookie cache, if one is configured."""
+        return self._session_cache
+
+    @property
+    def refresh_coordinator(self) -> Optional[RefreshCoordinator]:
+        """The single-flight session refresh coordinator, if one is configured."""
+        return self._refresh_coordinator
+
+    @property
+    def auto_paging_page_size(self) -> Optional[int]:
+        """The ``limit`` used for pages fetched by auto-pagination, if raised."""
+        return self._auto_paging_page_size
+
+    def _next_page_params(
+        self, params: Optional[Dict[str, Any]], after: Optional[str]
+    ) -> Dict[str, Any]:
+        """Query parameters for the page after ``after`` in an auto-paging walk."""
+        next_params = {**(params or {}), "after": after}
+        size = self._auto_paging_page_size
+        if size is not None and (next_params.get("limit") or 0) < size:
+            next_params["limit"] = size
+        return next_params
+
+    @property
+    def lazy_models(self) -> bool:
+        """Whether responses are deserialized into lazy models by default."""
+        return self._lazy_models
+
+    def _use_lazy_models(self, request_options: Optional[RequestOptions]) -> bool:
+        if request_options:
+            lazy = request_options.get("lazy")
+            if lazy is not None:
+                return lazy
+        return self._lazy_models
+
+    @property
+    def compiled_models(self) -> bool:
+        """Whether responses are deserialized with compiled loaders."""
+        return self._compiled_models
+
+    def _loader(
+        self, model: Type[D], request_options: Optional[RequestOptions]
+    ) -> Callable[[Dict[str, Any]], D]:
+        """The lazy, compiled or generated ``from_dict`` for ``model``."""
+        if self._use_lazy_models(request_options):
+            from ._lazy import lazy_loader
+
+            return lazy_loader(model)
+        if self._compiled_models:
+            from ._compiled import compiled_loader
+
+            return compiled_loader(model)
+        return model.from_dict
+
+    def _model_loader(
+        self, model: Type[D], request_options: Optional[RequestOptions]
+    ) -> Callable[[Dict[str, Any]], D]:
+        """How list items are built from their JSON objects.
+
+        ``model.from_dict`` by default, or its lazy or compiled counterpart
+        when lazy or compiled models are on. ``RequestOptions(raw=True)``
+        returns the dicts as they are, and ``RequestOptions(fields=...)`` returns dicts with only those
+        keys; neither calls ``from_dict``.
+        """
+        if request_options:
+            fields = request_options.get("fields")
+            if fields is not None:
+                return cast(Callable[[Dict[str, Any]], D], _projection(fields))
+            if request_options.get("raw"):
+                return cast(Callable[[Dict[str, Any]], D], _raw_item)
+        return self._loader(model, request_options)
+
     def build_url(
         self, path: Sequence[str], params: Optional[Dict[str, Any]] = None
     ) -> str:
@@ -103,22 +292,7 @@ class _BaseWorkOSClient:
     @staticmethod
     def _parse_retry_after(retry_after: Optional[str]) -> Optional[float]:
         """Parse Retry-After as seconds or an HTTP-date."""
-        if not retry_after:
-            return None
-        value = retry_after.strip()
-        if not value:
-            return None
-        try:
-            return max(float(value), 0.0)
-        except ValueError:
-            pass
-        try:
-            retry_at = parsedate_to_datetime(value)
-        except (TypeError, ValueError, IndexError, OverflowError):
-            return None
-        if retry_at.tzinfo is None:
-            retry_at = retry_at.replace(tzinfo=timezone.utc)
-        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+        return parse_retry_after(retry_after)
 
     @staticmethod
     def _calculate_retry_delay(
@@ -159,13 +333,110 @@ class _BaseWorkOSClient:
             )
         return "/".join(quote(str(seg), safe="") for seg in path)
 
-    def _resolve_timeout(self, request_options: Optional[RequestOptions]) -> float:
-        timeout = self._request_timeout
+    def _resolve_timeout(
+        self, request_options: Optional[RequestOptions]
+    ) -> httpx.Timeout:
         if request_options:
             t = request_options.get("timeout")
             if isinstance(t, (int, float)):
-                timeout = float(t)
-        return timeout
+                return httpx.Timeout(float(t))
+        return self._timeout
+
+    def _rate_limit_delay(self, path: str) -> float:
+        """Seconds to wait before sending a request to ``path``."""
+        if self._rate_limiter is None:
+            return 0.0
+        return self._rate_limiter.reserve(path)
+
+    def _observe_rate_limit(self, response: httpx.Response) -> bool:
+        """Feed rate-limit headers to the limiter.
+
+        Returns True when the limiter paused all callers, in which case the
+        next ``_rate_limit_delay`` already covers the server's back-off.
+        """
+        if self._rate_limiter is None:
+            return False
+        return self._rate_limiter.observe(response.status_code, response.headers) > 0
+
+    def _cache_lookup(
+        self,
+        method: str,
+        encoded_path: str,
+        params: Optional[Dict[str, Any]],
+        base_url: str,
+        request_options: Optional[RequestOptions],
+    ) -> Tuple[Optional[str], Optional[bytes], int]:
+        """Look up a GET in the response cache.
+
+        Returns the cache key (``None`` if the request is not cacheable), the
+        cached body if there is one, and the cache generation to pass to
+        ``_cache_store``. Requests with ``extra_headers`` are not cacheable:
+        the key does not cover headers, and some of them carry per-user
+        credentials such as the access token of ``sso.get_profile``.
+        """
+        cache = self._response_cache
+        if cache is None or method.upper() != "GET":
+            return None, None, 0
+        if request_options and request_options.get("extra_headers"):
+            return None, None, 0
+        key = cache.key(encoded_path, params, cache.namespace(self._api_key, base_url))
+        if request_options and request_options.get("cache") is False:
+            return key, None, cache.generation
+        content, generation = cache.lookup(key)
+        return key, content, generation
+
+    def _cache_store(
+        self,
+        cache_key: Optional[str],
+        encoded_path: str,
+        response: httpx.Response,
+        generation: int,
+    ) -> None:
+        if cache_key is None or self._response_cache is None:
+            return
+        if response.status_code == 200 and response.content:
+            self._response_cache.store(
+                cache_key, encoded_path, response.content, generation
+            )
+
+    def _invalidate_cache(self, method: str, encoded_path: str) -> None:
+        """Drop cached responses a write to ``encoded_path`` may have changed."""
+        if self._response_cache is not None and method.upper() != "GET":
+            self._response_cache.invalidate(encoded_path)
+
+    def _start_request(self) -> None:
+        """Count a new logical request against the retry budget."""
+        if self._retry_budget is not None:
+            self._retry_budget.record_request()
+
+    def _before_attempt(self) -> None:
+        """Raise ``CircuitOpenError`` instead of attempting a request."""
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.before_request()
+
+    def _record_attempt(self, failed: bool) -> None:
+        """Report the outcome of an attempt to the circuit breaker."""
+        if self._circuit_breaker is None:
+            return
+        if failed:
+            self._circuit_breaker.record_failure()
+        else:
+            self._circuit_breaker.record_success()
+
+    def _can_retry(self, attempt: int, max_retries: int) -> bool:
+        """Whether a failed attempt may be retried.
+
+        Retries stop early when the circuit has opened or the retry budget is
+        spent; the caller then surfaces the error of the last attempt.
+        """
+        if attempt >= max_retries:
+            return False
+        if (
+            self._circuit_breaker is not None
+            and self._circuit_breaker.state is CircuitState.OPEN
+        ):
+            return False
+        return self._retry_budget is None or self._retry_budget.try_acquire_retry()
 
     def _resolve_max_retries(self, request_options: Optional[RequestOptions]) -> int:
         if request_options:
@@ -218,17 +489,25 @@ class _BaseWorkOSClient:
         return headers
 
     def _deserialize_response(
-        self, response: httpx.Response, model: Optional[Type[Deserializable]]
+        self,
+        response: httpx.Response,
+        load: Optional[Callable[[Dict[str, Any]], Any]],
     ) -> Any:
         if response.status_code == 204 or not response.content:
             return None
+        return self._deserialize_content(response.content, load)
+
+    @staticmethod
+    def _deserialize_content(
+        content: bytes, load: Optional[Callable[[Dict[str, Any]], Any]]
+    ) -> Any:
         try:
-            data = response.json()
+            data = _json.loads(content)
         except Exception:
             return None
-        if model is not None:
-            return model.from_dict(cast(Dict[str, Any], data))
-        return data
+        if load is None:
+            return data
+        return load(cast(Dict[str, Any], data))
 
     @staticmethod
     def _raise_error(response: httpx.Response) -> None:
@@ -240,7 +519,7 @@ class _BaseWorkOSClient:
         request_method = request.method if request is not None else None
         response_json: Optional[Dict[str, Any]] = None
         try:
-            response_json = cast(Dict[str, Any], response.json())
+            response_json = cast(Dict[str, Any], _json.loads(response.content))
             message: str = str(response_json.get("message", response.text))
             error = cast(Optional[str], response_json.get("error"))
             errors = response_json.get("errors")
@@ -364,6 +643,18 @@ class WorkOSClient(_BaseWorkOSClient):
         jwt_leeway: float = 0.0,
         max_retries: int = MAX_RETRIES,
         is_public: bool = False,
+        transport_config: Optional[TransportConfig] = None,
+        http2: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        coalesce_requests: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        auto_paging_page_size: Optional[int] = None,
+        lazy_models: bool = False,
+        compiled_models: bool = False,
+        session_cache: Optional[SessionCache] = None,
+        refresh_coordinator: Optional[RefreshCoordinator] = None,
     ) -> None:
         """Initialize the WorkOS client.
 
@@ -378,9 +669,45 @@ class WorkOSClient(_BaseWorkOSClient):
                 / mobile / CLI). The API key is forced to None and the
                 ``WORKOS_API_KEY`` environment variable is ignored. Use
                 ``create_public_client`` instead of setting this directly.
+            transport_config: Connection pool limits, per-phase timeouts, and an
+                optional injected ``httpx.Client`` or transport.
+            http2: When True, negotiate HTTP/2 so concurrent requests share
+                one connection. Same as ``TransportConfig(http2=True)``.
+                Requires the ``h2`` package: ``pip install "workos[http2]"``.
+            rate_limiter: Proactive token-bucket limiter applied before every
+                request. Share one instance across clients and threads to
+                enforce a process-wide budget.
+            circuit_breaker: Fails requests fast with ``CircuitOpenError``
+                after repeated 5xx responses, connection errors or timeouts,
+                and probes for recovery after a cool-down.
+            retry_budget: Caps retries to a share of recent requests so an
+                outage does not multiply traffic by ``max_retries``.
+            coalesce_requests: When True, identical GET requests that are in
+                flight at the same time share a single HTTP round trip.
+            response_cache: Serves repeated GET requests from a TTL cache and
+                invalidates affected entries on writes through this client.
+            auto_paging_page_size: ``limit`` for the follow-up pages that
+                auto-pagination fetches, e.g. ``MAX_PAGE_SIZE`` to walk a list
+                in as few requests as possible. The first page keeps the
+                caller's ``limit``, and larger caller limits are kept.
+            lazy_models: When True, response models keep the raw JSON and
+                convert each field on first access. Override per call with
+                ``RequestOptions(lazy=...)``.
+            compiled_models: When True, response models are built by loaders
+                compiled at runtime from each model's ``from_dict``, which is
+                about twice as fast for large responses. Off by default, so
+                models are built by the generated ``from_dict``.
+            session_cache: Caches verified sealed session cookies so that
+                authenticating the same cookie again skips decryption and
+                signature verification until its access token expires.
+            refresh_coordinator: Runs concurrent ``Session.refresh`` calls
+                for the same refresh token once and hands every caller the
+                same sealed session. Share one instance across clients for a
+                process-wide view, or give it a shared ``RefreshStore``.
 
         Raises:
             ValueError: If neither api_key nor client_id is provided, directly or via environment variables.
+            ConfigurationError: If HTTP/2 is requested and ``h2`` is not installed.
         """
         super().__init__(
             api_key=api_key,
@@ -390,14 +717,39 @@ class WorkOSClient(_BaseWorkOSClient):
             jwt_leeway=jwt_leeway,
             max_retries=max_retries,
             is_public=is_public,
+            transport_config=transport_config,
+            http2=http2,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            retry_budget=retry_budget,
+            response_cache=response_cache,
+            auto_paging_page_size=auto_paging_page_size,
+            lazy_models=lazy_models,
+            compiled_models=compiled_models,
+            session_cache=session_cache,
+            refresh_coordinator=refresh_coordinator,
         )
-        self._client = httpx.Client(
-            timeout=self._request_timeout, follow_redirects=True
+        self._client = self._transport_config.build_sync_client(
+            float(self._request_timeout)
         )
+        if self._transport_config.http_client is not None:
+            self._timeout = self._client.timeout
+        self._coalescer: Optional[RequestCoalescer] = (
+            RequestCoalescer() if coalesce_requests else None
+        )
+
+    @property
+    def coalescer(self) -> Optional[RequestCoalescer]:
+        """The single-flight coalescer for GETs, if ``coalesce_requests`` is on."""
+        return self._coalescer
 
     def close(self) -> None:
-        """Close the underlying HTTP client and release resources."""
-        self._client.close()
+        """Close the underlying HTTP client and release resources.
+
+        An ``http_client`` injected through ``transport_config`` is left open.
+        """
+        if self._transport_config.http_client is None:
+            self._client.close()
 
     def __enter__(self) -> "WorkOSClient":
         return self
@@ -405,6 +757,44 @@ class WorkOSClient(_BaseWorkOSClient):
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         self.close()
 
+    def fan_out(
+        self,
+        scopes: Iterable[S],
+        list_page: Callable[[S], SyncPage[D]],
+        *,
+        concurrency: int = DEFAULT_FAN_OUT_CONCURRENCY,
+    ) -> Generator[Tuple[S, D], None, None]:
+        """Run ``list_page`` for every scope concurrently and merge the items.
+
+        For example, every membership of every organization::
+
+            for organization, membership in client.fan_out(
+                client.organizations.list_organizations(),
+                lambda organization: client.organization_membership.list_organization_memberships(
+                    organization_id=organization.id
+                ),
+            ):
+                ...
+
+        Each inner list is walked across all its pages in one of
+        ``concurrency`` worker threads, and the requests go through this
+        client, so its rate limiter, retries and circuit breaker apply.
+        Items of one scope keep their order; different scopes interleave.
+
+        Args:
+            scopes: The outer values, read lazily; may be a paginated list.
+            list_page: Returns the first page of the inner list for a scope.
+            concurrency: How many inner lists are paginated at once. Keep it
+                within the connection pool's ``max_connections``.
+
+        Returns:
+            An iterator of ``(scope, item)`` pairs. Closing it stops the workers.
+
+        Raises:
+            ValueError: If ``concurrency`` is less than 1.
+        """
+        return fan_out(scopes, list_page, concurrency=concurrency)
+
     @overload
     def request(
         self,
@@ -443,45 +833,117 @@ class WorkOSClient(_BaseWorkOSClient):
         request_options: Optional[RequestOptions] = None,
     ) -> Any:
         """Make an HTTP request with retry logic."""
-        url = f"{self._resolve_base_url(request_options)}/{self._encode_path(path)}"
+        encoded_path = self._encode_path(path)
+        base_url = self._resolve_base_url(request_options)
+        url = f"{base_url}/{encoded_path}"
         headers = self._build_headers(method, idempotency_key, request_options)
         timeout = self._resolve_timeout(request_options)
         max_retries = self._resolve_max_retries(request_options)
+        cache_key, cached, generation = self._cache_lookup(
+            method, encoded_path, params, base_url, request_options
+        )
+        load = None if model is None else self._loader(model, request_options)
+        if cached is not None:
+            return self._deserialize_content(cached, load)
+
+        def send() -> httpx.Response:
+            return self._send(
+                method,
+                url,
+                encoded_path,
+                params=params,
+                body=body,
+                headers=headers,
+                timeout=timeout,
+                max_retries=max_retries,
+            )
+
+        try:
+            if self._coalescer is not None and method.upper() == "GET":
+                # Identical in-flight GETs share one HTTP round trip.
+                response = self._coalescer.run(coalesce_key(url, params, headers), send)
+            else:
+                response = send()
+        finally:
+            self._invalidate_cache(method, encoded_path)
+        self._cache_store(cache_key, encoded_path, response, generation)
+        return self._deserialize_response(response, load)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        encoded_path: str,
+        *,
+        params: Optional[Dict[str, Any]],
+        body: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        timeout: httpx.Timeout,
+        max_retries: int,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Send a request, retrying as configured, and return the successful response.
+
+        With ``stream=True`` the successful response is returned before its
+        body is read, and the caller must close it.
+        """
         last_error: Optional[Exception] = None
+        # Encoded once; every retry sends the same bytes.
+        content = _json.dumps(body) if body is not None else None
+        self._start_request()
         for attempt in range(max_retries + 1):
+            self._before_attempt()
+            rate_limit_delay = self._rate_limit_delay(encoded_path)
+            if rate_limit_delay > 0:
+                time.sleep(rate_limit_delay)
             try:
-                response = self._client.request(
+                request = self._client.build_request(
                     method=method.upper(),
                     url=url,
                     params=params,
-                    json=body if body is not None else None,
+                    content=content,
                     headers=headers,
                     timeout=timeout,
+                    extensions={"trace": self._transport_stats.sync_trace()},
                 )
-                if response.status_code in RETRY_STATUS_CODES and attempt < max_retries:
-                    delay = self._calculate_retry_delay(
-                        attempt, response.headers.get("Retry-After")
-                    )
-                    time.sleep(delay)
+                response = self._client.send(request, stream=stream)
+                self._transport_stats.record_response(response)
+                self._record_attempt(response.status_code >= 500)
+                paused = self._observe_rate_limit(response)
+                if response.status_code in RETRY_STATUS_CODES and self._can_retry(
+                    attempt, max_retries
+                ):
+                    if stream:
+                        response.close()
+                    if not paused:
+                        delay = self._calculate_retry_delay(
+                            attempt, response.headers.get("Retry-After")
+                        )
+                        time.sleep(delay)
                     continue
                 if response.status_code >= 400:
+                    if stream:
+                        response.read()
                     self._raise_error(response)
-                return self._deserialize_response(response, model)
+                return response
             except httpx.TimeoutException as e:
                 last_error = e
-                if attempt < max_retries:
+                self._record_attempt(True)
+                if self._can_retry(attempt, max_retries):
                     time.sleep(self._calculate_retry_delay(attempt))
                     continue
                 raise WorkOSTimeoutError(f"Request timed out: {e}") from e
             except httpx.ConnectError as e:
                 last_error = e
-                if attempt < max_retries:
+                self._record_attempt(True)
+                if self._can_retry(attempt, max_retries):
                     time.sleep(self._calculate_retry_delay(attempt))
                     continue
                 raise WorkOSConnectionError(f"Connection failed: {e}") from e
             except httpx.HTTPError as e:
                 last_error = e
-                if attempt < max_retries:
+                self._record_attempt(True)
+                if self._can_retry(attempt, max_retries):
                     time.sleep(self._calculate_retry_delay(attempt))
                     continue
                 raise WorkOSError(f"Network error: {e}") from e
@@ -541,6 +1003,32 @@ class WorkOSClient(_BaseWorkOSClient):
             )
         return result
 
+    def _open_stream(
+        self,
+        method: str,
+        path: Sequence[str],
+        params: Optional[Dict[str, Any]],
+        body: Optional[Dict[str, Any]],
+        request_options: RequestOptions,
+    ) -> httpx.Response:
+        """Send a request and return the response with its body still unread.
+
+        Streamed responses bypass the response cache and request coalescing.
+        """
+        encoded_path = self._encode_path(path)
+        base_url = self._resolve_base_url(request_options)
+        return self._send(
+            method,
+            f"{base_url}/{encoded_path}",
+            encoded_path,
+            params=params,
+            body=body,
+            headers=self._build_headers(method, None, request_options),
+            timeout=self._resolve_timeout(request_options),
+            max_retries=self._resolve_max_retries(request_options),
+            stream=True,
+        )
+
     def request_page(
         self,
         method: str,
@@ -551,7 +1039,38 @@ class WorkOSClient(_BaseWorkOSClient):
         body: Optional[Dict[str, Any]] = None,
         request_options: Optional[RequestOptions] = None,
     ) -> SyncPage[D]:
-        """Make an HTTP request that returns a paginated response."""
+        """Make an HTTP request that returns a paginated response.
+
+        With ``RequestOptions(stream=True)`` the page holds a
+        :class:`~workos._streaming.SyncPageStream` that parses items as the
+        body arrives. With ``RequestOptions(raw=True)`` or
+        ``RequestOptions(fields=...)`` its items are plain dicts.
+
+        Raises:
+            TypeError: If ``fields`` is a str rather than a sequence of names.
+        """
+
+        def _fetch(*, after: Optional[str] = None) -> SyncPage[D]:
+            next_params = self._next_page_params(params, after)
+            return self.request_page(
+                method=method,
+                path=path,
+                model=model,
+                params=next_params,
+                body=body,
+                request_options=request_options,
+            )
+
+        load = self._model_loader(model, request_options)
+        if request_options and request_options.get("stream"):
+            response = self._open_stream(method, path, params, body, request_options)
+            return SyncPage(
+                data=[],
+                list_metadata=ListMetadata(),
+                _fetch_page=_fetch,
+                _stream=SyncPageStream(response, load),
+            )
+
         raw = self.request(
             method=method,
             path=path,
@@ -561,24 +1080,11 @@ class WorkOSClient(_BaseWorkOSClient):
         )
         data: Dict[str, Any] = raw if isinstance(raw, dict) else {}
         raw_items: list[Any] = cast(list[Any], data.get("data") or [])
-        items: list[D] = [
-            cast(D, model.from_dict(cast(Dict[str, Any], item))) for item in raw_items
-        ]
+        items: list[D] = [load(cast(Dict[str, Any], item)) for item in raw_items]
         list_metadata = ListMetadata.from_dict(
             cast(Dict[str, Any], data.get("list_metadata", {}))
         )
 
-        def _fetch(*, after: Optional[str] = None) -> SyncPage[D]:
-            next_params = {**(params or {}), "after": after}
-            return self.request_page(
-                method=method,
-                path=path,
-                model=model,
-                params=next_params,
-                body=body,
-                request_options=request_options,
-            )
-
         return SyncPage(data=items, list_metadata=list_metadata, _fetch_page=_fetch)
 
 
@@ -595,6 +1101,19 @@ class AsyncWorkOSClient(_BaseWorkOSClient):
         jwt_leeway: float = 0.0,
         max_retries: int = MAX_RETRIES,
         is_public: bool = False,
+        transport_config: Optional[TransportConfig] = None,
+        http2: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        coalesce_requests: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        auto_paging_page_size: Optional[int] = None,
+        lazy_models: bool = False,
+        compiled_models: bool = False,
+        session_cache: Optional[SessionCache] = None,
+        refresh_coordinator: Optional[RefreshCoordinator] = None,
+        prewarm_jwks: bool = False,
     ) -> None:
         """Initialize the async WorkOS client.
 
@@ -605,9 +1124,49 @@ class AsyncWorkOSClient(_BaseWorkOSClient):
             request_timeout: HTTP request timeout in seconds. Falls back to WORKOS_REQUEST_TIMEOUT or 60.
             jwt_leeway: JWT clock skew leeway in seconds.
             max_retries: Maximum number of retries for failed requests. Defaults to 3.
+            transport_config: Connection pool limits, per-phase timeouts, and an
+                optional injected ``httpx.AsyncClient`` or transport.
+            http2: When True, negotiate HTTP/2 so concurrent requests share
+                one connection. Same as ``TransportConfig(http2=True)``.
+                Requires the ``h2`` package: ``pip install "workos[http2]"``.
+            rate_limiter: Proactive token-bucket limiter applied before every
+                request. Waiting uses ``asyncio.sleep``, so it never blocks
+                the event loop.
+            circuit_breaker: Fails requests fast with ``CircuitOpenError``
+                after repeated 5xx responses, connection errors or timeouts,
+                and probes for recovery after a cool-down.
+            retry_budget: Caps retries to a share of recent requests so an
+                outage does not multiply traffic by ``max_retries``.
+            coalesce_requests: When True, identical GET requests that are in
+                flight at the same time share a single HTTP round trip.
+            response_cache: Serves repeated GET requests from a TTL cache and
+                invalidates affected entries on writes through this client.
+            auto_paging_page_size: ``limit`` for the follow-up pages that
+                auto-pagination fetches, e.g. ``MAX_PAGE_SIZE`` to walk a list
+                in as few requests as possible. The first page keeps the
+                caller's ``limit``, and larger caller limits are kept.
+            lazy_models: When True, response models keep the raw JSON and
+                convert each field on first access. Override per call with
+                ``RequestOptions(lazy=...)``.
+            compiled_models: When True, response models are built by loaders
+                compiled at runtime from each model's ``from_dict``, which is
+                about twice as fast for large responses. Off by default, so
+                models are built by the generated ``from_dict``.
+            session_cache: Caches verified sealed session cookies so that
+                authenticating the same cookie again skips decryption and
+                signature verification until its access token expires.
+            refresh_coordinator: Runs concurrent ``Session.refresh`` calls
+                for the same refresh token once and hands every caller the
+                same sealed session. Share one instance across clients for a
+                process-wide view, or give it a shared ``RefreshStore``.
+            prewarm_jwks: When True, fetch the session signing keys
+                (:attr:`jwks`) in the background as soon as the client is
+                created inside a running event loop, or entered with
+                ``async with``, so the first ``AsyncSession`` does not wait.
 
         Raises:
             ValueError: If neither api_key nor client_id is provided, directly or via environment variables.
+            ConfigurationError: If HTTP/2 is requested and ``h2`` is not installed.
         """
         super().__init__(
             api_key=api_key,
@@ -617,21 +1176,131 @@ class AsyncWorkOSClient(_BaseWorkOSClient):
             jwt_leeway=jwt_leeway,
             max_retries=max_retries,
             is_public=is_public,
+            transport_config=transport_config,
+            http2=http2,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            retry_budget=retry_budget,
+            response_cache=response_cache,
+            auto_paging_page_size=auto_paging_page_size,
+            lazy_models=lazy_models,
+            compiled_models=compiled_models,
+            session_cache=session_cache,
+            refresh_coordinator=refresh_coordinator,
+        )
+        self._client = self._transport_config.build_async_client(
+            float(self._request_timeout)
         )
-        self._client = httpx.AsyncClient(
-            timeout=self._request_timeout, follow_redirects=True
+        if self._transport_config.http_client is not None:
+            self._timeout = self._client.timeout
+        self._coalescer: Optional[AsyncRequestCoalescer] = (
+            AsyncRequestCoalescer() if coalesce_requests else None
         )
+        self._jwks: Optional[AsyncJWKSKeyStore] = None
+        self._prewarm_jwks = prewarm_jwks
+        self._prewarm_task: Optional[asyncio.Task[None]] = None
+        if prewarm_jwks:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                pass  # No loop yet; ``async with`` starts the prewarm.
+            else:
+                self._start_jwks_prewarm()
+
+    @property
+    def coalescer(self) -> Optional[AsyncRequestCoalescer]:
+        """The single-flight coalescer for GETs, if ``coalesce_requests`` is on."""
+        return self._coalescer
+
+    @property
+    def jwks(self) -> AsyncJWKSKeyStore:
+        """Signing keys for this client's access tokens, used by ``AsyncSession``.
+
+        Keys are fetched through this client's connection pool without
+        blocking the event loop. Await ``client.jwks.refresh()`` at startup
+        to warm the store, or pass ``prewarm_jwks=True``.
+
+        Raises:
+            ConfigurationError: If the client has no client ID.
+        """
+        if self._jwks is None:
+            from ._jwks import AsyncJWKSKeyStore
+
+            url = f"{self.base_url}sso/jwks/{self._require_client_id()}"
+
+            async def fetch() -> Dict[str, Any]:
+                response = await self._client.get(url)
+                response.raise_for_status()
+                return cast(Dict[str, Any], _json.loads(response.content))
+
+            self._jwks = AsyncJWKSKeyStore(url, fetch=fetch)
+        return self._jwks
+
+    def _start_jwks_prewarm(self) -> None:
+        if self._prewarm_task is not None or not self.client_id:
+            return
+
+        async def prewarm() -> None:
+            # Failures are counted in ``jwks.stats()``; sessions fetch again.
+            with contextlib.suppress(Exception):
+                await self.jwks.refresh()
+
+        self._prewarm_task = asyncio.ensure_future(prewarm())
 
     async def close(self) -> None:
-        """Close the underlying HTTP client and release resources."""
-        await self._client.aclose()
+        """Close the underlying HTTP client and release resources.
+
+        An ``http_client`` injected through ``transport_config`` is left open.
+        """
+        if self._prewarm_task is not None:
+            self._prewarm_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._prewarm_task
+        if self._jwks is not None:
+            await self._jwks.close()
+        if self._transport_config.http_client is None:
+            await self._client.aclose()
 
     async def __aenter__(self) -> "AsyncWorkOSClient":
+        if self._prewarm_jwks:
+            self._start_jwks_prewarm()
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         await self.close()
 
+    def fan_out(
+        self,
+        scopes: Union[Iterable[S], AsyncIterable[S]],
+        list_page: Callable[[S], Awaitable[AsyncPage[D]]],
+        *,
+        concurrency: int = DEFAULT_FAN_OUT_CONCURRENCY,
+    ) -> AsyncGenerator[Tuple[S, D], None]:
+        """Run ``list_page`` for every scope concurrently and merge the items.
+
+        Like :meth:`WorkOSClient.fan_out`, with ``concurrency`` tasks sharing
+        this client's connection pool. ``scopes`` may also be an async
+        iterable such as an :class:`AsyncPage`::
+
+            organizations = await client.organizations.list_organizations()
+            async for organization, membership in client.fan_out(
+                organizations,
+                lambda organization: client.organization_membership.list_organization_memberships(
+                    organization_id=organization.id
+                ),
+            ):
+                ...
+
+        Returns:
+            An async iterator of ``(scope, item)`` pairs. Wrap it in
+            ``contextlib.aclosing`` when stopping early so the tasks are
+            cancelled promptly.
+
+        Raises:
+            ValueError: If ``concurrency`` is less than 1.
+        """
+        return afan_out(scopes, list_page, concurrency=concurrency)
+
     @overload
     async def request(
         self,
@@ -670,45 +1339,119 @@ class AsyncWorkOSClient(_BaseWorkOSClient):
         request_options: Optional[RequestOptions] = None,
     ) -> Any:
         """Make an async HTTP request with retry logic."""
-        url = f"{self._resolve_base_url(request_options)}/{self._encode_path(path)}"
+        encoded_path = self._encode_path(path)
+        base_url = self._resolve_base_url(request_options)
+        url = f"{base_url}/{encoded_path}"
         headers = self._build_headers(method, idempotency_key, request_options)
         timeout = self._resolve_timeout(request_options)
         max_retries = self._resolve_max_retries(request_options)
+        cache_key, cached, generation = self._cache_lookup(
+            method, encoded_path, params, base_url, request_options
+        )
+        load = None if model is None else self._loader(model, request_options)
+        if cached is not None:
+            return self._deserialize_content(cached, load)
+
+        def send() -> Awaitable[httpx.Response]:
+            return self._send(
+                method,
+                url,
+                encoded_path,
+                params=params,
+                body=body,
+                headers=headers,
+                timeout=timeout,
+                max_retries=max_retries,
+            )
+
+        try:
+            if self._coalescer is not None and method.upper() == "GET":
+                # Identical in-flight GETs share one HTTP round trip.
+                response = await self._coalescer.run(
+                    coalesce_key(url, params, headers), send
+                )
+            else:
+                response = await send()
+        finally:
+            self._invalidate_cache(method, encoded_path)
+        self._cache_store(cache_key, encoded_path, response, generation)
+        return self._deserialize_response(response, load)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        encoded_path: str,
+        *,
+        params: Optional[Dict[str, Any]],
+        body: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        timeout: httpx.Timeout,
+        max_retries: int,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Send a request, retrying as configured, and return the successful response.
+
+        With ``stream=True`` the successful response is returned before its
+        body is read, and the caller must close it.
+        """
         last_error: Optional[Exception] = None
+        # Encoded once; every retry sends the same bytes.
+        content = _json.dumps(body) if body is not None else None
+        self._start_request()
         for attempt in range(max_retries + 1):
+            self._before_attempt()
+            rate_limit_delay = self._rate_limit_delay(encoded_path)
+            if rate_limit_delay > 0:
+                await asyncio.sleep(rate_limit_delay)
             try:
-                response = await self._client.request(
+                request = self._client.build_request(
                     method=method.upper(),
                     url=url,
                     params=params,
-                    json=body if body is not None else None,
+                    content=content,
                     headers=headers,
                     timeout=timeout,
+                    extensions={"trace": self._transport_stats.async_trace()},
                 )
-                if response.status_code in RETRY_STATUS_CODES and attempt < max_retries:
-                    delay = self._calculate_retry_delay(
-                        attempt, response.headers.get("Retry-After")
-                    )
-                    await asyncio.sleep(delay)
+                response = await self._client.send(request, stream=stream)
+                self._transport_stats.record_response(response)
+                self._record_attempt(response.status_code >= 500)
+                paused = self._observe_rate_limit(response)
+                if response.status_code in RETRY_STATUS_CODES and self._can_retry(
+                    attempt, max_retries
+                ):
+                    if stream:
+                        await response.aclose()
+                    if not paused:
+                        delay = self._calculate_retry_delay(
+                            attempt, response.headers.get("Retry-After")
+                        )
+                        await asyncio.sleep(delay)
                     continue
                 if response.status_code >= 400:
+                    if stream:
+                        await response.aread()
                     self._raise_error(response)
-                return self._deserialize_response(response, model)
+                return response
             except httpx.TimeoutException as e:
                 last_error = e
-                if attempt < max_retries:
+                self._record_attempt(True)
+                if self._can_retry(attempt, max_retries):
                     await asyncio.sleep(self._calculate_retry_delay(attempt))
                     continue
                 raise WorkOSTimeoutError(f"Request timed out: {e}") from e
             except httpx.ConnectError as e:
                 last_error = e
-                if attempt < max_retries:
+                self._record_attempt(True)
+                if self._can_retry(attempt, max_retries):
                     await asyncio.sleep(self._calculate_retry_delay(attempt))
                     continue
                 raise WorkOSConnectionError(f"Connection failed: {e}") from e
             except httpx.HTTPError as e:
                 last_error = e
-                if attempt < max_retries:
+                self._record_attempt(True)
+                if self._can_retry(attempt, max_retries):
                     await asyncio.sleep(self._calculate_retry_delay(attempt))
                     continue
                 raise WorkOSError(f"Network error: {e}") from e
@@ -768,6 +1511,32 @@ class AsyncWorkOSClient(_BaseWorkOSClient):
             )
         return result
 
+    async def _open_stream(
+        self,
+        method: str,
+        path: Sequence[str],
+        params: Optional[Dict[str, Any]],
+        body: Optional[Dict[str, Any]],
+        request_options: RequestOptions,
+    ) -> httpx.Response:
+        """Send a request and return the response with its body still unread.
+
+        Streamed responses bypass the response cache and request coalescing.
+        """
+        encoded_path = self._encode_path(path)
+        base_url = self._resolve_base_url(request_options)
+        return await self._send(
+            method,
+            f"{base_url}/{encoded_path}",
+            encoded_path,
+            params=params,
+            body=body,
+            headers=self._build_headers(method, None, request_options),
+            timeout=self._resolve_timeout(request_options),
+            max_retries=self._resolve_max_retries(request_options),
+            stream=True,
+        )
+
     async def request_page(
         self,
         method: str,
@@ -778,7 +1547,40 @@ class AsyncWorkOSClient(_BaseWorkOSClient):
         body: Optional[Dict[str, Any]] = None,
         request_options: Optional[RequestOptions] = None,
     ) -> AsyncPage[D]:
-        """Make an async HTTP request that returns a paginated response."""
+        """Make an async HTTP request that returns a paginated response.
+
+        With ``RequestOptions(stream=True)`` the page holds an
+        :class:`~workos._streaming.AsyncPageStream` that parses items as the
+        body arrives. With ``RequestOptions(raw=True)`` or
+        ``RequestOptions(fields=...)`` its items are plain dicts.
+
+        Raises:
+            TypeError: If ``fields`` is a str rather than a sequence of names.
+        """
+
+        async def _fetch(*, after: Optional[str] = None) -> AsyncPage[D]:
+            next_params = self._next_page_params(params, after)
+            return await self.request_page(
+                method=method,
+                path=path,
+                model=model,
+                params=next_params,
+                body=body,
+                request_options=request_options,
+            )
+
+        load = self._model_loader(model, request_options)
+        if request_options and request_options.get("stream"):
+            response = await self._open_stream(
+                method, path, params, body, request_options
+            )
+            return AsyncPage(
+                data=[],
+                list_metadata=ListMetadata(),
+                _fetch_page=_fetch,
+                _stream=AsyncPageStream(response, load),
+            )
+
         raw = await self.request(
             method=method,
             path=path,
@@ -788,22 +1590,9 @@ class AsyncWorkOSClient(_BaseWorkOSClient):
         )
         data: Dict[str, Any] = raw if isinstance(raw, dict) else {}
         raw_items: list[Any] = cast(list[Any], data.get("data") or [])
-        items: list[D] = [
-            cast(D, model.from_dict(cast(Dict[str, Any], item))) for item in raw_items
-        ]
+        items: list[D] = [load(cast(Dict[str, Any], item)) for item in raw_items]
         list_metadata = ListMetadata.from_dict(
             cast(Dict[str, Any], data.get("list_metadata", {}))
         )
 
-        async def _fetch(*, after: Optional[str] = None) -> AsyncPage[D]:
-            next_params = {**(params or {}), "after": after}
-            return await self.request_page(
-                method=method,
-                path=path,
-                model=model,
-                params=next_params,
-                body=body,
-                request_options=request_options,
-            )
-
         return AsyncPage(data=items, list_metadata=list_metadata, _fetch_page=_fetch)
@@ -0,0 +1,339 @@
+# @oagen-ignore-file
+
+"""Client-side response caching for read endpoints."""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import (
+    Any,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Tuple,
+    runtime_checkable,
+)
+
+import httpx
+
+DEFAULT_CACHE_TTL = 60.0
+DEFAULT_CACHE_MAXSIZE = 1024
+
+_now = time.monotonic
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """Storage used by :class:`ResponseCache`.
+
+    Values are raw response bodies. Keys have the form
+    ``"<path>?<query>#<namespace>"``, so every cached variant of a path can be
+    removed with :meth:`delete_prefix`. Backends may optionally expose an
+    ``evictions`` counter, which is reported in :class:`CacheStats`.
+    """
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the stored value, or ``None`` if missing or expired."""
+        ...
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store ``value`` for ``ttl`` seconds."""
+        ...
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Remove every key starting with ``prefix`` and return how many were removed."""
+        ...
+
+    def delete_matching(self, pattern: str) -> int:
+        """Remove every key matching ``pattern`` and return how many were removed.
+
+        ``*`` matches any run of characters other than ``/``, so it stands
+        for one path segment; a trailing ``*`` matches the rest of the key.
+        Every other character matches itself.
+        """
+        ...
+
+    def clear(self) -> None:
+        """Remove every key."""
+        ...
+
+
+class InMemoryLRUCache:
+    """Thread-safe, size-bounded in-memory :class:`CacheBackend`.
+
+    When ``maxsize`` entries are stored, the least recently used entry is
+    evicted to make room. Expired entries are dropped when they are read.
+    Keys are also kept sorted, so prefix invalidation only visits the keys it
+    removes instead of scanning the whole cache.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_MAXSIZE) -> None:
+        if maxsize < 1:
+            raise ValueError("InMemoryLRUCache.maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, Tuple[float, bytes]] = OrderedDict()
+        self._sorted_keys: List[str] = []
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def evictions(self) -> int:
+        """Entries removed to stay within ``maxsize``."""
+        return self._evictions
+
+    def _remove(self, key: str) -> None:
+        del self._entries[key]
+        keys = self._sorted_keys
+        del keys[bisect.bisect_left(keys, key)]
+
+    def _prefix_range(self, prefix: str) -> Tuple[int, int]:
+        keys = self._sorted_keys
+        start = bisect.bisect_left(keys, prefix)
+        if not prefix:
+            return start, len(keys)
+        # The smallest string greater than every string starting with prefix.
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        return start, bisect.bisect_left(keys, upper, start)
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= _now():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            if key not in self._entries:
+                bisect.insort(self._sorted_keys, key)
+            self._entries[key] = (_now() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def delete_prefix(self, prefix: str) -> int:
+        with self._lock:
+            start, end = self._prefix_range(prefix)
+            for key in self._sorted_keys[start:end]:
+                del self._entries[key]
+            del self._sorted_keys[start:end]
+            return end - start
+
+    def delete_matching(self, pattern: str) -> int:
+        parts = pattern.split("*")
+        trailing = len(parts) > 1 and parts[-1] == ""
+        if trailing:
+            parts.pop()
+        matcher = re.compile(
+            "[^/]*".join(re.escape(part) for part in parts) + (".*" if trailing else "")
+        )
+        with self._lock:
+            keys = self._sorted_keys
+            # Only keys starting with the literal head can match.
+            start, end = self._prefix_range(parts[0])
+            stale = [key for key in keys[start:end] if matcher.fullmatch(key)]
+            if stale:
+                for key in stale:
+                    del self._entries[key]
+                removed = set(stale)
+                keys[start:end] = [key for key in keys[start:end] if key not in removed]
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._sorted_keys.clear()
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """A snapshot of :class:`ResponseCache` counters."""
+
+    hits: int = 0
+    """Requests answered from the cache."""
+    misses: int = 0
+    """Cacheable requests that went to the network."""
+    stores: int = 0
+    """Responses written to the cache."""
+    invalidations: int = 0
+    """Entries removed because of writes or explicit invalidation."""
+    evictions: int = 0
+    """Entries evicted by the backend to stay within its size bound."""
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of cacheable requests answered from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache:
+    """Caches successful GET responses and invalidates them on writes.
+
+    Every GET made through a client configured with a cache is looked up
+    here first. ``ttl`` is the default lifetime in seconds; ``ttls`` overrides
+    it per resource, keyed by path prefix such as ``"organizations"`` or
+    ``"authorization/roles"`` (the longest matching prefix wins, and a TTL of
+    ``0`` disables caching for that resource).
+
+    Any other method through the same client invalidates the target path, its
+    sub-paths, and list queries of every parent path. For example, updating
+    ``organizations/org_123`` drops the cached organization and cached pages
+    of ``organizations``. A write that starts while a GET is in flight also
+    keeps that GET's response out of the cache.
+
+    Responses are cached per API key and base URL, so a shared backend never
+    serves one environment's data to another.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        *,
+        ttl: float = DEFAULT_CACHE_TTL,
+        ttls: Optional[Mapping[str, float]] = None,
+        maxsize: int = DEFAULT_CACHE_MAXSIZE,
+    ) -> None:
+        self._backend: CacheBackend = (
+            backend if backend is not None else InMemoryLRUCache(maxsize)
+        )
+        self.ttl = ttl
+        self._ttls: Tuple[Tuple[str, float], ...] = tuple(
+            sorted(
+                ((prefix.strip("/"), value) for prefix, value in (ttls or {}).items()),
+                key=lambda item: len(item[0]),
+                reverse=True,
+            )
+        )
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._invalidations = 0
+
+    @property
+    def backend(self) -> CacheBackend:
+        """The storage backend."""
+        return self._backend
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every invalidation; see :meth:`lookup`."""
+        return self._generation
+
+    @property
+    def stats(self) -> CacheStats:
+        """A snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                stores=self._stores,
+                invalidations=self._invalidations,
+                evictions=int(getattr(self._backend, "evictions", 0)),
+            )
+
+    def reset_stats(self) -> None:
+        """Reset the hit, miss, store and invalidation counters."""
+        with self._lock:
+            self._hits = self._misses = self._stores = self._invalidations = 0
+
+    def ttl_for(self, path: str) -> float:
+        """The TTL in seconds for responses from ``path``."""
+        path = path.strip("/")
+        for prefix, ttl in self._ttls:
+            if path == prefix or path.startswith(prefix + "/"):
+                return ttl
+        return self.ttl
+
+    @staticmethod
+    def namespace(api_key: Optional[str], base_url: str) -> str:
+        """The key suffix isolating one API key and base URL."""
+        digest = hashlib.sha256(f"{api_key or ''}|{base_url}".encode()).hexdigest()
+        return digest[:16]
+
+    @staticmethod
+    def key(path: str, params: Optional[Mapping[str, Any]], namespace: str) -> str:
+        """Build the cache key for a GET of ``path`` with ``params``."""
+        query = httpx.QueryParams(params) if params else httpx.QueryParams()
+        ordered = httpx.QueryParams(sorted(query.multi_items()))
+        return f"{path.strip('/')}?{ordered}#{namespace}"
+
+    def lookup(self, key: str) -> Tuple[Optional[bytes], int]:
+        """Return the cached body for ``key`` (or ``None``) and the current generation.
+
+        Pass the generation back to :meth:`store` so a response fetched while
+        a write was invalidating the cache is not stored.
+        """
+        value = self._backend.get(key)
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return value, self._generation
+
+    def store(self, key: str, path: str, content: bytes, generation: int) -> bool:
+        """Cache ``content`` under ``key`` unless an invalidation happened since ``generation``."""
+        ttl = self.ttl_for(path)
+        if ttl <= 0:
+            return False
+        with self._lock:
+            if generation != self._generation:
+                return False
+            self._stores += 1
+        self._backend.set(key, content, ttl)
+        return True
+
+    def invalidate(self, path: str, *, parents: bool = True) -> int:
+        """Drop cached responses affected by a change to ``path``.
+
+        Removes ``path`` itself with any query and its sub-paths, plus list
+        queries of each parent path when ``parents`` is true. A ``*`` segment
+        stands for any id, e.g. ``"organizations/*/groups"``.
+        Returns the number of entries removed.
+        """
+        removed = 0
+        wildcard = "*" in path
+        for prefix in self._invalidation_prefixes(path, parents):
+            if wildcard:
+                removed += self._backend.delete_matching(prefix + "*")
+            else:
+                removed += self._backend.delete_prefix(prefix)
+        with self._lock:
+            self._generation += 1
+            self._invalidations += removed
+        return removed
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self._backend.clear()
+        with self._lock:
+            self._generation += 1
+
+    @staticmethod
+    def _invalidation_prefixes(path: str, parents: bool = True) -> List[str]:
+        segments = path.strip("/").split("/")
+        target = "/".join(segments)
+        prefixes = [f"{target}?", f"{target}/"]
+        if parents:
+            for end in range(len(segments) - 1, 0, -1):
+                prefixes.append("/".join(segments[:end]) + "?")
+        return prefixes
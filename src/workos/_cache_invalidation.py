@@ -0,0 +1,385 @@
+# @oagen-ignore-file
+
+"""Evict cached API responses when WorkOS events report a change."""
+
+from __future__ import annotations
+
+import string
+import threading
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from ._cache import ResponseCache
+
+# Paths whose cached responses an event makes stale, keyed by event type.
+# ``{field}`` placeholders are read from the event's ``data`` (dotted names
+# reach into nested objects) and ``*`` stands for any id. Parent list queries
+# of concrete paths are invalidated too, see ``ResponseCache.invalidate``.
+# Events that change nothing the SDK can cache map to an empty tuple.
+EVENT_INVALIDATIONS: Dict[str, Tuple[str, ...]] = {
+    "action.authentication.denied": (),
+    "action.user_registration.denied": (),
+    "agent.registration.claim.attempt.created": (
+        "agents/registrations/{agent_registration_id}",
+    ),
+    "agent.registration.claim.completed": (
+        "agents/registrations/{agent_registration_id}",
+    ),
+    "agent.registration.created": ("agents/registrations/{id}",),
+    "agent.registration.credential.issued": (
+        "agents/registrations/{agent_registration_id}",
+    ),
+    "agent.registration.deleted": ("agents/registrations/{agent_registration_id}",),
+    "agent.registration.expired": ("agents/registrations/{agent_registration_id}",),
+    "agent.registration.organization.switched": (
+        "agents/registrations/{agent_registration_id}",
+    ),
+    "agent.registration.refreshed": ("agents/registrations/{agent_registration_id}",),
+    "agent.registration.revoked": ("agents/registrations/{agent_registration_id}",),
+    "api_key.created": (
+        "organizations/{owner.id}/api_keys",
+        "user_management/users/{owner.id}/api_keys",
+    ),
+    "api_key.revoked": (
+        "organizations/{owner.id}/api_keys",
+        "user_management/users/{owner.id}/api_keys",
+    ),
+    "api_key.updated": (
+        "organizations/{owner.id}/api_keys",
+        "user_management/users/{owner.id}/api_keys",
+    ),
+    "authentication.email_verification_failed": (),
+    "authentication.email_verification_succeeded": ("user_management/users/{user_id}",),
+    "authentication.magic_auth_failed": (),
+    "authentication.magic_auth_succeeded": (),
+    "authentication.mfa_failed": (),
+    "authentication.mfa_succeeded": (),
+    "authentication.oauth_failed": (),
+    "authentication.oauth_succeeded": (),
+    "authentication.passkey_failed": (),
+    "authentication.passkey_succeeded": (),
+    "authentication.password_failed": (),
+    "authentication.password_succeeded": (),
+    "authentication.radar_risk_detected": (),
+    "authentication.reauthentication_succeeded": (),
+    "authentication.sso_failed": (),
+    "authentication.sso_started": (),
+    "authentication.sso_succeeded": (),
+    "authentication.sso_timed_out": (),
+    "connection.activated": ("connections/{id}",),
+    "connection.deactivated": ("connections/{id}",),
+    "connection.deleted": ("connections/{id}",),
+    "connection.saml_certificate_renewal_required": (),
+    "connection.saml_certificate_renewed": ("connections/{connection.id}",),
+    "dsync.activated": ("directories/{id}",),
+    "dsync.deleted": ("directories/{id}",),
+    "dsync.group.created": ("directory_groups/{id}",),
+    "dsync.group.deleted": ("directory_groups/{id}",),
+    "dsync.group.updated": ("directory_groups/{id}",),
+    "dsync.group.user_added": (
+        "directory_groups/{group.id}",
+        "directory_users/{user.id}",
+    ),
+    "dsync.group.user_removed": (
+        "directory_groups/{group.id}",
+        "directory_users/{user.id}",
+    ),
+    "dsync.token.created": ("directories/{directory_id}",),
+    "dsync.token.revoked": ("directories/{directory_id}",),
+    "dsync.user.created": ("directory_users/{id}",),
+    "dsync.user.deleted": ("directory_users/{id}",),
+    "dsync.user.updated": ("directory_users/{id}",),
+    "email_verification.created": ("user_management/email_verification/{id}",),
+    "flag.created": (
+        "feature-flags/{slug}",
+        "organizations/*/feature-flags",
+        "user_management/users/*/feature-flags",
+    ),
+    "flag.deleted": (
+        "feature-flags/{slug}",
+        "organizations/*/feature-flags",
+        "user_management/users/*/feature-flags",
+    ),
+    "flag.rule_updated": (
+        "feature-flags/{slug}",
+        "organizations/*/feature-flags",
+        "user_management/users/*/feature-flags",
+    ),
+    "flag.updated": (
+        "feature-flags/{slug}",
+        "organizations/*/feature-flags",
+        "user_management/users/*/feature-flags",
+    ),
+    "group.created": ("organizations/{organization_id}/groups/{id}",),
+    "group.deleted": ("organizations/{organization_id}/groups/{id}",),
+    "group.member_added": (
+        "organizations/*/groups/{group_id}",
+        "user_management/organization_memberships/{organization_membership_id}",
+    ),
+    "group.member_removed": (
+        "organizations/*/groups/{group_id}",
+        "user_management/organization_memberships/{organization_membership_id}",
+    ),
+    "group.updated": ("organizations/{organization_id}/groups/{id}",),
+    "invitation.accepted": (
+        "user_management/invitations/{id}",
+        "user_management/invitations/by_token",
+    ),
+    "invitation.created": ("user_management/invitations/{id}",),
+    "invitation.resent": (
+        "user_management/invitations/{id}",
+        "user_management/invitations/by_token",
+    ),
+    "invitation.revoked": (
+        "user_management/invitations/{id}",
+        "user_management/invitations/by_token",
+    ),
+    "magic_auth.created": ("user_management/magic_auth/{id}",),
+    "organization_domain.created": (
+        "organization_domains/{id}",
+        "organizations/{organization_id}",
+    ),
+    "organization_domain.deleted": (
+        "organization_domains/{id}",
+        "organizations/{organization_id}",
+    ),
+    "organization_domain.updated": (
+        "organization_domains/{id}",
+        "organizations/{organization_id}",
+    ),
+    "organization_domain.verification_failed": (
+        "organization_domains/{organization_domain.id}",
+        "organizations/{organization_domain.organization_id}",
+    ),
+    "organization_domain.verified": (
+        "organization_domains/{id}",
+        "organizations/{organization_id}",
+    ),
+    "organization_membership.created": (
+        "user_management/organization_memberships/{id}",
+        "authorization/organization_memberships/{id}",
+    ),
+    "organization_membership.deleted": (
+        "user_management/organization_memberships/{id}",
+        "authorization/organization_memberships/{id}",
+    ),
+    "organization_membership.updated": (
+        "user_management/organization_memberships/{id}",
+        "authorization/organization_memberships/{id}",
+    ),
+    "organization_role.created": (
+        "authorization/organizations/{organization_id}/roles/{slug}",
+    ),
+    "organization_role.deleted": (
+        "authorization/organizations/{organization_id}/roles/{slug}",
+    ),
+    "organization_role.updated": (
+        "authorization/organizations/{organization_id}/roles/{slug}",
+    ),
+    "organization.created": ("organizations/{id}",),
+    "organization.deleted": (
+        "organizations/{id}",
+        "organizations/external_id/{external_id}",
+    ),
+    "organization.updated": (
+        "organizations/{id}",
+        "organizations/external_id/{external_id}",
+    ),
+    "password_reset.created": ("user_management/password_reset/{id}",),
+    "password_reset.succeeded": ("user_management/password_reset/{id}",),
+    "permission.created": ("authorization/permissions/{slug}",),
+    "permission.deleted": (
+        "authorization/permissions/{slug}",
+        "authorization/roles",
+        "authorization/organizations/*/roles",
+    ),
+    "permission.updated": (
+        "authorization/permissions/{slug}",
+        "authorization/roles",
+        "authorization/organizations/*/roles",
+    ),
+    "pipes.connected_account.connected": (
+        "user_management/users/{user_id}/connected_accounts",
+        "user_management/users/{user_id}/data_providers",
+    ),
+    "pipes.connected_account.connection_failed": (),
+    "pipes.connected_account.disconnected": (
+        "user_management/users/{user_id}/connected_accounts",
+        "user_management/users/{user_id}/data_providers",
+    ),
+    "pipes.connected_account.reauthorization_needed": (
+        "user_management/users/{user_id}/connected_accounts",
+        "user_management/users/{user_id}/data_providers",
+    ),
+    "radar.challenge_created": (
+        "user_management/radar_challenges/{radar_challenge_id}",
+    ),
+    "role.created": (
+        "authorization/roles/{slug}",
+        "authorization/organizations/*/roles",
+    ),
+    "role.deleted": (
+        "authorization/roles/{slug}",
+        "authorization/organizations/*/roles",
+    ),
+    "role.updated": (
+        "authorization/roles/{slug}",
+        "authorization/organizations/*/roles",
+    ),
+    "session.created": ("user_management/users/{user_id}/sessions",),
+    "session.revoked": ("user_management/users/{user_id}/sessions",),
+    "user.created": ("user_management/users/{id}",),
+    "user.deleted": (
+        "user_management/users/{id}",
+        "user_management/users/external_id/{external_id}",
+        "user_management/organization_memberships",
+    ),
+    "user.updated": (
+        "user_management/users/{id}",
+        "user_management/users/external_id/{external_id}",
+    ),
+    "vault.byok_key.deleted": (),
+    "vault.byok_key.verification_completed": (),
+    "vault.data.created": ("vault/v1/kv/name/{kv_name}",),
+    "vault.data.deleted": ("vault/v1/kv",),
+    "vault.data.read": (),
+    "vault.data.updated": ("vault/v1/kv",),
+    "vault.dek.decrypted": (),
+    "vault.dek.read": (),
+    "vault.kek.created": (),
+    "vault.kek.deleted": (),
+    "vault.metadata.read": (),
+    "vault.names.listed": (),
+    "waitlist_user.approved": (),
+    "waitlist_user.created": (),
+    "waitlist_user.denied": (),
+}
+
+_MISSING = object()
+
+
+def _field(data: Any, dotted: str) -> Any:
+    value = data
+    for name in dotted.split("."):
+        if isinstance(value, Mapping):
+            value = value.get(name, _MISSING)
+        else:
+            value = getattr(value, name, _MISSING)
+        if value is _MISSING or value is None:
+            return _MISSING
+    return value
+
+
+def _compile(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    return tuple(
+        (literal, field) for literal, field, _, _ in string.Formatter().parse(template)
+    )
+
+
+class CacheInvalidator:
+    """Evicts cached responses named by WorkOS events.
+
+    Feed it events from ``webhooks.verify_event`` or ``events.list_events``,
+    either typed event models or raw event dicts. Each event type maps to the
+    API paths it makes stale (see ``EVENT_INVALIDATIONS``), which are dropped
+    from every attached :class:`ResponseCache`. This makes long TTLs safe.
+
+    ``rules`` adds or overrides mappings. Event types without a mapping are
+    counted in ``unmapped``; with ``clear_on_unknown`` they clear the caches
+    instead, which is the safe choice if the API adds event types before the
+    SDK knows about them.
+    """
+
+    def __init__(
+        self,
+        *caches: ResponseCache,
+        rules: Optional[Mapping[str, Sequence[str]]] = None,
+        clear_on_unknown: bool = False,
+    ) -> None:
+        self._caches: List[ResponseCache] = list(caches)
+        self.clear_on_unknown = clear_on_unknown
+        merged: Dict[str, Sequence[str]] = {**EVENT_INVALIDATIONS, **(rules or {})}
+        self._rules: Dict[str, Tuple[Tuple[Tuple[str, Optional[str]], ...], ...]] = {
+            event: tuple(_compile(template) for template in templates)
+            for event, templates in merged.items()
+        }
+        self._lock = threading.Lock()
+        self._events = 0
+        self._invalidated = 0
+        self._unmapped = 0
+
+    @property
+    def caches(self) -> List[ResponseCache]:
+        """The caches events are applied to."""
+        return list(self._caches)
+
+    def add_cache(self, cache: ResponseCache) -> None:
+        """Apply future events to ``cache`` as well."""
+        self._caches.append(cache)
+
+    @property
+    def events(self) -> int:
+        """Events processed."""
+        return self._events
+
+    @property
+    def invalidated(self) -> int:
+        """Cache entries removed."""
+        return self._invalidated
+
+    @property
+    def unmapped(self) -> int:
+        """Events whose type has no invalidation rule."""
+        return self._unmapped
+
+    def paths_for(self, event: Any) -> Optional[List[str]]:
+        """The paths ``event`` makes stale, or ``None`` if its type is unmapped.
+
+        Templates whose placeholders are missing from the event are skipped.
+        """
+        event_type, data = _unpack(event)
+        rule = self._rules.get(event_type) if event_type is not None else None
+        if rule is None:
+            return None
+        paths: List[str] = []
+        for parts in rule:
+            rendered: List[str] = []
+            for literal, field in parts:
+                rendered.append(literal)
+                if field is not None:
+                    value = _field(data, field)
+                    if value is _MISSING:
+                        break
+                    rendered.append(str(value))
+            else:
+                paths.append("".join(rendered))
+        return paths
+
+    def handle(self, event: Any) -> int:
+        """Apply one event and return the number of cache entries removed."""
+        paths = self.paths_for(event)
+        removed = 0
+        if paths is None:
+            if self.clear_on_unknown:
+                for cache in self._caches:
+                    cache.clear()
+        else:
+            for path in paths:
+                parents = "*" not in path
+                for cache in self._caches:
+                    removed += cache.invalidate(path, parents=parents)
+        with self._lock:
+            self._events += 1
+            self._invalidated += removed
+            if paths is None:
+                self._unmapped += 1
+        return removed
+
+    def handle_many(self, events: Iterable[Any]) -> int:
+        """Apply several events, e.g. a page from ``events.list_events``."""
+        return sum(self.handle(event) for event in events)
+
+
+def _unpack(event: Any) -> Tuple[Optional[str], Any]:
+    if isinstance(event, Mapping):
+        return event.get("event"), event.get("data")
+    return getattr(event, "event", None), getattr(event, "data", None)
@@ -0,0 +1,163 @@
+# @oagen-ignore-file
+
+"""Persisted pagination cursors for resumable auto-pagination."""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Optional, Protocol, Union, runtime_checkable
+
+
+@runtime_checkable
+class CheckpointStore(Protocol):
+    """Where :meth:`SyncPage.auto_paging_iter` records its progress.
+
+    The stored value is the ``after`` cursor of the next page to fetch, so
+    passing it back as ``after=`` to the same list method resumes the crawl.
+    ``None`` means there is nothing to resume: either nothing has been saved
+    yet or the last crawl reached the end.
+    """
+
+    def load(self) -> Optional[str]:
+        """Return the saved cursor, or ``None`` if there is none."""
+        ...
+
+    def save(self, cursor: Optional[str]) -> None:
+        """Record ``cursor``; ``None`` clears the checkpoint."""
+        ...
+
+
+# A store, or a callable that is passed each cursor as it would be saved.
+Checkpoint = Union[CheckpointStore, Callable[[Optional[str]], Any]]
+
+
+class MemoryCheckpoint:
+    """Keeps the cursor in memory, e.g. to read it back after a failure."""
+
+    def __init__(self, cursor: Optional[str] = None) -> None:
+        self.cursor = cursor
+
+    def load(self) -> Optional[str]:
+        return self.cursor
+
+    def save(self, cursor: Optional[str]) -> None:
+        self.cursor = cursor
+
+
+class FileCheckpoint:
+    """Keeps the cursor in a text file.
+
+    Each save writes a temporary file next to ``path`` and renames it over
+    ``path``, so a crash mid-write leaves the previous checkpoint intact.
+    Clearing the checkpoint removes the file.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike[str]]) -> None:
+        self.path = os.fspath(path)
+
+    def load(self) -> Optional[str]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                cursor = f.read().strip()
+        except FileNotFoundError:
+            return None
+        return cursor or None
+
+    def save(self, cursor: Optional[str]) -> None:
+        if cursor is None:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self.path)
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temporary = tempfile.mkstemp(
+            dir=directory, prefix=".workos-checkpoint-", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(cursor)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporary, self.path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(temporary)
+            raise
+
+
+class SQLiteCheckpoint:
+    """Keeps cursors in a SQLite table, one row per ``key``.
+
+    Several crawls can share one database by using different keys. The
+    table is created on first use; each load and save opens its own
+    connection, so a store may be shared between threads and processes.
+
+    Args:
+        path: The database file.
+        key: Identifies this crawl, e.g. ``"directory_users:directory_01"``.
+        table: The table to keep cursors in.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike[str]],
+        key: str = "default",
+        *,
+        table: str = "workos_pagination_checkpoints",
+    ) -> None:
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table!r}")
+        self.path = os.fspath(path)
+        self.key = key
+        self.table = table
+        self._created = False
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=30.0)
+        with self._lock:
+            if not self._created:
+                with connection:
+                    connection.execute(
+                        f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                        "key TEXT PRIMARY KEY, cursor TEXT, updated_at REAL)"
+                    )
+                self._created = True
+        return connection
+
+    def load(self) -> Optional[str]:
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                f"SELECT cursor FROM {self.table} WHERE key = ?", (self.key,)
+            ).fetchone()
+        finally:
+            connection.close()
+        return row[0] if row else None
+
+    def save(self, cursor: Optional[str]) -> None:
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute(
+                    f"INSERT INTO {self.table} (key, cursor, updated_at) "
+                    "VALUES (?, ?, ?) ON CONFLICT(key) DO UPDATE SET "
+                    "cursor = excluded.cursor, updated_at = excluded.updated_at",
+                    (self.key, cursor, time.time()),
+                )
+        finally:
+            connection.close()
+
+
+def _saver(checkpoint: Checkpoint) -> Callable[[Optional[str]], Any]:
+    if isinstance(checkpoint, CheckpointStore):
+        return checkpoint.save
+    if callable(checkpoint):
+        return checkpoint
+    raise TypeError(
+        "checkpoint must be a CheckpointStore or a callable taking the cursor"
+    )
@@ -0,0 +1,143 @@
+# @oagen-ignore-file
+
+"""Single-flight coalescing of identical in-flight requests."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+import httpx
+
+
+def coalesce_key(
+    url: str, params: Optional[Mapping[str, Any]], headers: Mapping[str, str]
+) -> Tuple[Hashable, ...]:
+    """Build the key identifying identical requests.
+
+    Headers are part of the key so requests made with different credentials
+    or per-request headers are never merged.
+    """
+    return (
+        url,
+        repr(sorted((params or {}).items())),
+        tuple(sorted(headers.items())),
+    )
+
+
+class _Call:
+    __slots__ = ("done", "response", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response: Optional[httpx.Response] = None
+        self.error: Optional[BaseException] = None
+
+
+class RequestCoalescer:
+    """Shares one in-flight request between threads asking for the same thing.
+
+    The first caller for a key (the leader) sends the request; callers that
+    arrive while it is in flight wait for it and receive the same response or
+    exception. Nothing is retained once the request completes, so this is not
+    a cache: a call made after the leader returns sends a new request.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._leaders = 0
+        self._coalesced = 0
+
+    @property
+    def leaders(self) -> int:
+        """Requests that were actually sent."""
+        return self._leaders
+
+    @property
+    def coalesced(self) -> int:
+        """Requests that were served by another caller's in-flight request."""
+        return self._coalesced
+
+    @property
+    def in_flight(self) -> int:
+        """Keys with a request currently in flight."""
+        return len(self._calls)
+
+    def run(self, key: Hashable, send: Callable[[], httpx.Response]) -> httpx.Response:
+        """Return the response for ``key``, calling ``send`` only if none is in flight."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._leaders += 1
+            else:
+                self._coalesced += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            assert call.response is not None
+            return call.response
+        try:
+            call.response = send()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.response
+
+
+class AsyncRequestCoalescer:
+    """Shares one in-flight request between asyncio tasks asking for the same thing.
+
+    The request runs in its own task and every caller awaits it through
+    ``asyncio.shield``, so cancelling one caller does not cancel the request
+    for the others.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: Dict[Hashable, asyncio.Future[httpx.Response]] = {}
+        self._leaders = 0
+        self._coalesced = 0
+
+    @property
+    def leaders(self) -> int:
+        """Requests that were actually sent."""
+        return self._leaders
+
+    @property
+    def coalesced(self) -> int:
+        """Requests that were served by another caller's in-flight request."""
+        return self._coalesced
+
+    @property
+    def in_flight(self) -> int:
+        """Keys with a request currently in flight."""
+        return len(self._tasks)
+
+    async def run(
+        self, key: Hashable, send: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """Return the response for ``key``, calling ``send`` only if none is in flight."""
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(send())
+            self._tasks[key] = task
+            self._leaders += 1
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self._coalesced += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Future[httpx.Response]) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        # Mark the outcome as retrieved in case every caller was cancelled.
+        if not task.cancelled():
+            task.exception()
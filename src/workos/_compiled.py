@@ -0,0 +1,141 @@
+# @oagen-ignore-file
+
+"""Precompiled deserializers for the generated models.
+
+The generated ``from_dict`` methods are written to be read: they call
+``cast()`` on nested values, convert enums through ``Enum.__call__`` and
+pass every field to the constructor by keyword.
+``scripts/generate_model_loaders.py`` writes a specialized version of each
+into ``workos/_model_loaders.py`` that
+
+* drops ``cast()``, which does nothing at runtime;
+* looks enum values up in the enum's value-to-member map;
+* calls the compiled loaders of nested models directly, with ``map()`` for
+  lists of them;
+* passes the fields to the constructor positionally.
+
+Malformed data raises the same error as ``from_dict``. Models whose
+``from_dict`` is not a single ``cls(...)`` call, such as discriminated
+unions, keep their ``from_dict``.
+
+The client only uses these loaders when it is created with
+``compiled_models=True``; by default it calls the generated ``from_dict``.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Type, TypeVar
+
+M = TypeVar("M")
+
+Loader = Callable[[Dict[str, Any]], Any]
+
+_loaders: Dict[type, Loader] = {}
+_compiling: Set[type] = set()
+_lock = threading.RLock()
+
+
+E = TypeVar("E", bound=Enum)
+
+
+class _EnumMembers(Dict[Any, Any]):
+    """An enum's value-to-member map that defers misses to the enum itself.
+
+    Unknown values go through ``Enum.__call__``, so ``_missing_`` (or the
+    ValueError for an invalid value) behaves as when calling the enum.
+    """
+
+    __slots__ = ("enum",)
+
+    def __init__(self, enum_class: Type[Enum]) -> None:
+        super().__init__(enum_class._value2member_map_)
+        self.enum = enum_class
+
+    def __missing__(self, value: Any) -> Any:
+        return self.enum(value)
+
+
+_enum_member_maps: Dict[type, _EnumMembers] = {}
+
+
+def _enum_members(enum_class: Type[E]) -> Dict[Any, E]:
+    """The value-to-member map of an enum, built once per enum.
+
+    ``_enum_members(State)[value]`` is ``State(value)`` without the overhead
+    of ``Enum.__call__`` for known values. The map raises TypeError rather
+    than ValueError for unhashable values.
+    """
+    members = _enum_member_maps.get(enum_class)
+    if members is None:
+        members = _enum_member_maps.setdefault(enum_class, _EnumMembers(enum_class))
+    return members
+
+
+def compiled_from_dict(model: Type[M], data: Dict[str, Any]) -> M:
+    """Deserialize ``data`` into ``model`` with its compiled loader.
+
+    Equivalent to ``model.from_dict(data)``, including the errors raised.
+    """
+    return compiled_loader(model)(data)
+
+
+def compiled_loader(model: Type[M]) -> Callable[[Dict[str, Any]], M]:
+    """The compiled counterpart of ``model.from_dict``, built once per model."""
+    loader = _loaders.get(model)
+    if loader is None:
+        with _lock:
+            loader = _loaders.get(model)
+            if loader is None:
+                if model in _compiling:
+                    # A model that (indirectly) contains itself: use the
+                    # original from_dict for the inner occurrences.
+                    return getattr(model, "from_dict")
+                _compiling.add(model)
+                try:
+                    loader = _compile(model)
+                finally:
+                    _compiling.discard(model)
+                _loaders[model] = loader
+    return loader
+
+
+def _dependency(kind: str, value: Any) -> Any:
+    if kind == "loader":
+        return compiled_loader(value)
+    if kind == "members":
+        return _enum_members(value)
+    return value
+
+
+def generated_loaders(
+    model: type,
+) -> Optional[Tuple[Loader, Dict[str, Loader], Tuple[str, ...]]]:
+    """The generated loaders of ``model`` from ``workos/_model_loaders.py``.
+
+    Returns:
+        The compiled loader, one loader per field and the keys ``from_dict``
+        requires; or None if the model keeps its ``from_dict``.
+    """
+    from ._model_loaders import LOADERS
+
+    entry = LOADERS.get(f"{model.__module__}.{model.__qualname__}")
+    if entry is None:
+        return None
+    factory, dependencies, required = entry
+    namespace = vars(sys.modules[model.__module__])
+    loader, fields = factory(
+        model, *(_dependency(kind, namespace[name]) for kind, name in dependencies)
+    )
+    return loader, fields, required
+
+
+def _compile(model: Type[Any]) -> Loader:
+    loaders = generated_loaders(model)
+    if loaders is None:
+        return getattr(model, "from_dict")
+    loader = loaders[0]
+    loader.__qualname__ = f"{model.__qualname__}.from_dict"
+    return loader
@@ -400,6 +400,18 @@ class WorkOSTimeoutError(WorkOSError):
         super().__init__(message)
 
 
+class CircuitOpenError(WorkOSError):
+    """Raised without making a request while the circuit breaker is open."""
+
+    retry_after: float
+
+    def __init__(
+        self, message: str = "Circuit breaker is open", *, retry_after: float = 0.0
+    ) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 STATUS_CODE_TO_ERROR: Dict[int, Type[APIError]] = {
     400: BadRequestError,
     401: AuthenticationError,
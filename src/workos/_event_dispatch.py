@@ -0,0 +1,319 @@
+# @oagen-ignore-file
+
+"""Event dispatch that imports only the variant models it sees.
+
+The generated :class:`~workos.events.models.EventSchema` imports every event
+model (over a hundred modules) when ``workos.events.models`` is first
+imported. Webhook verification goes through :func:`parse_event` instead,
+which imports the model for each event type the first time it is seen and
+leaves unknown or malformed events to ``EventSchema.from_dict``.
+``tests/test_lazy_imports.py`` checks that :data:`_EVENTS` matches the
+generated ``EventSchema._DISPATCH``.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, cast
+
+if TYPE_CHECKING:
+    from workos.events.models import EventSchemaVariant
+
+_MODELS_PACKAGE = "workos.common.models"
+
+# Event type -> (module under ``workos.common.models``, class name).
+_EVENTS: Dict[str, Tuple[str, str]] = {
+    "action.authentication.denied": (
+        "action_authentication_denied",
+        "ActionAuthenticationDenied",
+    ),
+    "action.user_registration.denied": (
+        "action_user_registration_denied",
+        "ActionUserRegistrationDenied",
+    ),
+    "agent.registration.claim.attempt.created": (
+        "agent_registration_claim_attempt_created",
+        "AgentRegistrationClaimAttemptCreated",
+    ),
+    "agent.registration.claim.completed": (
+        "agent_registration_claim_completed",
+        "AgentRegistrationClaimCompleted",
+    ),
+    "agent.registration.created": (
+        "agent_registration_created",
+        "AgentRegistrationCreated",
+    ),
+    "agent.registration.credential.issued": (
+        "agent_registration_credential_issued",
+        "AgentRegistrationCredentialIssued",
+    ),
+    "agent.registration.deleted": (
+        "agent_registration_deleted",
+        "AgentRegistrationDeleted",
+    ),
+    "agent.registration.expired": (
+        "agent_registration_expired",
+        "AgentRegistrationExpired",
+    ),
+    "agent.registration.organization.switched": (
+        "agent_registration_organization_switched",
+        "AgentRegistrationOrganizationSwitched",
+    ),
+    "agent.registration.refreshed": (
+        "agent_registration_refreshed",
+        "AgentRegistrationRefreshed",
+    ),
+    "agent.registration.revoked": (
+        "agent_registration_revoked",
+        "AgentRegistrationRevoked",
+    ),
+    "api_key.created": ("api_key_created", "ApiKeyCreated"),
+    "api_key.revoked": ("api_key_revoked", "ApiKeyRevoked"),
+    "api_key.updated": ("api_key_updated", "ApiKeyUpdated"),
+    "authentication.email_verification_failed": (
+        "authentication_email_verification_failed",
+        "AuthenticationEmailVerificationFailed",
+    ),
+    "authentication.email_verification_succeeded": (
+        "authentication_email_verification_succeeded",
+        "AuthenticationEmailVerificationSucceeded",
+    ),
+    "authentication.magic_auth_failed": (
+        "authentication_magic_auth_failed",
+        "AuthenticationMagicAuthFailed",
+    ),
+    "authentication.magic_auth_succeeded": (
+        "authentication_magic_auth_succeeded",
+        "AuthenticationMagicAuthSucceeded",
+    ),
+    "authentication.mfa_failed": (
+        "authentication_mfa_failed",
+        "AuthenticationMFAFailed",
+    ),
+    "authentication.mfa_succeeded": (
+        "authentication_mfa_succeeded",
+        "AuthenticationMFASucceeded",
+    ),
+    "authentication.oauth_failed": (
+        "authentication_oauth_failed",
+        "AuthenticationOAuthFailed",
+    ),
+    "authentication.oauth_succeeded": (
+        "authentication_oauth_succeeded",
+        "AuthenticationOAuthSucceeded",
+    ),
+    "authentication.passkey_failed": (
+        "authentication_passkey_failed",
+        "AuthenticationPasskeyFailed",
+    ),
+    "authentication.passkey_succeeded": (
+        "authentication_passkey_succeeded",
+        "AuthenticationPasskeySucceeded",
+    ),
+    "authentication.password_failed": (
+        "authentication_password_failed",
+        "AuthenticationPasswordFailed",
+    ),
+    "authentication.password_succeeded": (
+        "authentication_password_succeeded",
+        "AuthenticationPasswordSucceeded",
+    ),
+    "authentication.radar_risk_detected": (
+        "authentication_radar_risk_detected",
+        "AuthenticationRadarRiskDetected",
+    ),
+    "authentication.reauthentication_succeeded": (
+        "authentication_reauthentication_succeeded",
+        "AuthenticationReauthenticationSucceeded",
+    ),
+    "authentication.sso_failed": (
+        "authentication_sso_failed",
+        "AuthenticationSSOFailed",
+    ),
+    "authentication.sso_started": (
+        "authentication_sso_started",
+        "AuthenticationSSOStarted",
+    ),
+    "authentication.sso_succeeded": (
+        "authentication_sso_succeeded",
+        "AuthenticationSSOSucceeded",
+    ),
+    "authentication.sso_timed_out": (
+        "authentication_sso_timed_out",
+        "AuthenticationSSOTimedOut",
+    ),
+    "connection.activated": ("connection_activated", "ConnectionActivated"),
+    "connection.deactivated": ("connection_deactivated", "ConnectionDeactivated"),
+    "connection.deleted": ("connection_deleted", "ConnectionDeleted"),
+    "connection.saml_certificate_renewal_required": (
+        "connection_saml_certificate_renewal_required",
+        "ConnectionSAMLCertificateRenewalRequired",
+    ),
+    "connection.saml_certificate_renewed": (
+        "connection_saml_certificate_renewed",
+        "ConnectionSAMLCertificateRenewed",
+    ),
+    "dsync.activated": ("dsync_activated", "DsyncActivated"),
+    "dsync.deleted": ("dsync_deleted", "DsyncDeleted"),
+    "dsync.group.created": ("dsync_group_created", "DsyncGroupCreated"),
+    "dsync.group.deleted": ("dsync_group_deleted", "DsyncGroupDeleted"),
+    "dsync.group.updated": ("dsync_group_updated", "DsyncGroupUpdated"),
+    "dsync.group.user_added": ("dsync_group_user_added", "DsyncGroupUserAdded"),
+    "dsync.group.user_removed": (
+        "dsync_group_user_removed",
+        "DsyncGroupUserRemoved",
+    ),
+    "dsync.token.created": ("dsync_token_created", "DsyncTokenCreated"),
+    "dsync.token.revoked": ("dsync_token_revoked", "DsyncTokenRevoked"),
+    "dsync.user.created": ("dsync_user_created", "DsyncUserCreated"),
+    "dsync.user.deleted": ("dsync_user_deleted", "DsyncUserDeleted"),
+    "dsync.user.updated": ("dsync_user_updated", "DsyncUserUpdated"),
+    "email_verification.created": (
+        "email_verification_created",
+        "EmailVerificationCreated",
+    ),
+    "flag.created": ("flag_created", "FlagCreated"),
+    "flag.deleted": ("flag_deleted", "FlagDeleted"),
+    "flag.rule_updated": ("flag_rule_updated", "FlagRuleUpdated"),
+    "flag.updated": ("flag_updated", "FlagUpdated"),
+    "group.created": ("group_created", "GroupCreated"),
+    "group.deleted": ("group_deleted", "GroupDeleted"),
+    "group.member_added": ("group_member_added", "GroupMemberAdded"),
+    "group.member_removed": ("group_member_removed", "GroupMemberRemoved"),
+    "group.updated": ("group_updated", "GroupUpdated"),
+    "invitation.accepted": ("invitation_accepted", "InvitationAccepted"),
+    "invitation.created": ("invitation_created", "InvitationCreated"),
+    "invitation.resent": ("invitation_resent", "InvitationResent"),
+    "invitation.revoked": ("invitation_revoked", "InvitationRevoked"),
+    "magic_auth.created": ("magic_auth_created", "MagicAuthCreated"),
+    "organization_domain.created": (
+        "organization_domain_created",
+        "OrganizationDomainCreated",
+    ),
+    "organization_domain.deleted": (
+        "organization_domain_deleted",
+        "OrganizationDomainDeleted",
+    ),
+    "organization_domain.updated": (
+        "organization_domain_updated",
+        "OrganizationDomainUpdated",
+    ),
+    "organization_domain.verification_failed": (
+        "organization_domain_verification_failed",
+        "OrganizationDomainVerificationFailed",
+    ),
+    "organization_domain.verified": (
+        "organization_domain_verified",
+        "OrganizationDomainVerified",
+    ),
+    "organization_membership.created": (
+        "organization_membership_created",
+        "OrganizationMembershipCreated",
+    ),
+    "organization_membership.deleted": (
+        "organization_membership_deleted",
+        "OrganizationMembershipDeleted",
+    ),
+    "organization_membership.updated": (
+        "organization_membership_updated",
+        "OrganizationMembershipUpdated",
+    ),
+    "organization_role.created": (
+        "organization_role_created",
+        "OrganizationRoleCreated",
+    ),
+    "organization_role.deleted": (
+        "organization_role_deleted",
+        "OrganizationRoleDeleted",
+    ),
+    "organization_role.updated": (
+        "organization_role_updated",
+        "OrganizationRoleUpdated",
+    ),
+    "organization.created": ("organization_created", "OrganizationCreated"),
+    "organization.deleted": ("organization_deleted", "OrganizationDeleted"),
+    "organization.updated": ("organization_updated", "OrganizationUpdated"),
+    "password_reset.created": ("password_reset_created", "PasswordResetCreated"),
+    "password_reset.succeeded": (
+        "password_reset_succeeded",
+        "PasswordResetSucceeded",
+    ),
+    "permission.created": ("permission_created", "PermissionCreated"),
+    "permission.deleted": ("permission_deleted", "PermissionDeleted"),
+    "permission.updated": ("permission_updated", "PermissionUpdated"),
+    "pipes.connected_account.connected": (
+        "pipes_connected_account_connected",
+        "PipesConnectedAccountConnected",
+    ),
+    "pipes.connected_account.connection_failed": (
+        "pipes_connected_account_connection_failed",
+        "PipesConnectedAccountConnectionFailed",
+    ),
+    "pipes.connected_account.disconnected": (
+        "pipes_connected_account_disconnected",
+        "PipesConnectedAccountDisconnected",
+    ),
+    "pipes.connected_account.reauthorization_needed": (
+        "pipes_connected_account_reauthorization_needed",
+        "PipesConnectedAccountReauthorizationNeeded",
+    ),
+    "radar.challenge_created": ("radar_challenge_created", "RadarChallengeCreated"),
+    "role.created": ("role_created", "RoleCreated"),
+    "role.deleted": ("role_deleted", "RoleDeleted"),
+    "role.updated": ("role_updated", "RoleUpdated"),
+    "session.created": ("session_created", "SessionCreated"),
+    "session.revoked": ("session_revoked", "SessionRevoked"),
+    "user.created": ("user_created", "UserCreated"),
+    "user.deleted": ("user_deleted", "UserDeleted"),
+    "user.updated": ("user_updated", "UserUpdated"),
+    "vault.byok_key.deleted": ("vault_byok_key_deleted", "VaultByokKeyDeleted"),
+    "vault.byok_key.verification_completed": (
+        "vault_byok_key_verification_completed",
+        "VaultByokKeyVerificationCompleted",
+    ),
+    "vault.data.created": ("vault_data_created", "VaultDataCreated"),
+    "vault.data.deleted": ("vault_data_deleted", "VaultDataDeleted"),
+    "vault.data.read": ("vault_data_read", "VaultDataRead"),
+    "vault.data.updated": ("vault_data_updated", "VaultDataUpdated"),
+    "vault.dek.decrypted": ("vault_dek_decrypted", "VaultDekDecrypted"),
+    "vault.dek.read": ("vault_dek_read", "VaultDekRead"),
+    "vault.kek.created": ("vault_kek_created", "VaultKekCreated"),
+    "vault.kek.deleted": ("vault_kek_deleted", "VaultKekDeleted"),
+    "vault.metadata.read": ("vault_metadata_read", "VaultMetadataRead"),
+    "vault.names.listed": ("vault_names_listed", "VaultNamesListed"),
+    "waitlist_user.approved": ("waitlist_user_approved", "WaitlistUserApproved"),
+    "waitlist_user.created": ("waitlist_user_created", "WaitlistUserCreated"),
+    "waitlist_user.denied": ("waitlist_user_denied", "WaitlistUserDenied"),
+}
+
+_resolved: Dict[str, type] = {}
+
+
+def variant(event: Any) -> Optional[type]:
+    """The model class for ``event``, or ``None`` for unknown event types."""
+    resolved = _resolved.get(event)
+    if resolved is None:
+        target = _EVENTS.get(event) if isinstance(event, str) else None
+        if target is None:
+            return None
+        module, name = target
+        resolved = getattr(importlib.import_module(f"{_MODELS_PACKAGE}.{module}"), name)
+        _resolved[event] = resolved
+    return resolved
+
+
+def parse_event(data: Dict[str, Any]) -> EventSchemaVariant:
+    """Deserialize an event like ``EventSchema.from_dict``.
+
+    Args:
+        data: The decoded event payload.
+
+    Returns:
+        EventSchemaVariant: The event model for ``data["event"]``.
+    """
+    cls = variant(data.get("event"))
+    if cls is None:
+        from workos.events.models import EventSchema
+
+        return EventSchema.from_dict(data)
+    return cast("EventSchemaVariant", cast(Any, cls).from_dict(data))
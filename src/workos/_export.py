@@ -0,0 +1,551 @@
+# @oagen-ignore-file
+
+"""Export paginated results to JSON Lines, CSV or Parquet files.
+
+Items are written in batches of ``batch_size``, so memory stays bounded
+however many pages are exported. JSON Lines keeps each item's ``to_dict()``
+as one nested object per line. CSV and Parquet are flat: their columns come
+from the model's fields, nested models are flattened into dotted columns
+(``role.slug``), and lists, dicts and deeper nesting are written as JSON
+strings. Parquet needs `pyarrow <https://arrow.apache.org/docs/python/>`_.
+
+The columns of dict items (``raw=True`` or ``fields=...`` pages) are the keys
+of the first batch. A key that first appears in a later batch raises
+``ValueError`` rather than being dropped, since the header is already written.
+"""
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import csv
+import dataclasses
+import enum
+import os
+import types
+import typing
+from datetime import datetime
+from operator import attrgetter
+from typing import (
+    Any,
+    AsyncIterable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from . import _json
+from ._pagination import DEFAULT_EXPORT_BATCH_SIZE
+from ._types import _format_datetime
+
+ExportFormat = Literal["jsonl", "csv", "parquet"]
+
+_SUFFIXES: Dict[str, ExportFormat] = {
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+}
+
+# How deep nested models are flattened into dotted columns.
+_MAX_DEPTH = 2
+
+# Column kinds.
+_STRING, _INT, _FLOAT, _BOOL, _DATETIME, _ENUM, _JSON, _AUTO = (
+    "string",
+    "int",
+    "float",
+    "bool",
+    "datetime",
+    "enum",
+    "json",
+    "auto",
+)
+_SCALAR_KINDS: Dict[type, str] = {str: _STRING, int: _INT, float: _FLOAT, bool: _BOOL}
+
+
+def export_items(
+    items: Iterable[Any],
+    path: Union[str, os.PathLike[str]],
+    *,
+    format: Optional[ExportFormat] = None,
+    batch_size: int = DEFAULT_EXPORT_BATCH_SIZE,
+) -> int:
+    """Write ``items`` (models or dicts) to ``path``.
+
+    Args:
+        items: The items to write, typically ``page.auto_paging_iter()``.
+        path: The file to create or overwrite.
+        format: ``"jsonl"``, ``"csv"`` or ``"parquet"``. Inferred from the
+            suffix of ``path`` when omitted.
+        batch_size: How many items are held in memory before they are
+            written (one Parquet row group per batch).
+
+    Returns:
+        The number of items written.
+
+    Raises:
+        ValueError: If the format cannot be inferred or is unknown,
+            ``batch_size`` is not positive, or a CSV or Parquet export of
+            dicts meets a key the first batch did not have.
+        ImportError: If the format is Parquet and pyarrow is not installed.
+    """
+    writer = _writer(path, format, batch_size)
+    count = 0
+    try:
+        batch: List[Any] = []
+        for item in items:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                writer.write(batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            writer.write(batch)
+            count += len(batch)
+    finally:
+        writer.close()
+    return count
+
+
+async def aexport_items(
+    items: AsyncIterable[Any],
+    path: Union[str, os.PathLike[str]],
+    *,
+    format: Optional[ExportFormat] = None,
+    batch_size: int = DEFAULT_EXPORT_BATCH_SIZE,
+) -> int:
+    """Async counterpart of :func:`export_items`.
+
+    Batches are converted and written in a worker thread, so the event loop
+    keeps running while a batch is written.
+    """
+    writer = _writer(path, format, batch_size)
+    count = 0
+    try:
+        batch: List[Any] = []
+        async for item in items:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                await asyncio.to_thread(writer.write, batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            await asyncio.to_thread(writer.write, batch)
+            count += len(batch)
+    finally:
+        await asyncio.to_thread(writer.close)
+    return count
+
+
+def _writer(
+    path: Union[str, os.PathLike[str]],
+    format: Optional[str],
+    batch_size: int,
+) -> _Writer:
+    if batch_size < 1:
+        raise ValueError("batch_size must be 1 or greater")
+    if format is None:
+        suffix = os.path.splitext(os.fspath(path))[1].lower()
+        format = _SUFFIXES.get(suffix)
+        if format is None:
+            raise ValueError(
+                f"Cannot infer the export format from {os.fspath(path)!r}; "
+                "pass format='jsonl', 'csv' or 'parquet'"
+            )
+    if format == "jsonl":
+        return _JSONLinesWriter(path)
+    if format == "csv":
+        return _CSVWriter(path)
+    if format == "parquet":
+        return _ParquetWriter(path)
+    raise ValueError(
+        f"Unknown export format {format!r}; expected 'jsonl', 'csv' or 'parquet'"
+    )
+
+
+def _jsonable(value: Any) -> Any:
+    """Convert a field value to what ``to_dict()`` would produce for it."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    to_dict = getattr(value, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return _format_datetime(value)
+    if isinstance(value, dict):
+        return {key: _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    return value
+
+
+def _json_string(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return _json.dumps(_jsonable(value)).decode("utf-8")
+
+
+@dataclasses.dataclass
+class _Column:
+    name: str
+    kind: str
+    index: int
+    """Position of the top-level field (or key) in the row's values."""
+    path: Tuple[str, ...] = ()
+    """Attributes (or keys) leading from the item to the value."""
+
+
+def _unwrap_optional(hint: Any) -> Any:
+    if typing.get_origin(hint) in (Union, types.UnionType):
+        args = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return hint
+
+
+def _kind(hint: Any) -> str:
+    hint = _unwrap_optional(hint)
+    if typing.get_origin(hint) is Literal:
+        values = typing.get_args(hint)
+        kinds = {_SCALAR_KINDS.get(type(value), _JSON) for value in values}
+        return kinds.pop() if len(kinds) == 1 else _JSON
+    if isinstance(hint, type):
+        if issubclass(hint, enum.Enum):
+            return _ENUM
+        if issubclass(hint, datetime):
+            return _DATETIME
+        for scalar, kind in _SCALAR_KINDS.items():
+            if hint is scalar:
+                return kind
+    return _JSON
+
+
+def _model_class(hint: Any) -> Optional[type]:
+    hint = _unwrap_optional(hint)
+    if isinstance(hint, type) and dataclasses.is_dataclass(hint):
+        return hint
+    return None
+
+
+def _model_columns(
+    model: type, prefix: str = "", path: Tuple[str, ...] = (), depth: int = 0
+) -> List[_Column]:
+    """Columns for a model's fields, with nested models flattened.
+
+    ``index`` is left at 0; the caller sets it from the top-level field.
+    """
+    try:
+        hints = typing.get_type_hints(model)
+    except Exception:
+        hints = {}
+    columns: List[_Column] = []
+    for field in dataclasses.fields(model):
+        hint = hints.get(field.name)
+        name = f"{prefix}{field.name}"
+        nested = _model_class(hint) if depth < _MAX_DEPTH else None
+        if nested is not None:
+            columns.extend(
+                _model_columns(nested, f"{name}.", (*path, field.name), depth + 1)
+            )
+        else:
+            kind = _AUTO if hint is None else _kind(hint)
+            columns.append(_Column(name, kind, 0, (*path, field.name)))
+    return columns
+
+
+def _dict_kind(values: Sequence[Any]) -> str:
+    kinds = {
+        _SCALAR_KINDS.get(type(value), _JSON) for value in values if value is not None
+    }
+    if len(kinds) == 1:
+        return kinds.pop()
+    if kinds == {_INT, _FLOAT}:
+        return _FLOAT
+    return _STRING if not kinds else _JSON
+
+
+def _dict_columns(rows: Sequence[Dict[str, Any]]) -> List[_Column]:
+    """Columns for dict items: every key in ``rows``, nested dicts flattened."""
+    columns: List[_Column] = []
+
+    def add(name: str, index: int, path: Tuple[str, ...], values: List[Any]) -> None:
+        dicts = [value for value in values if isinstance(value, dict)]
+        if dicts and len(dicts) == sum(value is not None for value in values):
+            if len(path) <= _MAX_DEPTH:
+                keys = dict.fromkeys(key for value in dicts for key in value)
+                for key in keys:
+                    add(
+                        f"{name}.{key}",
+                        index,
+                        (*path, key),
+                        [value.get(key) if value else None for value in values],
+                    )
+                return
+        columns.append(_Column(name, _dict_kind(values), index, path))
+
+    keys = list(dict.fromkeys(key for row in rows for key in row))
+    for index, key in enumerate(keys):
+        add(key, index, (key,), [row.get(key) for row in rows])
+    return columns
+
+
+class _Rows:
+    """Turns items into rows of column values, based on the first batch."""
+
+    def __init__(self, batch: Sequence[Any]) -> None:
+        first = batch[0]
+        self.is_dict = isinstance(first, dict)
+        if self.is_dict:
+            self.columns = _dict_columns(batch)
+            self.keys = tuple(dict.fromkeys(column.path[0] for column in self.columns))
+            # The keys each flattened dict (and the item itself) may contain.
+            self._known: Dict[Tuple[str, ...], FrozenSet[str]] = {
+                (): frozenset(self.keys)
+            }
+            for column in self.columns:
+                for depth in range(1, len(column.path)):
+                    prefix = column.path[:depth]
+                    self._known[prefix] = self._known.get(prefix, frozenset()) | {
+                        column.path[depth]
+                    }
+            self.model: Optional[type] = None
+        else:
+            model = next(
+                (cls for cls in type(first).__mro__ if dataclasses.is_dataclass(cls)),
+                None,
+            )
+            if model is None:
+                raise TypeError(
+                    f"Cannot export {type(first).__name__} items; expected models "
+                    "or dicts"
+                )
+            self.model = model
+            fields = [field.name for field in dataclasses.fields(model)]
+            self.keys = tuple(fields)
+            self.columns = _model_columns(model)
+            for column in self.columns:
+                column.index = fields.index(column.path[0])
+        self._getter: Callable[[Any], Any] = attrgetter(*self.keys)
+
+    @property
+    def names(self) -> List[str]:
+        return [column.name for column in self.columns]
+
+    def values(self, item: Any) -> Sequence[Any]:
+        """The top-level values of ``item``, in ``self.keys`` order."""
+        if self.is_dict:
+            if not isinstance(item, dict):
+                raise TypeError("Cannot export a mix of models and dicts")
+            return [item.get(key) for key in self.keys]
+        if len(self.keys) == 1:
+            return [getattr(item, self.keys[0], None)]
+        if isinstance(item, typing.cast(type, self.model)):
+            return self._getter(item)
+        return [getattr(item, key, None) for key in self.keys]
+
+    def check_keys(self, batch: Sequence[Any]) -> None:
+        """Reject dict items with keys the first batch did not have.
+
+        The columns are written before later batches are seen, so such keys
+        would otherwise be dropped without notice.
+
+        Raises:
+            ValueError: If an item, or a dict flattened into dotted columns,
+                has a key that is not a column.
+        """
+        for item in batch:
+            if not isinstance(item, dict):
+                continue
+            for prefix, known in self._known.items():
+                value: Any = item
+                for part in prefix:
+                    value = value.get(part) if isinstance(value, dict) else None
+                if not isinstance(value, dict) or value.keys() <= known:
+                    continue
+                unknown = ", ".join(
+                    repr(".".join((*prefix, str(key))))
+                    for key in value
+                    if key not in known
+                )
+                raise ValueError(
+                    f"Cannot export keys missing from the first batch: {unknown}. "
+                    "Columns are fixed by the first batch; give every item the "
+                    "same keys or raise batch_size"
+                )
+
+    def columnar(self, batch: Sequence[Any]) -> List[List[Any]]:
+        """The batch as one list of raw values per column."""
+        if self.is_dict:
+            self.check_keys(batch)
+        rows = [self.values(item) for item in batch]
+        result: List[List[Any]] = []
+        for column in self.columns:
+            index = column.index
+            path = column.path[1:]
+            if not path:
+                result.append([row[index] for row in rows])
+                continue
+            values = []
+            for row in rows:
+                value = row[index]
+                for part in path:
+                    if value is None:
+                        break
+                    if self.is_dict:
+                        value = value.get(part) if isinstance(value, dict) else None
+                    else:
+                        value = getattr(value, part, None)
+                values.append(value)
+            result.append(values)
+        return result
+
+
+def _text_converter(kind: str) -> Optional[Callable[[Any], Any]]:
+    """Convert a raw value to a CSV cell, or None if it can be written as is.
+
+    The csv module already writes None as an empty cell and numbers with
+    ``str()``.
+    """
+    if kind == _BOOL:
+        return lambda value: "" if value is None else ("true" if value else "false")
+    if kind == _DATETIME:
+        return lambda value: "" if value is None else _format_datetime(value)
+    if kind == _ENUM:
+        return lambda value: (
+            ""
+            if value is None
+            else value.value
+            if isinstance(value, enum.Enum)
+            else value
+        )
+    if kind in (_JSON, _AUTO):
+        return lambda value: (
+            ""
+            if value is None
+            else value
+            if isinstance(value, str)
+            else _json_string(value)
+        )
+    return None
+
+
+class _Writer(abc.ABC):
+    @abc.abstractmethod
+    def write(self, batch: List[Any]) -> None:
+        """Write one batch of items."""
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """Flush and close the file."""
+
+
+class _JSONLinesWriter(_Writer):
+    def __init__(self, path: Union[str, os.PathLike[str]]) -> None:
+        self._file = open(path, "wb")
+
+    def write(self, batch: List[Any]) -> None:
+        dumps = _json.dumps
+        self._file.write(
+            b"".join(
+                dumps(item if isinstance(item, dict) else _jsonable(item)) + b"\n"
+                for item in batch
+            )
+        )
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _CSVWriter(_Writer):
+    def __init__(self, path: Union[str, os.PathLike[str]]) -> None:
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._csv = csv.writer(self._file)
+        self._rows: Optional[_Rows] = None
+        self._converters: List[Optional[Callable[[Any], Any]]] = []
+
+    def write(self, batch: List[Any]) -> None:
+        if self._rows is None:
+            self._rows = _Rows(batch)
+            self._converters = [
+                _text_converter(column.kind) for column in self._rows.columns
+            ]
+            self._csv.writerow(self._rows.names)
+        columns = [
+            values if convert is None else list(map(convert, values))
+            for convert, values in zip(self._converters, self._rows.columnar(batch))
+        ]
+        self._csv.writerows(zip(*columns))
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter(_Writer):
+    def __init__(self, path: Union[str, os.PathLike[str]]) -> None:
+        try:
+            import pyarrow  # type: ignore[import-not-found]
+            import pyarrow.parquet  # type: ignore[import-not-found]
+        except ImportError as e:
+            raise ImportError(
+                "Exporting to Parquet requires pyarrow: pip install pyarrow"
+            ) from e
+        self._pa: Any = pyarrow
+        self._pq: Any = pyarrow.parquet
+        self._path = path
+        self._rows: Optional[_Rows] = None
+        self._schema: Any = None
+        self._writer: Any = None
+
+    def _type(self, kind: str) -> Any:
+        pa = self._pa
+        return {
+            _INT: pa.int64(),
+            _FLOAT: pa.float64(),
+            _BOOL: pa.bool_(),
+            _DATETIME: pa.timestamp("us", tz="UTC"),
+        }.get(kind, pa.string())
+
+    def write(self, batch: List[Any]) -> None:
+        pa = self._pa
+        if self._rows is None:
+            self._rows = _Rows(batch)
+            self._schema = pa.schema(
+                [
+                    (column.name, self._type(column.kind))
+                    for column in self._rows.columns
+                ]
+            )
+            self._writer = self._pq.ParquetWriter(self._path, self._schema)
+        arrays = []
+        for column, values in zip(self._rows.columns, self._rows.columnar(batch)):
+            if column.kind == _ENUM:
+                values = [
+                    value.value if isinstance(value, enum.Enum) else value
+                    for value in values
+                ]
+            elif column.kind in (_JSON, _AUTO):
+                values = [
+                    value
+                    if value is None or isinstance(value, str)
+                    else _json_string(value)
+                    for value in values
+                ]
+            arrays.append(pa.array(values, type=self._type(column.kind)))
+        self._writer.write_table(pa.Table.from_arrays(arrays, schema=self._schema))
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        else:
+            self._pq.write_table(self._pa.table({}), self._path)
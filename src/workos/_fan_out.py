@@ -0,0 +1,192 @@
+# @oagen-ignore-file
+
+"""Run one paginated list per scope concurrently and merge the results."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import queue
+import threading
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from ._pagination import MAX_PAGE_SIZE, AsyncPage, SyncPage
+from ._types import Deserializable
+
+S = TypeVar("S")
+T = TypeVar("T", bound=Deserializable)
+
+# Seconds a blocked worker waits before checking whether the caller stopped.
+_POLL_INTERVAL = 0.05
+
+# Inner paginations run at once unless the caller says otherwise.
+DEFAULT_FAN_OUT_CONCURRENCY = 8
+
+_DONE: Any = object()
+
+
+class _Failure:
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def _check_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError("concurrency must be 1 or greater")
+
+
+def fan_out(
+    scopes: Iterable[S],
+    list_page: Callable[[S], SyncPage[T]],
+    *,
+    concurrency: int = DEFAULT_FAN_OUT_CONCURRENCY,
+) -> Generator[Tuple[S, T], None, None]:
+    """Yield ``(scope, item)`` for every item of ``list_page(scope)`` across all pages.
+
+    ``concurrency`` worker threads each take the next scope, walk every page
+    of its list and hand the items back to the caller, so at most
+    ``concurrency`` inner paginations (and requests) are in flight at once.
+    Scopes are read lazily, so ``scopes`` may itself be a paginated list.
+    Items from different scopes are interleaved; items of one scope keep
+    their order. The first error raised by ``scopes`` or ``list_page`` is
+    raised from the iterator, and closing the iterator stops the workers.
+    """
+    _check_concurrency(concurrency)
+    scope_iterator = iter(scopes)
+    scope_lock = threading.Lock()
+    # Enough room for every worker to deliver a full page without waiting.
+    results: queue.Queue[Any] = queue.Queue(maxsize=concurrency * MAX_PAGE_SIZE)
+    stopped = threading.Event()
+
+    def put(entry: Any) -> bool:
+        while not stopped.is_set():
+            try:
+                results.put(entry, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def work() -> None:
+        try:
+            while not stopped.is_set():
+                with scope_lock:
+                    scope = next(scope_iterator, _DONE)
+                if scope is _DONE:
+                    break
+                items = list_page(scope).auto_paging_iter()
+                try:
+                    for item in items:
+                        if not put((scope, item)):
+                            return
+                finally:
+                    items.close()
+        except BaseException as error:
+            put(_Failure(error))
+            return
+        put(_DONE)
+
+    workers = [
+        threading.Thread(target=work, name="workos-fan-out", daemon=True)
+        for _ in range(concurrency)
+    ]
+    for worker in workers:
+        worker.start()
+    running = len(workers)
+    try:
+        while running:
+            entry = results.get()
+            if entry is _DONE:
+                running -= 1
+            elif isinstance(entry, _Failure):
+                raise entry.error
+            else:
+                yield entry
+    finally:
+        stopped.set()
+        # Close a scope generator we started, e.g. a page's auto-paging iterator.
+        if scope_iterator is not scopes and isinstance(scope_iterator, Generator):
+            with scope_lock:
+                scope_iterator.close()
+
+
+async def afan_out(
+    scopes: Union[Iterable[S], AsyncIterable[S]],
+    list_page: Callable[[S], Awaitable[AsyncPage[T]]],
+    *,
+    concurrency: int = DEFAULT_FAN_OUT_CONCURRENCY,
+) -> AsyncGenerator[Tuple[S, T], None]:
+    """Async version of :func:`fan_out` using ``concurrency`` tasks.
+
+    ``scopes`` may be a plain or an async iterable such as an
+    :class:`AsyncPage`. Closing the iterator cancels the tasks; wrap it in
+    ``contextlib.aclosing`` when stopping early.
+    """
+    _check_concurrency(concurrency)
+    scope_lock = asyncio.Lock()
+    results: asyncio.Queue[Any] = asyncio.Queue(maxsize=concurrency * MAX_PAGE_SIZE)
+
+    async_scopes: Any = None
+    if isinstance(scopes, AsyncIterable):
+        async_scopes = scopes.__aiter__()
+
+        async def next_scope() -> Any:
+            async with scope_lock:
+                try:
+                    return await async_scopes.__anext__()
+                except StopAsyncIteration:
+                    return _DONE
+
+    else:
+        sync_scopes = iter(scopes)
+
+        async def next_scope() -> Any:
+            return next(sync_scopes, _DONE)
+
+    async def work() -> None:
+        try:
+            while True:
+                scope = await next_scope()
+                if scope is _DONE:
+                    break
+                page = await list_page(scope)
+                async with contextlib.aclosing(page.auto_paging_iter()) as items:
+                    async for item in items:
+                        await results.put((scope, item))
+        except asyncio.CancelledError:
+            raise
+        except BaseException as error:
+            await results.put(_Failure(error))
+            return
+        await results.put(_DONE)
+
+    tasks = [asyncio.ensure_future(work()) for _ in range(concurrency)]
+    running = len(tasks)
+    try:
+        while running:
+            entry = await results.get()
+            if entry is _DONE:
+                running -= 1
+            elif isinstance(entry, _Failure):
+                raise entry.error
+            else:
+                yield entry
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if async_scopes is not scopes and isinstance(async_scopes, AsyncGenerator):
+            await async_scopes.aclose()
@@ -0,0 +1,208 @@
+# @oagen-ignore-file
+
+"""Pluggable JSON codec used for API responses, request bodies and webhooks."""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from typing import Any, Dict, Optional, Protocol, Union, runtime_checkable
+
+
+@runtime_checkable
+class JSONCodec(Protocol):
+    """Encodes and decodes JSON for the SDK.
+
+    ``dumps`` must produce compact UTF-8 JSON (no whitespace between tokens,
+    non-ASCII characters unescaped), which is what the API receives today.
+    """
+
+    name: str
+
+    def loads(self, data: Union[bytes, bytearray, str]) -> Any:
+        """Parse a JSON document."""
+        ...
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize ``obj`` to compact UTF-8 JSON."""
+        ...
+
+
+class StdlibJSONCodec:
+    """The standard library ``json`` module. Always available."""
+
+    name = "json"
+
+    def loads(self, data: Union[bytes, bytearray, str]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        # Matches httpx's own encoding of ``json=`` request bodies.
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode("utf-8")
+
+
+class OrjsonCodec:
+    """`orjson <https://github.com/ijl/orjson>`_, typically several times faster than ``json``.
+
+    Falls back to the standard library wherever orjson would behave
+    differently, so switching codecs does not change what is sent or
+    accepted: NaN and infinities raise ``ValueError``, datetimes, dataclasses
+    and other types the stdlib cannot encode raise ``TypeError``, integers
+    wider than 64 bits are encoded exactly, and documents orjson rejects but
+    the stdlib accepts (such as ``NaN``) are parsed. orjson does decode
+    integers wider than 64 bits as floats.
+
+    Raises:
+        ImportError: If orjson is not installed.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        # Like the stdlib, accept non-string dict keys such as ints, and hand
+        # the types orjson encodes natively but the stdlib rejects (or
+        # encodes differently) back to the stdlib fallback in ``dumps``.
+        self._options = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_SUBCLASS
+        )
+
+    def loads(self, data: Union[bytes, bytearray, str]) -> Any:
+        try:
+            return self._orjson.loads(data)
+        except self._orjson.JSONDecodeError:
+            return _STDLIB.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            data = self._orjson.dumps(obj, option=self._options)
+        except TypeError:
+            # Integers wider than 64 bits and passed-through types: the
+            # stdlib encodes them or raises its own error.
+            return _STDLIB.dumps(obj)
+        if b"null" in data and _has_non_finite(obj):
+            # orjson writes NaN and infinities as null; the stdlib raises.
+            return _STDLIB.dumps(obj)
+        return data
+
+
+def _has_non_finite(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(value) for value in obj)
+    return False
+
+
+class MsgspecCodec:
+    """`msgspec <https://jcristharif.com/msgspec/>`_'s JSON encoder and decoder.
+
+    Only used when selected by name: unlike :class:`OrjsonCodec` it does not
+    defer to the standard library when encoding, so NaN and infinities are
+    written as ``null`` and datetimes and dataclasses are encoded rather than
+    rejected. Documents msgspec cannot parse are handed to the standard
+    library, so invalid JSON still raises ``ValueError``.
+
+    Raises:
+        ImportError: If msgspec is not installed.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec  # type: ignore[import-not-found]
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._decode_error = msgspec.DecodeError
+
+    def loads(self, data: Union[bytes, bytearray, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error:
+            return _STDLIB.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+
+_STDLIB = StdlibJSONCodec()
+
+_CODECS: Dict[str, type] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": StdlibJSONCodec,
+}
+
+
+def _auto() -> JSONCodec:
+    # msgspec is left out: it encodes some values differently from the stdlib
+    # (see MsgspecCodec), so it has to be asked for by name.
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return StdlibJSONCodec()
+
+
+def _from_name(name: str) -> JSONCodec:
+    if name == "auto":
+        return _auto()
+    codec = _CODECS.get(name)
+    if codec is None:
+        raise ValueError(
+            f"Unknown JSON codec {name!r}; expected one of auto, {', '.join(_CODECS)}"
+        )
+    return codec()
+
+
+_codec: JSONCodec = _from_name(os.environ.get("WORKOS_JSON_CODEC", "auto"))
+
+
+def get_json_codec() -> JSONCodec:
+    """The codec currently used by the SDK."""
+    return _codec
+
+
+def set_json_codec(codec: Optional[Union[JSONCodec, str]] = None) -> JSONCodec:
+    """Choose the JSON codec used by every client in this process.
+
+    Args:
+        codec: A :class:`JSONCodec`, or one of ``"orjson"``, ``"msgspec"``,
+            ``"json"`` (the standard library) or ``"auto"``. ``None`` means
+            ``"auto"``, which picks orjson if it is installed and the
+            standard library otherwise; msgspec is only used when named. The initial codec can
+            also be set with the ``WORKOS_JSON_CODEC`` environment variable.
+
+    Returns:
+        The codec now in use.
+
+    Raises:
+        ValueError: If ``codec`` names an unknown codec.
+        ImportError: If ``codec`` names a codec that is not installed.
+    """
+    global _codec
+    if codec is None or isinstance(codec, str):
+        _codec = _from_name(codec or "auto")
+    else:
+        _codec = codec
+    return _codec
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """Parse JSON with the current codec."""
+    return _codec.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact UTF-8 JSON with the current codec."""
+    return _codec.dumps(obj)
@@ -0,0 +1,428 @@
+# @oagen-ignore-file
+
+"""A JWKS key store that keeps parsed signing keys warm for session validation."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+import jwt
+from jwt import PyJWK, PyJWKClientError, PyJWKSet
+
+# Seconds after a fetch when a lookup starts a background refresh.
+DEFAULT_JWKS_REFRESH_INTERVAL = 300.0
+# Seconds after a fetch when cached keys are no longer used.
+DEFAULT_JWKS_MAX_AGE = 3600.0
+# Minimum seconds between fetches caused by unknown key IDs.
+DEFAULT_JWKS_MIN_FETCH_INTERVAL = 10.0
+DEFAULT_JWKS_TIMEOUT = 10.0
+
+_now = time.monotonic
+
+
+@dataclass(frozen=True)
+class JWKSStats:
+    """A snapshot of :class:`JWKSKeyStore` counters."""
+
+    hits: int = 0
+    """Lookups answered from the cached keys."""
+    misses: int = 0
+    """Lookups whose key ID was not cached, or that found no usable keys."""
+    fetches: int = 0
+    """Successful JWKS fetches, in the foreground or the background."""
+    fetch_errors: int = 0
+    """JWKS fetches that failed."""
+    background_refreshes: int = 0
+    """Fetches made in the background ahead of expiry."""
+    keys: int = 0
+    """Signing keys currently cached."""
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered from the cached keys."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def parse_jwks(data: Dict[str, Any]) -> Dict[Optional[str], PyJWK]:
+    """Parse a JWKS document into ready-to-use keys by key ID.
+
+    Like :class:`jwt.PyJWKClient`, only keys with a ``kid`` whose ``use`` is
+    ``"sig"`` or unspecified are kept, and unsupported keys are skipped.
+
+    Raises:
+        PyJWKClientError: If the document has no usable signing keys.
+    """
+    try:
+        key_set = PyJWKSet.from_dict(data)
+    except jwt.PyJWTError as error:
+        raise PyJWKClientError(f"Invalid JWKS: {error}") from error
+    keys: Dict[Optional[str], PyJWK] = {
+        key.key_id: key
+        for key in key_set.keys
+        if key.key_id and key.public_key_use in ("sig", None)
+    }
+    if not keys:
+        raise PyJWKClientError("The JWKS endpoint did not contain any signing keys")
+    return keys
+
+
+class _KeyCache:
+    """Cached keys, counters and refresh timing for a JWKS endpoint."""
+
+    def __init__(
+        self,
+        *,
+        refresh_interval: float,
+        max_age: float,
+        min_fetch_interval: float,
+    ) -> None:
+        if not 0 < refresh_interval <= max_age:
+            raise ValueError("refresh_interval must be positive and at most max_age")
+        if min_fetch_interval < 0:
+            raise ValueError("min_fetch_interval must be 0 or greater")
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        self.min_fetch_interval = min_fetch_interval
+        self._keys: Dict[Optional[str], PyJWK] = {}
+        self._fetched_at: Optional[float] = None
+        self._last_attempt: Optional[float] = None
+        self._generation = 0
+        self._stats_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._fetches = 0
+        self._fetch_errors = 0
+        self._background_refreshes = 0
+
+    def _lookup(self, kid: Optional[str]) -> Optional[PyJWK]:
+        """Return the cached key for ``kid`` while the keys are fresh enough."""
+        if self._fetched_at is None or _now() - self._fetched_at >= self.max_age:
+            return None
+        return self._keys.get(kid)
+
+    def _needs_refresh(self) -> bool:
+        return (
+            self._fetched_at is not None
+            and _now() - self._fetched_at >= self.refresh_interval
+            and not self._recently_attempted()
+        )
+
+    def _recently_attempted(self) -> bool:
+        return (
+            self._last_attempt is not None
+            and _now() - self._last_attempt < self.min_fetch_interval
+        )
+
+    def _store(self, data: Dict[str, Any]) -> None:
+        try:
+            keys = parse_jwks(data)
+        except PyJWKClientError:
+            self._count("_fetch_errors")
+            raise
+        self._keys = keys
+        self._fetched_at = _now()
+        self._generation += 1
+        self._count("_fetches")
+
+    def _count(self, counter: str) -> None:
+        with self._stats_lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _hit(self, key: PyJWK) -> PyJWK:
+        self._count("_hits")
+        return key
+
+    def _fetch_failed(self, error: Exception) -> PyJWKClientError:
+        self._count("_fetch_errors")
+        return PyJWKClientError(f'Fail to fetch data from the url, err: "{error}"')
+
+    @staticmethod
+    def _kid(token: str) -> Optional[str]:
+        try:
+            return jwt.get_unverified_header(token).get("kid")
+        except jwt.DecodeError as error:
+            raise PyJWKClientError(f"Invalid token header: {error}") from error
+
+    @staticmethod
+    def _not_found(kid: Optional[str]) -> PyJWKClientError:
+        return PyJWKClientError(f'Unable to find a signing key that matches: "{kid}"')
+
+    def stats(self) -> JWKSStats:
+        """A snapshot of the store counters."""
+        with self._stats_lock:
+            return JWKSStats(
+                hits=self._hits,
+                misses=self._misses,
+                fetches=self._fetches,
+                fetch_errors=self._fetch_errors,
+                background_refreshes=self._background_refreshes,
+                keys=len(self._keys),
+            )
+
+
+class JWKSKeyStore(_KeyCache):
+    """Caches the parsed signing keys of a JWKS endpoint for JWT validation.
+
+    Keys are parsed once into public-key objects. A lookup more than
+    ``refresh_interval`` seconds after the last fetch returns the cached key
+    at once and refreshes the set in a background thread, so validating a
+    token only waits on the network when the store is cold, the keys are
+    older than ``max_age`` (e.g. because refreshes keep failing), or the
+    token's key ID is unknown. Fetches are single-flight: concurrent callers
+    wait for the one fetch in progress. Unknown key IDs trigger at most one
+    fetch per ``min_fetch_interval`` seconds, so tokens with made-up key IDs
+    cannot flood the endpoint.
+
+    A drop-in replacement for :class:`jwt.PyJWKClient` in
+    :class:`~workos.session.Session`, which shares one store per JWKS URL.
+
+    Args:
+        url: The JWKS URL.
+        refresh_interval: Age in seconds after which a lookup starts a
+            background refresh.
+        max_age: Age in seconds after which cached keys are not used.
+        min_fetch_interval: Minimum seconds between fetches caused by
+            unknown key IDs or failed refreshes.
+        timeout: Timeout in seconds for the default fetch.
+        fetch: Returns the JWKS document; defaults to an HTTP GET of ``url``.
+
+    Raises:
+        ValueError: If the intervals are inconsistent.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        refresh_interval: float = DEFAULT_JWKS_REFRESH_INTERVAL,
+        max_age: float = DEFAULT_JWKS_MAX_AGE,
+        min_fetch_interval: float = DEFAULT_JWKS_MIN_FETCH_INTERVAL,
+        timeout: float = DEFAULT_JWKS_TIMEOUT,
+        fetch: Optional[Callable[[], Dict[str, Any]]] = None,
+    ) -> None:
+        super().__init__(
+            refresh_interval=refresh_interval,
+            max_age=max_age,
+            min_fetch_interval=min_fetch_interval,
+        )
+        self.url = url
+        self.timeout = timeout
+        self._fetch_jwks = fetch or self._get
+        self._fetch_lock = threading.Lock()
+        self._refreshing = False
+
+    def _get(self) -> Dict[str, Any]:
+        response = httpx.get(self.url, timeout=self.timeout, follow_redirects=True)
+        response.raise_for_status()
+        return response.json()
+
+    def get_signing_key(self, kid: Optional[str]) -> PyJWK:
+        """Return the signing key for ``kid``.
+
+        Raises:
+            PyJWKClientError: If the key cannot be found or the JWKS cannot
+                be fetched.
+        """
+        key = self._lookup(kid)
+        if key is not None:
+            if self._needs_refresh():
+                self._refresh_in_background()
+            return self._hit(key)
+        self._count("_misses")
+        return self._fetch_for(kid)
+
+    def get_signing_key_from_jwt(self, token: str) -> PyJWK:
+        """Return the signing key named by the ``kid`` header of ``token``.
+
+        Raises:
+            PyJWKClientError: If the header is malformed, the key cannot be
+                found or the JWKS cannot be fetched.
+        """
+        return self.get_signing_key(self._kid(token))
+
+    def refresh(self) -> None:
+        """Fetch the keys now, e.g. at startup so the first request is fast.
+
+        Raises:
+            PyJWKClientError: If the JWKS cannot be fetched.
+        """
+        with self._fetch_lock:
+            self._fetch()
+
+    def _fetch(self) -> None:
+        """Fetch and store the keys; the caller holds ``_fetch_lock``."""
+        self._last_attempt = _now()
+        try:
+            data = self._fetch_jwks()
+        except Exception as error:
+            raise self._fetch_failed(error) from error
+        self._store(data)
+
+    def _fetch_for(self, kid: Optional[str]) -> PyJWK:
+        generation = self._generation
+        with self._fetch_lock:
+            # Another caller may have fetched while this one waited.
+            if self._generation == generation:
+                if self._recently_attempted():
+                    raise self._not_found(kid)
+                self._fetch()
+            key = self._lookup(kid)
+        if key is None:
+            raise self._not_found(kid)
+        return key
+
+    def _refresh_in_background(self) -> None:
+        with self._stats_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(
+            target=self._background_refresh, name="workos-jwks-refresh", daemon=True
+        ).start()
+
+    def _background_refresh(self) -> None:
+        try:
+            with self._fetch_lock:
+                if self._needs_refresh():
+                    self._fetch()
+                    self._count("_background_refreshes")
+        except PyJWKClientError:
+            # Keep serving the cached keys; the next lookup after
+            # ``min_fetch_interval`` tries again.
+            pass
+        finally:
+            with self._stats_lock:
+                self._refreshing = False
+
+
+class AsyncJWKSKeyStore(_KeyCache):
+    """The asyncio counterpart of :class:`JWKSKeyStore`.
+
+    Lookups served from the cache do not await anything. Fetches run as
+    tasks on the event loop through ``fetch``, which for
+    :attr:`AsyncWorkOSClient.jwks` uses the client's connection pool, so a
+    cold cache or a key rotation never blocks the loop. Concurrent lookups
+    that need a fetch await the same task, and background refreshes ahead
+    of expiry are tasks too.
+
+    Args:
+        url: The JWKS URL, for reference.
+        fetch: Returns the JWKS document.
+        refresh_interval: Age in seconds after which a lookup starts a
+            background refresh.
+        max_age: Age in seconds after which cached keys are not used.
+        min_fetch_interval: Minimum seconds between fetches caused by
+            unknown key IDs or failed refreshes.
+
+    Raises:
+        ValueError: If the intervals are inconsistent.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        fetch: Callable[[], Awaitable[Dict[str, Any]]],
+        refresh_interval: float = DEFAULT_JWKS_REFRESH_INTERVAL,
+        max_age: float = DEFAULT_JWKS_MAX_AGE,
+        min_fetch_interval: float = DEFAULT_JWKS_MIN_FETCH_INTERVAL,
+    ) -> None:
+        super().__init__(
+            refresh_interval=refresh_interval,
+            max_age=max_age,
+            min_fetch_interval=min_fetch_interval,
+        )
+        self.url = url
+        self._fetch_jwks = fetch
+        self._fetching: Optional[asyncio.Task[None]] = None
+        self._refresh_task: Optional[asyncio.Task[None]] = None
+
+    async def get_signing_key(self, kid: Optional[str]) -> PyJWK:
+        """Return the signing key for ``kid``.
+
+        Raises:
+            PyJWKClientError: If the key cannot be found or the JWKS cannot
+                be fetched.
+        """
+        key = self._lookup(kid)
+        if key is not None:
+            if self._needs_refresh():
+                self._refresh_in_background()
+            return self._hit(key)
+        self._count("_misses")
+        if self._fetching is None and self._recently_attempted():
+            raise self._not_found(kid)
+        await self._single_fetch()
+        key = self._lookup(kid)
+        if key is None:
+            raise self._not_found(kid)
+        return key
+
+    async def get_signing_key_from_jwt(self, token: str) -> PyJWK:
+        """Return the signing key named by the ``kid`` header of ``token``.
+
+        Raises:
+            PyJWKClientError: If the header is malformed, the key cannot be
+                found or the JWKS cannot be fetched.
+        """
+        return await self.get_signing_key(self._kid(token))
+
+    async def refresh(self) -> None:
+        """Fetch the keys now, or wait for the fetch in progress.
+
+        Raises:
+            PyJWKClientError: If the JWKS cannot be fetched.
+        """
+        await self._single_fetch()
+
+    async def _single_fetch(self) -> None:
+        if self._fetching is None:
+            self._fetching = asyncio.ensure_future(self._fetch())
+            self._fetching.add_done_callback(self._fetch_done)
+        # A cancelled caller must not cancel the fetch other callers await.
+        await asyncio.shield(self._fetching)
+
+    def _fetch_done(self, task: asyncio.Task[None]) -> None:
+        self._fetching = None
+        if not task.cancelled():
+            # Mark the error retrieved when every waiter was cancelled.
+            task.exception()
+
+    async def _fetch(self) -> None:
+        self._last_attempt = _now()
+        try:
+            data = await self._fetch_jwks()
+        except Exception as error:
+            raise self._fetch_failed(error) from error
+        self._store(data)
+
+    def _refresh_in_background(self) -> None:
+        if self._fetching is not None or (
+            self._refresh_task is not None and not self._refresh_task.done()
+        ):
+            return
+        self._refresh_task = asyncio.ensure_future(self._background_refresh())
+
+    async def _background_refresh(self) -> None:
+        try:
+            await self._single_fetch()
+        except PyJWKClientError:
+            # Keep serving the cached keys; the next lookup after
+            # ``min_fetch_interval`` tries again.
+            return
+        self._count("_background_refreshes")
+
+    async def close(self) -> None:
+        """Cancel a fetch or background refresh in progress."""
+        for task in (self._refresh_task, self._fetching):
+            if task is not None and not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError, PyJWKClientError):
+                    await task
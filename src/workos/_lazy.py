@@ -0,0 +1,161 @@
+# @oagen-ignore-file
+
+"""Lazy model deserialization: convert fields from the raw dict on first access.
+
+``lazy_from_dict(Model, data)`` returns an instance of a subclass of
+``Model`` that keeps ``data`` and converts each field the first time it is
+read, caching the result on the instance. Each field is converted by its
+loader in ``workos/_model_loaders.py``, which evaluates the specialized form
+of the expression the generated ``from_dict`` uses for it inside the same
+``except`` clauses, so values (and the errors raised for malformed ones) are
+the same as eager deserialization.
+
+Models whose ``from_dict`` is not a single ``cls(...)`` call, such as
+discriminated unions, are deserialized eagerly. ``EventSchema`` dispatches
+to a lazy instance of the matching event class.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar, cast
+
+from . import _event_dispatch
+from ._compiled import generated_loaders
+
+M = TypeVar("M")
+
+Loader = Callable[[Dict[str, Any]], Any]
+
+_EVENT_SCHEMA = "workos.events.models.event_schema.EventSchema"
+
+_loaders: Dict[type, Loader] = {}
+_lock = threading.Lock()
+
+
+def lazy_from_dict(model: Type[M], data: Dict[str, Any]) -> M:
+    """Build a ``model`` whose fields are converted from ``data`` on first access.
+
+    Args:
+        model: A generated model class.
+        data: The raw JSON object, which the instance keeps a reference to.
+
+    Returns:
+        An instance of ``model`` (a lazy subclass of it when supported).
+
+    Raises:
+        WorkOSError: If a required field is missing. Malformed
+            values raise when their field is first read.
+    """
+    return lazy_loader(model)(data)
+
+
+def lazy_loader(model: Type[M]) -> Callable[[Dict[str, Any]], M]:
+    """The lazy counterpart of ``model.from_dict``, built once per model."""
+    loader = _loaders.get(model)
+    if loader is None:
+        with _lock:
+            loader = _loaders.get(model)
+            if loader is None:
+                loader = _build_loader(model)
+                _loaders[model] = loader
+    return loader
+
+
+def _build_loader(model: Type[Any]) -> Loader:
+    if f"{model.__module__}.{model.__qualname__}" == _EVENT_SCHEMA:
+        return _dispatching_loader(model)
+    loaders = generated_loaders(model)
+    if loaders is None:
+        return model.from_dict
+    _, fields, required = loaders
+    return _lazy_class(model, fields, required)
+
+
+def _dispatching_loader(model: Type[Any]) -> Loader:
+    """Dispatch on the ``event`` discriminator, like ``EventSchema.from_dict``."""
+
+    def load(data: Dict[str, Any]) -> Any:
+        variant = _event_dispatch.variant(data.get("event"))
+        if variant is None:
+            return model.from_dict(data)
+        return lazy_loader(cast(type, variant))(data)
+
+    return load
+
+
+_MISSING: Any = object()
+
+
+class _LazyField:
+    """Converts a field from the raw dict on first read and caches the value."""
+
+    __slots__ = ("name", "load")
+
+    def __init__(self, name: str, load: Loader) -> None:
+        self.name = name
+        self.load = load
+
+    def __get__(self, obj: Any, owner: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        values = obj._lazy_values
+        value = values.get(self.name, _MISSING)
+        if value is _MISSING:
+            value = values[self.name] = self.load(obj._lazy_data)
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        obj._lazy_values[self.name] = value
+
+
+def _lazy_class(
+    model: Type[Any], loaders: Dict[str, Loader], required: Tuple[str, ...]
+) -> Loader:
+    if not dataclasses.is_dataclass(model):
+        return model.from_dict
+    names = tuple(field.name for field in dataclasses.fields(model))
+    if set(names) != set(loaders):
+        return model.from_dict
+
+    def __init__(self: Any, *args: Any, **kwargs: Any) -> None:
+        # Only reached through dataclasses.replace() and the like.
+        self._lazy_values = {}
+        model.__init__(self, *args, **kwargs)
+
+    def __eq__(self: Any, other: Any) -> Any:
+        if not isinstance(other, model):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in names)
+
+    def __reduce__(self: Any) -> Any:
+        # Pickle and copy as the eager model.
+        return (model, tuple(getattr(self, name) for name in names))
+
+    namespace: Dict[str, Any] = {
+        "__slots__": ("_lazy_data", "_lazy_values"),
+        "__init__": __init__,
+        "__module__": model.__module__,
+        "__qualname__": model.__qualname__,
+        "__doc__": model.__doc__,
+        "__eq__": __eq__,
+        "__hash__": model.__hash__,
+        "__reduce__": __reduce__,
+    }
+    for name in names:
+        namespace[name] = _LazyField(name, loaders[name])
+    lazy = type(model.__name__, (model,), namespace)
+    new = object.__new__
+
+    def load(data: Dict[str, Any]) -> Any:
+        for key in required:
+            if key not in data:
+                # Raises the same error eager deserialization does.
+                return model.from_dict(data)
+        instance = new(lazy)
+        instance._lazy_data = data
+        instance._lazy_values = {}
+        return instance
+
+    return load
@@ -0,0 +1,130 @@
+# @oagen-ignore-file
+
+"""Clients whose service accessors import each service on first use.
+
+The generated ``workos/_client.py`` imports all of the service modules up
+front. ``import workos`` exports these classes in its place. They have the
+same accessors, but each one imports its service module the first time it is
+read. Type checkers still see the generated classes, and
+``tests/test_lazy_imports.py`` checks that both define the same accessors.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, Optional
+
+from ._base_client import (
+    AsyncWorkOSClient as _AsyncBase,
+    WorkOSClient as _SyncBase,
+)
+
+
+class _Service:
+    """Like ``functools.cached_property``, building the service of an accessor.
+
+    The service class is imported from ``module`` on first access.
+    """
+
+    def __init__(self, module: str, name: str, *, with_client: bool = True) -> None:
+        self.module = module
+        self.name = name
+        self.with_client = with_client
+        self.attr = name
+
+    def __set_name__(self, owner: type, attr: str) -> None:
+        self.attr = attr
+
+    def __get__(self, client: Any, owner: Optional[type] = None) -> Any:
+        if client is None:
+            return self
+        service_class = getattr(
+            importlib.import_module(self.module, __package__), self.name
+        )
+        service = service_class(client) if self.with_client else service_class()
+        client.__dict__[self.attr] = service
+        return service
+
+
+class _Alias:
+    """An accessor returning another accessor's service."""
+
+    def __init__(self, target: str) -> None:
+        self.target = target
+
+    def __get__(self, client: Any, owner: Optional[type] = None) -> Any:
+        if client is None:
+            return self
+        return getattr(client, self.target)
+
+
+class WorkOSClient(_SyncBase):
+    """Synchronous WorkOS API client with service accessors."""
+
+    agents = _Service(".agents._resource", "Agents")
+    multi_factor_auth = _Service(".multi_factor_auth._resource", "MultiFactorAuth")
+    connect = _Service(".connect._resource", "Connect")
+    authorization = _Service(".authorization._resource", "Authorization")
+    client_api = _Service(".client_api._resource", "ClientApi")
+    sso = _Service(".sso._resource", "SSO")
+    pipes = _Service(".pipes._resource", "Pipes")
+    directory_sync = _Service(".directory_sync._resource", "DirectorySync")
+    events = _Service(".events._resource", "Events")
+    feature_flags = _Service(".feature_flags._resource", "FeatureFlags")
+    organization_domains = _Service(
+        ".organization_domains._resource", "OrganizationDomains"
+    )
+    organizations = _Service(".organizations._resource", "Organizations")
+    api_keys = _Service(".api_keys._resource", "ApiKeys")
+    pipes_provider = _Service(".pipes_provider._resource", "PipesProvider")
+    groups = _Service(".groups._resource", "Groups")
+    admin_portal = _Service(".admin_portal._resource", "AdminPortal")
+    radar = _Service(".radar._resource", "Radar")
+    user_management = _Service(".user_management._resource", "UserManagement")
+    organization_membership = _Service(
+        ".organization_membership._resource", "OrganizationMembershipService"
+    )
+    vault = _Service(".vault._resource", "Vault")
+    webhooks = _Service(".webhooks._resource", "Webhooks")
+    widgets = _Service(".widgets._resource", "Widgets")
+    audit_logs = _Service(".audit_logs._resource", "AuditLogs")
+    mfa = _Alias("multi_factor_auth")
+    passwordless = _Service(".passwordless", "Passwordless")
+    actions = _Service(".actions", "Actions", with_client=False)
+    pkce = _Service(".pkce", "PKCE", with_client=False)
+
+
+class AsyncWorkOSClient(_AsyncBase):
+    """Asynchronous WorkOS API client with service accessors."""
+
+    agents = _Service(".agents._resource", "AsyncAgents")
+    multi_factor_auth = _Service(".multi_factor_auth._resource", "AsyncMultiFactorAuth")
+    connect = _Service(".connect._resource", "AsyncConnect")
+    authorization = _Service(".authorization._resource", "AsyncAuthorization")
+    client_api = _Service(".client_api._resource", "AsyncClientApi")
+    sso = _Service(".sso._resource", "AsyncSSO")
+    pipes = _Service(".pipes._resource", "AsyncPipes")
+    directory_sync = _Service(".directory_sync._resource", "AsyncDirectorySync")
+    events = _Service(".events._resource", "AsyncEvents")
+    feature_flags = _Service(".feature_flags._resource", "AsyncFeatureFlags")
+    organization_domains = _Service(
+        ".organization_domains._resource", "AsyncOrganizationDomains"
+    )
+    organizations = _Service(".organizations._resource", "AsyncOrganizations")
+    api_keys = _Service(".api_keys._resource", "AsyncApiKeys")
+    pipes_provider = _Service(".pipes_provider._resource", "AsyncPipesProvider")
+    groups = _Service(".groups._resource", "AsyncGroups")
+    admin_portal = _Service(".admin_portal._resource", "AsyncAdminPortal")
+    radar = _Service(".radar._resource", "AsyncRadar")
+    user_management = _Service(".user_management._resource", "AsyncUserManagement")
+    organization_membership = _Service(
+        ".organization_membership._resource", "AsyncOrganizationMembershipService"
+    )
+    vault = _Service(".vault._resource", "AsyncVault")
+    webhooks = _Service(".webhooks._resource", "AsyncWebhooks")
+    widgets = _Service(".widgets._resource", "AsyncWidgets")
+    audit_logs = _Service(".audit_logs._resource", "AsyncAuditLogs")
+    mfa = _Alias("multi_factor_auth")
+    passwordless = _Service(".passwordless", "AsyncPasswordless")
+    actions = _Service(".actions", "AsyncActions", with_client=False)
+    pkce = _Service(".pkce", "PKCE", with_client=False)
@@ -0,0 +1,532 @@
+# @oagen-ignore-file
+
+"""Lazy stand-ins for the generated ``workos.common`` model barrels.
+
+The generated ``workos/common/__init__.py`` and
+``workos/common/models/__init__.py`` import several hundred model modules as
+soon as anything touches ``workos.common``. Importing this module, which
+``workos/__init__.py`` does first, registers modules in their place that
+import each model the first time it is accessed. The generated barrels are
+left as they are and are what type checkers read;
+``tests/test_lazy_imports.py`` checks that :data:`_MODELS` exports the same
+names.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import sys
+import types
+from typing import Any, Dict, List
+
+_MODELS_PACKAGE = "workos.common.models"
+
+# Each name exported by the generated barrels, and the module under
+# ``workos.common.models`` that defines it.
+_MODELS: Dict[str, str] = {
+    "AccessTokenAgentRegistrationCredentialIssuedDataDetail": "access_token_agent_registration_credential_issued_data_detail",
+    "ActionAuthenticationDenied": "action_authentication_denied",
+    "ActionAuthenticationDeniedData": "action_authentication_denied_data",
+    "ActionUserRegistrationDenied": "action_user_registration_denied",
+    "ActionUserRegistrationDeniedData": "action_user_registration_denied_data",
+    "Actor": "actor",
+    "AddRolePermission": "add_role_permission",
+    "AgentAdminValidateCredentialRequestType": "agent_admin_validate_credential_request_type",
+    "AgentRegistrationClaimAttemptCreated": "agent_registration_claim_attempt_created",
+    "AgentRegistrationClaimAttemptCreatedData": "agent_registration_claim_attempt_created_data",
+    "AgentRegistrationClaimCompleted": "agent_registration_claim_completed",
+    "AgentRegistrationClaimCompletedData": "agent_registration_claim_completed_data",
+    "AgentRegistrationClaimCompletedDataClaimedBy": "agent_registration_claim_completed_data_claimed_by",
+    "AgentRegistrationCreated": "agent_registration_created",
+    "AgentRegistrationCreatedData": "agent_registration_created_data",
+    "AgentRegistrationCreatedDataAgentIdentity": "agent_registration_created_data_agent_identity",
+    "AgentRegistrationCreatedDataKind": "agent_registration_created_data_kind",
+    "AgentRegistrationCreatedDataKindLiteral": "agent_registration_created_data_kind",
+    "AgentRegistrationCreatedDataMethod": "agent_registration_created_data_method",
+    "AgentRegistrationCreatedDataMethodLiteral": "agent_registration_created_data_method",
+    "AgentRegistrationCreatedDataStatus": "agent_registration_created_data_status",
+    "AgentRegistrationCreatedDataStatusLiteral": "agent_registration_created_data_status",
+    "AgentRegistrationCredentialIssued": "agent_registration_credential_issued",
+    "AgentRegistrationCredentialIssuedData": "agent_registration_credential_issued_data",
+    "AgentRegistrationCredentialIssuedDataDetail": "agent_registration_credential_issued_data_detail",
+    "AgentRegistrationDeleted": "agent_registration_deleted",
+    "AgentRegistrationDeletedData": "agent_registration_deleted_data",
+    "AgentRegistrationExpired": "agent_registration_expired",
+    "AgentRegistrationExpiredData": "agent_registration_expired_data",
+    "AgentRegistrationKind": "agent_registration_kind",
+    "AgentRegistrationOrganizationSwitched": "agent_registration_organization_switched",
+    "AgentRegistrationOrganizationSwitchedData": "agent_registration_organization_switched_data",
+    "AgentRegistrationRefreshed": "agent_registration_refreshed",
+    "AgentRegistrationRefreshedData": "agent_registration_refreshed_data",
+    "AgentRegistrationRevoked": "agent_registration_revoked",
+    "AgentRegistrationRevokedData": "agent_registration_revoked_data",
+    "AgentRegistrationStatus": "agent_registration_status",
+    "ApiKeyCreated": "api_key_created",
+    "ApiKeyCreatedData": "api_key_created_data",
+    "ApiKeyCreatedDataOwner": "api_key_created_data_owner",
+    "ApiKeyRevoked": "api_key_revoked",
+    "ApiKeyRevokedData": "api_key_revoked_data",
+    "ApiKeyRevokedDataOwner": "api_key_revoked_data_owner",
+    "ApiKeyUpdated": "api_key_updated",
+    "ApiKeyUpdatedData": "api_key_updated_data",
+    "ApiKeyUpdatedDataOwner": "api_key_updated_data_owner",
+    "ApiKeyUpdatedDataPreviousAttribute": "api_key_updated_data_previous_attribute",
+    "AuditLogConfigurationLogStreamState": "audit_log_configuration_log_stream_state",
+    "AuditLogConfigurationLogStreamType": "audit_log_configuration_log_stream_type",
+    "AuditLogConfigurationState": "audit_log_configuration_state",
+    "AuditLogExportState": "audit_log_export_state",
+    "AuthMethodMismatchError": "auth_method_mismatch_error",
+    "AuthenticateResponseAuthenticationMethod": "authenticate_response_authentication_method",
+    "AuthenticateResponseImpersonator": "authenticate_response_impersonator",
+    "AuthenticationChallenge": "authentication_challenge",
+    "AuthenticationEmailVerificationFailed": "authentication_email_verification_failed",
+    "AuthenticationEmailVerificationFailedData": "authentication_email_verification_failed_data",
+    "AuthenticationEmailVerificationFailedDataError": "authentication_email_verification_failed_data_error",
+    "AuthenticationEmailVerificationSucceeded": "authentication_email_verification_succeeded",
+    "AuthenticationEmailVerificationSucceededData": "authentication_email_verification_succeeded_data",
+    "AuthenticationFactor": "authentication_factor",
+    "AuthenticationFactorEnrolled": "authentication_factor_enrolled",
+    "AuthenticationFactorEnrolledSms": "authentication_factor_enrolled_sms",
+    "AuthenticationFactorEnrolledTotp": "authentication_factor_enrolled_totp",
+    "AuthenticationFactorEnrolledType": "authentication_factor_enrolled_type",
+    "AuthenticationFactorSms": "authentication_factor_sms",
+    "AuthenticationFactorTotp": "authentication_factor_totp",
+    "AuthenticationFactorType": "authentication_factor_type",
+    "AuthenticationFactorsCreateRequestType": "authentication_factors_create_request_type",
+    "AuthenticationMFAFailed": "authentication_mfa_failed",
+    "AuthenticationMFAFailedData": "authentication_mfa_failed_data",
+    "AuthenticationMFAFailedDataError": "authentication_mfa_failed_data_error",
+    "AuthenticationMFASucceeded": "authentication_mfa_succeeded",
+    "AuthenticationMFASucceededData": "authentication_mfa_succeeded_data",
+    "AuthenticationMagicAuthFailed": "authentication_magic_auth_failed",
+    "AuthenticationMagicAuthFailedData": "authentication_magic_auth_failed_data",
+    "AuthenticationMagicAuthFailedDataError": "authentication_magic_auth_failed_data_error",
+    "AuthenticationMagicAuthSucceeded": "authentication_magic_auth_succeeded",
+    "AuthenticationMagicAuthSucceededData": "authentication_magic_auth_succeeded_data",
+    "AuthenticationOAuthFailed": "authentication_oauth_failed",
+    "AuthenticationOAuthFailedData": "authentication_oauth_failed_data",
+    "AuthenticationOAuthFailedDataError": "authentication_oauth_failed_data_error",
+    "AuthenticationOAuthSucceeded": "authentication_oauth_succeeded",
+    "AuthenticationOAuthSucceededData": "authentication_oauth_succeeded_data",
+    "AuthenticationPasskeyFailed": "authentication_passkey_failed",
+    "AuthenticationPasskeyFailedData": "authentication_passkey_failed_data",
+    "AuthenticationPasskeyFailedDataError": "authentication_passkey_failed_data_error",
+    "AuthenticationPasskeySucceeded": "authentication_passkey_succeeded",
+    "AuthenticationPasskeySucceededData": "authentication_passkey_succeeded_data",
+    "AuthenticationPasswordFailed": "authentication_password_failed",
+    "AuthenticationPasswordFailedData": "authentication_password_failed_data",
+    "AuthenticationPasswordFailedDataError": "authentication_password_failed_data_error",
+    "AuthenticationPasswordSucceeded": "authentication_password_succeeded",
+    "AuthenticationPasswordSucceededData": "authentication_password_succeeded_data",
+    "AuthenticationRadarRiskDetected": "authentication_radar_risk_detected",
+    "AuthenticationRadarRiskDetectedData": "authentication_radar_risk_detected_data",
+    "AuthenticationRadarRiskDetectedDataAction": "authentication_radar_risk_detected_data_action",
+    "AuthenticationRadarRiskDetectedDataActionLiteral": "authentication_radar_risk_detected_data_action",
+    "AuthenticationReauthenticationSucceeded": "authentication_reauthentication_succeeded",
+    "AuthenticationReauthenticationSucceededData": "authentication_reauthentication_succeeded_data",
+    "AuthenticationSSOFailed": "authentication_sso_failed",
+    "AuthenticationSSOFailedData": "authentication_sso_failed_data",
+    "AuthenticationSSOFailedDataError": "authentication_sso_failed_data_error",
+    "AuthenticationSSOFailedDataSSO": "authentication_sso_failed_data_sso",
+    "AuthenticationSSOStarted": "authentication_sso_started",
+    "AuthenticationSSOStartedData": "authentication_sso_started_data",
+    "AuthenticationSSOStartedDataSSO": "authentication_sso_started_data_sso",
+    "AuthenticationSSOSucceeded": "authentication_sso_succeeded",
+    "AuthenticationSSOSucceededData": "authentication_sso_succeeded_data",
+    "AuthenticationSSOSucceededDataSSO": "authentication_sso_succeeded_data_sso",
+    "AuthenticationSSOTimedOut": "authentication_sso_timed_out",
+    "AuthenticationSSOTimedOutData": "authentication_sso_timed_out_data",
+    "AuthenticationSSOTimedOutDataError": "authentication_sso_timed_out_data_error",
+    "AuthenticationSSOTimedOutDataSSO": "authentication_sso_timed_out_data_sso",
+    "AuthorizationPermission": "authorization_permission",
+    "ClaimViewResponseStatus": "claim_view_response_status",
+    "ConnectApplication": "connect_application",
+    "ConnectApplicationM2M": "connect_application_m2m",
+    "ConnectApplicationOAuth": "connect_application_oauth",
+    "ConnectApplicationOAuthRedirectUris": "connect_application_oauth_redirect_uris",
+    "ConnectApplicationUnknown": "connect_application",
+    "ConnectApplicationVariant": "connect_application",
+    "ConnectedAccount": "connected_account",
+    "ConnectedAccountAuthMethod": "connected_account_auth_method",
+    "ConnectedAccountInputState": "connected_account_input_state",
+    "ConnectedAccountState": "connected_account_state",
+    "ConnectionActivated": "connection_activated",
+    "ConnectionActivatedData": "connection_activated_data",
+    "ConnectionActivatedDataConnectionType": "connection_activated_data_connection_type",
+    "ConnectionActivatedDataConnectionTypeLiteral": "connection_activated_data_connection_type",
+    "ConnectionActivatedDataDomain": "connection_activated_data_domain",
+    "ConnectionActivatedDataState": "connection_activated_data_state",
+    "ConnectionActivatedDataStateLiteral": "connection_activated_data_state",
+    "ConnectionActivatedDataStatus": "connection_activated_data_status",
+    "ConnectionActivatedDataStatusLiteral": "connection_activated_data_status",
+    "ConnectionDeactivated": "connection_deactivated",
+    "ConnectionDeactivatedData": "connection_deactivated_data",
+    "ConnectionDeactivatedDataConnectionType": "connection_deactivated_data_connection_type",
+    "ConnectionDeactivatedDataDomain": "connection_deactivated_data_domain",
+    "ConnectionDeactivatedDataState": "connection_deactivated_data_state",
+    "ConnectionDeactivatedDataStatus": "connection_deactivated_data_status",
+    "ConnectionDeleted": "connection_deleted",
+    "ConnectionDeletedData": "connection_deleted_data",
+    "ConnectionDeletedDataConnectionType": "connection_deleted_data_connection_type",
+    "ConnectionDeletedDataState": "connection_deleted_data_state",
+    "ConnectionSAMLCertificateRenewalRequired": "connection_saml_certificate_renewal_required",
+    "ConnectionSAMLCertificateRenewalRequiredData": "connection_saml_certificate_renewal_required_data",
+    "ConnectionSAMLCertificateRenewalRequiredDataCertificate": "connection_saml_certificate_renewal_required_data_certificate",
+    "ConnectionSAMLCertificateRenewalRequiredDataCertificateCertificateType": "connection_saml_certificate_renewal_required_data_certificate_certificate_type",
+    "ConnectionSAMLCertificateRenewalRequiredDataCertificateCertificateTypeLiteral": "connection_saml_certificate_renewal_required_data_certificate_certificate_type",
+    "ConnectionSAMLCertificateRenewalRequiredDataConnection": "connection_saml_certificate_renewal_required_data_connection",
+    "ConnectionSAMLCertificateRenewed": "connection_saml_certificate_renewed",
+    "ConnectionSAMLCertificateRenewedData": "connection_saml_certificate_renewed_data",
+    "ConnectionSAMLCertificateRenewedDataCertificate": "connection_saml_certificate_renewed_data_certificate",
+    "ConnectionSAMLCertificateRenewedDataCertificateCertificateType": "connection_saml_certificate_renewed_data_certificate_certificate_type",
+    "ConnectionSAMLCertificateRenewedDataConnection": "connection_saml_certificate_renewed_data_connection",
+    "ConnectionState": "connection_state",
+    "ConnectionStatus": "connection_status",
+    "ConnectionType": "connection_type",
+    "CreateDataIntegrationAuthMethods": "create_data_integration_auth_methods",
+    "CreateUserInviteOptionsLocale": "create_user_invite_options_locale",
+    "CreateUserPasswordHashType": "create_user_password_hash_type",
+    "CreateUserPasswordSaltPosition": "create_user_password_salt_position",
+    "CreateWebhookEndpointEvents": "create_webhook_endpoint_events",
+    "CustomProviderDefinitionAuthenticateVia": "custom_provider_definition_authenticate_via",
+    "DataIntegrationAccessTokenResponseError": "data_integration_access_token_response_error",
+    "DataIntegrationAuthMethods": "data_integration_auth_methods",
+    "DataIntegrationCredentialType": "data_integration_credential_type",
+    "DataIntegrationCredentialsCredentialsType": "data_integration_credentials_credentials_type",
+    "DataIntegrationCredentialsInputType": "data_integration_credentials_input_type",
+    "DataIntegrationCredentialsResponseError": "data_integration_credentials_response_error",
+    "DataIntegrationCustomProviderAuthenticateVia": "data_integration_custom_provider_authenticate_via",
+    "DataIntegrationState": "data_integration_state",
+    "DataIntegrationsListResponseDataAuthMethods": "data_integrations_list_response_data_auth_methods",
+    "DataIntegrationsListResponseDataConnectedAccountAuthMethod": "data_integrations_list_response_data_connected_account_auth_method",
+    "DataIntegrationsListResponseDataConnectedAccountState": "data_integrations_list_response_data_connected_account_state",
+    "DataIntegrationsListResponseDataOwnership": "data_integrations_list_response_data_ownership",
+    "DirectoryGroup": "directory_group",
+    "DirectoryState": "directory_state",
+    "DirectoryType": "directory_type",
+    "DirectoryUser": "directory_user",
+    "DirectoryUserEmail": "directory_user_email",
+    "DirectoryUserState": "directory_user_state",
+    "DirectoryUserStateLiteral": "directory_user_state",
+    "DirectoryUserWithGroupsState": "directory_user_with_groups_state",
+    "DsyncActivated": "dsync_activated",
+    "DsyncActivatedData": "dsync_activated_data",
+    "DsyncActivatedDataDomain": "dsync_activated_data_domain",
+    "DsyncActivatedDataState": "dsync_activated_data_state",
+    "DsyncActivatedDataStateLiteral": "dsync_activated_data_state",
+    "DsyncActivatedDataType": "dsync_activated_data_type",
+    "DsyncActivatedDataTypeLiteral": "dsync_activated_data_type",
+    "DsyncDeleted": "dsync_deleted",
+    "DsyncDeletedData": "dsync_deleted_data",
+    "DsyncDeletedDataState": "dsync_deleted_data_state",
+    "DsyncDeletedDataType": "dsync_deleted_data_type",
+    "DsyncGroupCreated": "dsync_group_created",
+    "DsyncGroupDeleted": "dsync_group_deleted",
+    "DsyncGroupUpdated": "dsync_group_updated",
+    "DsyncGroupUpdatedData": "dsync_group_updated_data",
+    "DsyncGroupUserAdded": "dsync_group_user_added",
+    "DsyncGroupUserAddedData": "dsync_group_user_added_data",
+    "DsyncGroupUserRemoved": "dsync_group_user_removed",
+    "DsyncGroupUserRemovedData": "dsync_group_user_removed_data",
+    "DsyncTokenCreated": "dsync_token_created",
+    "DsyncTokenCreatedData": "dsync_token_created_data",
+    "DsyncTokenRevoked": "dsync_token_revoked",
+    "DsyncTokenRevokedData": "dsync_token_revoked_data",
+    "DsyncUserCreated": "dsync_user_created",
+    "DsyncUserDeleted": "dsync_user_deleted",
+    "DsyncUserUpdated": "dsync_user_updated",
+    "DsyncUserUpdatedData": "dsync_user_updated_data",
+    "DsyncUserUpdatedDataEmail": "dsync_user_updated_data_email",
+    "DsyncUserUpdatedDataState": "dsync_user_updated_data_state",
+    "EmailVerificationCreated": "email_verification_created",
+    "EmailVerificationCreatedData": "email_verification_created_data",
+    "ErrorResponse": "error_response",
+    "EventContext": "event_context",
+    "EventContextActor": "event_context_actor",
+    "EventContextActorSource": "event_context_actor_source",
+    "EventContextActorSourceLiteral": "event_context_actor_source",
+    "EventContextGoogleAnalyticsSession": "event_context_google_analytics_session",
+    "FeatureFlag": "feature_flag",
+    "FeatureFlagOwner": "feature_flag_owner",
+    "Flag": "flag",
+    "FlagCreated": "flag_created",
+    "FlagCreatedContext": "flag_created_context",
+    "FlagCreatedContextActor": "flag_created_context_actor",
+    "FlagCreatedContextActorSource": "flag_created_context_actor_source",
+    "FlagCreatedData": "flag_created_data",
+    "FlagCreatedDataOwner": "flag_created_data_owner",
+    "FlagDeleted": "flag_deleted",
+    "FlagDeletedContext": "flag_deleted_context",
+    "FlagDeletedContextActor": "flag_deleted_context_actor",
+    "FlagDeletedContextActorSource": "flag_deleted_context_actor_source",
+    "FlagDeletedData": "flag_deleted_data",
+    "FlagDeletedDataOwner": "flag_deleted_data_owner",
+    "FlagOwner": "flag_owner",
+    "FlagRuleUpdated": "flag_rule_updated",
+    "FlagRuleUpdatedContext": "flag_rule_updated_context",
+    "FlagRuleUpdatedContextAccessType": "flag_rule_updated_context_access_type",
+    "FlagRuleUpdatedContextAccessTypeLiteral": "flag_rule_updated_context_access_type",
+    "FlagRuleUpdatedContextActor": "flag_rule_updated_context_actor",
+    "FlagRuleUpdatedContextActorSource": "flag_rule_updated_context_actor_source",
+    "FlagRuleUpdatedContextConfiguredTarget": "flag_rule_updated_context_configured_target",
+    "FlagRuleUpdatedContextConfiguredTargetOrganization": "flag_rule_updated_context_configured_target_organization",
+    "FlagRuleUpdatedContextConfiguredTargetUser": "flag_rule_updated_context_configured_target_user",
+    "FlagRuleUpdatedContextPreviousAttribute": "flag_rule_updated_context_previous_attribute",
+    "FlagRuleUpdatedContextPreviousAttributeContext": "flag_rule_updated_context_previous_attribute_context",
+    "FlagRuleUpdatedContextPreviousAttributeContextAccessType": "flag_rule_updated_context_previous_attribute_context_access_type",
+    "FlagRuleUpdatedContextPreviousAttributeContextConfiguredTarget": "flag_rule_updated_context_previous_attribute_context_configured_target",
+    "FlagRuleUpdatedContextPreviousAttributeContextConfiguredTargetOrganization": "flag_rule_updated_context_previous_attribute_context_configured_target_organization",
+    "FlagRuleUpdatedContextPreviousAttributeContextConfiguredTargetUser": "flag_rule_updated_context_previous_attribute_context_configured_target_user",
+    "FlagRuleUpdatedContextPreviousAttributeData": "flag_rule_updated_context_previous_attribute_data",
+    "FlagRuleUpdatedData": "flag_rule_updated_data",
+    "FlagRuleUpdatedDataOwner": "flag_rule_updated_data_owner",
+    "FlagUpdated": "flag_updated",
+    "FlagUpdatedContext": "flag_updated_context",
+    "FlagUpdatedContextActor": "flag_updated_context_actor",
+    "FlagUpdatedContextActorSource": "flag_updated_context_actor_source",
+    "FlagUpdatedContextPreviousAttribute": "flag_updated_context_previous_attribute",
+    "FlagUpdatedContextPreviousAttributeData": "flag_updated_context_previous_attribute_data",
+    "FlagUpdatedData": "flag_updated_data",
+    "FlagUpdatedDataOwner": "flag_updated_data_owner",
+    "GenerateLinkIntent": "generate_link_intent",
+    "Group": "group",
+    "GroupCreated": "group_created",
+    "GroupDeleted": "group_deleted",
+    "GroupMemberAdded": "group_member_added",
+    "GroupMemberAddedData": "group_member_added_data",
+    "GroupMemberRemoved": "group_member_removed",
+    "GroupMemberRemovedData": "group_member_removed_data",
+    "GroupUpdated": "group_updated",
+    "InvitationAccepted": "invitation_accepted",
+    "InvitationAcceptedData": "invitation_accepted_data",
+    "InvitationAcceptedDataState": "invitation_accepted_data_state",
+    "InvitationAcceptedDataStateLiteral": "invitation_accepted_data_state",
+    "InvitationCreated": "invitation_created",
+    "InvitationCreatedData": "invitation_created_data",
+    "InvitationCreatedDataState": "invitation_created_data_state",
+    "InvitationResent": "invitation_resent",
+    "InvitationResentData": "invitation_resent_data",
+    "InvitationResentDataState": "invitation_resent_data_state",
+    "InvitationRevoked": "invitation_revoked",
+    "InvitationRevokedData": "invitation_revoked_data",
+    "InvitationRevokedDataState": "invitation_revoked_data_state",
+    "InvitationState": "invitation_state",
+    "ListMetadata": "list_metadata",
+    "MagicAuthCreated": "magic_auth_created",
+    "MagicAuthCreatedData": "magic_auth_created_data",
+    "OrganizationCreated": "organization_created",
+    "OrganizationCreatedData": "organization_created_data",
+    "OrganizationCreatedDataDomain": "organization_created_data_domain",
+    "OrganizationCreatedDataDomainState": "organization_created_data_domain_state",
+    "OrganizationCreatedDataDomainStateLiteral": "organization_created_data_domain_state",
+    "OrganizationCreatedDataDomainVerificationStrategy": "organization_created_data_domain_verification_strategy",
+    "OrganizationCreatedDataDomainVerificationStrategyLiteral": "organization_created_data_domain_verification_strategy",
+    "OrganizationDeleted": "organization_deleted",
+    "OrganizationDeletedData": "organization_deleted_data",
+    "OrganizationDeletedDataDomain": "organization_deleted_data_domain",
+    "OrganizationDeletedDataDomainState": "organization_deleted_data_domain_state",
+    "OrganizationDeletedDataDomainVerificationStrategy": "organization_deleted_data_domain_verification_strategy",
+    "OrganizationDomain": "organization_domain",
+    "OrganizationDomainCreated": "organization_domain_created",
+    "OrganizationDomainCreatedData": "organization_domain_created_data",
+    "OrganizationDomainCreatedDataState": "organization_domain_created_data_state",
+    "OrganizationDomainCreatedDataVerificationStrategy": "organization_domain_created_data_verification_strategy",
+    "OrganizationDomainDataState": "organization_domain_data_state",
+    "OrganizationDomainDeleted": "organization_domain_deleted",
+    "OrganizationDomainDeletedData": "organization_domain_deleted_data",
+    "OrganizationDomainDeletedDataState": "organization_domain_deleted_data_state",
+    "OrganizationDomainDeletedDataVerificationStrategy": "organization_domain_deleted_data_verification_strategy",
+    "OrganizationDomainState": "organization_domain_state",
+    "OrganizationDomainUpdated": "organization_domain_updated",
+    "OrganizationDomainUpdatedData": "organization_domain_updated_data",
+    "OrganizationDomainUpdatedDataState": "organization_domain_updated_data_state",
+    "OrganizationDomainUpdatedDataVerificationStrategy": "organization_domain_updated_data_verification_strategy",
+    "OrganizationDomainVerificationFailed": "organization_domain_verification_failed",
+    "OrganizationDomainVerificationFailedData": "organization_domain_verification_failed_data",
+    "OrganizationDomainVerificationFailedDataOrganizationDomain": "organization_domain_verification_failed_data_organization_domain",
+    "OrganizationDomainVerificationFailedDataOrganizationDomainState": "organization_domain_verification_failed_data_organization_domain_state",
+    "OrganizationDomainVerificationFailedDataOrganizationDomainVerificationStrategy": "organization_domain_verification_failed_data_organization_domain_verification_strategy",
+    "OrganizationDomainVerificationFailedDataReason": "organization_domain_verification_failed_data_reason",
+    "OrganizationDomainVerificationFailedDataReasonLiteral": "organization_domain_verification_failed_data_reason",
+    "OrganizationDomainVerificationStrategy": "organization_domain_verification_strategy",
+    "OrganizationDomainVerified": "organization_domain_verified",
+    "OrganizationDomainVerifiedData": "organization_domain_verified_data",
+    "OrganizationDomainVerifiedDataState": "organization_domain_verified_data_state",
+    "OrganizationDomainVerifiedDataVerificationStrategy": "organization_domain_verified_data_verification_strategy",
+    "OrganizationMembershipCreated": "organization_membership_created",
+    "OrganizationMembershipCreatedData": "organization_membership_created_data",
+    "OrganizationMembershipCreatedDataStatus": "organization_membership_created_data_status",
+    "OrganizationMembershipCreatedDataStatusLiteral": "organization_membership_created_data_status",
+    "OrganizationMembershipDeleted": "organization_membership_deleted",
+    "OrganizationMembershipDeletedData": "organization_membership_deleted_data",
+    "OrganizationMembershipDeletedDataStatus": "organization_membership_deleted_data_status",
+    "OrganizationMembershipStatus": "organization_membership_status",
+    "OrganizationMembershipUpdated": "organization_membership_updated",
+    "OrganizationMembershipUpdatedData": "organization_membership_updated_data",
+    "OrganizationMembershipUpdatedDataStatus": "organization_membership_updated_data_status",
+    "OrganizationRoleCreated": "organization_role_created",
+    "OrganizationRoleCreatedData": "organization_role_created_data",
+    "OrganizationRoleDeleted": "organization_role_deleted",
+    "OrganizationRoleDeletedData": "organization_role_deleted_data",
+    "OrganizationRoleUpdated": "organization_role_updated",
+    "OrganizationRoleUpdatedData": "organization_role_updated_data",
+    "OrganizationUpdated": "organization_updated",
+    "OrganizationUpdatedData": "organization_updated_data",
+    "OrganizationUpdatedDataDomain": "organization_updated_data_domain",
+    "OrganizationUpdatedDataDomainState": "organization_updated_data_domain_state",
+    "OrganizationUpdatedDataDomainVerificationStrategy": "organization_updated_data_domain_verification_strategy",
+    "PaginationOrder": "pagination_order",
+    "PasswordResetCreated": "password_reset_created",
+    "PasswordResetCreatedData": "password_reset_created_data",
+    "PasswordResetSucceeded": "password_reset_succeeded",
+    "PasswordResetSucceededData": "password_reset_succeeded_data",
+    "PermissionCreated": "permission_created",
+    "PermissionCreatedData": "permission_created_data",
+    "PermissionDeleted": "permission_deleted",
+    "PermissionDeletedData": "permission_deleted_data",
+    "PermissionUpdated": "permission_updated",
+    "PermissionUpdatedData": "permission_updated_data",
+    "PipeConnectedAccount": "pipe_connected_account",
+    "PipeConnectedAccountState": "pipe_connected_account_state",
+    "PipesConnectedAccountConnected": "pipes_connected_account_connected",
+    "PipesConnectedAccountConnectionFailed": "pipes_connected_account_connection_failed",
+    "PipesConnectedAccountConnectionFailedData": "pipes_connected_account_connection_failed_data",
+    "PipesConnectedAccountDisconnected": "pipes_connected_account_disconnected",
+    "PipesConnectedAccountReauthorizationNeeded": "pipes_connected_account_reauthorization_needed",
+    "ProfileConnectionType": "profile_connection_type",
+    "RadarChallengeCreated": "radar_challenge_created",
+    "RadarChallengeCreatedData": "radar_challenge_created_data",
+    "RadarStandaloneAssessRequestAction": "radar_standalone_assess_request_action",
+    "RadarStandaloneAssessRequestAuthMethod": "radar_standalone_assess_request_auth_method",
+    "RadarStandaloneResponseBlocklistType": "radar_standalone_response_blocklist_type",
+    "RadarStandaloneResponseControl": "radar_standalone_response_control",
+    "RadarStandaloneResponseVerdict": "radar_standalone_response_verdict",
+    "ResendUserInviteOptionsLocale": "resend_user_invite_options_locale",
+    "RoleCreated": "role_created",
+    "RoleCreatedData": "role_created_data",
+    "RoleDeleted": "role_deleted",
+    "RoleDeletedData": "role_deleted_data",
+    "RoleType": "role_type",
+    "RoleUpdated": "role_updated",
+    "RoleUpdatedData": "role_updated_data",
+    "SessionCreated": "session_created",
+    "SessionCreatedData": "session_created_data",
+    "SessionCreatedDataAuthMethod": "session_created_data_auth_method",
+    "SessionCreatedDataAuthMethodLiteral": "session_created_data_auth_method",
+    "SessionCreatedDataImpersonator": "session_created_data_impersonator",
+    "SessionCreatedDataStatus": "session_created_data_status",
+    "SessionCreatedDataStatusLiteral": "session_created_data_status",
+    "SessionRevoked": "session_revoked",
+    "SessionRevokedData": "session_revoked_data",
+    "SessionRevokedDataAuthMethod": "session_revoked_data_auth_method",
+    "SessionRevokedDataImpersonator": "session_revoked_data_impersonator",
+    "SessionRevokedDataStatus": "session_revoked_data_status",
+    "SlimRole": "slim_role",
+    "UpdateCustomProviderDefinitionAuthenticateVia": "update_custom_provider_definition_authenticate_via",
+    "UpdateUserPasswordHashType": "update_user_password_hash_type",
+    "UpdateUserPasswordSaltPosition": "update_user_password_salt_position",
+    "UpdateWebhookEndpointEvents": "update_webhook_endpoint_events",
+    "UpdateWebhookEndpointStatus": "update_webhook_endpoint_status",
+    "User": "user",
+    "UserApiKeyCreatedDataOwner": "user_api_key_created_data_owner",
+    "UserApiKeyRevokedDataOwner": "user_api_key_revoked_data_owner",
+    "UserApiKeyUpdatedDataOwner": "user_api_key_updated_data_owner",
+    "UserCreated": "user_created",
+    "UserDeleted": "user_deleted",
+    "UserIdentitiesGetItemProvider": "user_identities_get_item_provider",
+    "UserInviteState": "user_invite_state",
+    "UserOrganizationMembershipBaseListData": "user_organization_membership_base_list_data",
+    "UserOrganizationMembershipBaseListDataStatus": "user_organization_membership_base_list_data_status",
+    "UserOrganizationMembershipStatus": "user_organization_membership_status",
+    "UserRoleAssignmentSourceType": "user_role_assignment_source_type",
+    "UserSessionsAuthMethod": "user_sessions_auth_method",
+    "UserSessionsImpersonator": "user_sessions_impersonator",
+    "UserSessionsListItem": "user_sessions_list_item",
+    "UserSessionsStatus": "user_sessions_status",
+    "UserUpdated": "user_updated",
+    "VaultByokKeyDeleted": "vault_byok_key_deleted",
+    "VaultByokKeyDeletedData": "vault_byok_key_deleted_data",
+    "VaultByokKeyProvider": "vault_byok_key_provider",
+    "VaultByokKeyProviderLiteral": "vault_byok_key_provider",
+    "VaultByokKeyVerificationCompleted": "vault_byok_key_verification_completed",
+    "VaultByokKeyVerificationCompletedData": "vault_byok_key_verification_completed_data",
+    "VaultDataCreated": "vault_data_created",
+    "VaultDataCreatedData": "vault_data_created_data",
+    "VaultDataCreatedDataActorSource": "vault_data_created_data_actor_source",
+    "VaultDataCreatedDataActorSourceLiteral": "vault_data_created_data_actor_source",
+    "VaultDataDeleted": "vault_data_deleted",
+    "VaultDataDeletedData": "vault_data_deleted_data",
+    "VaultDataDeletedDataActorSource": "vault_data_deleted_data_actor_source",
+    "VaultDataRead": "vault_data_read",
+    "VaultDataReadData": "vault_data_read_data",
+    "VaultDataReadDataActorSource": "vault_data_read_data_actor_source",
+    "VaultDataUpdated": "vault_data_updated",
+    "VaultDataUpdatedData": "vault_data_updated_data",
+    "VaultDataUpdatedDataActorSource": "vault_data_updated_data_actor_source",
+    "VaultDekDecrypted": "vault_dek_decrypted",
+    "VaultDekDecryptedData": "vault_dek_decrypted_data",
+    "VaultDekDecryptedDataActorSource": "vault_dek_decrypted_data_actor_source",
+    "VaultDekRead": "vault_dek_read",
+    "VaultDekReadData": "vault_dek_read_data",
+    "VaultDekReadDataActorSource": "vault_dek_read_data_actor_source",
+    "VaultKekCreated": "vault_kek_created",
+    "VaultKekCreatedData": "vault_kek_created_data",
+    "VaultKekCreatedDataActorSource": "vault_kek_created_data_actor_source",
+    "VaultKekDeleted": "vault_kek_deleted",
+    "VaultKekDeletedData": "vault_kek_deleted_data",
+    "VaultKekDeletedDataActorSource": "vault_kek_deleted_data_actor_source",
+    "VaultMetadataRead": "vault_metadata_read",
+    "VaultMetadataReadData": "vault_metadata_read_data",
+    "VaultMetadataReadDataActorSource": "vault_metadata_read_data_actor_source",
+    "VaultNamesListed": "vault_names_listed",
+    "VaultNamesListedData": "vault_names_listed_data",
+    "VaultNamesListedDataActorSource": "vault_names_listed_data_actor_source",
+    "WaitlistUser": "waitlist_user",
+    "WaitlistUserApproved": "waitlist_user_approved",
+    "WaitlistUserCreated": "waitlist_user_created",
+    "WaitlistUserDenied": "waitlist_user_denied",
+    "WaitlistUserState": "waitlist_user_state",
+    "WaitlistUserStateLiteral": "waitlist_user_state",
+    "WebhookEndpointStatus": "webhook_endpoint_status",
+    "WidgetSessionTokenScopes": "widget_session_token_scopes",
+}
+
+
+def _lazy_package(name: str) -> types.ModuleType:
+    spec = importlib.util.find_spec(name)
+    assert spec is not None, name
+    module = importlib.util.module_from_spec(spec)
+
+    def __getattr__(attr: str) -> Any:
+        submodule = _MODELS.get(attr)
+        if submodule is None:
+            raise AttributeError(f"module {name!r} has no attribute {attr!r}")
+        value = getattr(importlib.import_module(f"{_MODELS_PACKAGE}.{submodule}"), attr)
+        setattr(module, attr, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(module)) | set(_MODELS))
+
+    vars(module).update(
+        __getattr__=__getattr__, __dir__=__dir__, __all__=sorted(_MODELS)
+    )
+    sys.modules[name] = module
+    parent, _, child = name.rpartition(".")
+    setattr(sys.modules[parent], child, module)
+    return module
+
+
+def install() -> None:
+    """Register the lazy ``workos.common`` and ``workos.common.models`` modules.
+
+    Does nothing if ``workos.common`` has already been imported.
+    """
+    if "workos.common" in sys.modules:
+        return
+    _lazy_package("workos.common")
+    _lazy_package(_MODELS_PACKAGE)
+
+
+install()
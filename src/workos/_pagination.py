@@ -2,24 +2,45 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import os
+import queue
+import threading
 from dataclasses import dataclass, field
 from typing import (
     Any,
+    AsyncGenerator,
     AsyncIterator,
     Awaitable,
     Callable,
     Dict,
+    Generator,
     Generic,
     Iterator,
     List,
     Optional,
+    TYPE_CHECKING,
+    Tuple,
     TypeVar,
+    Union,
 )
 
 from ._types import Deserializable
 
+if TYPE_CHECKING:
+    from ._checkpoint import Checkpoint
+    from ._export import ExportFormat
+    from ._streaming import AsyncPageStream, SyncPageStream
+
 T = TypeVar("T", bound=Deserializable)
 
+# Largest ``limit`` the API accepts for list endpoints.
+MAX_PAGE_SIZE = 100
+
+# Items held in memory at a time by ``export()``.
+DEFAULT_EXPORT_BATCH_SIZE = 10_000
+
 
 @dataclass(slots=True)
 class ListMetadata:
@@ -35,13 +56,23 @@ class ListMetadata:
 
 @dataclass
 class SyncPage(Generic[T]):
-    """A page of results with auto-pagination support."""
+    """A page of results with auto-pagination support.
+
+    A page requested with ``RequestOptions(stream=True)`` holds a
+    :class:`~workos._streaming.SyncPageStream` and starts out with empty
+    ``data`` and ``list_metadata``. Iterating it yields items as they
+    arrive and then fills in ``list_metadata``; :meth:`read` downloads the
+    whole page and fills in both.
+    """
 
     data: List[T]
     list_metadata: ListMetadata
     _fetch_page: Optional[Callable[..., "SyncPage[T]"]] = field(
         default=None, repr=False
     )
+    _stream: Optional["SyncPageStream[T]"] = field(
+        default=None, repr=False, compare=False
+    )
 
     @property
     def before(self) -> Optional[str]:
@@ -57,31 +88,138 @@ class SyncPage(Generic[T]):
         """Whether there are more pages available."""
         return self.after is not None
 
-    def auto_paging_iter(self) -> Iterator[T]:
-        """Iterate through all items across all pages."""
-        page = self
-        while True:
-            yield from page.data
-            if not page.data:
-                break
-            if not page.has_more() or page._fetch_page is None:
-                break
-            page = page._fetch_page(after=page.after)
+    def read(self) -> SyncPage[T]:
+        """Download and parse the rest of a streamed page into ``data``.
+
+        Other pages are read when they are returned, so this does nothing.
+
+        Raises:
+            WorkOSError: If the items of a streamed page have been iterated.
+        """
+        if self._stream is not None:
+            self.data = self._stream.items()
+            self.list_metadata = self._stream.list_metadata()
+        return self
+
+    def close(self) -> None:
+        """Close the response of a streamed page without reading the rest."""
+        if self._stream is not None:
+            self._stream.close()
+
+    def _has_next_page(self) -> bool:
+        count = len(self.data) if self._stream is None else self._stream.count
+        return bool(count) and self.has_more() and self._fetch_page is not None
+
+    def _iter_items(self) -> Iterator[T]:
+        if self._stream is None:
+            yield from self.data
+            return
+        yield from self._stream.iter_items()
+        self.list_metadata = self._stream.list_metadata()
+
+    def _load(self) -> None:
+        """Finish reading a streamed page before its cursor is needed."""
+        if self._stream is not None:
+            self._stream.load()
+            self.list_metadata = self._stream.list_metadata()
+
+    def auto_paging_iter(
+        self, *, prefetch: int = 0, checkpoint: Optional[Checkpoint] = None
+    ) -> SyncPageIterator[T]:
+        """Iterate through all items across all pages.
+
+        Args:
+            prefetch: Number of pages to fetch ahead in a background thread
+                while the caller processes the current page. At most this
+                many unconsumed pages are held in memory. ``0`` (the default)
+                fetches each page only after the previous one is exhausted.
+            checkpoint: A :class:`CheckpointStore` (such as
+                :class:`FileCheckpoint` or :class:`SQLiteCheckpoint`) or a
+                callable that is given the cursor of the next page each time
+                every item of a page has been consumed, and ``None`` once the
+                last page has been. Passing a saved cursor as ``after=`` to
+                the same list method resumes from that page; items of a page
+                that was only partly consumed are yielded again.
+
+        Returns:
+            A :class:`SyncPageIterator`. Its ``cursor`` attribute holds the
+            cursor a checkpoint would save, so a crawl can be resumed without
+            one.
+
+        Raises:
+            TypeError: If ``checkpoint`` is neither a store nor callable.
+        """
+        if prefetch < 0:
+            raise ValueError("prefetch must be 0 or greater")
+        save = None
+        if checkpoint is not None:
+            from ._checkpoint import _saver
+
+            save = _saver(checkpoint)
+        pages = _prefetch_pages(self, prefetch) if prefetch else _pages(self)
+        return SyncPageIterator(pages, save)
 
     def __iter__(self) -> Iterator[T]:
         """Iterate through all items across all pages."""
         return self.auto_paging_iter()
 
+    def export(
+        self,
+        path: Union[str, os.PathLike[str]],
+        *,
+        format: Optional[ExportFormat] = None,
+        batch_size: int = DEFAULT_EXPORT_BATCH_SIZE,
+        prefetch: int = 0,
+    ) -> int:
+        """Write every item across all pages to a JSON Lines, CSV or Parquet file.
+
+        Items are written ``batch_size`` at a time as pages arrive, so memory
+        stays bounded. CSV and Parquet flatten nested models into dotted
+        columns and write lists and dicts as JSON; Parquet needs pyarrow.
+
+        Args:
+            path: The file to create or overwrite.
+            format: ``"jsonl"``, ``"csv"`` or ``"parquet"``. Inferred from the
+                suffix of ``path`` when omitted.
+            batch_size: How many items are held in memory before they are
+                written (one Parquet row group per batch).
+            prefetch: Passed to :meth:`auto_paging_iter`.
+
+        Returns:
+            The number of items written.
+
+        Raises:
+            ValueError: If the format cannot be inferred or is unknown.
+            ImportError: If the format is Parquet and pyarrow is not installed.
+        """
+        from ._export import export_items
+
+        return export_items(
+            self.auto_paging_iter(prefetch=prefetch),
+            path,
+            format=format,
+            batch_size=batch_size,
+        )
+
 
 @dataclass
 class AsyncPage(Generic[T]):
-    """A page of results with async auto-pagination support."""
+    """A page of results with async auto-pagination support.
+
+    A page requested with ``RequestOptions(stream=True)`` holds an
+    :class:`~workos._streaming.AsyncPageStream` and starts out with empty
+    ``data`` and ``list_metadata``; await :meth:`aread` to fill them in, or
+    iterate it once, which fills in ``list_metadata`` at the end.
+    """
 
     data: List[T]
     list_metadata: ListMetadata
     _fetch_page: Optional[Callable[..., Awaitable["AsyncPage[T]"]]] = field(
         default=None, repr=False
     )
+    _stream: Optional["AsyncPageStream[T]"] = field(
+        default=None, repr=False, compare=False
+    )
 
     @property
     def before(self) -> Optional[str]:
@@ -97,18 +235,288 @@ class AsyncPage(Generic[T]):
         """Whether there are more pages available."""
         return self.after is not None
 
-    async def auto_paging_iter(self) -> AsyncIterator[T]:
-        """Iterate through all items across all pages."""
-        page = self
-        while True:
-            for item in page.data:
+    async def aread(self) -> AsyncPage[T]:
+        """Download and parse the rest of a streamed page, keeping its items.
+
+        Other pages are read when they are returned, so this does nothing.
+
+        Raises:
+            WorkOSError: If the items of a streamed page have been iterated.
+        """
+        if self._stream is not None:
+            await self._stream.aread()
+            self.data = self._stream.items()
+            self.list_metadata = self._stream.list_metadata()
+        return self
+
+    async def aclose(self) -> None:
+        """Close the response of a streamed page without reading the rest."""
+        if self._stream is not None:
+            await self._stream.aclose()
+
+    def _has_next_page(self) -> bool:
+        count = len(self.data) if self._stream is None else self._stream.count
+        return bool(count) and self.has_more() and self._fetch_page is not None
+
+    async def _aiter_items(self) -> AsyncGenerator[T, None]:
+        if self._stream is None:
+            for item in self.data:
                 yield item
-            if not page.data:
-                break
-            if not page.has_more() or page._fetch_page is None:
-                break
-            page = await page._fetch_page(after=page.after)
+            return
+        async with contextlib.aclosing(self._stream.aiter_items()) as items:
+            async for item in items:
+                yield item
+        self.list_metadata = self._stream.list_metadata()
+
+    async def _load(self) -> None:
+        """Finish reading a streamed page before its cursor is needed."""
+        if self._stream is not None:
+            await self._stream.load()
+            self.list_metadata = self._stream.list_metadata()
+
+    def auto_paging_iter(
+        self, *, prefetch: int = 0, checkpoint: Optional[Checkpoint] = None
+    ) -> AsyncPageIterator[T]:
+        """Iterate through all items across all pages.
+
+        Args:
+            prefetch: Number of pages to fetch ahead in a background task
+                while the caller processes the current page. At most this
+                many unconsumed pages are held in memory. ``0`` (the default)
+                fetches each page only after the previous one is exhausted.
+            checkpoint: Saves the cursor after each page, as in
+                :meth:`SyncPage.auto_paging_iter`. Stores are called on the
+                event loop; the bundled ones only write a few bytes locally.
+
+        Returns:
+            An :class:`AsyncPageIterator` with the same ``cursor`` attribute
+            as :class:`SyncPageIterator`.
+
+        Raises:
+            TypeError: If ``checkpoint`` is neither a store nor callable.
+        """
+        if prefetch < 0:
+            raise ValueError("prefetch must be 0 or greater")
+        save = None
+        if checkpoint is not None:
+            from ._checkpoint import _saver
+
+            save = _saver(checkpoint)
+        pages = _aprefetch_pages(self, prefetch) if prefetch else _apages(self)
+        return AsyncPageIterator(pages, save)
 
     def __aiter__(self) -> AsyncIterator[T]:
         """Iterate through all items across all pages."""
         return self.auto_paging_iter()
+
+    async def export(
+        self,
+        path: Union[str, os.PathLike[str]],
+        *,
+        format: Optional[ExportFormat] = None,
+        batch_size: int = DEFAULT_EXPORT_BATCH_SIZE,
+        prefetch: int = 0,
+    ) -> int:
+        """Write every item across all pages to a JSON Lines, CSV or Parquet file.
+
+        Like :meth:`SyncPage.export`; batches are written in a worker thread
+        so the event loop is not blocked.
+
+        Returns:
+            The number of items written.
+        """
+        from ._export import aexport_items
+
+        async with contextlib.aclosing(
+            self.auto_paging_iter(prefetch=prefetch)
+        ) as items:
+            return await aexport_items(
+                items, path, format=format, batch_size=batch_size
+            )
+
+
+class SyncPageIterator(Iterator[T]):
+    """The iterator returned by :meth:`SyncPage.auto_paging_iter`.
+
+    Attributes:
+        cursor: The cursor of the page after the last page whose items have
+            all been consumed, which is what a checkpoint would hold. Passing
+            it as ``after=`` to the same list method resumes from there.
+            ``None`` until the first page is consumed and again after the
+            last one.
+    """
+
+    def __init__(
+        self,
+        pages: Iterator[SyncPage[T]],
+        save: Optional[Callable[[Optional[str]], Any]] = None,
+    ) -> None:
+        self.cursor: Optional[str] = None
+        self._items = self._iterate(pages, save)
+
+    def _iterate(
+        self,
+        pages: Iterator[SyncPage[T]],
+        save: Optional[Callable[[Optional[str]], Any]],
+    ) -> Generator[T, None, None]:
+        for page in pages:
+            yield from page._iter_items()
+            self.cursor = page.after if page._has_next_page() else None
+            if save is not None:
+                save(self.cursor)
+
+    def __iter__(self) -> SyncPageIterator[T]:
+        return self
+
+    def __next__(self) -> T:
+        return next(self._items)
+
+    def close(self) -> None:
+        """Stop iterating, releasing a prefetching thread if there is one."""
+        self._items.close()
+
+
+class AsyncPageIterator(AsyncIterator[T]):
+    """The async iterator returned by :meth:`AsyncPage.auto_paging_iter`.
+
+    Attributes:
+        cursor: As :attr:`SyncPageIterator.cursor`.
+    """
+
+    def __init__(
+        self,
+        pages: AsyncGenerator[AsyncPage[T], None],
+        save: Optional[Callable[[Optional[str]], Any]] = None,
+    ) -> None:
+        self.cursor: Optional[str] = None
+        self._items = self._iterate(pages, save)
+
+    async def _iterate(
+        self,
+        pages: AsyncGenerator[AsyncPage[T], None],
+        save: Optional[Callable[[Optional[str]], Any]],
+    ) -> AsyncGenerator[T, None]:
+        async with contextlib.aclosing(pages):
+            async for page in pages:
+                async with contextlib.aclosing(page._aiter_items()) as items:
+                    async for item in items:
+                        yield item
+                self.cursor = page.after if page._has_next_page() else None
+                if save is not None:
+                    save(self.cursor)
+
+    def __aiter__(self) -> AsyncPageIterator[T]:
+        return self
+
+    async def __anext__(self) -> T:
+        return await self._items.__anext__()
+
+    async def aclose(self) -> None:
+        """Stop iterating, cancelling a prefetching task if there is one."""
+        await self._items.aclose()
+
+
+def _pages(page: SyncPage[T]) -> Iterator[SyncPage[T]]:
+    yield page
+    while page._has_next_page():
+        assert page._fetch_page is not None
+        page = page._fetch_page(after=page.after)
+        yield page
+
+
+def _prefetch_pages(first: SyncPage[T], depth: int) -> Iterator[SyncPage[T]]:
+    """Yield pages while a worker thread fetches up to ``depth`` pages ahead."""
+    results: queue.SimpleQueue[Tuple[Optional[SyncPage[T]], Optional[BaseException]]]
+    results = queue.SimpleQueue()
+    # One slot per page that may be fetched but not yet handed to the caller.
+    slots = threading.Semaphore(depth)
+    stopped = threading.Event()
+
+    def produce() -> None:
+        page = first
+        try:
+            while page._has_next_page():
+                slots.acquire()
+                if stopped.is_set():
+                    return
+                assert page._fetch_page is not None
+                page = page._fetch_page(after=page.after)
+                page._load()
+                results.put((page, None))
+        except BaseException as error:
+            results.put((None, error))
+            return
+        results.put((None, None))
+
+    # A streamed first page is read before the worker looks at its cursor.
+    first._load()
+    if first._has_next_page():
+        threading.Thread(
+            target=produce, name="workos-page-prefetch", daemon=True
+        ).start()
+    else:
+        results.put((None, None))
+    try:
+        yield first
+        while True:
+            page, error = results.get()
+            if error is not None:
+                raise error
+            if page is None:
+                return
+            slots.release()
+            yield page
+    finally:
+        # Wake the worker if it is waiting for a slot so that it exits.
+        stopped.set()
+        slots.release()
+
+
+async def _apages(page: AsyncPage[T]) -> AsyncGenerator[AsyncPage[T], None]:
+    yield page
+    while page._has_next_page():
+        assert page._fetch_page is not None
+        page = await page._fetch_page(after=page.after)
+        yield page
+
+
+async def _aprefetch_pages(
+    first: AsyncPage[T], depth: int
+) -> AsyncGenerator[AsyncPage[T], None]:
+    """Yield pages while a background task fetches up to ``depth`` pages ahead."""
+    results: asyncio.Queue[Tuple[Optional[AsyncPage[T]], Optional[BaseException]]]
+    results = asyncio.Queue()
+    slots = asyncio.Semaphore(depth)
+
+    async def produce() -> None:
+        page = first
+        try:
+            while page._has_next_page():
+                await slots.acquire()
+                assert page._fetch_page is not None
+                page = await page._fetch_page(after=page.after)
+                await page._load()
+                results.put_nowait((page, None))
+        except asyncio.CancelledError:
+            raise
+        except BaseException as error:
+            results.put_nowait((None, error))
+            return
+        results.put_nowait((None, None))
+
+    await first._load()
+    task = asyncio.ensure_future(produce())
+    try:
+        yield first
+        while True:
+            page, error = await results.get()
+            if error is not None:
+                raise error
+            if page is None:
+                return
+            slots.release()
+            yield page
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
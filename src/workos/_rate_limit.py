@@ -0,0 +1,255 @@
+# @oagen-ignore-file
+
+"""Proactive client-side rate limiting shared across threads and tasks."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional, Tuple
+
+# Reset headers larger than this are treated as a Unix timestamp, smaller
+# values as a number of seconds from now.
+_EPOCH_THRESHOLD = 1_000_000_000
+
+_now = time.monotonic
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimit:
+    """A token-bucket budget of ``rate`` requests per second.
+
+    ``burst`` is the bucket capacity, i.e. how many requests may be sent
+    back-to-back after an idle period. It defaults to ``rate`` (rounded up,
+    minimum 1).
+    """
+
+    rate: float
+    """Sustained requests per second."""
+    burst: Optional[int] = None
+    """Bucket capacity. Defaults to ``rate``."""
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError("RateLimit.rate must be greater than 0")
+        if self.burst is not None and self.burst < 1:
+            raise ValueError("RateLimit.burst must be at least 1")
+
+    @property
+    def capacity(self) -> float:
+        """The effective bucket capacity."""
+        if self.burst is not None:
+            return float(self.burst)
+        return float(max(1, math.ceil(self.rate)))
+
+
+class _TokenBucket:
+    """Reservation-based token bucket. Callers must hold the limiter lock.
+
+    Tokens may go negative: each reservation takes a token immediately and
+    the debt tells the caller how long to wait, which queues concurrent
+    callers fairly without holding a lock while they sleep.
+    """
+
+    __slots__ = ("rate", "capacity", "tokens", "updated_at")
+
+    def __init__(self, limit: RateLimit, now: float) -> None:
+        self.rate = limit.rate
+        self.capacity = limit.capacity
+        self.tokens = self.capacity
+        self.updated_at = now
+
+    def reserve(self, at: float) -> float:
+        """Take one token at time ``at``; return extra seconds to wait after ``at``."""
+        if at > self.updated_at:
+            self.tokens = min(
+                self.capacity, self.tokens + (at - self.updated_at) * self.rate
+            )
+            self.updated_at = at
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+
+class RateLimiter:
+    """Token-bucket rate limiter for WorkOS API requests.
+
+    A limiter smooths bursts before they leave the process. It can be shared
+    by several clients, threads and asyncio tasks. Reservations are computed
+    under a short-lived lock and the caller then sleeps outside of it:
+    ``time.sleep`` for ``WorkOSClient``, ``asyncio.sleep`` for
+    ``AsyncWorkOSClient``. The event loop is never blocked.
+
+    ``endpoints`` maps an endpoint family, written as a path prefix such as
+    ``"user_management/authenticate"`` or ``"audit_logs/events"``, to its own
+    budget. The longest matching prefix wins, and requests also draw from the
+    ``default`` budget when one is set.
+
+    The limiter also learns from responses. A ``Retry-After`` header, or an
+    exhausted ``X-RateLimit-Remaining``/``RateLimit-Remaining`` with a reset
+    time, pauses every caller of the limiter, not just the one that was
+    throttled.
+    """
+
+    def __init__(
+        self,
+        default: Optional[RateLimit] = None,
+        *,
+        endpoints: Optional[Mapping[str, RateLimit]] = None,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._default = default
+        self._endpoints: Tuple[Tuple[str, RateLimit], ...] = tuple(
+            sorted(
+                (
+                    (prefix.strip("/"), limit)
+                    for prefix, limit in (endpoints or {}).items()
+                ),
+                key=lambda item: len(item[0]),
+                reverse=True,
+            )
+        )
+        self._buckets: Dict[str, _TokenBucket] = {}
+        self._paused_until = 0.0
+        self._throttled = 0
+        self._total_delay = 0.0
+        self._pauses = 0
+
+    @property
+    def throttled(self) -> int:
+        """Number of requests that were delayed by the limiter."""
+        return self._throttled
+
+    @property
+    def total_delay(self) -> float:
+        """Cumulative seconds requests were delayed by the limiter."""
+        return self._total_delay
+
+    @property
+    def pauses(self) -> int:
+        """Number of times a server response paused all callers."""
+        return self._pauses
+
+    @property
+    def paused_for(self) -> float:
+        """Seconds remaining in the current server-requested pause."""
+        return max(self._paused_until - _now(), 0.0)
+
+    def _family(self, path: str) -> Optional[Tuple[str, RateLimit]]:
+        for prefix, limit in self._endpoints:
+            if path == prefix or path.startswith(prefix + "/"):
+                return prefix, limit
+        return None
+
+    def _bucket(self, key: str, limit: RateLimit, now: float) -> _TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _TokenBucket(limit, now)
+        return bucket
+
+    def reserve(self, path: str) -> float:
+        """Reserve capacity for a request to ``path``.
+
+        Returns the number of seconds the caller must wait before sending.
+        """
+        path = path.strip("/")
+        with self._lock:
+            now = _now()
+            start = max(now, self._paused_until)
+            extra = 0.0
+            family = self._family(path)
+            if family is not None:
+                prefix, limit = family
+                extra = self._bucket(prefix, limit, now).reserve(start)
+            if self._default is not None:
+                extra = max(extra, self._bucket("", self._default, now).reserve(start))
+            delay = start - now + extra
+            if delay > 0:
+                self._throttled += 1
+                self._total_delay += delay
+            return delay
+
+    def acquire(self, path: str) -> None:
+        """Block the current thread until a request to ``path`` may be sent."""
+        delay = self.reserve(path)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, path: str) -> None:
+        """Wait, without blocking the event loop, until ``path`` may be sent."""
+        delay = self.reserve(path)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller of this limiter for ``seconds``."""
+        if seconds <= 0:
+            return
+        with self._lock:
+            until = _now() + seconds
+            if until > self._paused_until:
+                self._paused_until = until
+                self._pauses += 1
+
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> float:
+        """Learn from a response's rate-limit headers.
+
+        Returns the pause applied to all callers in seconds (``0.0`` if none).
+        """
+        pause = _pause_from_headers(status_code, headers)
+        if pause > 0:
+            self.pause(pause)
+        return pause
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After value given in seconds or as an HTTP-date.
+
+    Returns the delay in seconds, clamped at zero, or ``None`` when the value
+    is missing or unparseable. Shared by the retry loop and the limiter so
+    both read the header the same way.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def _parse_reset(value: Optional[str]) -> Optional[float]:
+    # Reset headers use Retry-After's formats, or a Unix timestamp.
+    seconds = parse_retry_after(value)
+    if seconds is not None and seconds > _EPOCH_THRESHOLD:
+        return max(seconds - time.time(), 0.0)
+    return seconds
+
+
+def _pause_from_headers(status_code: int, headers: Mapping[str, str]) -> float:
+    if status_code == 429 or status_code == 503:
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+        if retry_after is not None:
+            return retry_after
+    for prefix in ("X-RateLimit-", "RateLimit-"):
+        remaining = headers.get(prefix + "Remaining")
+        if remaining is not None and remaining.strip() == "0":
+            reset = _parse_reset(headers.get(prefix + "Reset"))
+            if reset is not None:
+                return reset
+    return 0.0
@@ -0,0 +1,370 @@
+# @oagen-ignore-file
+
+"""Single-flight coordination of concurrent session refreshes."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import secrets
+import threading
+import time
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    runtime_checkable,
+)
+
+DEFAULT_REFRESH_RESULT_TTL = 10.0
+DEFAULT_REFRESH_LOCK_TTL = 30.0
+DEFAULT_REFRESH_STORE_MAXSIZE = 10_000
+
+# Seconds between checks while another process holds the refresh lock.
+_POLL_INTERVAL = 0.05
+
+_now = time.monotonic
+
+R = TypeVar("R")
+
+
+@runtime_checkable
+class RefreshStore(Protocol):
+    """Storage shared by :class:`RefreshCoordinator` instances.
+
+    The default :class:`InMemoryRefreshStore` coordinates the clients of one
+    process. Implement this protocol over shared storage such as Redis to
+    coordinate refreshes across processes: ``add`` maps to ``SET NX PX``,
+    ``set`` to ``SET PX`` and ``delete_if`` to a script that runs ``DEL``
+    only if ``GET`` returns the given value.
+    """
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the stored value, or ``None`` if missing or expired."""
+        ...
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store ``value`` for ``ttl`` seconds."""
+        ...
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        """Store ``value`` for ``ttl`` seconds unless ``key`` is already stored.
+
+        Returns whether the value was stored.
+        """
+        ...
+
+    def delete_if(self, key: str, value: bytes) -> bool:
+        """Remove ``key`` if it is stored with ``value``, atomically.
+
+        Returns whether the key was removed.
+        """
+        ...
+
+
+class InMemoryRefreshStore:
+    """Thread-safe, size-bounded in-memory :class:`RefreshStore`.
+
+    Expired entries are dropped when they are read, and swept once more than
+    ``maxsize`` entries are stored. If the sweep is not enough, the oldest
+    entries are evicted.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_REFRESH_STORE_MAXSIZE) -> None:
+        if maxsize < 1:
+            raise ValueError("InMemoryRefreshStore.maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[float, bytes]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _live(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= _now():
+            del self._entries[key]
+            return None
+        return value
+
+    def _put(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries.pop(key, None)
+        self._entries[key] = (_now() + ttl, value)
+        if len(self._entries) > self.maxsize:
+            now = _now()
+            for stale in [k for k, (exp, _) in self._entries.items() if exp <= now]:
+                del self._entries[stale]
+            while len(self._entries) > self.maxsize:
+                del self._entries[next(iter(self._entries))]
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            return self._live(key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            self._put(key, value, ttl)
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        with self._lock:
+            if self._live(key) is not None:
+                return False
+            self._put(key, value, ttl)
+            return True
+
+    def delete_if(self, key: str, value: bytes) -> bool:
+        with self._lock:
+            if self._live(key) != value:
+                return False
+            del self._entries[key]
+            return True
+
+
+@dataclass(slots=True)
+class RefreshStats:
+    """A snapshot of :class:`RefreshCoordinator` counters."""
+
+    refreshes: int = 0
+    """Refreshes this coordinator actually sent."""
+    coalesced: int = 0
+    """Calls that waited for a refresh in flight in this process."""
+    reused: int = 0
+    """Calls answered with a stored result, including ones that waited for
+    another process."""
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class RefreshCoordinator:
+    """Runs one refresh per refresh token and shares its result.
+
+    Pass one to ``WorkOSClient(refresh_coordinator=...)`` or
+    ``AsyncWorkOSClient(refresh_coordinator=...)``, and share it between
+    clients for a process-wide view. When a page load fires several requests
+    with the same expired session, each calls ``Session.refresh`` with the
+    same refresh token. Only the first sends ``user_management/authenticate``.
+    The others wait for it and receive the same sealed session. Refresh
+    tokens are single use, so without this every refresh but one fails.
+
+    A successful result is kept in ``store`` for ``result_ttl`` seconds
+    under a SHA-256 digest of the refresh token, organization and cookie
+    password, so requests that arrive just after the refresh reuse it too. A
+    refresh in progress holds a lock in ``store`` for up to ``lock_ttl``
+    seconds. With a shared store, other processes wait for that lock and
+    then reuse the stored result. The lock holds a random token and is only
+    released while it still holds that token, so a refresh that outlives
+    ``lock_ttl`` does not release a lock that another process has taken
+    since. Failed refreshes are handed to the callers already waiting but
+    are not stored.
+    """
+
+    def __init__(
+        self,
+        store: Optional[RefreshStore] = None,
+        *,
+        result_ttl: float = DEFAULT_REFRESH_RESULT_TTL,
+        lock_ttl: float = DEFAULT_REFRESH_LOCK_TTL,
+    ) -> None:
+        if result_ttl <= 0:
+            raise ValueError("result_ttl must be greater than 0")
+        if lock_ttl <= 0:
+            raise ValueError("lock_ttl must be greater than 0")
+        self.store: RefreshStore = (
+            store if store is not None else InMemoryRefreshStore()
+        )
+        self.result_ttl = result_ttl
+        self.lock_ttl = lock_ttl
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self._tasks: Dict[str, asyncio.Future[Any]] = {}
+        self._refreshes = 0
+        self._coalesced = 0
+        self._reused = 0
+
+    @staticmethod
+    def key(
+        refresh_token: str,
+        organization_id: Optional[str] = None,
+        *,
+        cookie_password: Union[str, Sequence[str], None] = None,
+    ) -> str:
+        """Build the key identifying refreshes that can share a result.
+
+        The key covers the refresh token, the organization and the cookie
+        password(s) the new session is sealed with, so a caller is only
+        handed a sealed session it can unseal.
+        """
+        passwords = (
+            cookie_password
+            if cookie_password is None or isinstance(cookie_password, str)
+            else "\0".join(cookie_password)
+        )
+        digest = hashlib.sha256(
+            f"{refresh_token}\0{organization_id or ''}\0\0{passwords or ''}".encode(
+                "utf-8"
+            )
+        ).hexdigest()
+        return f"workos:refresh:{digest}"
+
+    def stats(self) -> RefreshStats:
+        """Return a snapshot of the coordinator counters."""
+        with self._lock:
+            return RefreshStats(
+                refreshes=self._refreshes,
+                coalesced=self._coalesced,
+                reused=self._reused,
+            )
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _stored(self, key: str, decode: Callable[[bytes], R]) -> Optional[R]:
+        data = self.store.get(key)
+        if data is None:
+            return None
+        self._count("_reused")
+        return decode(data)
+
+    def _finish(self, key: str, result: R, encode: Callable[[R], Optional[bytes]]) -> R:
+        data = encode(result)
+        if data is not None:
+            self.store.set(key, data, self.result_ttl)
+        return result
+
+    def run(
+        self,
+        key: str,
+        refresh: Callable[[], R],
+        *,
+        encode: Callable[[R], Optional[bytes]],
+        decode: Callable[[bytes], R],
+    ) -> R:
+        """Return the refresh result for ``key``, calling ``refresh`` at most once.
+
+        ``encode`` turns a result into bytes for the store, or ``None`` for
+        results that must not be reused; ``decode`` reverses it.
+        """
+        stored = self._stored(key, decode)
+        if stored is not None:
+            return stored
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+            else:
+                self._coalesced += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        try:
+            flight.result = self._lead(key, refresh, encode, decode)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def _lead(
+        self,
+        key: str,
+        refresh: Callable[[], R],
+        encode: Callable[[R], Optional[bytes]],
+        decode: Callable[[bytes], R],
+    ) -> R:
+        lock_key = f"{key}:lock"
+        token = secrets.token_bytes(16)
+        while not self.store.add(lock_key, token, self.lock_ttl):
+            # Another process is refreshing this token.
+            time.sleep(_POLL_INTERVAL)
+            stored = self._stored(key, decode)
+            if stored is not None:
+                return stored
+        try:
+            stored = self._stored(key, decode)
+            if stored is not None:
+                return stored
+            self._count("_refreshes")
+            return self._finish(key, refresh(), encode)
+        finally:
+            self.store.delete_if(lock_key, token)
+
+    async def arun(
+        self,
+        key: str,
+        refresh: Callable[[], Awaitable[R]],
+        *,
+        encode: Callable[[R], Optional[bytes]],
+        decode: Callable[[bytes], R],
+    ) -> R:
+        """Async variant of :meth:`run`.
+
+        The refresh runs in its own task, and every caller awaits it through
+        ``asyncio.shield``, so cancelling one caller does not cancel the
+        refresh for the others.
+        """
+        stored = self._stored(key, decode)
+        if stored is not None:
+            return stored
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._alead(key, refresh, encode, decode))
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._atask_done(key, done))
+        else:
+            self._count("_coalesced")
+        return await asyncio.shield(task)
+
+    def _atask_done(self, key: str, task: asyncio.Future[Any]) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        # Mark the outcome as retrieved in case every caller was cancelled.
+        if not task.cancelled():
+            task.exception()
+
+    async def _alead(
+        self,
+        key: str,
+        refresh: Callable[[], Awaitable[R]],
+        encode: Callable[[R], Optional[bytes]],
+        decode: Callable[[bytes], R],
+    ) -> R:
+        lock_key = f"{key}:lock"
+        token = secrets.token_bytes(16)
+        while not self.store.add(lock_key, token, self.lock_ttl):
+            await asyncio.sleep(_POLL_INTERVAL)
+            stored = self._stored(key, decode)
+            if stored is not None:
+                return stored
+        try:
+            stored = self._stored(key, decode)
+            if stored is not None:
+                return stored
+            self._count("_refreshes")
+            return self._finish(key, await refresh(), encode)
+        finally:
+            self.store.delete_if(lock_key, token)
@@ -0,0 +1,259 @@
+# @oagen-ignore-file
+
+"""Retry budgets and circuit breaking for the request loop."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable, Deque, List, Optional, Tuple
+
+from ._errors import CircuitOpenError
+
+_now = time.monotonic
+
+
+class RetryBudget:
+    """Caps retries as a share of recent requests.
+
+    Within a sliding ``window`` (seconds), retries are allowed while they stay
+    below ``ratio`` times the number of requests, plus a floor of
+    ``min_retries`` so low-traffic clients can still retry. During an outage
+    this bounds retry amplification to roughly ``1 + ratio`` attempts per
+    request instead of ``1 + max_retries``.
+
+    A budget is thread-safe and may be shared by several clients.
+    """
+
+    def __init__(
+        self,
+        *,
+        ratio: float = 0.2,
+        min_retries: int = 10,
+        window: float = 10.0,
+    ) -> None:
+        if ratio < 0:
+            raise ValueError("RetryBudget.ratio must not be negative")
+        if window <= 0:
+            raise ValueError("RetryBudget.window must be greater than 0")
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._lock = threading.Lock()
+        # (timestamp, is_retry) for every request and retry in the window.
+        self._events: Deque[Tuple[float, bool]] = deque()
+        self._requests_in_window = 0
+        self._retries_in_window = 0
+        self._exhausted = 0
+
+    @property
+    def requests(self) -> int:
+        """Requests recorded in the current window."""
+        with self._lock:
+            self._prune(_now())
+            return self._requests_in_window
+
+    @property
+    def retries(self) -> int:
+        """Retries granted in the current window."""
+        with self._lock:
+            self._prune(_now())
+            return self._retries_in_window
+
+    @property
+    def exhausted(self) -> int:
+        """Total retries denied because the budget was spent."""
+        return self._exhausted
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window
+        events = self._events
+        while events and events[0][0] < cutoff:
+            _, is_retry = events.popleft()
+            if is_retry:
+                self._retries_in_window -= 1
+            else:
+                self._requests_in_window -= 1
+
+    def record_request(self) -> None:
+        """Record a new logical request (not a retry)."""
+        with self._lock:
+            now = _now()
+            self._prune(now)
+            self._events.append((now, False))
+            self._requests_in_window += 1
+
+    def try_acquire_retry(self) -> bool:
+        """Spend one retry from the budget. Returns False if it is exhausted."""
+        with self._lock:
+            now = _now()
+            self._prune(now)
+            allowed = max(self.min_retries, self.ratio * self._requests_in_window)
+            if self._retries_in_window >= allowed:
+                self._exhausted += 1
+                return False
+            self._events.append((now, True))
+            self._retries_in_window += 1
+            return True
+
+
+class CircuitState(str, Enum):
+    """States of a :class:`CircuitBreaker`."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Fails fast after repeated server or network failures.
+
+    After ``failure_threshold`` consecutive failed attempts (5xx responses,
+    connection errors or timeouts) the circuit opens and requests raise
+    :class:`~workos._errors.CircuitOpenError` without touching the network.
+    After ``recovery_timeout`` seconds the circuit turns half-open and lets
+    ``half_open_max_calls`` probe requests through: a successful probe closes
+    the circuit, a failed one re-opens it. Any non-5xx response counts as a
+    success, since it shows the API is reachable.
+
+    ``on_state_change`` is called with ``(old_state, new_state)`` on every
+    transition, after the breaker's lock is released, so the callback may
+    read :attr:`state` or call :meth:`reset`. A breaker is thread-safe and may
+    be shared by several clients.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        on_state_change: Optional[Callable[[CircuitState, CircuitState], None]] = None,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("CircuitBreaker.failure_threshold must be at least 1")
+        if half_open_max_calls < 1:
+            raise ValueError("CircuitBreaker.half_open_max_calls must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.on_state_change = on_state_change
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probes: Deque[float] = deque()
+        # Transitions waiting to be reported once the lock is released.
+        self._changes: List[Tuple[CircuitState, CircuitState]] = []
+        self._times_opened = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """The current circuit state."""
+        with self._lock:
+            state = self._current_state(_now())
+        self._notify()
+        return state
+
+    @property
+    def consecutive_failures(self) -> int:
+        """Failed attempts since the last success."""
+        return self._consecutive_failures
+
+    @property
+    def times_opened(self) -> int:
+        """How many times the circuit has opened."""
+        return self._times_opened
+
+    @property
+    def rejected(self) -> int:
+        """Requests failed fast while the circuit was open."""
+        return self._rejected
+
+    def _current_state(self, now: float) -> CircuitState:
+        if (
+            self._state is CircuitState.OPEN
+            and now - self._opened_at >= self.recovery_timeout
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def _transition(self, new_state: CircuitState) -> None:
+        old_state = self._state
+        if old_state is new_state:
+            return
+        self._state = new_state
+        self._probes.clear()
+        if new_state is CircuitState.OPEN:
+            self._times_opened += 1
+        if self.on_state_change is not None:
+            self._changes.append((old_state, new_state))
+
+    def _notify(self) -> None:
+        if not self._changes:
+            return
+        with self._lock:
+            changes, self._changes = self._changes, []
+        callback = self.on_state_change
+        if callback is not None:
+            for old_state, new_state in changes:
+                callback(old_state, new_state)
+
+    def before_request(self) -> None:
+        """Raise :class:`CircuitOpenError` if a request may not be attempted."""
+        with self._lock:
+            now = _now()
+            state = self._current_state(now)
+            retry_after = 0.0
+            if state is CircuitState.CLOSED:
+                allowed = True
+            elif state is CircuitState.HALF_OPEN:
+                # Probes that never reported back (e.g. the caller crashed)
+                # free their slot after another recovery period.
+                while self._probes and now - self._probes[0] >= self.recovery_timeout:
+                    self._probes.popleft()
+                allowed = len(self._probes) < self.half_open_max_calls
+                if allowed:
+                    self._probes.append(now)
+            else:
+                allowed = False
+                retry_after = self.recovery_timeout - (now - self._opened_at)
+            if not allowed:
+                self._rejected += 1
+        self._notify()
+        if allowed:
+            return
+        raise CircuitOpenError(
+            "Circuit breaker is open after repeated WorkOS API failures; failing fast",
+            retry_after=max(retry_after, 0.0),
+        )
+
+    def record_success(self) -> None:
+        """Record an attempt that reached a healthy API."""
+        with self._lock:
+            self._consecutive_failures = 0
+            if self._state is not CircuitState.CLOSED:
+                self._transition(CircuitState.CLOSED)
+        self._notify()
+
+    def record_failure(self) -> None:
+        """Record a 5xx response, connection error or timeout."""
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._state is CircuitState.HALF_OPEN or (
+                self._state is CircuitState.CLOSED
+                and self._consecutive_failures >= self.failure_threshold
+            ):
+                self._opened_at = _now()
+                self._transition(CircuitState.OPEN)
+        self._notify()
+
+    def reset(self) -> None:
+        """Force the circuit closed and clear the failure count."""
+        with self._lock:
+            self._consecutive_failures = 0
+            self._transition(CircuitState.CLOSED)
+        self._notify()
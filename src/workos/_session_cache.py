@@ -0,0 +1,173 @@
+# @oagen-ignore-file
+
+"""Verified-token cache for repeated sealed session cookie authentication."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, Union
+
+if TYPE_CHECKING:
+    from .session import AuthenticateWithSessionCookieSuccessResponse
+
+DEFAULT_SESSION_CACHE_MAXSIZE = 1024
+
+# JWT ``exp`` claims are Unix timestamps, so entries expire by the wall clock.
+_now = time.time
+
+
+@dataclass(frozen=True, slots=True)
+class CachedAuthentication:
+    """A verified session cookie held by :class:`SessionCache`."""
+
+    claims: Dict[str, Any]
+    """The decoded access token claims."""
+    response: AuthenticateWithSessionCookieSuccessResponse
+    """The result returned for the cookie. Shared by every hit; do not mutate."""
+    expires_at: float
+    """Unix time after which the entry is no longer served."""
+
+
+@dataclass(slots=True)
+class SessionCacheStats:
+    """A snapshot of :class:`SessionCache` counters."""
+
+    hits: int = 0
+    """Authentications answered from the cache."""
+    misses: int = 0
+    """Authentications that unsealed and verified the cookie."""
+    stores: int = 0
+    """Verified cookies written to the cache."""
+    expirations: int = 0
+    """Entries dropped because their access token expired."""
+    evictions: int = 0
+    """Entries evicted to stay within ``maxsize``."""
+    size: int = 0
+    """Entries currently cached."""
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of authentications answered from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def _digest(session_data: str, cookie_password: Union[str, Sequence[str]]) -> bytes:
+    # The passwords are part of the key so a cookie is only served to
+    # sessions that could have unsealed it.
+    passwords = (
+        cookie_password
+        if isinstance(cookie_password, str)
+        else "\0".join(cookie_password)
+    )
+    return hashlib.sha256(f"{passwords}\0\0{session_data}".encode("utf-8")).digest()
+
+
+class SessionCache:
+    """Thread-safe, size-bounded cache of verified session cookies.
+
+    Pass one to ``WorkOSClient(session_cache=...)`` or
+    ``AsyncWorkOSClient(session_cache=...)``. A successful
+    ``Session.authenticate`` stores the decoded claims and its response under
+    a SHA-256 digest of the cookie and password, until the access token's
+    ``exp`` minus the client's ``jwt_leeway``. Authenticating the same cookie
+    again is then a hash lookup instead of Fernet decryption and an RS256
+    signature check.
+
+    A cached cookie stays valid until its token expires, even if its signing
+    key is rotated out of the JWKS first. Tokens without ``exp`` and failed
+    authentications are never cached. When ``maxsize`` entries are stored,
+    the least recently used entry is evicted.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_SESSION_CACHE_MAXSIZE) -> None:
+        if maxsize < 1:
+            raise ValueError("SessionCache.maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[bytes, CachedAuthentication] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._expirations = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self, session_data: str, cookie_password: Union[str, Sequence[str]]
+    ) -> Optional[CachedAuthentication]:
+        """Return the cached authentication of a cookie, or ``None``."""
+        key = _digest(session_data, cookie_password)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry.expires_at <= _now():
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry
+
+    def store(
+        self,
+        session_data: str,
+        cookie_password: Union[str, Sequence[str]],
+        claims: Dict[str, Any],
+        response: AuthenticateWithSessionCookieSuccessResponse,
+        *,
+        leeway: float = 0.0,
+    ) -> None:
+        """Cache a verified cookie until ``claims["exp"] - leeway``.
+
+        Does nothing if the token has no numeric ``exp`` or is already past
+        that point.
+        """
+        exp = claims.get("exp")
+        if not isinstance(exp, (int, float)) or isinstance(exp, bool):
+            return
+        expires_at = exp - leeway
+        if expires_at <= _now():
+            return
+        key = _digest(session_data, cookie_password)
+        with self._lock:
+            self._entries[key] = CachedAuthentication(claims, response, expires_at)
+            self._entries.move_to_end(key)
+            self._stores += 1
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(
+        self, session_data: str, cookie_password: Union[str, Sequence[str]]
+    ) -> bool:
+        """Remove a cookie from the cache and return whether it was cached."""
+        key = _digest(session_data, cookie_password)
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> SessionCacheStats:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return SessionCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                stores=self._stores,
+                expirations=self._expirations,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
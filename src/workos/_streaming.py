@@ -0,0 +1,468 @@
+# @oagen-ignore-file
+
+"""Incremental parsing of list responses for ``RequestOptions(stream=True)``."""
+
+from __future__ import annotations
+
+import codecs
+import contextlib
+import json
+import re
+import weakref
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+import httpx
+
+from ._errors import WorkOSError
+from ._pagination import ListMetadata, T
+
+_WHITESPACE = " \t\n\r"
+_DECODER = json.JSONDecoder()
+
+# What the scanner looks for inside strings, inside containers, and after
+# the first character of a number, true, false or null.
+_STRING_END = re.compile(r'["\\]')
+# A bracket, a whole string, or the opening quote of a string that is not
+# closed yet.
+_STRUCTURE = re.compile(r'[\[\]{}]|"[^"\\]*(?:\\.[^"\\]*)*"|"', re.DOTALL)
+_SCALAR_END = re.compile(r"[,\]}\s]")
+
+# Parser states.
+_START, _KEY, _COLON, _VALUE, _ITEMS, _END = range(6)
+
+
+class ListStreamParser:
+    """Incrementally parses a ``{"data": [...], "list_metadata": {...}}`` body.
+
+    Feed it the body in chunks of any size; each call returns the elements of
+    ``data`` that are complete so far. Every other top-level field is decoded
+    whole and collected in ``fields`` once it has arrived, so
+    ``fields["list_metadata"]`` is available after the tail of the body.
+
+    A value that is complete within its chunk is decoded directly. A value
+    cut off by the end of a chunk is scanned once, tracking strings, escapes
+    and bracket depth, and kept as a list of pieces until its last chunk
+    arrives, when it is joined and decoded once; large items and small
+    chunks therefore cost linear time. Values are decoded with the standard
+    library, independent of the configured :mod:`JSON codec
+    <workos._json>`, because only it can decode a value from the middle of
+    a buffer.
+    """
+
+    def __init__(self, array_key: str = "data") -> None:
+        self.array_key = array_key
+        self.fields: Dict[str, Any] = {}
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._state = _START
+        self._key = ""
+        # The value being scanned, if it started in an earlier chunk.
+        self._pieces: Optional[List[str]] = None
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    @property
+    def done(self) -> bool:
+        """Whether the closing brace of the body has been parsed."""
+        return self._state == _END
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Add the next chunk of the body and return the newly complete items.
+
+        Raises:
+            ValueError: If the body is not a JSON object.
+        """
+        return self._parse(self._utf8.decode(chunk))
+
+    def close(self) -> List[Any]:
+        """Signal the end of the body and return any remaining items.
+
+        An empty body parses as an empty page.
+
+        Raises:
+            ValueError: If the body is truncated or not a JSON object.
+        """
+        items = self._parse(self._utf8.decode(b"", final=True))
+        if self._state == _START:
+            # Only whitespace has arrived.
+            self._state = _END
+        if self._state != _END:
+            raise ValueError("List response ended before its closing brace")
+        return items
+
+    def _scan(self, text: str, pos: int) -> int:
+        """Scan the current value from ``pos`` and return the index just past
+        its end, or -1 if it continues in the next chunk."""
+        size = len(text)
+        depth = self._depth
+        in_string = self._in_string
+        if self._escaped:
+            if pos >= size:
+                return -1
+            pos += 1
+            self._escaped = False
+        while True:
+            if in_string:
+                match = _STRING_END.search(text, pos)
+                if match is None:
+                    break
+                pos = match.end()
+                if match.group() == "\\":
+                    if pos >= size:
+                        self._escaped = True
+                        break
+                    pos += 1
+                    continue
+                in_string = False
+                if depth == 0:
+                    return pos
+            elif depth == 0:
+                # A number, true, false or null.
+                match = _SCALAR_END.search(text, pos)
+                if match is None:
+                    break
+                return match.start()
+            else:
+                match = _STRUCTURE.search(text, pos)
+                if match is None:
+                    break
+                pos = match.end()
+                token = match.group()
+                if token == '"':
+                    in_string = True
+                elif token == "[" or token == "{":
+                    depth += 1
+                elif token == "]" or token == "}":
+                    depth -= 1
+                    if depth == 0:
+                        return pos
+        self._depth = depth
+        self._in_string = in_string
+        return -1
+
+    def _value(self, text: str, pos: int) -> Optional[Tuple[Any, int]]:
+        """Decode the value at ``pos``, or return None if it is still arriving."""
+        start = pos
+        if self._pieces is None:
+            char = text[pos]
+            try:
+                value, end = _DECODER.raw_decode(text, pos)
+            except json.JSONDecodeError:
+                pass
+            else:
+                # A number at the very end may continue in the next chunk.
+                if end < len(text) or char in '"[{':
+                    return value, end
+            # The value is cut off by the end of the chunk (or malformed):
+            # scan it once and decode it when its last chunk arrives.
+            self._depth = 0
+            self._in_string = char == '"'
+            self._escaped = False
+            if self._in_string:
+                pos += 1
+            elif char == "[" or char == "{":
+                self._depth = 1
+                pos += 1
+        end = self._scan(text, pos)
+        if end < 0:
+            if self._pieces is None:
+                self._pieces = []
+            self._pieces.append(text[start:])
+            return None
+        if self._pieces is None:
+            value, stop = _DECODER.raw_decode(text, start)
+        else:
+            self._pieces.append(text[:end])
+            whole = "".join(self._pieces)
+            self._pieces = None
+            value, stop = _DECODER.raw_decode(whole)
+            stop += end - len(whole)
+        if stop != end:
+            raise ValueError(f"Invalid JSON value ending at position {stop}")
+        return value, end
+
+    def _parse(self, text: str) -> List[Any]:
+        items: List[Any] = []
+        pos = 0
+        size = len(text)
+        while True:
+            if self._pieces is None:
+                while pos < size and text[pos] in _WHITESPACE:
+                    pos += 1
+            if pos >= size:
+                break
+            char = text[pos]
+            state = self._state
+            if state == _ITEMS:
+                if self._pieces is not None:
+                    decoded = self._value(text, pos)
+                    if decoded is None:
+                        break
+                    item, pos = decoded
+                    items.append(item)
+                elif char == ",":
+                    pos += 1
+                elif char == "]":
+                    pos += 1
+                    self._state = _KEY
+                else:
+                    decoded = self._value(text, pos)
+                    if decoded is None:
+                        break
+                    item, pos = decoded
+                    items.append(item)
+            elif state == _KEY:
+                if self._pieces is None and char == ",":
+                    pos += 1
+                elif self._pieces is None and char == "}":
+                    pos += 1
+                    self._state = _END
+                elif self._pieces is not None or char == '"':
+                    decoded = self._value(text, pos)
+                    if decoded is None:
+                        break
+                    self._key, pos = decoded
+                    self._state = _COLON
+                else:
+                    raise ValueError(f"Expected a key at position {pos}")
+            elif state == _COLON:
+                if char != ":":
+                    raise ValueError(f"Expected ':' at position {pos}")
+                pos += 1
+                self._state = _VALUE
+            elif state == _VALUE:
+                if self._pieces is None and self._key == self.array_key and char == "[":
+                    pos += 1
+                    self._state = _ITEMS
+                else:
+                    decoded = self._value(text, pos)
+                    if decoded is None:
+                        break
+                    self.fields[self._key], pos = decoded
+                    self._state = _KEY
+            elif state == _START:
+                if char != "{":
+                    raise ValueError("List response is not a JSON object")
+                pos += 1
+                self._state = _KEY
+            else:
+                raise ValueError(f"Unexpected data after the list at position {pos}")
+        return items
+
+
+def _list_metadata(parser: ListStreamParser) -> ListMetadata:
+    metadata = parser.fields.get("list_metadata")
+    return ListMetadata.from_dict(metadata if isinstance(metadata, dict) else {})
+
+
+class SyncPageStream(Generic[T]):
+    """The body of a page requested with ``RequestOptions(stream=True)``.
+
+    A :class:`~workos._pagination.SyncPage` holds one in place of its items.
+    Iterating the page (or ``auto_paging_iter()``) yields each item as soon
+    as it has arrived and does not keep it, and later pages are streamed the
+    same way. ``page.read()`` instead downloads the rest of the page and
+    fills in its ``data`` and ``list_metadata``; iterating fills in only
+    ``list_metadata``.
+
+    The response is closed once the body has been read, when iteration
+    stops, by ``page.close()``, or when the stream is garbage collected.
+    """
+
+    def __init__(
+        self, response: httpx.Response, load: Callable[[Dict[str, Any]], T]
+    ) -> None:
+        self._response = response
+        self._load_item = load
+        self._items: Optional[List[T]] = None
+        self._metadata: Optional[ListMetadata] = None
+        self._streamed = 0
+        self._started = False
+        self._closer = weakref.finalize(self, response.close)
+
+    @property
+    def count(self) -> int:
+        """How many items have been read so far."""
+        return len(self._items) if self._items is not None else self._streamed
+
+    def items(self) -> List[T]:
+        """Every item on the page, downloading the rest of the body if needed.
+
+        Raises:
+            WorkOSError: If the items have already been streamed.
+        """
+        if self._items is None:
+            if self._started:
+                raise WorkOSError(
+                    "The items of a streamed page can only be iterated once"
+                )
+            self._started = True
+            self._items = list(self._stream())
+        return self._items
+
+    def list_metadata(self) -> ListMetadata:
+        """Pagination cursors, read from the end of the body."""
+        if self._metadata is None:
+            if self._started:
+                raise WorkOSError(
+                    "list_metadata is available once every item has been iterated"
+                )
+            self.items()
+        assert self._metadata is not None
+        return self._metadata
+
+    def close(self) -> None:
+        """Close the response without reading the rest of the body."""
+        self._closer()
+
+    def load(self) -> None:
+        """Read the rest of the body unless iterating it has started."""
+        if not self._started:
+            self.items()
+
+    def iter_items(self) -> Iterator[T]:
+        """Yield the items as they arrive, or the kept ones after :meth:`items`."""
+        if self._items is not None or self._started:
+            yield from self.items()
+            return
+        self._started = True
+        for item in self._stream():
+            self._streamed += 1
+            yield item
+
+    def _stream(self) -> Iterator[T]:
+        parser = ListStreamParser()
+        try:
+            for chunk in self._response.iter_bytes():
+                for item in parser.feed(chunk):
+                    yield self._load_item(item)
+            for item in parser.close():
+                yield self._load_item(item)
+        except ValueError as e:
+            raise WorkOSError(f"Malformed list response: {e}") from e
+        except httpx.HTTPError as e:
+            raise WorkOSError(f"Network error: {e}") from e
+        finally:
+            self.close()
+        self._metadata = _list_metadata(parser)
+
+    def __repr__(self) -> str:
+        return f"SyncPageStream(response={self._response!r})"
+
+
+class AsyncPageStream(Generic[T]):
+    """The body of an async page requested with ``RequestOptions(stream=True)``.
+
+    An :class:`~workos._pagination.AsyncPage` holds one in place of its
+    items. Iterating the page (or ``auto_paging_iter()``) yields each item
+    as soon as it has arrived and does not keep it. Await ``page.aread()``
+    instead to fill in the page's ``data`` and ``list_metadata``.
+
+    The response is closed once the body has been read, when iteration
+    stops, or by ``page.aclose()``. An async response cannot be closed from
+    the garbage collector, so close pages you do not read.
+    """
+
+    def __init__(
+        self, response: httpx.Response, load: Callable[[Dict[str, Any]], T]
+    ) -> None:
+        self._response = response
+        self._load_item = load
+        self._items: Optional[List[T]] = None
+        self._metadata: Optional[ListMetadata] = None
+        self._streamed = 0
+        self._started = False
+
+    @property
+    def count(self) -> int:
+        """How many items have been read so far."""
+        return len(self._items) if self._items is not None else self._streamed
+
+    def items(self) -> List[T]:
+        """Every item on the page.
+
+        Raises:
+            WorkOSError: If the page has not been read with :meth:`aread`.
+        """
+        if self._items is None:
+            raise WorkOSError("Await page.aread() before using data on a streamed page")
+        return self._items
+
+    def list_metadata(self) -> ListMetadata:
+        """Pagination cursors, read from the end of the body.
+
+        Raises:
+            WorkOSError: If the body has not been read yet.
+        """
+        if self._metadata is None:
+            raise WorkOSError(
+                "list_metadata is available after page.aread() or once every "
+                "item has been iterated"
+            )
+        return self._metadata
+
+    async def aread(self) -> None:
+        """Download and parse the rest of the body, keeping its items.
+
+        Raises:
+            WorkOSError: If the items have already been streamed.
+        """
+        if self._items is None:
+            if self._started:
+                raise WorkOSError(
+                    "The items of a streamed page can only be iterated once"
+                )
+            self._started = True
+            async with contextlib.aclosing(self._stream()) as items:
+                self._items = [item async for item in items]
+
+    async def aclose(self) -> None:
+        """Close the response without reading the rest of the body."""
+        await self._response.aclose()
+
+    async def load(self) -> None:
+        """Read the rest of the body unless iterating it has started."""
+        if not self._started:
+            await self.aread()
+
+    async def aiter_items(self) -> AsyncGenerator[T, None]:
+        """Yield the items as they arrive, or the kept ones after :meth:`aread`."""
+        if self._items is not None or self._started:
+            await self.aread()
+            for item in self.items():
+                yield item
+            return
+        self._started = True
+        async with contextlib.aclosing(self._stream()) as items:
+            async for item in items:
+                self._streamed += 1
+                yield item
+
+    async def _stream(self) -> AsyncGenerator[T, None]:
+        parser = ListStreamParser()
+        try:
+            async for chunk in self._response.aiter_bytes():
+                for item in parser.feed(chunk):
+                    yield self._load_item(item)
+            for item in parser.close():
+                yield self._load_item(item)
+        except ValueError as e:
+            raise WorkOSError(f"Malformed list response: {e}") from e
+        except httpx.HTTPError as e:
+            raise WorkOSError(f"Network error: {e}") from e
+        finally:
+            await self.aclose()
+        self._metadata = _list_metadata(parser)
+
+    def __repr__(self) -> str:
+        return f"AsyncPageStream(response={self._response!r})"
@@ -0,0 +1,255 @@
+# @oagen-ignore-file
+
+"""HTTP transport configuration and connection-pool statistics."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+import httpx
+
+from ._errors import ConfigurationError
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+
+
+@dataclass(slots=True)
+class TransportConfig:
+    """Connection pool, timeout, and transport settings for a WorkOS client.
+
+    Timeouts left as ``None`` inherit the client's ``request_timeout``. When
+    ``http_client`` is supplied the SDK uses it as-is: pool limits, timeouts
+    and ``transport`` on this object are ignored, and closing the WorkOS
+    client does not close the injected client.
+    """
+
+    max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS
+    """Maximum number of concurrent connections. ``None`` means unbounded."""
+    max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+    """Maximum number of idle connections kept in the pool."""
+    keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY
+    """Seconds an idle connection is kept before being closed."""
+    connect_timeout: Optional[float] = None
+    """Seconds to wait for a connection to be established."""
+    read_timeout: Optional[float] = None
+    """Seconds to wait for a chunk of the response body."""
+    write_timeout: Optional[float] = None
+    """Seconds to wait for a chunk of the request body to be sent."""
+    pool_timeout: Optional[float] = None
+    """Seconds to wait for a connection from the pool."""
+    http_client: Optional[Union[httpx.Client, httpx.AsyncClient]] = None
+    """A preconfigured httpx client to use instead of building one."""
+    transport: Optional[Union[httpx.BaseTransport, httpx.AsyncBaseTransport]] = None
+    """A custom httpx transport for the client the SDK builds."""
+    http2: bool = False
+    """Negotiate HTTP/2 via ALPN so concurrent requests share one connection.
+
+    Requires the ``h2`` package, installed with ``pip install "workos[http2]"``.
+    Building the client raises ``ConfigurationError`` if it is missing.
+    """
+
+    def build_limits(self) -> httpx.Limits:
+        """Build the ``httpx.Limits`` for the connection pool."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def build_timeout(self, default: float) -> httpx.Timeout:
+        """Build an ``httpx.Timeout``, falling back to ``default`` per phase."""
+        return httpx.Timeout(
+            default,
+            connect=_or_default(self.connect_timeout, default),
+            read=_or_default(self.read_timeout, default),
+            write=_or_default(self.write_timeout, default),
+            pool=_or_default(self.pool_timeout, default),
+        )
+
+    def _require_h2(self) -> None:
+        if not self.http2:
+            return
+        try:
+            import h2  # noqa: F401  # pyright: ignore[reportUnusedImport]
+        except ImportError as e:
+            raise ConfigurationError(
+                "HTTP/2 support requires the 'h2' package. "
+                'Install it with: pip install "workos[http2]"'
+            ) from e
+
+    def build_sync_client(self, default_timeout: float) -> httpx.Client:
+        """Return the injected sync client or build one from this config."""
+        if self.http_client is not None:
+            if not isinstance(self.http_client, httpx.Client):
+                raise ConfigurationError(
+                    "WorkOSClient requires an httpx.Client; got "
+                    f"{type(self.http_client).__name__}"
+                )
+            return self.http_client
+        if self.transport is not None and not isinstance(
+            self.transport, httpx.BaseTransport
+        ):
+            raise ConfigurationError(
+                "WorkOSClient requires an httpx.BaseTransport; got "
+                f"{type(self.transport).__name__}"
+            )
+        self._require_h2()
+        return httpx.Client(
+            timeout=self.build_timeout(default_timeout),
+            limits=self.build_limits(),
+            transport=self.transport,
+            http2=self.http2,
+            follow_redirects=True,
+        )
+
+    def build_async_client(self, default_timeout: float) -> httpx.AsyncClient:
+        """Return the injected async client or build one from this config."""
+        if self.http_client is not None:
+            if not isinstance(self.http_client, httpx.AsyncClient):
+                raise ConfigurationError(
+                    "AsyncWorkOSClient requires an httpx.AsyncClient; got "
+                    f"{type(self.http_client).__name__}"
+                )
+            return self.http_client
+        if self.transport is not None and not isinstance(
+            self.transport, httpx.AsyncBaseTransport
+        ):
+            raise ConfigurationError(
+                "AsyncWorkOSClient requires an httpx.AsyncBaseTransport; got "
+                f"{type(self.transport).__name__}"
+            )
+        self._require_h2()
+        return httpx.AsyncClient(
+            timeout=self.build_timeout(default_timeout),
+            limits=self.build_limits(),
+            transport=self.transport,
+            http2=self.http2,
+            follow_redirects=True,
+        )
+
+
+def _or_default(value: Optional[float], default: float) -> float:
+    return default if value is None else value
+
+
+class TransportStats:
+    """Thread-safe counters for connection pool waits and negotiated protocols.
+
+    Pool wait is measured from the moment a request is handed to httpx until
+    the connection pool produces a connection for it (either a reused
+    keep-alive connection or a freshly opened one). Requests served by
+    transports that do not emit httpcore trace events, such as mock
+    transports, are not counted.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._total_pool_wait = 0.0
+        self._max_pool_wait = 0.0
+        self._last_pool_wait = 0.0
+        self._http_versions: Dict[str, int] = {}
+        self._last_http_version: Optional[str] = None
+
+    @property
+    def requests(self) -> int:
+        """Number of requests with a recorded pool wait."""
+        return self._requests
+
+    @property
+    def total_pool_wait(self) -> float:
+        """Cumulative seconds spent waiting for a pooled connection."""
+        return self._total_pool_wait
+
+    @property
+    def max_pool_wait(self) -> float:
+        """Longest single pool wait in seconds."""
+        return self._max_pool_wait
+
+    @property
+    def last_pool_wait(self) -> float:
+        """Pool wait of the most recently recorded request in seconds."""
+        return self._last_pool_wait
+
+    @property
+    def http_versions(self) -> Dict[str, int]:
+        """Response counts keyed by protocol, e.g. ``{"HTTP/2": 10}``."""
+        with self._lock:
+            return dict(self._http_versions)
+
+    @property
+    def last_http_version(self) -> Optional[str]:
+        """Protocol of the most recent response, e.g. ``"HTTP/1.1"``."""
+        return self._last_http_version
+
+    @property
+    def negotiated_http2(self) -> bool:
+        """Whether the most recent response was served over HTTP/2."""
+        return self._last_http_version == "HTTP/2"
+
+    @property
+    def average_pool_wait(self) -> float:
+        """Mean pool wait in seconds, or ``0.0`` before any request."""
+        with self._lock:
+            if not self._requests:
+                return 0.0
+            return self._total_pool_wait / self._requests
+
+    def reset(self) -> None:
+        """Reset all counters to zero."""
+        with self._lock:
+            self._requests = 0
+            self._total_pool_wait = 0.0
+            self._max_pool_wait = 0.0
+            self._last_pool_wait = 0.0
+            self._http_versions = {}
+            self._last_http_version = None
+
+    def record_response(self, response: httpx.Response) -> None:
+        """Record the protocol a response was served over."""
+        http_version = response.http_version
+        with self._lock:
+            self._http_versions[http_version] = (
+                self._http_versions.get(http_version, 0) + 1
+            )
+            self._last_http_version = http_version
+
+    def record(self, pool_wait: float) -> None:
+        """Record the pool wait of a single request."""
+        with self._lock:
+            self._requests += 1
+            self._total_pool_wait += pool_wait
+            self._last_pool_wait = pool_wait
+            if pool_wait > self._max_pool_wait:
+                self._max_pool_wait = pool_wait
+
+    def sync_trace(self) -> Callable[[str, Dict[str, Any]], None]:
+        """Build an httpcore ``trace`` extension for a single sync request."""
+        started = time.perf_counter()
+        recorded = False
+
+        def trace(event_name: str, info: Dict[str, Any]) -> None:
+            nonlocal recorded
+            if not recorded:
+                recorded = True
+                self.record(time.perf_counter() - started)
+
+        return trace
+
+    def async_trace(self) -> Callable[[str, Dict[str, Any]], Awaitable[None]]:
+        """Build an httpcore ``trace`` extension for a single async request."""
+        started = time.perf_counter()
+        recorded = False
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            nonlocal recorded
+            if not recorded:
+                recorded = True
+                self.record(time.perf_counter() - started)
+
+        return trace
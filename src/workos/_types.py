@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
+import functools
 import sys
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Literal, NoReturn, Protocol, TypedDict, TypeVar
+from typing import (
+    Any,
+    Dict,
+    Literal,
+    NoReturn,
+    Protocol,
+    Sequence,
+    TypedDict,
+    TypeVar,
+)
 
 if sys.version_info >= (3, 11):
     from typing import Self
@@ -21,6 +31,11 @@ class RequestOptions(TypedDict, total=False):
     idempotency_key: str
     max_retries: int
     base_url: str
+    cache: bool
+    stream: bool
+    lazy: bool
+    raw: bool
+    fields: Sequence[str]
 
 
 class Deserializable(Protocol):
@@ -56,11 +71,18 @@ NOT_GIVEN = NotGiven()
 D = TypeVar("D", bound=Deserializable)
 
 
+# Timestamps repeat within and across pages, and datetimes are immutable, so
+# equal strings can share one parsed value.
+_DATETIME_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=_DATETIME_CACHE_SIZE)
 def _parse_datetime(value: str) -> datetime:
     """Parse an ISO 8601 datetime string, handling 'Z' suffix.
 
     On Python 3.11+ fromisoformat handles 'Z' natively;
-    on older versions we replace 'Z' with '+00:00'.
+    on older versions we replace 'Z' with '+00:00'. Results are memoized in
+    a bounded LRU cache.
     """
     if sys.version_info >= (3, 11):
         return datetime.fromisoformat(value)
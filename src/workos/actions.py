@@ -11,6 +11,8 @@ import json
 import time
 from typing import Any, Dict, Literal, Optional, Union
 
+from . import _json
+
 DEFAULT_TOLERANCE = 30  # seconds (stricter than webhooks' 180s)
 
 ActionType = Literal["authentication", "user_registration"]
@@ -105,7 +107,7 @@ class Actions:
             tolerance=tolerance,
         )
         body = payload.decode("utf-8") if isinstance(payload, bytes) else payload
-        return json.loads(body)
+        return _json.loads(body)
 
     def sign_response(
         self,
@@ -124,6 +126,7 @@ class Actions:
         if error_message is not None:
             response_payload["error_message"] = error_message
 
+        # Always the stdlib: the signature covers these exact bytes.
         payload_json = json.dumps(response_payload, separators=(",", ":"))
         signed_payload = f"{timestamp}.{payload_json}"
         signature = _compute_signature(signed_payload, secret)
@@ -171,7 +174,7 @@ class AsyncActions:
             tolerance=tolerance,
         )
         body = payload.decode("utf-8") if isinstance(payload, bytes) else payload
-        return json.loads(body)
+        return _json.loads(body)
 
     def sign_response(
         self,
@@ -190,6 +193,7 @@ class AsyncActions:
         if error_message is not None:
             response_payload["error_message"] = error_message
 
+        # Always the stdlib: the signature covers these exact bytes.
         payload_json = json.dumps(response_payload, separators=(",", ":"))
         signed_payload = f"{timestamp}.{payload_json}"
         signature = _compute_signature(signed_payload, secret)
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from ._client import WorkOSClient
+    from ._transport import TransportConfig
 
 
 def create_public_client(
@@ -15,6 +16,7 @@ def create_public_client(
     client_id: str,
     base_url: Optional[str] = None,
     request_timeout: Optional[int] = None,
+    transport_config: Optional["TransportConfig"] = None,
 ) -> "WorkOSClient":
     """Create a WorkOS client configured for public/PKCE-only usage.
 
@@ -26,11 +28,13 @@ def create_public_client(
         client_id: The WorkOS client ID.
         base_url: Override the base URL. Defaults to ``https://api.workos.com``.
         request_timeout: HTTP request timeout in seconds.
+        transport_config: Connection pool limits, per-phase timeouts, and an
+            optional injected ``httpx.Client`` or transport.
 
     Returns:
         A WorkOSClient instance with only ``client_id`` configured.
     """
-    from ._client import WorkOSClient
+    from . import WorkOSClient
 
     return WorkOSClient(
         api_key=None,
@@ -38,4 +42,5 @@ def create_public_client(
         base_url=base_url,
         request_timeout=request_timeout,
         is_public=True,
+        transport_config=transport_config,
     )
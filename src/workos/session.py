@@ -5,8 +5,7 @@
 
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from enum import Enum
 from functools import lru_cache
 from typing import (
@@ -16,14 +15,15 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Tuple,
     Union,
     cast,
 )
 
 import jwt
-from cryptography.fernet import Fernet
-from jwt import PyJWKClient
+from cryptography.fernet import Fernet, MultiFernet
 
+from . import _json
 from ._errors import (
     AuthenticationError,
     AuthenticationMethodNotAllowedError,
@@ -37,8 +37,14 @@ from ._errors import (
     WorkOSConnectionError,
     WorkOSTimeoutError,
 )
+from ._jwks import (
+    AsyncJWKSKeyStore as AsyncJWKSKeyStore,
+    JWKSKeyStore as JWKSKeyStore,
+    JWKSStats as JWKSStats,
+)
 
 if TYPE_CHECKING:
+    from ._base_client import _BaseWorkOSClient
     from ._client import AsyncWorkOSClient, WorkOSClient
 
 
@@ -177,24 +183,112 @@ class RefreshWithSessionCookieErrorResponse:
 # ---------------------------------------------------------------------------
 
 
-@lru_cache(maxsize=None)
-def _get_jwks_client(jwks_url: str) -> PyJWKClient:
-    return PyJWKClient(jwks_url)
+# One key store per JWKS URL, shared by every session of the process.
+_KEY_STORES_MAXSIZE = 32
+
+
+@lru_cache(maxsize=_KEY_STORES_MAXSIZE)
+def _get_key_store(jwks_url: str) -> JWKSKeyStore:
+    return JWKSKeyStore(jwks_url)
+
+
+def _cached_authentication(
+    client: "_BaseWorkOSClient", session_data: str, cookie_password: CookiePassword
+) -> Optional[AuthenticateWithSessionCookieSuccessResponse]:
+    cache = client.session_cache
+    if cache is None or not session_data:
+        return None
+    entry = cache.get(session_data, cookie_password)
+    return entry.response if entry is not None else None
+
+
+def _remember_authentication(
+    client: "_BaseWorkOSClient",
+    session_data: str,
+    cookie_password: CookiePassword,
+    claims: Dict[str, Any],
+    response: AuthenticateWithSessionCookieSuccessResponse,
+) -> AuthenticateWithSessionCookieSuccessResponse:
+    if client.session_cache is not None:
+        client.session_cache.store(
+            session_data,
+            cookie_password,
+            claims,
+            response,
+            leeway=client._jwt_leeway,
+        )
+    return response
+
+
+# A Fernet key, or a list of keys, newest first, while rotating keys.
+CookiePassword = Union[str, Sequence[str]]
+
+# One cipher per password (or password list), shared by every seal and unseal.
+_CIPHERS_MAXSIZE = 32
+
+
+@lru_cache(maxsize=_CIPHERS_MAXSIZE)
+def _cipher(keys: Tuple[str, ...]) -> Union[Fernet, MultiFernet]:
+    if len(keys) == 1:
+        return Fernet(keys[0])
+    return MultiFernet([Fernet(key) for key in keys])
+
 
+def _get_cipher(key: CookiePassword) -> Union[Fernet, MultiFernet]:
+    if isinstance(key, str):
+        return _cipher((key,))
+    if not key:
+        raise ValueError("cookie_password must contain at least one key")
+    return _cipher(tuple(key))
 
-def seal_data(data: Dict[str, Any], key: str) -> str:
-    """Encrypt a dictionary with Fernet symmetric encryption."""
-    fernet = Fernet(key)
-    encrypted_bytes = fernet.encrypt(json.dumps(data).encode())
+
+def seal_data(data: Dict[str, Any], key: CookiePassword) -> str:
+    """Encrypt a dictionary with Fernet symmetric encryption.
+
+    ``key`` is a Fernet key, or a list of keys, newest first, in which case
+    the newest key is used.
+    """
+    encrypted_bytes = _get_cipher(key).encrypt(_json.dumps(data))
     return encrypted_bytes.decode("utf-8")
 
 
-def unseal_data(sealed_data: str, key: str) -> Dict[str, Any]:
-    """Decrypt a Fernet-encrypted string back to a dictionary."""
-    fernet = Fernet(key)
+def unseal_data(sealed_data: str, key: CookiePassword) -> Dict[str, Any]:
+    """Decrypt a Fernet-encrypted string back to a dictionary.
+
+    ``key`` is a Fernet key, or a list of keys that are tried newest first.
+    """
     encrypted_bytes = sealed_data.encode("utf-8")
-    decrypted_str = fernet.decrypt(encrypted_bytes).decode()
-    return cast(Dict[str, Any], json.loads(decrypted_str))
+    return cast(Dict[str, Any], _json.loads(_get_cipher(key).decrypt(encrypted_bytes)))
+
+
+def reseal_data(sealed_data: str, key: CookiePassword) -> str:
+    """Re-encrypt sealed data with the newest key of ``key``.
+
+    Use this to move a cookie sealed with an older password onto the newest
+    one without a refresh. The payload and its timestamp are unchanged.
+
+    Raises:
+        cryptography.fernet.InvalidToken: If no key can decrypt the data.
+    """
+    cipher = _get_cipher(key)
+    if isinstance(cipher, Fernet):
+        cipher = MultiFernet([cipher])
+    return cipher.rotate(sealed_data.encode("utf-8")).decode("utf-8")
+
+
+def _encode_refresh(
+    result: Union[
+        RefreshWithSessionCookieSuccessResponse, RefreshWithSessionCookieErrorResponse
+    ],
+) -> Optional[bytes]:
+    # Only successful refreshes are shared with later callers.
+    if not isinstance(result, RefreshWithSessionCookieSuccessResponse):
+        return None
+    return _json.dumps(asdict(result))
+
+
+def _decode_refresh(data: bytes) -> RefreshWithSessionCookieSuccessResponse:
+    return RefreshWithSessionCookieSuccessResponse(**_json.loads(data))
 
 
 def seal_session_from_auth_response(
@@ -203,7 +297,7 @@ def seal_session_from_auth_response(
     refresh_token: str,
     user: Dict[str, Any],
     impersonator: Optional[Dict[str, Any]] = None,
-    cookie_password: str,
+    cookie_password: CookiePassword,
 ) -> str:
     """Seal session data from an authentication response into a cookie-safe string.
 
@@ -212,7 +306,8 @@ def seal_session_from_auth_response(
         refresh_token: The refresh token from the auth response.
         user: The user dict from the auth response.
         impersonator: The impersonator dict, if present.
-        cookie_password: The Fernet key used to seal the session.
+        cookie_password: The Fernet key used to seal the session, or a list
+            of keys, newest first, to seal with the newest.
 
     Returns:
         A sealed session string suitable for storing in a cookie.
@@ -233,7 +328,12 @@ def seal_session_from_auth_response(
 
 
 class Session:
-    """Server-side session management using sealed cookies and JWT validation."""
+    """Server-side session management using sealed cookies and JWT validation.
+
+    To rotate the cookie password, pass a list of passwords, newest first.
+    Cookies sealed with any of them are accepted, and :meth:`refresh` seals
+    the new session with the newest.
+    """
 
     _JWK_ALGORITHMS: List[str] = ["RS256"]
 
@@ -242,7 +342,7 @@ class Session:
         *,
         client: "WorkOSClient",
         session_data: str,
-        cookie_password: str,
+        cookie_password: CookiePassword,
     ) -> None:
         if not cookie_password:
             raise ValueError("cookie_password is required")
@@ -252,7 +352,7 @@ class Session:
         self.cookie_password = cookie_password
 
         jwks_url = f"{client.base_url}sso/jwks/{client.client_id}"
-        self.jwks = _get_jwks_client(jwks_url)
+        self.jwks = _get_key_store(jwks_url)
 
     def authenticate(
         self,
@@ -260,7 +360,16 @@ class Session:
         AuthenticateWithSessionCookieSuccessResponse,
         AuthenticateWithSessionCookieErrorResponse,
     ]:
-        """Validate the sealed session cookie and return the session claims."""
+        """Validate the sealed session cookie and return the session claims.
+
+        With a client ``session_cache``, a cookie that was verified before
+        and whose access token has not expired is answered from the cache.
+        """
+        cached = _cached_authentication(
+            self._client, self.session_data, self.cookie_password
+        )
+        if cached is not None:
+            return cached
         if not self.session_data:
             return AuthenticateWithSessionCookieErrorResponse(
                 authenticated=False,
@@ -296,7 +405,7 @@ class Session:
                 reason=AuthenticateWithSessionCookieFailureReason.INVALID_JWT,
             )
 
-        return AuthenticateWithSessionCookieSuccessResponse(
+        response = AuthenticateWithSessionCookieSuccessResponse(
             authenticated=True,
             session_id=decoded["sid"],
             organization_id=decoded.get("org_id"),
@@ -308,17 +417,25 @@ class Session:
             impersonator=session.get("impersonator"),
             feature_flags=decoded.get("feature_flags"),
         )
+        return _remember_authentication(
+            self._client, self.session_data, self.cookie_password, decoded, response
+        )
 
     def refresh(
         self,
         *,
         organization_id: Optional[str] = None,
-        cookie_password: Optional[str] = None,
+        cookie_password: Optional[CookiePassword] = None,
     ) -> Union[
         RefreshWithSessionCookieSuccessResponse,
         RefreshWithSessionCookieErrorResponse,
     ]:
-        """Refresh the session using the stored refresh token."""
+        """Refresh the session using the stored refresh token.
+
+        The new session is sealed with the newest cookie password. With a
+        client ``refresh_coordinator``, concurrent refreshes of the same
+        refresh token send one request and all receive its sealed session.
+        """
         effective_cookie_password = cookie_password or self.cookie_password
 
         try:
@@ -335,12 +452,45 @@ class Session:
                 reason=AuthenticateWithSessionCookieFailureReason.INVALID_SESSION_COOKIE,
             )
 
+        refresh_token = session["refresh_token"]
+        coordinator = self._client.refresh_coordinator
+        if coordinator is None:
+            result = self._request_refresh(
+                refresh_token, organization_id, effective_cookie_password
+            )
+        else:
+            result = coordinator.run(
+                coordinator.key(
+                    refresh_token,
+                    organization_id,
+                    cookie_password=effective_cookie_password,
+                ),
+                lambda: self._request_refresh(
+                    refresh_token, organization_id, effective_cookie_password
+                ),
+                encode=_encode_refresh,
+                decode=_decode_refresh,
+            )
+        if isinstance(result, RefreshWithSessionCookieSuccessResponse):
+            self.session_data = result.sealed_session
+            self.cookie_password = effective_cookie_password
+        return result
+
+    def _request_refresh(
+        self,
+        refresh_token: str,
+        organization_id: Optional[str],
+        effective_cookie_password: CookiePassword,
+    ) -> Union[
+        RefreshWithSessionCookieSuccessResponse,
+        RefreshWithSessionCookieErrorResponse,
+    ]:
         try:
             body: Dict[str, Any] = {
                 "grant_type": "refresh_token",
                 "client_id": self._client.client_id,
                 "client_secret": self._client._api_key,
-                "refresh_token": session["refresh_token"],
+                "refresh_token": refresh_token,
             }
             if organization_id is not None:
                 body["organization_id"] = organization_id
@@ -352,8 +502,8 @@ class Session:
             )
 
             access_token = auth_response.get("access_token")
-            refresh_token = auth_response.get("refresh_token")
-            if not access_token or not refresh_token:
+            new_refresh_token = auth_response.get("refresh_token")
+            if not access_token or not new_refresh_token:
                 return RefreshWithSessionCookieErrorResponse(
                     authenticated=False,
                     reason=AuthenticateWithSessionCookieFailureReason.REFRESH_DENIED,
@@ -389,15 +539,12 @@ class Session:
 
             new_sealed = seal_session_from_auth_response(
                 access_token=access_token,
-                refresh_token=refresh_token,
+                refresh_token=new_refresh_token,
                 user=user,
                 impersonator=impersonator,
                 cookie_password=effective_cookie_password,
             )
 
-            self.session_data = new_sealed
-            self.cookie_password = effective_cookie_password
-
             return RefreshWithSessionCookieSuccessResponse(
                 authenticated=True,
                 sealed_session=new_sealed,
@@ -446,7 +593,7 @@ class AsyncSession:
         *,
         client: "AsyncWorkOSClient",
         session_data: str,
-        cookie_password: str,
+        cookie_password: CookiePassword,
     ) -> None:
         if not cookie_password:
             raise ValueError("cookie_password is required")
@@ -456,7 +603,19 @@ class AsyncSession:
         self.cookie_password = cookie_password
 
         jwks_url = f"{client.base_url}sso/jwks/{client.client_id}"
-        self.jwks = _get_jwks_client(jwks_url)
+        self.jwks = _get_key_store(jwks_url)
+        self._async_jwks: Optional[AsyncJWKSKeyStore] = None
+
+    @property
+    def async_jwks(self) -> AsyncJWKSKeyStore:
+        """The client's :class:`AsyncJWKSKeyStore`, used by the async methods."""
+        if self._async_jwks is None:
+            self._async_jwks = self._client.jwks
+        return self._async_jwks
+
+    @async_jwks.setter
+    def async_jwks(self, store: AsyncJWKSKeyStore) -> None:
+        self._async_jwks = store
 
     def authenticate(
         self,
@@ -466,9 +625,62 @@ class AsyncSession:
     ]:
         """Validate the sealed session cookie and return the session claims.
 
-        Note: This method is synchronous because it only performs local
-        operations (Fernet decryption and JWT validation using cached JWKS).
+        Note: This method is synchronous. With warm keys it only performs
+        local operations (Fernet decryption and JWT validation), but a cold
+        or rotated key set is fetched with a blocking request. Prefer
+        :meth:`aauthenticate` inside the event loop.
+        """
+        cached = _cached_authentication(
+            self._client, self.session_data, self.cookie_password
+        )
+        if cached is not None:
+            return cached
+        session = self._unseal_for_authentication()
+        if isinstance(session, AuthenticateWithSessionCookieErrorResponse):
+            return session
+        try:
+            signing_key = self.jwks.get_signing_key_from_jwt(session["access_token"])
+            return self._authenticated(session, signing_key.key)
+        except jwt.exceptions.InvalidTokenError:
+            return AuthenticateWithSessionCookieErrorResponse(
+                authenticated=False,
+                reason=AuthenticateWithSessionCookieFailureReason.INVALID_JWT,
+            )
+
+    async def aauthenticate(
+        self,
+    ) -> Union[
+        AuthenticateWithSessionCookieSuccessResponse,
+        AuthenticateWithSessionCookieErrorResponse,
+    ]:
+        """Validate the sealed session cookie without blocking the event loop.
+
+        Like :meth:`authenticate`, but signing keys come from
+        :attr:`async_jwks`, which fetches them through the client's
+        connection pool when they are missing or have rotated.
         """
+        cached = _cached_authentication(
+            self._client, self.session_data, self.cookie_password
+        )
+        if cached is not None:
+            return cached
+        session = self._unseal_for_authentication()
+        if isinstance(session, AuthenticateWithSessionCookieErrorResponse):
+            return session
+        try:
+            signing_key = await self.async_jwks.get_signing_key_from_jwt(
+                session["access_token"]
+            )
+            return self._authenticated(session, signing_key.key)
+        except jwt.exceptions.InvalidTokenError:
+            return AuthenticateWithSessionCookieErrorResponse(
+                authenticated=False,
+                reason=AuthenticateWithSessionCookieFailureReason.INVALID_JWT,
+            )
+
+    def _unseal_for_authentication(
+        self,
+    ) -> Union[Dict[str, Any], AuthenticateWithSessionCookieErrorResponse]:
         if not self.session_data:
             return AuthenticateWithSessionCookieErrorResponse(
                 authenticated=False,
@@ -488,23 +700,19 @@ class AsyncSession:
                 authenticated=False,
                 reason=AuthenticateWithSessionCookieFailureReason.INVALID_SESSION_COOKIE,
             )
-
-        try:
-            signing_key = self.jwks.get_signing_key_from_jwt(session["access_token"])
-            decoded = jwt.decode(
-                session["access_token"],
-                signing_key.key,
-                algorithms=self._JWK_ALGORITHMS,
-                options={"verify_aud": False},
-                leeway=self._client._jwt_leeway,
-            )
-        except jwt.exceptions.InvalidTokenError:
-            return AuthenticateWithSessionCookieErrorResponse(
-                authenticated=False,
-                reason=AuthenticateWithSessionCookieFailureReason.INVALID_JWT,
-            )
-
-        return AuthenticateWithSessionCookieSuccessResponse(
+        return session
+
+    def _authenticated(
+        self, session: Dict[str, Any], key: Any
+    ) -> AuthenticateWithSessionCookieSuccessResponse:
+        decoded = jwt.decode(
+            session["access_token"],
+            key,
+            algorithms=self._JWK_ALGORITHMS,
+            options={"verify_aud": False},
+            leeway=self._client._jwt_leeway,
+        )
+        response = AuthenticateWithSessionCookieSuccessResponse(
             authenticated=True,
             session_id=decoded["sid"],
             organization_id=decoded.get("org_id"),
@@ -516,17 +724,25 @@ class AsyncSession:
             impersonator=session.get("impersonator"),
             feature_flags=decoded.get("feature_flags"),
         )
+        return _remember_authentication(
+            self._client, self.session_data, self.cookie_password, decoded, response
+        )
 
     async def refresh(
         self,
         *,
         organization_id: Optional[str] = None,
-        cookie_password: Optional[str] = None,
+        cookie_password: Optional[CookiePassword] = None,
     ) -> Union[
         RefreshWithSessionCookieSuccessResponse,
         RefreshWithSessionCookieErrorResponse,
     ]:
-        """Refresh the session using the stored refresh token."""
+        """Refresh the session using the stored refresh token.
+
+        The new session is sealed with the newest cookie password. With a
+        client ``refresh_coordinator``, concurrent refreshes of the same
+        refresh token send one request and all receive its sealed session.
+        """
         effective_cookie_password = cookie_password or self.cookie_password
 
         try:
@@ -543,12 +759,45 @@ class AsyncSession:
                 reason=AuthenticateWithSessionCookieFailureReason.INVALID_SESSION_COOKIE,
             )
 
+        refresh_token = session["refresh_token"]
+        coordinator = self._client.refresh_coordinator
+        if coordinator is None:
+            result = await self._request_refresh(
+                refresh_token, organization_id, effective_cookie_password
+            )
+        else:
+            result = await coordinator.arun(
+                coordinator.key(
+                    refresh_token,
+                    organization_id,
+                    cookie_password=effective_cookie_password,
+                ),
+                lambda: self._request_refresh(
+                    refresh_token, organization_id, effective_cookie_password
+                ),
+                encode=_encode_refresh,
+                decode=_decode_refresh,
+            )
+        if isinstance(result, RefreshWithSessionCookieSuccessResponse):
+            self.session_data = result.sealed_session
+            self.cookie_password = effective_cookie_password
+        return result
+
+    async def _request_refresh(
+        self,
+        refresh_token: str,
+        organization_id: Optional[str],
+        effective_cookie_password: CookiePassword,
+    ) -> Union[
+        RefreshWithSessionCookieSuccessResponse,
+        RefreshWithSessionCookieErrorResponse,
+    ]:
         try:
             body: Dict[str, Any] = {
                 "grant_type": "refresh_token",
                 "client_id": self._client.client_id,
                 "client_secret": self._client._api_key,
-                "refresh_token": session["refresh_token"],
+                "refresh_token": refresh_token,
             }
             if organization_id is not None:
                 body["organization_id"] = organization_id
@@ -560,8 +809,8 @@ class AsyncSession:
             )
 
             access_token = auth_response.get("access_token")
-            refresh_token = auth_response.get("refresh_token")
-            if not access_token or not refresh_token:
+            new_refresh_token = auth_response.get("refresh_token")
+            if not access_token or not new_refresh_token:
                 return RefreshWithSessionCookieErrorResponse(
                     authenticated=False,
                     reason=AuthenticateWithSessionCookieFailureReason.REFRESH_DENIED,
@@ -571,7 +820,9 @@ class AsyncSession:
             impersonator = auth_response.get("impersonator")
 
             try:
-                signing_key = self.jwks.get_signing_key_from_jwt(access_token)
+                signing_key = await self.async_jwks.get_signing_key_from_jwt(
+                    access_token
+                )
                 decoded = jwt.decode(
                     access_token,
                     signing_key.key,
@@ -597,15 +848,12 @@ class AsyncSession:
 
             new_sealed = seal_session_from_auth_response(
                 access_token=access_token,
-                refresh_token=refresh_token,
+                refresh_token=new_refresh_token,
                 user=user,
                 impersonator=impersonator,
                 cookie_password=effective_cookie_password,
             )
 
-            self.session_data = new_sealed
-            self.cookie_password = effective_cookie_password
-
             return RefreshWithSessionCookieSuccessResponse(
                 authenticated=True,
                 sealed_session=new_sealed,
@@ -626,7 +874,7 @@ class AsyncSession:
 
     async def get_logout_url(self, return_to: Optional[str] = None) -> str:
         """Get the logout URL for the current session."""
-        auth_response = self.authenticate()
+        auth_response = await self.aauthenticate()
 
         if isinstance(auth_response, AuthenticateWithSessionCookieErrorResponse):
             raise ValueError(
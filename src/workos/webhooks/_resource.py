@@ -28,6 +28,9 @@ from .._types import RequestOptions, enum_value
 from .models import WebhookEndpoint
 
 # @oagen-ignore-start
+# Webhook bodies are parsed with the SDK's configured JSON codec.
+from .. import _json as json  # noqa: F811
+
 if TYPE_CHECKING:
     from workos.events.models import EventSchemaVariant
     # @oagen-ignore-end
@@ -222,7 +225,7 @@ class Webhooks:
         Raises:
             ValueError: If the signature is invalid or the event is too old.
         """
-        from workos.events.models import EventSchema
+        from workos._event_dispatch import parse_event
 
         self.verify_header(
             event_body=event_body,
@@ -231,7 +234,7 @@ class Webhooks:
             tolerance=tolerance,
         )
         body = event_body if isinstance(event_body, (str, bytes)) else str(event_body)
-        return EventSchema.from_dict(json.loads(body))
+        return parse_event(json.loads(body))
 
     def verify_header(
         self,
@@ -479,7 +482,7 @@ class AsyncWebhooks:
         Raises:
             ValueError: If the signature is invalid or the event is too old.
         """
-        from workos.events.models import EventSchema
+        from workos._event_dispatch import parse_event
 
         self.verify_header(
             event_body=event_body,
@@ -488,7 +491,7 @@ class AsyncWebhooks:
             tolerance=tolerance,
         )
         body = event_body if isinstance(event_body, (str, bytes)) else str(event_body)
-        return EventSchema.from_dict(json.loads(body))
+        return parse_event(json.loads(body))
 
     def verify_header(
         self,
@@ -6,11 +6,11 @@ from __future__ import annotations
 
 import hashlib
 import hmac
-import json
 import time
 from typing import TYPE_CHECKING, Optional, Union
 
-from workos.events.models import EventSchema
+from workos import _json
+from workos._event_dispatch import parse_event
 
 if TYPE_CHECKING:
     from workos.events.models import EventSchemaVariant
@@ -47,7 +47,7 @@ def verify_event(
         secret=secret,
         tolerance=tolerance,
     )
-    return EventSchema.from_dict(json.loads(event_body))
+    return parse_event(_json.loads(event_body))
 
 
 def verify_header(
@@ -1,10 +1,56 @@
 # @oagen-ignore-file
 
+from typing import Any
+
+import jwt as pyjwt
 import pytest
 import pytest_asyncio
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
 
 from workos import WorkOSClient, AsyncWorkOSClient
 
+# Signing key for session tests, published as ``key_1`` in JWKS.
+PRIVATE_KEY = rsa.generate_private_key(65537, 2048)
+JWKS = {
+    "keys": [
+        {
+            **RSAAlgorithm.to_jwk(PRIVATE_KEY.public_key(), as_dict=True),
+            "kid": "key_1",
+            "alg": "RS256",
+        }
+    ]
+}
+
+
+def sign_access_token(**claims: Any) -> str:
+    """Sign ``claims`` as an access token that verifies against JWKS."""
+    return pyjwt.encode(
+        claims, PRIVATE_KEY, algorithm="RS256", headers={"kid": "key_1"}
+    )
+
+
+class FakeClock:
+    """A monotonic clock that only moves when a test sets ``now``."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(clock_module, monkeypatch):
+    """A FakeClock installed as ``clock_module._now``.
+
+    Test modules define a ``clock_module`` fixture returning the module
+    whose clock they control.
+    """
+    fake = FakeClock()
+    monkeypatch.setattr(clock_module, "_now", fake.monotonic)
+    return fake
+
 
 @pytest.fixture
 def workos():
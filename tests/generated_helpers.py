@@ -12,3 +12,41 @@ def load_fixture(name: str) -> dict:
     path = os.path.join(FIXTURES_DIR, name)
     with open(path) as f:
         return json.load(f)
+
+
+def round_trip_cases() -> list:
+    """``(model class, fixture name)`` pairs from the generated round-trip tests."""
+    import ast
+    import glob
+    import importlib
+
+    cases = []
+    tests_dir = os.path.dirname(__file__)
+    for path in sorted(glob.glob(os.path.join(tests_dir, "test_*_round_trip.py"))):
+        with open(path) as f:
+            tree = ast.parse(f.read())
+        modules = {
+            alias.asname or alias.name: node.module
+            for node in tree.body
+            if isinstance(node, ast.ImportFrom) and node.module
+            for alias in node.names
+        }
+        for function in ast.walk(tree):
+            if not isinstance(function, ast.FunctionDef):
+                continue
+            fixture = model = None
+            for node in ast.walk(function):
+                if not isinstance(node, ast.Call) or not node.args:
+                    continue
+                arg = node.args[0]
+                if getattr(node.func, "id", None) == "load_fixture":
+                    fixture = getattr(arg, "value", None)
+                elif (
+                    isinstance(node.func, ast.Attribute)
+                    and node.func.attr == "from_dict"
+                ):
+                    model = model or getattr(node.func.value, "id", None)
+            if fixture and model in modules:
+                module = importlib.import_module(modules[model])
+                cases.append((getattr(module, model), fixture))
+    return cases
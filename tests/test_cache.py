@@ -0,0 +1,251 @@
+# @oagen-ignore-file
+
+"""Response cache tests: TTLs, LRU eviction, write invalidation, statistics."""
+
+import pytest
+
+from tests.generated_helpers import load_fixture
+from workos import (
+    AsyncWorkOSClient,
+    CacheBackend,
+    InMemoryLRUCache,
+    NotFoundError,
+    ResponseCache,
+    WorkOSClient,
+)
+from workos import _cache as cache_module
+
+ORGANIZATION = load_fixture("organization.json")
+PROFILE = load_fixture("profile.json")
+
+
+@pytest.fixture
+def clock_module():
+    return cache_module
+
+
+class TestInMemoryLRUCache:
+    def test_expires_entries(self, clock):
+        backend = InMemoryLRUCache()
+        backend.set("a?#ns", b"1", ttl=10)
+        assert backend.get("a?#ns") == b"1"
+        clock.now += 10
+        assert backend.get("a?#ns") is None
+
+    def test_evicts_least_recently_used(self, clock):
+        backend = InMemoryLRUCache(maxsize=2)
+        backend.set("a", b"1", ttl=60)
+        backend.set("b", b"2", ttl=60)
+        backend.get("a")
+        backend.set("c", b"3", ttl=60)
+        assert backend.get("b") is None
+        assert backend.get("a") == b"1"
+        assert backend.evictions == 1
+        assert len(backend) == 2
+
+    def test_delete_prefix(self, clock):
+        backend = InMemoryLRUCache()
+        backend.set("organizations?#ns", b"1", ttl=60)
+        backend.set("organizations?limit=5#ns", b"2", ttl=60)
+        backend.set("organizations/org_1?#ns", b"3", ttl=60)
+        assert backend.delete_prefix("organizations?") == 2
+        assert backend.get("organizations/org_1?#ns") == b"3"
+
+    def test_satisfies_backend_protocol(self):
+        assert isinstance(InMemoryLRUCache(), CacheBackend)
+
+
+class TestResponseCache:
+    def test_per_resource_ttls(self):
+        cache = ResponseCache(
+            ttl=30,
+            ttls={"organizations": 300, "authorization/organizations": 0},
+        )
+        assert cache.ttl_for("organizations/org_123") == 300
+        assert cache.ttl_for("authorization/organizations/org_123/roles") == 0
+        assert cache.ttl_for("connections/conn_123") == 30
+
+    def test_key_is_order_independent(self):
+        assert ResponseCache.key("organizations", {"a": 1, "b": 2}, "ns") == (
+            ResponseCache.key("organizations", {"b": 2, "a": 1}, "ns")
+        )
+
+    def test_invalidates_target_children_and_parent_lists(self, clock):
+        cache = ResponseCache()
+        for key in (
+            "organizations?#ns",
+            "organizations/org_1?#ns",
+            "organizations/org_1/roles?#ns",
+            "organizations/org_12?#ns",
+        ):
+            cache.store(key, "organizations", b"{}", cache.generation)
+        assert cache.invalidate("organizations/org_1") == 3
+        assert cache.backend.get("organizations/org_12?#ns") == b"{}"
+        assert cache.stats.invalidations == 3
+
+    def test_store_skipped_after_concurrent_invalidation(self, clock):
+        cache = ResponseCache()
+        _, generation = cache.lookup("organizations/org_1?#ns")
+        cache.invalidate("organizations/org_1")
+        assert not cache.store(
+            "organizations/org_1?#ns", "organizations/org_1", b"{}", generation
+        )
+
+
+class TestWorkOSClientCache:
+    def test_repeated_get_is_served_from_cache(self, httpx_mock, clock):
+        httpx_mock.add_response(json=ORGANIZATION)
+        cache = ResponseCache()
+        client = WorkOSClient(api_key="sk_test_123", response_cache=cache)
+        try:
+            first = client.organizations.get_organization("org_123")
+            second = client.organizations.get_organization("org_123")
+        finally:
+            client.close()
+        assert first.id == second.id == ORGANIZATION["id"]
+        assert first is not second
+        assert len(httpx_mock.get_requests()) == 1
+        stats = cache.stats
+        assert (stats.hits, stats.misses, stats.stores) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_entries_expire(self, httpx_mock, clock):
+        httpx_mock.add_response(json=ORGANIZATION)
+        httpx_mock.add_response(json=ORGANIZATION)
+        client = WorkOSClient(
+            api_key="sk_test_123", response_cache=ResponseCache(ttl=5)
+        )
+        try:
+            client.organizations.get_organization("org_123")
+            clock.now += 5
+            client.organizations.get_organization("org_123")
+        finally:
+            client.close()
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_list_pages_are_cached(self, httpx_mock, clock):
+        httpx_mock.add_response(
+            json={
+                "data": [ORGANIZATION],
+                "list_metadata": {"before": None, "after": None},
+            }
+        )
+        client = WorkOSClient(api_key="sk_test_123", response_cache=ResponseCache())
+        try:
+            client.organizations.list_organizations(limit=10)
+            page = client.organizations.list_organizations(limit=10)
+        finally:
+            client.close()
+        assert [org.id for org in page.data] == [ORGANIZATION["id"]]
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_writes_invalidate(self, httpx_mock, clock):
+        httpx_mock.add_response(method="GET", json=ORGANIZATION)
+        httpx_mock.add_response(method="PUT", json={**ORGANIZATION, "name": "New"})
+        httpx_mock.add_response(method="GET", json={**ORGANIZATION, "name": "New"})
+        cache = ResponseCache()
+        client = WorkOSClient(api_key="sk_test_123", response_cache=cache)
+        try:
+            client.organizations.get_organization("org_123")
+            client.organizations.update_organization("org_123", name="New")
+            organization = client.organizations.get_organization("org_123")
+        finally:
+            client.close()
+        assert organization.name == "New"
+        assert len(httpx_mock.get_requests()) == 3
+        assert cache.stats.invalidations == 1
+
+    def test_cache_request_option_bypasses_lookup(self, httpx_mock, clock):
+        httpx_mock.add_response(json=ORGANIZATION)
+        httpx_mock.add_response(json={**ORGANIZATION, "name": "Fresh"})
+        client = WorkOSClient(api_key="sk_test_123", response_cache=ResponseCache())
+        try:
+            client.organizations.get_organization("org_123")
+            fresh = client.organizations.get_organization(
+                "org_123", request_options={"cache": False}
+            )
+            cached = client.organizations.get_organization("org_123")
+        finally:
+            client.close()
+        assert fresh.name == "Fresh"
+        # The bypassing request refreshed the cached copy.
+        assert cached.name == "Fresh"
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_api_keys_do_not_share_entries(self, httpx_mock, clock):
+        httpx_mock.add_response(json=ORGANIZATION)
+        httpx_mock.add_response(json=ORGANIZATION)
+        cache = ResponseCache()
+        first = WorkOSClient(api_key="sk_test_1", response_cache=cache)
+        second = WorkOSClient(api_key="sk_test_2", response_cache=cache)
+        try:
+            first.organizations.get_organization("org_123")
+            second.organizations.get_organization("org_123")
+        finally:
+            first.close()
+            second.close()
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_requests_with_extra_headers_are_not_cached(self, httpx_mock, clock):
+        first = {**PROFILE, "id": "prof_1", "email": "first@example.com"}
+        second = {**PROFILE, "id": "prof_2", "email": "second@example.com"}
+        httpx_mock.add_response(
+            json=first, match_headers={"Authorization": "Bearer at_1"}
+        )
+        httpx_mock.add_response(
+            json=second, match_headers={"Authorization": "Bearer at_2"}
+        )
+        cache = ResponseCache()
+        client = WorkOSClient(api_key="sk_test_123", response_cache=cache)
+        try:
+            profiles = [
+                client.sso.get_profile(access_token="at_1"),
+                client.sso.get_profile(access_token="at_2"),
+            ]
+        finally:
+            client.close()
+        assert [p.id for p in profiles] == ["prof_1", "prof_2"]
+        assert cache.stats.stores == 0
+
+    def test_errors_are_not_cached(self, httpx_mock, clock):
+        httpx_mock.add_response(status_code=404, json={"message": "Not found"})
+        httpx_mock.add_response(json=ORGANIZATION)
+        cache = ResponseCache()
+        client = WorkOSClient(api_key="sk_test_123", response_cache=cache)
+        try:
+            with pytest.raises(NotFoundError):
+                client.organizations.get_organization("org_123")
+            client.organizations.get_organization("org_123")
+        finally:
+            client.close()
+        assert cache.stats.stores == 1
+
+
+@pytest.mark.asyncio
+class TestAsyncWorkOSClientCache:
+    async def test_repeated_get_is_served_from_cache(self, httpx_mock, clock):
+        httpx_mock.add_response(json=ORGANIZATION)
+        cache = ResponseCache()
+        client = AsyncWorkOSClient(api_key="sk_test_123", response_cache=cache)
+        try:
+            await client.organizations.get_organization("org_123")
+            await client.organizations.get_organization("org_123")
+        finally:
+            await client.close()
+        assert len(httpx_mock.get_requests()) == 1
+        assert cache.stats.hits == 1
+
+    async def test_writes_invalidate(self, httpx_mock, clock):
+        httpx_mock.add_response(method="GET", json=ORGANIZATION)
+        httpx_mock.add_response(method="DELETE", status_code=204)
+        httpx_mock.add_response(method="GET", status_code=404, json={})
+        client = AsyncWorkOSClient(
+            api_key="sk_test_123", response_cache=ResponseCache()
+        )
+        try:
+            await client.organizations.get_organization("org_123")
+            await client.organizations.delete_organization("org_123")
+            with pytest.raises(NotFoundError):
+                await client.organizations.get_organization("org_123")
+        finally:
+            await client.close()
@@ -0,0 +1,159 @@
+# @oagen-ignore-file
+
+"""Webhook-driven cache invalidation tests."""
+
+import pytest
+
+from tests.generated_helpers import load_fixture
+from workos import CacheInvalidator, InMemoryLRUCache, ResponseCache, WorkOSClient
+from workos import _cache as cache_module
+from workos._cache_invalidation import EVENT_INVALIDATIONS
+from workos.events.models.event_schema import EventSchema
+
+ORGANIZATION = load_fixture("organization.json")
+ORGANIZATION_UPDATED = load_fixture("organization_updated.json")
+GROUP_USER_ADDED = load_fixture("dsync_group_user_added.json")
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache_module, "_now", fake.monotonic)
+    return fake
+
+
+def _fill(cache: ResponseCache, *paths: str) -> None:
+    for path in paths:
+        cache.store(f"{path}#ns", path.partition("?")[0], b"{}", cache.generation)
+
+
+def _cached(cache: ResponseCache, path: str) -> bool:
+    return cache.backend.get(f"{path}#ns") is not None
+
+
+class TestInMemoryLRUCacheMatching:
+    def test_delete_matching_wildcard(self):
+        backend = InMemoryLRUCache()
+        for key in (
+            "organizations/org_1/feature-flags?#ns",
+            "organizations/org_2/feature-flags?limit=5#ns",
+            "organizations/org_1/groups?#ns",
+            "user_management/users/u_1/feature-flags?#ns",
+        ):
+            backend.set(key, b"1", ttl=60)
+        assert backend.delete_matching("organizations/*/feature-flags?*") == 2
+        assert backend.get("organizations/org_1/groups?#ns") == b"1"
+        assert len(backend) == 2
+
+    def test_delete_matching_treats_other_characters_literally(self):
+        backend = InMemoryLRUCache()
+        backend.set("a.b?#ns", b"1", ttl=60)
+        backend.set("axb?#ns", b"1", ttl=60)
+        assert backend.delete_matching("a.b?*") == 1
+        assert backend.get("axb?#ns") == b"1"
+
+    def test_sorted_index_survives_eviction(self):
+        backend = InMemoryLRUCache(maxsize=2)
+        backend.set("b?#ns", b"1", ttl=60)
+        backend.set("a?#ns", b"1", ttl=60)
+        backend.set("c?#ns", b"1", ttl=60)
+        assert backend.delete_prefix("b?") == 0
+        assert backend.delete_prefix("a?") == 1
+        assert len(backend) == 1
+
+
+class TestCacheInvalidator:
+    def test_every_event_type_is_mapped(self):
+        assert set(EVENT_INVALIDATIONS) == set(EventSchema._DISPATCH)
+
+    def test_typed_event_invalidates_resource_and_lists(self):
+        cache = ResponseCache()
+        org_id = ORGANIZATION_UPDATED["data"]["id"]
+        _fill(
+            cache,
+            f"organizations/{org_id}?",
+            "organizations?limit=10",
+            "organizations/org_other?",
+        )
+        invalidator = CacheInvalidator(cache)
+        removed = invalidator.handle(EventSchema.from_dict(ORGANIZATION_UPDATED))
+        assert removed == 2
+        assert _cached(cache, "organizations/org_other?")
+        assert (invalidator.events, invalidator.invalidated) == (1, 2)
+
+    def test_raw_event_with_nested_fields(self):
+        cache = ResponseCache()
+        group_id = GROUP_USER_ADDED["data"]["group"]["id"]
+        user_id = GROUP_USER_ADDED["data"]["user"]["id"]
+        _fill(cache, f"directory_groups/{group_id}?", f"directory_users/{user_id}?")
+        assert CacheInvalidator(cache).paths_for(GROUP_USER_ADDED) == [
+            f"directory_groups/{group_id}",
+            f"directory_users/{user_id}",
+        ]
+        assert CacheInvalidator(cache).handle(GROUP_USER_ADDED) == 2
+
+    def test_wildcard_rules(self):
+        cache = ResponseCache()
+        _fill(
+            cache,
+            "feature-flags/beta?",
+            "organizations/org_1/feature-flags?",
+            "user_management/users/u_1/feature-flags?limit=5",
+            "organizations/org_1?",
+        )
+        event = {"event": "flag.updated", "data": {"slug": "beta"}}
+        assert CacheInvalidator(cache).handle(event) == 3
+        # Wildcard rules do not reach parent lists.
+        assert _cached(cache, "organizations/org_1?")
+
+    def test_missing_fields_are_skipped(self):
+        invalidator = CacheInvalidator()
+        event = {"event": "user.updated", "data": {"id": "user_1"}}
+        assert invalidator.paths_for(event) == ["user_management/users/user_1"]
+
+    def test_unknown_events(self):
+        cache = ResponseCache()
+        _fill(cache, "organizations?")
+        event = {"event": "something.new", "data": {}}
+        invalidator = CacheInvalidator(cache)
+        assert invalidator.handle(event) == 0
+        assert invalidator.unmapped == 1
+        assert _cached(cache, "organizations?")
+
+        CacheInvalidator(cache, clear_on_unknown=True).handle(event)
+        assert not _cached(cache, "organizations?")
+
+    def test_custom_rules(self):
+        invalidator = CacheInvalidator(rules={"something.new": ("widgets/{id}",)})
+        event = {"event": "something.new", "data": {"id": "w_1"}}
+        assert invalidator.paths_for(event) == ["widgets/w_1"]
+
+    def test_invalidates_client_cache(self, httpx_mock):
+        httpx_mock.add_response(json=ORGANIZATION)
+        httpx_mock.add_response(json={**ORGANIZATION, "name": "Renamed"})
+        cache = ResponseCache(ttl=3600)
+        invalidator = CacheInvalidator(cache)
+        client = WorkOSClient(api_key="sk_test_123", response_cache=cache)
+        try:
+            client.organizations.get_organization(ORGANIZATION["id"])
+            invalidator.handle_many(
+                [
+                    {
+                        "event": "organization.updated",
+                        "data": {**ORGANIZATION, "name": "Renamed"},
+                    }
+                ]
+            )
+            organization = client.organizations.get_organization(ORGANIZATION["id"])
+        finally:
+            client.close()
+        assert organization.name == "Renamed"
+        assert len(httpx_mock.get_requests()) == 2
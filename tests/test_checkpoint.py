@@ -0,0 +1,189 @@
+# @oagen-ignore-file
+
+"""Resumable auto-pagination with ``checkpoint=`` and the bundled stores."""
+
+import contextlib
+import sqlite3
+from typing import Any, List, Optional
+
+import pytest
+
+from tests.test_pagination import _async_chain, _org_page, _sync_chain
+from workos import (
+    AsyncPageIterator,
+    CheckpointStore,
+    FileCheckpoint,
+    MemoryCheckpoint,
+    SQLiteCheckpoint,
+    SyncPageIterator,
+)
+
+
+class TestSyncCheckpoint:
+    def test_saves_the_next_cursor_after_each_page(self):
+        saved: List[Optional[str]] = []
+        items = [
+            i.id for i in _sync_chain(3, []).auto_paging_iter(checkpoint=saved.append)
+        ]
+        assert items == ["0.0", "0.1", "1.0", "1.1", "2.0", "2.1"]
+        assert saved == ["1", "2", None]
+
+    def test_a_partly_consumed_page_is_not_saved(self):
+        checkpoint = MemoryCheckpoint()
+        items = _sync_chain(3, []).auto_paging_iter(checkpoint=checkpoint)
+        assert [next(items).id for _ in range(3)] == ["0.0", "0.1", "1.0"]
+        assert checkpoint.cursor == "1"
+        items.close()
+        assert checkpoint.cursor == "1"
+
+    def test_resumes_after_a_failure(self):
+        checkpoint = MemoryCheckpoint()
+        seen = []
+        with pytest.raises(RuntimeError, match="page 2 failed"):
+            for item in _sync_chain(4, [], fail_at=2).auto_paging_iter(
+                checkpoint=checkpoint
+            ):
+                seen.append(item.id)
+        assert checkpoint.load() == "2"
+        fetched: List[str] = []
+        first = _sync_chain(4, fetched)._fetch_page
+        assert first is not None
+        resumed = first(after=checkpoint.load())
+        seen += [i.id for i in resumed.auto_paging_iter(checkpoint=checkpoint)]
+        assert seen == ["0.0", "0.1", "1.0", "1.1", "2.0", "2.1", "3.0", "3.1"]
+        assert fetched == ["2", "3"]
+        assert checkpoint.cursor is None
+
+    def test_prefetched_pages_are_saved_only_once_consumed(self):
+        checkpoint = MemoryCheckpoint()
+        items = _sync_chain(5, []).auto_paging_iter(prefetch=3, checkpoint=checkpoint)
+        next(items)
+        assert checkpoint.cursor is None
+        next(items)
+        next(items)
+        assert checkpoint.cursor == "1"
+        items.close()
+
+    def test_iterator_cursor_resumes_without_a_checkpoint(self):
+        items = _sync_chain(4, [], fail_at=2).auto_paging_iter()
+        assert isinstance(items, SyncPageIterator)
+        assert items.cursor is None
+        seen = []
+        with pytest.raises(RuntimeError, match="page 2 failed"):
+            for item in items:
+                seen.append(item.id)
+                if item.id == "1.0":
+                    # Page 1 is only partly consumed.
+                    assert items.cursor == "1"
+        assert items.cursor == "2"
+        fetched: List[str] = []
+        first = _sync_chain(4, fetched)._fetch_page
+        assert first is not None
+        resumed = first(after=items.cursor).auto_paging_iter()
+        seen += [i.id for i in resumed]
+        assert seen == ["0.0", "0.1", "1.0", "1.1", "2.0", "2.1", "3.0", "3.1"]
+        assert fetched == ["2", "3"]
+        assert resumed.cursor is None
+
+    def test_rejects_other_checkpoints(self):
+        checkpoint: Any = "cursor.txt"
+        with pytest.raises(TypeError):
+            next(_sync_chain(2, []).auto_paging_iter(checkpoint=checkpoint))
+
+    def test_resumes_a_list_call_from_a_file(self, workos, httpx_mock, tmp_path):
+        checkpoint = FileCheckpoint(tmp_path / "organizations.cursor")
+        httpx_mock.add_response(json=_org_page(["org_1"], after="org_1"))
+        httpx_mock.add_exception(ConnectionError("reset"))
+        with pytest.raises(Exception):
+            for _ in workos.organizations.list_organizations(
+                after=checkpoint.load()
+            ).auto_paging_iter(checkpoint=checkpoint):
+                pass
+        assert checkpoint.load() == "org_1"
+
+        httpx_mock.add_response(json=_org_page(["org_2"]))
+        page = workos.organizations.list_organizations(after=checkpoint.load())
+        ids = [o.id for o in page.auto_paging_iter(checkpoint=checkpoint)]
+        assert ids == ["org_2"]
+        assert httpx_mock.get_requests()[-1].url.params["after"] == "org_1"
+        assert checkpoint.load() is None
+
+
+@pytest.mark.asyncio
+async def test_async_checkpoint():
+    checkpoint = MemoryCheckpoint()
+    items = [
+        i.id async for i in _async_chain(3, []).auto_paging_iter(checkpoint=checkpoint)
+    ]
+    assert items == ["0.0", "0.1", "1.0", "1.1", "2.0", "2.1"]
+    assert checkpoint.cursor is None
+
+    saved: List[Optional[str]] = []
+    async for _ in _async_chain(3, []).auto_paging_iter(
+        prefetch=2, checkpoint=saved.append
+    ):
+        pass
+    assert saved == ["1", "2", None]
+
+    items = _async_chain(3, []).auto_paging_iter(prefetch=1)
+    assert isinstance(items, AsyncPageIterator)
+    async with contextlib.aclosing(items):
+        assert [(await anext(items)).id for _ in range(3)] == ["0.0", "0.1", "1.0"]
+        assert items.cursor == "1"
+
+
+class TestFileCheckpoint:
+    def test_round_trip(self, tmp_path):
+        checkpoint = FileCheckpoint(tmp_path / "crawl.cursor")
+        assert checkpoint.load() is None
+        checkpoint.save("cursor_1")
+        checkpoint.save("cursor_2")
+        assert FileCheckpoint(tmp_path / "crawl.cursor").load() == "cursor_2"
+        checkpoint.save(None)
+        assert checkpoint.load() is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_failed_write_keeps_the_previous_cursor(self, tmp_path, monkeypatch):
+        checkpoint = FileCheckpoint(tmp_path / "crawl.cursor")
+        checkpoint.save("cursor_1")
+
+        def fail(*args):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("os.replace", fail)
+        with pytest.raises(OSError):
+            checkpoint.save("cursor_2")
+        assert checkpoint.load() == "cursor_1"
+        assert [p.name for p in tmp_path.iterdir()] == ["crawl.cursor"]
+
+
+class TestSQLiteCheckpoint:
+    def test_keys_are_independent(self, tmp_path):
+        path = tmp_path / "crawl.db"
+        users = SQLiteCheckpoint(path, key="users")
+        events = SQLiteCheckpoint(path, key="events")
+        assert users.load() is None
+        users.save("user_cursor")
+        events.save("event_cursor")
+        users.save("user_cursor_2")
+        assert SQLiteCheckpoint(path, key="users").load() == "user_cursor_2"
+        assert events.load() == "event_cursor"
+        users.save(None)
+        assert users.load() is None
+        with contextlib.closing(sqlite3.connect(path)) as connection:
+            (count,) = connection.execute(
+                "SELECT COUNT(*) FROM workos_pagination_checkpoints"
+            ).fetchone()
+        assert count == 2
+
+    def test_rejects_unsafe_table_names(self, tmp_path):
+        with pytest.raises(ValueError):
+            SQLiteCheckpoint(tmp_path / "crawl.db", table="t; DROP TABLE x")
+
+    def test_stores_satisfy_the_protocol(self, tmp_path):
+        for store in (
+            MemoryCheckpoint(),
+            FileCheckpoint(tmp_path / "c"),
+            SQLiteCheckpoint(tmp_path / "c.db"),
+        ):
+            assert isinstance(store, CheckpointStore)
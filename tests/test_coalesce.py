@@ -0,0 +1,198 @@
+# @oagen-ignore-file
+
+"""Single-flight GET coalescing tests."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from workos import AsyncWorkOSClient, NotFoundError, TransportConfig, WorkOSClient
+
+
+class _GatedTransport(httpx.BaseTransport):
+    """Holds every request until ``release`` is set and counts what it sees."""
+
+    def __init__(self, status_code: int = 200) -> None:
+        self.release = threading.Event()
+        self.requests: list[httpx.Request] = []
+        self.status_code = status_code
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.release.wait(5)
+        return httpx.Response(
+            self.status_code, json={"id": "org_123", "message": "status"}
+        )
+
+
+class _AsyncGatedTransport(httpx.AsyncBaseTransport):
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.requests: list[httpx.Request] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        await self.release.wait()
+        return httpx.Response(200, json={"id": "org_123"})
+
+
+def _wait_for(predicate) -> None:
+    deadline = time.monotonic() + 5
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out waiting for callers"
+        time.sleep(0.001)
+
+
+def _run_concurrently(client: WorkOSClient, count: int, path=("organizations",)):
+    results: list = [None] * count
+
+    def call(index: int) -> None:
+        try:
+            results[index] = client.request("GET", path)
+        except Exception as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    return threads, results
+
+
+class TestWorkOSClientCoalescing:
+    def test_concurrent_identical_gets_share_one_request(self):
+        transport = _GatedTransport()
+        client = WorkOSClient(
+            api_key="sk_test_123",
+            coalesce_requests=True,
+            transport_config=TransportConfig(transport=transport),
+        )
+        coalescer = client.coalescer
+        assert coalescer is not None
+        try:
+            threads, results = _run_concurrently(client, 8)
+            _wait_for(lambda: coalescer.coalesced == 7)
+            transport.release.set()
+            for t in threads:
+                t.join()
+        finally:
+            client.close()
+        assert len(transport.requests) == 1
+        assert results == [{"id": "org_123", "message": "status"}] * 8
+        # Each caller gets its own deserialized copy.
+        assert len({id(r) for r in results}) == 8
+        assert coalescer.in_flight == 0
+
+    def test_errors_are_shared_with_waiting_callers(self):
+        transport = _GatedTransport(status_code=404)
+        client = WorkOSClient(
+            api_key="sk_test_123",
+            coalesce_requests=True,
+            transport_config=TransportConfig(transport=transport),
+        )
+        coalescer = client.coalescer
+        assert coalescer is not None
+        try:
+            threads, results = _run_concurrently(client, 3)
+            _wait_for(lambda: coalescer.coalesced == 2)
+            transport.release.set()
+            for t in threads:
+                t.join()
+        finally:
+            client.close()
+        assert len(transport.requests) == 1
+        assert all(isinstance(r, NotFoundError) for r in results)
+
+    def test_different_params_are_not_merged(self, httpx_mock):
+        httpx_mock.add_response(json={"data": []})
+        httpx_mock.add_response(json={"data": []})
+        client = WorkOSClient(api_key="sk_test_123", coalesce_requests=True)
+        try:
+            client.request("GET", ("organizations",), params={"limit": 1})
+            client.request("GET", ("organizations",), params={"limit": 2})
+        finally:
+            client.close()
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_completed_requests_are_not_reused(self, httpx_mock):
+        httpx_mock.add_response(json={"id": "org_123"})
+        httpx_mock.add_response(json={"id": "org_123"})
+        client = WorkOSClient(api_key="sk_test_123", coalesce_requests=True)
+        try:
+            client.request("GET", ("organizations", "org_123"))
+            client.request("GET", ("organizations", "org_123"))
+        finally:
+            client.close()
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_writes_are_never_coalesced(self):
+        transport = _GatedTransport()
+        transport.release.set()
+        client = WorkOSClient(
+            api_key="sk_test_123",
+            coalesce_requests=True,
+            transport_config=TransportConfig(transport=transport),
+        )
+        try:
+            client.request("POST", ("organizations",), body={"name": "Acme"})
+            client.request("POST", ("organizations",), body={"name": "Acme"})
+        finally:
+            client.close()
+        assert client.coalescer is not None
+        assert client.coalescer.leaders == 0
+        assert len(transport.requests) == 2
+
+    def test_disabled_by_default(self):
+        client = WorkOSClient(api_key="sk_test_123")
+        try:
+            assert client.coalescer is None
+        finally:
+            client.close()
+
+
+@pytest.mark.asyncio
+class TestAsyncWorkOSClientCoalescing:
+    async def test_concurrent_identical_gets_share_one_request(self):
+        transport = _AsyncGatedTransport()
+        client = AsyncWorkOSClient(
+            api_key="sk_test_123",
+            coalesce_requests=True,
+            transport_config=TransportConfig(transport=transport),
+        )
+        assert client.coalescer is not None
+        try:
+            calls = asyncio.gather(
+                *(client.request("GET", ("organizations",)) for _ in range(10))
+            )
+            while client.coalescer.coalesced < 9:
+                await asyncio.sleep(0)
+            transport.release.set()
+            results = await calls
+        finally:
+            await client.close()
+        assert len(transport.requests) == 1
+        assert results == [{"id": "org_123"}] * 10
+        assert client.coalescer.in_flight == 0
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        transport = _AsyncGatedTransport()
+        client = AsyncWorkOSClient(
+            api_key="sk_test_123",
+            coalesce_requests=True,
+            transport_config=TransportConfig(transport=transport),
+        )
+        try:
+            first = asyncio.ensure_future(client.request("GET", ("organizations",)))
+            second = asyncio.ensure_future(client.request("GET", ("organizations",)))
+            while not transport.requests:
+                await asyncio.sleep(0)
+            first.cancel()
+            transport.release.set()
+            assert await second == {"id": "org_123"}
+            with pytest.raises(asyncio.CancelledError):
+                await first
+        finally:
+            await client.close()
+        assert len(transport.requests) == 1
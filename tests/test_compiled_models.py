@@ -0,0 +1,183 @@
+# @oagen-ignore-file
+
+"""Compiled deserializers: ``compiled_loader`` against the generated ``from_dict``."""
+
+import contextlib
+import inspect
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from tests.generated_helpers import load_fixture, round_trip_cases
+from workos import WorkOSClient, WorkOSError
+from workos import _compiled
+from workos._compiled import (
+    _enum_members,
+    compiled_from_dict,
+    compiled_loader,
+    generated_loaders,
+)
+from workos.api_keys.models import ApiKey
+from workos.audit_logs.models import AuditLogExport
+from workos.common.models import AuditLogExportState, DirectoryUserWithGroupsState
+from workos.directory_sync.models import DirectoryUserWithGroups
+from workos.organizations.models import Organization
+
+ROOT = Path(__file__).resolve().parent.parent
+CASES = round_trip_cases()
+DIRECTORY_USER = load_fixture("directory_user_with_groups.json")
+
+
+def _error(model, data) -> str:
+    with pytest.raises(Exception) as info:
+        model.from_dict(data)
+    return f"{info.type.__name__}: {info.value}"
+
+
+@pytest.mark.parametrize("model, fixture", CASES, ids=[fixture for _, fixture in CASES])
+def test_compiled_matches_from_dict_on_round_trip_fixtures(model, fixture):
+    data = load_fixture(fixture)
+    eager = model.from_dict(data)
+    compiled = compiled_from_dict(model, data)
+    assert type(compiled) is type(eager)
+    assert compiled == eager
+    assert repr(compiled) == repr(eager)
+    assert compiled.to_dict() == data
+    assert compiled_from_dict(model, compiled.to_dict()) == eager
+
+
+class TestGeneratedLoaders:
+    def test_list_required_keys_and_field_loaders(self):
+        loaders = generated_loaders(DirectoryUserWithGroups)
+        assert loaders is not None
+        _, fields, required = loaders
+        assert list(fields)[:3] == ["object", "id", "directory_id"]
+        assert "id" in required and "first_name" not in required
+        state = fields["state"](DIRECTORY_USER)
+        assert state is DirectoryUserWithGroupsState(DIRECTORY_USER["state"])
+
+    def test_discriminated_unions_have_none(self):
+        assert generated_loaders(ApiKey) is None
+        assert compiled_loader(ApiKey) == ApiKey.from_dict
+
+
+def test_generated_loaders_are_up_to_date():
+    result = subprocess.run(
+        [sys.executable, "scripts/generate_model_loaders.py", "--check"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+class TestCompiledLoader:
+    def test_does_not_read_model_source(self, monkeypatch):
+        def fail(obj):
+            raise OSError("no source")
+
+        monkeypatch.setattr(inspect, "getsource", fail)
+        monkeypatch.setattr(_compiled, "_loaders", {})
+        loader = compiled_loader(DirectoryUserWithGroups)
+        assert loader != DirectoryUserWithGroups.from_dict
+        assert loader(DIRECTORY_USER) == DirectoryUserWithGroups.from_dict(
+            DIRECTORY_USER
+        )
+
+    def test_is_built_once_per_model(self):
+        loader = compiled_loader(DirectoryUserWithGroups)
+        assert loader is compiled_loader(DirectoryUserWithGroups)
+        assert loader != DirectoryUserWithGroups.from_dict
+
+    def test_optional_fields_may_be_absent(self):
+        loaders = generated_loaders(DirectoryUserWithGroups)
+        assert loaders is not None
+        data = {key: DIRECTORY_USER[key] for key in loaders[2]}
+        user = compiled_from_dict(DirectoryUserWithGroups, data)
+        assert user == DirectoryUserWithGroups.from_dict(data)
+
+    def test_enum_members_are_the_same_objects(self):
+        user = compiled_from_dict(DirectoryUserWithGroups, DIRECTORY_USER)
+        assert user.state is DirectoryUserWithGroupsState(DIRECTORY_USER["state"])
+
+    def test_unknown_enum_values_use_missing(self):
+        data = {**load_fixture("audit_log_export.json"), "state": "archived"}
+        export = compiled_from_dict(AuditLogExport, data)
+        assert export == AuditLogExport.from_dict(data)
+        assert isinstance(export.state, AuditLogExportState)
+        assert export.state.value == "archived"
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {"id": None, "created_at": "not a date"},
+            {"state": 5},
+            {"state": ["unhashable"]},
+            {"groups": [{"id": "incomplete"}]},
+            {"groups": 5},
+        ],
+    )
+    def test_errors_match_from_dict(self, change):
+        data = {**DIRECTORY_USER, **change}
+        expected = _error(DirectoryUserWithGroups, data)
+        with pytest.raises(Exception) as info:
+            compiled_from_dict(DirectoryUserWithGroups, data)
+        assert f"{info.type.__name__}: {info.value}" == expected
+
+    def test_missing_required_key(self):
+        data = {k: v for k, v in DIRECTORY_USER.items() if k != "idp_id"}
+        with pytest.raises(WorkOSError, match="DirectoryUserWithGroups"):
+            compiled_from_dict(DirectoryUserWithGroups, data)
+
+
+def test_client_uses_compiled_loaders_when_enabled(httpx_mock, monkeypatch):
+    organization = load_fixture("organization.json")
+    httpx_mock.add_response(json=organization)
+    httpx_mock.add_response(json={"data": [organization], "list_metadata": {}})
+    compiled_loader(Organization)
+
+    def fail(data):
+        raise AssertionError("from_dict should not be called")
+
+    monkeypatch.setattr(Organization, "from_dict", fail)
+    with contextlib.closing(
+        WorkOSClient(api_key="sk_test_123", compiled_models=True)
+    ) as client:
+        assert client.compiled_models
+        fetched = client.organizations.get_organization(organization["id"])
+        page = client.organizations.list_organizations()
+    assert fetched.id == page.data[0].id == organization["id"]
+
+
+def test_client_uses_from_dict_by_default(workos, httpx_mock, monkeypatch):
+    organization = load_fixture("organization.json")
+    httpx_mock.add_response(json=organization)
+    httpx_mock.add_response(json={"data": [organization], "list_metadata": {}})
+    calls = []
+    from_dict = Organization.from_dict
+
+    def record(data):
+        calls.append(data["id"])
+        return from_dict(data)
+
+    monkeypatch.setattr(Organization, "from_dict", record)
+    assert not workos.compiled_models
+    workos.organizations.get_organization(organization["id"])
+    workos.organizations.list_organizations()
+    assert calls == [organization["id"], organization["id"]]
+
+
+class TestEnumMembers:
+    def test_known_values_map_to_members(self):
+        members = _enum_members(DirectoryUserWithGroupsState)
+        assert members is _enum_members(DirectoryUserWithGroupsState)
+        for member in DirectoryUserWithGroupsState:
+            assert members[member.value] is member
+
+    def test_unknown_values_go_through_the_enum(self):
+        members = _enum_members(AuditLogExportState)
+        assert members["archived"] == AuditLogExportState("archived")
+        with pytest.raises(ValueError):
+            members[5]
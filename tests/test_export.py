@@ -0,0 +1,152 @@
+# @oagen-ignore-file
+
+"""Exporting paginated results with ``SyncPage.export`` / ``AsyncPage.export``."""
+
+import csv
+import importlib.util
+import json
+
+import pytest
+
+from tests.generated_helpers import load_fixture
+from workos import RequestOptions
+from workos._export import _CSVWriter, export_items
+from workos.directory_sync.models import DirectoryUserWithGroups
+
+USER = load_fixture("user.json")
+DIRECTORY_USER = load_fixture("directory_user_with_groups.json")
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+def _users_page(ids, after=None):
+    return {
+        "data": [{**USER, "id": user_id} for user_id in ids],
+        "list_metadata": {"after": after} if after else {},
+    }
+
+
+def _read_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+class TestSyncExport:
+    def test_jsonl_writes_every_page(self, workos, httpx_mock, tmp_path):
+        httpx_mock.add_response(json=_users_page(["user_1", "user_2"], after="c2"))
+        httpx_mock.add_response(json=_users_page(["user_3"]))
+        path = tmp_path / "users.jsonl"
+        page = workos.user_management.list_users()
+        assert page.export(path) == 3
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line["id"] for line in lines] == ["user_1", "user_2", "user_3"]
+        assert lines[0] == {**USER, "id": "user_1"}
+
+    def test_csv_flattens_nested_models(self, tmp_path):
+        user = DirectoryUserWithGroups.from_dict(DIRECTORY_USER)
+        path = tmp_path / "directory_users.csv"
+        assert export_items([user], path) == 1
+        (row,) = _read_csv(path)
+        assert row["id"] == DIRECTORY_USER["id"]
+        assert row["state"] == DIRECTORY_USER["state"]
+        assert row["created_at"] == DIRECTORY_USER["created_at"]
+        assert row["role.slug"] == DIRECTORY_USER["role"]["slug"]
+        assert json.loads(row["groups"]) == DIRECTORY_USER["groups"]
+        attributes = json.loads(row["custom_attributes"])
+        assert attributes == DIRECTORY_USER["custom_attributes"]
+
+    def test_csv_missing_values_are_empty(self, tmp_path):
+        data = {**DIRECTORY_USER, "role": None, "email": None}
+        path = tmp_path / "directory_users.csv"
+        export_items([DirectoryUserWithGroups.from_dict(data)], path)
+        (row,) = _read_csv(path)
+        assert row["role.slug"] == "" and row["email"] == ""
+
+    def test_raw_items_are_flattened_by_key(self, workos, httpx_mock, tmp_path):
+        httpx_mock.add_response(json=_users_page(["user_1"]))
+        page = workos.user_management.list_users(
+            request_options=RequestOptions(fields=("id", "metadata", "email_verified"))
+        )
+        path = tmp_path / "users.csv"
+        page.export(path)
+        (row,) = _read_csv(path)
+        assert list(row) == [
+            "id",
+            *(f"metadata.{key}" for key in USER["metadata"]),
+            "email_verified",
+        ]
+        assert row["id"] == "user_1"
+        assert row["email_verified"] == str(USER["email_verified"]).lower()
+
+    def test_keys_missing_from_the_first_batch_are_rejected(self, tmp_path):
+        items = [
+            {"id": "user_1", "metadata": {"plan": "free"}},
+            {"id": "user_2", "metadata": {"plan": "pro"}, "email": "a@b.co"},
+            {"id": "user_3", "metadata": {"plan": "pro", "seats": 5}},
+        ]
+        path = tmp_path / "users.csv"
+        export_items(items[:2], path)
+        assert list(_read_csv(path)[0]) == ["id", "metadata.plan", "email"]
+        with pytest.raises(ValueError, match="'email'"):
+            export_items(items[:2], path, batch_size=1)
+        with pytest.raises(ValueError, match="'metadata.seats'"):
+            export_items([items[0], items[2]], path, batch_size=1)
+
+    def test_items_are_written_in_batches(self, tmp_path, monkeypatch):
+        sizes = []
+        write = _CSVWriter.write
+
+        def record(self, batch):
+            sizes.append(len(batch))
+            write(self, batch)
+
+        monkeypatch.setattr(_CSVWriter, "write", record)
+        user = DirectoryUserWithGroups.from_dict(DIRECTORY_USER)
+        path = tmp_path / "directory_users.csv"
+        assert export_items((user for _ in range(5)), path, batch_size=2) == 5
+        assert sizes == [2, 2, 1]
+        assert len(_read_csv(path)) == 5
+
+    def test_empty_export(self, tmp_path):
+        path = tmp_path / "empty.jsonl"
+        assert export_items([], path) == 0
+        assert path.read_bytes() == b""
+
+    @pytest.mark.parametrize(
+        "path, format", [("users.txt", None), ("users.csv", "xlsx")]
+    )
+    def test_unknown_formats_are_rejected(self, tmp_path, path, format):
+        with pytest.raises(ValueError):
+            export_items([], tmp_path / path, format=format)
+
+    def test_batch_size_must_be_positive(self, tmp_path):
+        with pytest.raises(ValueError):
+            export_items([], tmp_path / "users.csv", batch_size=0)
+
+    @pytest.mark.skipif(HAS_PYARROW, reason="pyarrow is installed")
+    def test_parquet_without_pyarrow(self, tmp_path):
+        with pytest.raises(ImportError, match="pyarrow"):
+            export_items([], tmp_path / "users.parquet")
+
+    @pytest.mark.skipif(not HAS_PYARROW, reason="pyarrow is not installed")
+    def test_parquet(self, workos, httpx_mock, tmp_path):
+        import pyarrow.parquet as pq  # type: ignore[import-not-found]
+
+        httpx_mock.add_response(json=_users_page(["user_1", "user_2"], after="c2"))
+        httpx_mock.add_response(json=_users_page(["user_3"]))
+        path = tmp_path / "users.parquet"
+        assert workos.user_management.list_users().export(path, batch_size=2) == 3
+        table = pq.read_table(path)
+        assert table.column("id").to_pylist() == ["user_1", "user_2", "user_3"]
+        assert str(table.schema.field("created_at").type) == "timestamp[us, tz=UTC]"
+        assert pq.ParquetFile(path).num_row_groups == 2
+
+
+@pytest.mark.asyncio
+async def test_async_export(async_workos, httpx_mock, tmp_path):
+    httpx_mock.add_response(json=_users_page(["user_1"], after="c2"))
+    httpx_mock.add_response(json=_users_page(["user_2"]))
+    path = tmp_path / "users.csv"
+    page = await async_workos.user_management.list_users()
+    assert await page.export(path, format="csv") == 2
+    assert [row["id"] for row in _read_csv(path)] == ["user_1", "user_2"]
+    assert _read_csv(path)[0]["email_verified"] == str(USER["email_verified"]).lower()
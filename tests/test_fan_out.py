@@ -0,0 +1,246 @@
+# @oagen-ignore-file
+
+"""Concurrent per-scope pagination with ``client.fan_out``."""
+
+import asyncio
+import contextlib
+import threading
+import time
+from collections import Counter
+from typing import Any, AsyncIterator, Dict, List
+
+import httpx
+import pytest
+
+from tests.generated_helpers import load_fixture
+from tests.test_pagination import _org_page
+from workos import AsyncWorkOSClient, TransportConfig, WorkOSClient
+
+MEMBERSHIP = load_fixture("user_organization_membership.json")
+ORGANIZATIONS = [f"org_{i}" for i in range(5)]
+
+
+def _memberships_page(organization_id: str, after: str) -> Dict[str, Any]:
+    # Two pages of two memberships per organization.
+    index = int(after or 0)
+    return {
+        "data": [
+            {
+                **MEMBERSHIP,
+                "id": f"{organization_id}.om_{index * 2 + i}",
+                "organization_id": organization_id,
+            }
+            for i in range(2)
+        ],
+        "list_metadata": {"after": "1"} if index == 0 else {},
+    }
+
+
+def _response(request: httpx.Request) -> httpx.Response:
+    params = request.url.params
+    if request.url.path == "/organizations":
+        index = int(params.get("after") or 0)
+        ids = ORGANIZATIONS[index : index + 2]
+        after = str(index + 2) if index + 2 < len(ORGANIZATIONS) else None
+        return httpx.Response(200, json=_org_page(ids, after=after))
+    organization_id = params["organization_id"]
+    if organization_id == "org_missing":
+        return httpx.Response(404, json={"message": "Not found"})
+    return httpx.Response(
+        200, json=_memberships_page(organization_id, params.get("after", ""))
+    )
+
+
+def _expected(organizations: List[str]) -> List[str]:
+    return [f"{o}.om_{i}" for o in organizations for i in range(4)]
+
+
+def _client(handler) -> WorkOSClient:
+    return WorkOSClient(
+        api_key="sk_test_123",
+        transport_config=TransportConfig(transport=httpx.MockTransport(handler)),
+        max_retries=0,
+    )
+
+
+@contextlib.asynccontextmanager
+async def _async_client(handler) -> AsyncIterator[AsyncWorkOSClient]:
+    client = AsyncWorkOSClient(
+        api_key="sk_test_123",
+        transport_config=TransportConfig(transport=httpx.MockTransport(handler)),
+        max_retries=0,
+    )
+    try:
+        yield client
+    finally:
+        await client.close()
+
+
+def _fan_out_threads() -> List[threading.Thread]:
+    return [t for t in threading.enumerate() if t.name == "workos-fan-out"]
+
+
+class TestSyncFanOut:
+    def test_yields_every_item_of_every_scope(self):
+        with contextlib.closing(_client(_response)) as client:
+            results = list(
+                client.fan_out(
+                    ["org_0", "org_1", "org_2"],
+                    lambda organization_id: (
+                        client.organization_membership.list_organization_memberships(
+                            organization_id=organization_id
+                        )
+                    ),
+                    concurrency=2,
+                )
+            )
+        assert sorted(m.id for _, m in results) == _expected(
+            ["org_0", "org_1", "org_2"]
+        )
+        assert all(m.organization_id == scope for scope, m in results)
+        for organization_id in ("org_0", "org_1", "org_2"):
+            ids = [m.id for scope, m in results if scope == organization_id]
+            assert ids == _expected([organization_id])
+
+    def test_scopes_can_be_a_paginated_list(self):
+        with contextlib.closing(_client(_response)) as client:
+            results = client.fan_out(
+                client.organizations.list_organizations(limit=2),
+                lambda organization: (
+                    client.organization_membership.list_organization_memberships(
+                        organization_id=organization.id
+                    )
+                ),
+            )
+            scopes = Counter(organization.id for organization, _ in results)
+        assert scopes == {organization_id: 4 for organization_id in ORGANIZATIONS}
+
+    def test_concurrency_caps_requests_in_flight(self):
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return _response(request)
+
+        with contextlib.closing(_client(handler)) as client:
+            results = list(
+                client.fan_out(
+                    ORGANIZATIONS * 2,
+                    lambda organization_id: (
+                        client.organization_membership.list_organization_memberships(
+                            organization_id=organization_id
+                        )
+                    ),
+                    concurrency=3,
+                )
+            )
+        assert len(results) == 40
+        assert 1 < peak <= 3
+
+    def test_errors_are_raised_from_the_iterator(self):
+        with contextlib.closing(_client(_response)) as client:
+            with pytest.raises(Exception, match="Not found"):
+                for _ in client.fan_out(
+                    [*ORGANIZATIONS, "org_missing"],
+                    lambda organization_id: (
+                        client.organization_membership.list_organization_memberships(
+                            organization_id=organization_id
+                        )
+                    ),
+                ):
+                    pass
+        deadline = time.monotonic() + 2
+        while _fan_out_threads() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not _fan_out_threads()
+
+    def test_closing_early_stops_the_workers(self):
+        requested: List[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(str(request.url))
+            return _response(request)
+
+        with contextlib.closing(_client(handler)) as client:
+            results = client.fan_out(
+                (f"org_{i}" for i in range(1000)),
+                lambda organization_id: (
+                    client.organization_membership.list_organization_memberships(
+                        organization_id=organization_id
+                    )
+                ),
+                concurrency=2,
+            )
+            next(results)
+            results.close()
+            deadline = time.monotonic() + 2
+            while _fan_out_threads() and time.monotonic() < deadline:
+                time.sleep(0.01)
+        assert not _fan_out_threads()
+        assert len(requested) < 1000
+
+    def test_rejects_invalid_concurrency(self, workos):
+        with pytest.raises(ValueError):
+            next(workos.fan_out([], lambda scope: scope, concurrency=0))
+
+
+@pytest.mark.asyncio
+class TestAsyncFanOut:
+    async def test_runs_inner_lists_concurrently(self):
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _response(request)
+
+        async with _async_client(handler) as client:
+            organizations = await client.organizations.list_organizations(limit=1)
+            results = [
+                (organization.id, membership.id)
+                async for organization, membership in client.fan_out(
+                    organizations,
+                    lambda organization: (
+                        client.organization_membership.list_organization_memberships(
+                            organization_id=organization.id
+                        )
+                    ),
+                    concurrency=3,
+                )
+            ]
+        assert sorted(m for _, m in results) == _expected(ORGANIZATIONS)
+        assert 1 < peak <= 3
+
+    async def test_errors_cancel_the_other_tasks(self):
+        async with _async_client(_response) as client:
+            with pytest.raises(Exception, match="Not found"):
+                async with contextlib.aclosing(
+                    client.fan_out(
+                        [*ORGANIZATIONS, "org_missing"],
+                        lambda organization_id: (
+                            client.organization_membership.list_organization_memberships(
+                                organization_id=organization_id
+                            )
+                        ),
+                    )
+                ) as results:
+                    async for _ in results:
+                        pass
+        pending = [
+            t
+            for t in asyncio.all_tasks()
+            if t is not asyncio.current_task() and not t.done()
+        ]
+        assert pending == []
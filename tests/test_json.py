@@ -0,0 +1,212 @@
+# @oagen-ignore-file
+
+"""JSON codec selection and the code paths that use it."""
+
+import hashlib
+import hmac
+import json
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from tests.generated_helpers import load_fixture
+from workos import JSONCodec, WorkOSClient, get_json_codec, set_json_codec
+from workos import _json
+from workos._json import OrjsonCodec, StdlibJSONCodec
+from workos.actions import Actions
+from workos.session import seal_data, unseal_data
+from workos.webhooks._verification import verify_event
+
+FIXTURES = sorted((Path(__file__).parent / "fixtures").glob("*.json"))
+ORGANIZATION = load_fixture("organization.json")
+
+
+class RecordingCodec(StdlibJSONCodec):
+    name = "recording"
+
+    def __init__(self) -> None:
+        self.loaded = 0
+        self.dumped = 0
+
+    def loads(self, data):
+        self.loaded += 1
+        return super().loads(data)
+
+    def dumps(self, obj):
+        self.dumped += 1
+        return super().dumps(obj)
+
+
+@pytest.fixture
+def codec():
+    previous = get_json_codec()
+    recording = set_json_codec(RecordingCodec())
+    yield recording
+    set_json_codec(previous)
+
+
+class TestCodecSelection:
+    def test_auto_prefers_orjson(self):
+        pytest.importorskip("orjson")
+        previous = get_json_codec()
+        try:
+            assert set_json_codec().name == "orjson"
+            assert set_json_codec("json").name == "json"
+        finally:
+            set_json_codec(previous)
+
+    def test_auto_falls_back_to_stdlib_not_msgspec(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        assert _json._auto().name == "json"
+
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError):
+            set_json_codec("yaml")
+
+    def test_codecs_satisfy_protocol(self):
+        assert isinstance(StdlibJSONCodec(), JSONCodec)
+        assert isinstance(RecordingCodec(), JSONCodec)
+
+    def test_stdlib_matches_httpx_encoding(self):
+        body = {"name": "Zoë", "domains": ["a.com"], "n": 1.5}
+        expected = json.dumps(
+            body, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode()
+        assert StdlibJSONCodec().dumps(body) == expected
+
+    def test_orjson_output_is_byte_compatible_on_fixtures(self):
+        pytest.importorskip("orjson")
+        orjson, stdlib = OrjsonCodec(), StdlibJSONCodec()
+        for path in FIXTURES:
+            data = stdlib.loads(path.read_bytes())
+            assert orjson.dumps(data) == stdlib.dumps(data), path.name
+            assert orjson.loads(path.read_bytes()) == data
+
+
+@dataclass
+class Point:
+    x: int
+
+
+class TestOrjsonMatchesStdlib:
+    @pytest.fixture(autouse=True)
+    def _orjson(self):
+        pytest.importorskip("orjson")
+
+    @pytest.mark.parametrize(
+        "value", [float("nan"), float("inf"), {"a": [None, -float("inf")]}]
+    )
+    def test_non_finite_floats_are_rejected(self, value):
+        with pytest.raises(ValueError):
+            StdlibJSONCodec().dumps(value)
+        with pytest.raises(ValueError):
+            OrjsonCodec().dumps(value)
+
+    def test_nulls_are_still_encoded_by_orjson(self):
+        assert OrjsonCodec().dumps({"a": None, "b": 1.5}) == b'{"a":null,"b":1.5}'
+
+    @pytest.mark.parametrize("value", [2**64, -(2**63) - 1, {"n": [10**30]}])
+    def test_wide_integers_are_encoded_exactly(self, value):
+        assert OrjsonCodec().dumps(value) == StdlibJSONCodec().dumps(value)
+
+    @pytest.mark.parametrize(
+        "value",
+        [datetime(2024, 1, 1, tzinfo=timezone.utc), {"at": datetime(2024, 1, 1)}],
+    )
+    def test_datetimes_raise_type_error(self, value):
+        with pytest.raises(TypeError):
+            OrjsonCodec().dumps(value)
+
+    def test_dataclasses_raise_type_error(self):
+        with pytest.raises(TypeError):
+            OrjsonCodec().dumps(Point(1))
+
+    @pytest.mark.parametrize("document", [b"[NaN, Infinity]", b'{"a": -Infinity}'])
+    def test_documents_only_the_stdlib_accepts_are_parsed(self, document):
+        assert repr(OrjsonCodec().loads(document)) == repr(json.loads(document))
+
+    def test_invalid_documents_raise_the_stdlib_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            OrjsonCodec().loads(b"{")
+
+    def test_client_parses_responses_orjson_rejects(self, httpx_mock):
+        httpx_mock.add_response(
+            content=b'{"id": "org_123", "score": NaN}',
+            headers={"content-type": "application/json"},
+        )
+        previous = get_json_codec()
+        set_json_codec("orjson")
+        client = WorkOSClient(api_key="sk_test_123")
+        try:
+            body = client.request("GET", ("organizations", "org_123"))
+        finally:
+            client.close()
+            set_json_codec(previous)
+        assert body is not None and body["id"] == "org_123"
+
+
+class TestCodecUsage:
+    def test_client_decodes_and_encodes_with_codec(self, httpx_mock, codec):
+        httpx_mock.add_response(json=ORGANIZATION)
+        client = WorkOSClient(api_key="sk_test_123")
+        try:
+            client.organizations.create_organization(name="Zoë")
+        finally:
+            client.close()
+        request = httpx_mock.get_requests()[0]
+        assert request.content == '{"name":"Zoë"}'.encode()
+        assert request.headers["content-type"] == "application/json"
+        assert (codec.dumped, codec.loaded) == (1, 1)
+
+    def test_retries_reuse_the_encoded_body(self, httpx_mock, codec, monkeypatch):
+        from workos import _base_client
+
+        monkeypatch.setattr(_base_client.time, "sleep", lambda _: None)
+        httpx_mock.add_response(status_code=500, json={})
+        httpx_mock.add_response(json=ORGANIZATION)
+        client = WorkOSClient(api_key="sk_test_123")
+        try:
+            client.organizations.create_organization(name="Acme")
+        finally:
+            client.close()
+        first, second = httpx_mock.get_requests()
+        assert first.content == second.content
+        assert codec.dumped == 1
+
+    def test_webhooks_decode_with_codec(self, codec):
+        body = json.dumps(load_fixture("user_created.json")).encode()
+        timestamp = "1700000000000"
+        digest = hmac.new(b"secret", f"{timestamp}.".encode() + body, hashlib.sha256)
+        event = verify_event(
+            event_body=body,
+            event_signature=f"t={timestamp}, v1={digest.hexdigest()}",
+            secret="secret",
+            tolerance=10**10,
+        )
+        assert type(event).__name__ == "UserCreated"
+        assert codec.loaded == 1
+
+    def test_action_signatures_do_not_depend_on_codec(self, codec):
+        response = Actions().sign_response(
+            action_type="authentication",
+            verdict="Deny",
+            error_message="Zugriff verweigert – bitte erneut versuchen",
+            secret="secret",
+        )
+        payload = response["payload"]
+        signed = f"{payload['timestamp']}.{json.dumps(payload, separators=(',', ':'))}"
+        expected = hmac.new(b"secret", signed.encode(), hashlib.sha256).hexdigest()
+        assert response["signature"] == expected
+        assert codec.dumped == 0
+
+    def test_sealed_sessions_round_trip(self, codec):
+        key = "kGkQ2y0hy8yVG4cQk1wYQhTHcRCw8w8J8mEXg9N5Uqw="
+        sealed = seal_data({"access_token": "at", "user": {"name": "Zoë"}}, key)
+        assert unseal_data(sealed, key) == {
+            "access_token": "at",
+            "user": {"name": "Zoë"},
+        }
+        assert (codec.dumped, codec.loaded) == (1, 1)
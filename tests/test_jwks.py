@@ -0,0 +1,398 @@
+# @oagen-ignore-file
+
+"""JWKS key store: caching, background refresh, rotation and single-flight fetches."""
+
+import asyncio
+import threading
+import time
+import urllib.request
+from typing import Any, Dict, List
+
+import httpx
+import jwt as pyjwt
+import pytest
+from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt import PyJWKClientError
+from jwt.algorithms import RSAAlgorithm
+
+from workos import AsyncWorkOSClient, TransportConfig, WorkOSClient
+from workos import _jwks
+from workos._jwks import AsyncJWKSKeyStore, JWKSKeyStore, parse_jwks
+from workos.session import (
+    AsyncSession,
+    AuthenticateWithSessionCookieSuccessResponse,
+    Session,
+    seal_data,
+)
+
+KEYS = {kid: rsa.generate_private_key(65537, 2048) for kid in ("key_1", "key_2")}
+
+
+def _jwk(kid: str, **extra: Any) -> Dict[str, Any]:
+    jwk = RSAAlgorithm.to_jwk(KEYS[kid].public_key(), as_dict=True)
+    return {**jwk, "kid": kid, "alg": "RS256", **extra}
+
+
+def _token(kid: str) -> str:
+    claims = {"sid": "session_01", "exp": int(time.time()) + 3600}
+    return pyjwt.encode(claims, KEYS[kid], algorithm="RS256", headers={"kid": kid})
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(_jwks, "_now", clock)
+    return clock
+
+
+class _Endpoint:
+    """A fake JWKS endpoint that records fetches and can block or fail."""
+
+    def __init__(self, *kids: str) -> None:
+        self.kids = list(kids)
+        self.calls = 0
+        self.error: Exception | None = None
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self) -> Dict[str, Any]:
+        self.calls += 1
+        self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return {"keys": [_jwk(kid) for kid in self.kids]}
+
+
+def _wait_for(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+class TestParseJWKS:
+    def test_keeps_signing_keys_by_kid(self):
+        keys = parse_jwks(
+            {
+                "keys": [
+                    _jwk("key_1"),
+                    _jwk("key_2", use="enc"),
+                    {**_jwk("key_2"), "kid": None},
+                ]
+            }
+        )
+        assert list(keys) == ["key_1"]
+        assert isinstance(keys["key_1"].key, rsa.RSAPublicKey)
+
+    def test_rejects_sets_without_signing_keys(self):
+        with pytest.raises(PyJWKClientError):
+            parse_jwks({"keys": [_jwk("key_1", use="enc")]})
+
+
+class TestJWKSKeyStore:
+    def test_fetches_once_and_serves_parsed_keys(self, clock):
+        endpoint = _Endpoint("key_1")
+        store = JWKSKeyStore("https://example.com/jwks", fetch=endpoint)
+        for _ in range(3):
+            key = store.get_signing_key_from_jwt(_token("key_1"))
+            decoded = pyjwt.decode(_token("key_1"), key.key, algorithms=["RS256"])
+            assert decoded["sid"] == "session_01"
+        assert endpoint.calls == 1
+        stats = store.stats()
+        assert (stats.hits, stats.misses, stats.fetches, stats.keys) == (2, 1, 1, 1)
+
+    def test_refreshes_in_the_background_before_expiry(self, clock):
+        endpoint = _Endpoint("key_1")
+        store = JWKSKeyStore(
+            "https://example.com/jwks", fetch=endpoint, refresh_interval=60, max_age=600
+        )
+        store.refresh()
+        endpoint.release.clear()
+        endpoint.kids = ["key_1", "key_2"]
+        clock.now += 61
+        # The cached key is returned while the refresh waits on the network.
+        assert store.get_signing_key("key_1").key_id == "key_1"
+        _wait_for(lambda: endpoint.calls == 2)
+        assert store.get_signing_key("key_1").key_id == "key_1"
+        endpoint.release.set()
+        _wait_for(lambda: store.stats().background_refreshes == 1)
+        assert store.get_signing_key("key_2").key_id == "key_2"
+        assert endpoint.calls == 2
+
+    def test_failed_background_refresh_keeps_the_keys(self, clock):
+        endpoint = _Endpoint("key_1")
+        store = JWKSKeyStore(
+            "https://example.com/jwks", fetch=endpoint, refresh_interval=60, max_age=600
+        )
+        store.refresh()
+        endpoint.error = OSError("unreachable")
+        clock.now += 61
+        assert store.get_signing_key("key_1").key_id == "key_1"
+        _wait_for(lambda: store.stats().fetch_errors == 1)
+        assert store.get_signing_key("key_1").key_id == "key_1"
+        assert endpoint.calls == 2
+
+    def test_unknown_kid_refetches_at_most_once_per_interval(self, clock):
+        endpoint = _Endpoint("key_1")
+        store = JWKSKeyStore(
+            "https://example.com/jwks", fetch=endpoint, min_fetch_interval=10
+        )
+        store.refresh()
+        clock.now += 11
+        endpoint.kids = ["key_1", "key_2"]
+        assert store.get_signing_key("key_2").key_id == "key_2"
+        assert endpoint.calls == 2
+        with pytest.raises(PyJWKClientError, match="made_up"):
+            store.get_signing_key("made_up")
+        with pytest.raises(PyJWKClientError, match="made_up"):
+            store.get_signing_key("made_up")
+        assert endpoint.calls == 2
+        assert store.stats().misses == 3
+
+    def test_expired_keys_are_refetched(self, clock):
+        endpoint = _Endpoint("key_1")
+        store = JWKSKeyStore(
+            "https://example.com/jwks", fetch=endpoint, refresh_interval=60, max_age=600
+        )
+        store.refresh()
+        clock.now += 601
+        endpoint.error = OSError("unreachable")
+        with pytest.raises(PyJWKClientError, match="unreachable"):
+            store.get_signing_key("key_1")
+        assert store.stats().fetch_errors == 1
+
+    def test_concurrent_cold_lookups_share_one_fetch(self):
+        endpoint = _Endpoint("key_1")
+        endpoint.release.clear()
+        store = JWKSKeyStore("https://example.com/jwks", fetch=endpoint)
+        found: List[str] = []
+
+        def lookup() -> None:
+            found.append(store.get_signing_key("key_1").key_id or "")
+
+        threads = [threading.Thread(target=lookup) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        _wait_for(lambda: endpoint.calls == 1)
+        time.sleep(0.02)
+        endpoint.release.set()
+        for thread in threads:
+            thread.join()
+        assert found == ["key_1"] * 8
+        assert endpoint.calls == 1
+
+    def test_rejects_inconsistent_intervals(self):
+        with pytest.raises(ValueError):
+            JWKSKeyStore("https://example.com/jwks", refresh_interval=60, max_age=30)
+
+    def test_default_fetch_uses_http(self, httpx_mock):
+        httpx_mock.add_response(
+            url="https://example.com/jwks", json={"keys": [_jwk("key_1")]}
+        )
+        store = JWKSKeyStore("https://example.com/jwks")
+        assert store.get_signing_key("key_1").key_id == "key_1"
+
+
+def test_sessions_share_one_store_per_jwks_url(httpx_mock):
+    client = WorkOSClient(api_key="sk_test_123", client_id="client_jwks_store")
+    httpx_mock.add_response(
+        url=f"{client.base_url}sso/jwks/client_jwks_store",
+        json={"keys": [_jwk("key_1")]},
+    )
+    password = Fernet.generate_key().decode()
+    sealed = seal_data({"access_token": _token("key_1")}, password)
+    try:
+        sessions = [
+            Session(client=client, session_data=sealed, cookie_password=password)
+            for _ in range(3)
+        ]
+        for session in sessions:
+            result = session.authenticate()
+            assert isinstance(result, AuthenticateWithSessionCookieSuccessResponse)
+        assert sessions[0].jwks is sessions[2].jwks
+        assert isinstance(sessions[0].jwks, JWKSKeyStore)
+        assert sessions[0].jwks.stats().fetches == 1
+        assert len(httpx_mock.get_requests()) == 1
+    finally:
+        client.close()
+
+
+class _AsyncEndpoint:
+    """An async fake JWKS endpoint whose responses can be held back."""
+
+    def __init__(self, *kids: str) -> None:
+        self.kids = list(kids)
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self) -> Dict[str, Any]:
+        self.calls += 1
+        await self.release.wait()
+        return {"keys": [_jwk(kid) for kid in self.kids]}
+
+
+def _async_client(handler) -> AsyncWorkOSClient:
+    return AsyncWorkOSClient(
+        api_key="sk_test_123",
+        client_id="client_async_jwks",
+        transport_config=TransportConfig(transport=httpx.MockTransport(handler)),
+    )
+
+
+def _jwks_handler(requests: List[httpx.Request], delay: float = 0.0):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(delay)
+        return httpx.Response(200, json={"keys": [_jwk("key_1")]})
+
+    return handler
+
+
+@pytest.mark.asyncio
+class TestAsyncJWKSKeyStore:
+    async def test_concurrent_lookups_share_one_fetch(self):
+        endpoint = _AsyncEndpoint("key_1")
+        endpoint.release.clear()
+        store = AsyncJWKSKeyStore("https://example.com/jwks", fetch=endpoint)
+        lookups = [
+            asyncio.ensure_future(store.get_signing_key("key_1")) for _ in range(5)
+        ]
+        await asyncio.sleep(0.01)
+        # A waiter that gives up does not cancel the fetch the others await.
+        lookups[0].cancel()
+        endpoint.release.set()
+        keys = await asyncio.gather(*lookups[1:])
+        assert [key.key_id for key in keys] == ["key_1"] * 4
+        assert endpoint.calls == 1
+        assert store.stats().misses == 5
+
+    async def test_refreshes_in_a_background_task(self, clock):
+        endpoint = _AsyncEndpoint("key_1")
+        store = AsyncJWKSKeyStore(
+            "https://example.com/jwks", fetch=endpoint, refresh_interval=60, max_age=600
+        )
+        await store.refresh()
+        endpoint.release.clear()
+        endpoint.kids = ["key_1", "key_2"]
+        clock.now += 61
+        assert (await store.get_signing_key("key_1")).key_id == "key_1"
+        while endpoint.calls < 2:
+            await asyncio.sleep(0)
+        assert (await store.get_signing_key("key_1")).key_id == "key_1"
+        endpoint.release.set()
+        while store.stats().background_refreshes == 0:
+            await asyncio.sleep(0.001)
+        assert (await store.get_signing_key("key_2")).key_id == "key_2"
+        assert endpoint.calls == 2
+
+    async def test_unknown_kid_refetches_at_most_once_per_interval(self, clock):
+        endpoint = _AsyncEndpoint("key_1")
+        store = AsyncJWKSKeyStore(
+            "https://example.com/jwks", fetch=endpoint, min_fetch_interval=10
+        )
+        await store.refresh()
+        with pytest.raises(PyJWKClientError, match="made_up"):
+            await store.get_signing_key("made_up")
+        assert endpoint.calls == 1
+        clock.now += 11
+        endpoint.kids = ["key_2"]
+        assert (await store.get_signing_key("key_2")).key_id == "key_2"
+        assert endpoint.calls == 2
+
+
+@pytest.mark.asyncio
+class TestAsyncSessionKeys:
+    async def test_aauthenticate_never_blocks_the_event_loop(self, monkeypatch):
+        def blocking(*args, **kwargs):
+            raise AssertionError("blocking HTTP request in the event loop")
+
+        monkeypatch.setattr(httpx.Client, "send", blocking)
+        monkeypatch.setattr(urllib.request, "urlopen", blocking)
+        requests: List[httpx.Request] = []
+        client = _async_client(_jwks_handler(requests, delay=0.2))
+        password = Fernet.generate_key().decode()
+        sealed = seal_data({"access_token": _token("key_1")}, password)
+        gaps: List[float] = []
+        done = asyncio.Event()
+
+        async def heartbeat() -> None:
+            last = time.perf_counter()
+            while not done.is_set():
+                await asyncio.sleep(0.005)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+
+        beating = asyncio.ensure_future(heartbeat())
+        try:
+            sessions = [
+                AsyncSession(
+                    client=client, session_data=sealed, cookie_password=password
+                )
+                for _ in range(20)
+            ]
+            results = await asyncio.gather(*(s.aauthenticate() for s in sessions))
+        finally:
+            done.set()
+            await beating
+            await client.close()
+        assert all(
+            isinstance(r, AuthenticateWithSessionCookieSuccessResponse) for r in results
+        )
+        assert len(requests) == 1
+        assert requests[0].url.path == "/sso/jwks/client_async_jwks"
+        # The 200 ms fetch never stalls the loop for more than a few ticks.
+        assert len(gaps) > 10
+        assert max(gaps) < 0.1
+
+    async def test_prewarm_at_startup(self):
+        requests: List[httpx.Request] = []
+        client = AsyncWorkOSClient(
+            api_key="sk_test_123",
+            client_id="client_async_jwks",
+            transport_config=TransportConfig(
+                transport=httpx.MockTransport(_jwks_handler(requests))
+            ),
+            prewarm_jwks=True,
+        )
+        try:
+            while client.jwks.stats().fetches == 0:
+                await asyncio.sleep(0.001)
+            password = Fernet.generate_key().decode()
+            session = AsyncSession(
+                client=client,
+                session_data=seal_data({"access_token": _token("key_1")}, password),
+                cookie_password=password,
+            )
+            result = await session.aauthenticate()
+            assert isinstance(result, AuthenticateWithSessionCookieSuccessResponse)
+            assert client.jwks.stats().misses == 0
+            assert len(requests) == 1
+        finally:
+            await client.close()
+
+    async def test_prewarm_failures_are_not_raised(self):
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(503)
+
+        client = AsyncWorkOSClient(
+            api_key="sk_test_123",
+            client_id="client_async_jwks",
+            transport_config=TransportConfig(transport=httpx.MockTransport(handler)),
+            prewarm_jwks=True,
+        )
+        try:
+            while client.jwks.stats().fetch_errors == 0:
+                await asyncio.sleep(0.001)
+        finally:
+            await client.close()
@@ -0,0 +1,263 @@
+# @oagen-ignore-file
+
+"""Service modules and shared models are imported on first use."""
+
+import ast
+import functools
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+import workos
+import workos.common
+import workos.common.models
+from workos import WorkOSError, _event_dispatch, _lazy_client, _lazy_models
+from tests.generated_helpers import load_fixture
+from workos.events.models import EventSchema, EventSchemaUnknown
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _run(code: str) -> str:
+    """Run ``code`` in a fresh interpreter, where nothing has been imported yet."""
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+class TestLazyImports:
+    def test_import_workos_loads_no_services_or_models(self):
+        loaded = _run(
+            """
+            import sys
+            import workos
+            print(sorted(m for m in sys.modules if m.startswith("workos.")))
+            """
+        )
+        assert "workos._client" not in loaded
+        assert "_resource" not in loaded
+        assert "workos.common.models." not in loaded
+        assert "workos.events" not in loaded
+
+    def test_import_workos_skips_opt_in_features(self):
+        loaded = _run(
+            """
+            import sys
+            import workos
+            print(sorted(sys.modules))
+            """
+        )
+        for module in (
+            "sqlite3",
+            "workos._checkpoint",
+            "workos._cache",
+            "workos._cache_invalidation",
+            "workos._refresh",
+            "workos._session_cache",
+            "workos._lazy",
+            "workos._compiled",
+        ):
+            assert f"'{module}'" not in loaded
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "session",
+            "user_management",
+            "webhooks",
+            "sso",
+            "pkce",
+            "passwordless",
+            "common",
+            "organizations",
+        ],
+    )
+    def test_submodules_resolve_as_attributes(self, name):
+        loaded = _run(
+            f"""
+            import workos
+            print(workos.{name}.__name__)
+            """
+        )
+        assert loaded == f"workos.{name}"
+        assert name in dir(workos)
+
+    def test_accessor_loads_only_its_service(self):
+        loaded = _run(
+            """
+            import sys
+            import workos
+            client = workos.WorkOSClient(api_key="sk_test_123")
+            client.organizations
+            print(sorted(m for m in sys.modules if m.endswith("._resource")))
+            """
+        )
+        assert loaded == "['workos.organizations._resource']"
+
+    def test_importing_one_model_does_not_load_the_rest(self):
+        count = _run(
+            """
+            import sys
+            from workos.common.models import User
+            print(len([m for m in sys.modules if m.startswith("workos.common.models.")]))
+            """
+        )
+        assert count == "1"
+
+    @pytest.mark.parametrize("package", [workos, workos.common, workos.common.models])
+    def test_every_exported_name_resolves(self, package):
+        for name in package.__all__:
+            getattr(package, name)
+        assert set(package.__all__) <= set(dir(package))
+
+    def test_unknown_name_raises_attribute_error(self):
+        with pytest.raises(AttributeError):
+            getattr(workos.common.models, "NoSuchModel")
+
+
+def _defined_names(source: Path) -> List[str]:
+    """Names ``from module import *`` takes from a generated model module."""
+    names: List[str] = []
+    for node in ast.parse(source.read_text()).body:
+        if isinstance(node, ast.ClassDef):
+            names.append(node.name)
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            names.append(node.target.id)
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name) and target.id == "__all__":
+                    return list(ast.literal_eval(node.value))
+                if isinstance(target, ast.Name):
+                    names.append(target.id)
+    return [name for name in names if not name.startswith("_")]
+
+
+def _barrel_exports(package: Path) -> Dict[str, str]:
+    """Map each name a generated barrel imports to the module it comes from."""
+    exports: Dict[str, str] = {}
+    for node in ast.parse((package / "__init__.py").read_text()).body:
+        if not isinstance(node, ast.ImportFrom) or node.module is None:
+            continue
+        for alias in node.names:
+            if alias.name == "*" and (package / node.module).is_dir():
+                exports.update(_barrel_exports(package / node.module))
+            elif alias.name == "*":
+                for name in _defined_names(package / f"{node.module}.py"):
+                    exports[name] = node.module
+            else:
+                exports[alias.asname or alias.name] = node.module
+    return exports
+
+
+class TestLazyLayerMatchesGeneratedCode:
+    """The hand-written lazy modules must keep up with regenerated code."""
+
+    def test_lazy_models_export_the_generated_barrel(self):
+        package = Path(_lazy_models.__file__).parent / "common" / "models"
+        assert _lazy_models._MODELS == _barrel_exports(package)
+
+    def test_lazy_common_exports_the_generated_barrel(self):
+        package = Path(_lazy_models.__file__).parent / "common"
+        assert _barrel_exports(package).keys() == _lazy_models._MODELS.keys()
+
+    @pytest.mark.parametrize(
+        "lazy, generated",
+        [
+            (workos.WorkOSClient, "WorkOSClient"),
+            (workos.AsyncWorkOSClient, "AsyncWorkOSClient"),
+        ],
+    )
+    def test_lazy_clients_have_the_generated_accessors(self, lazy, generated):
+        from workos import _client
+
+        generated_class = getattr(_client, generated)
+        accessors = {
+            name
+            for name, value in vars(generated_class).items()
+            if isinstance(value, functools.cached_property)
+        }
+        assert accessors == {
+            name
+            for name, value in vars(lazy).items()
+            if isinstance(value, (_lazy_client._Service, _lazy_client._Alias))
+        }
+        lazy_client = lazy(api_key="sk_test_123")
+        generated_client = generated_class(api_key="sk_test_123")
+        for name in accessors:
+            assert type(getattr(lazy_client, name)) is type(
+                getattr(generated_client, name)
+            )
+        assert lazy_client.mfa is lazy_client.multi_factor_auth
+
+
+class TestLazyEventDispatch:
+    def test_verifying_a_webhook_loads_only_its_models(self):
+        loaded = _run(
+            """
+            import hashlib, hmac, sys, time
+            from workos.webhooks._verification import verify_event
+            with open(FIXTURE, "rb") as f:
+                body = f.read()
+            timestamp = str(int(time.time() * 1000))
+            digest = hmac.new(b"secret", timestamp.encode() + b"." + body, hashlib.sha256)
+            event = verify_event(
+                event_body=body,
+                event_signature=f"t={timestamp}, v1={digest.hexdigest()}",
+                secret="secret",
+            )
+            print(type(event).__name__)
+            print(sorted(m for m in sys.modules if m.startswith("workos.")))
+            """.replace("FIXTURE", repr(str(FIXTURES / "user_created.json")))
+        )
+        name, modules = loaded.splitlines()
+        assert name == "UserCreated"
+        assert "workos.common.models.user_created" in modules
+        assert "workos.common.models.organization_created" not in modules
+        assert "workos.events" not in modules
+
+    def test_registry_matches_the_generated_dispatch(self):
+        resolved = {
+            event: _event_dispatch.variant(event) for event in _event_dispatch._EVENTS
+        }
+        assert resolved == EventSchema._DISPATCH
+
+    def test_registry_covers_every_generated_event_model(self):
+        events = {}
+        for path in sorted(
+            (Path(_event_dispatch.__file__).parent / "common" / "models").glob("*.py")
+        ):
+            for node in ast.parse(path.read_text()).body:
+                if not isinstance(node, ast.ClassDef):
+                    continue
+                for statement in node.body:
+                    if (
+                        isinstance(statement, ast.AnnAssign)
+                        and isinstance(statement.target, ast.Name)
+                        and statement.target.id == "event"
+                        and isinstance(statement.annotation, ast.Subscript)
+                        and ast.unparse(statement.annotation.value) == "Literal"
+                    ):
+                        event = ast.literal_eval(statement.annotation.slice)
+                        events[event] = (path.stem, node.name)
+        assert events == _event_dispatch._EVENTS
+
+    def test_unknown_events_use_the_generated_schema(self):
+        assert _event_dispatch.variant("something.new") is None
+        event = _event_dispatch.parse_event({"event": "something.new", "data": {}})
+        assert isinstance(event, EventSchemaUnknown)
+        with pytest.raises(WorkOSError):
+            _event_dispatch.parse_event({"data": {}})
+
+    def test_parse_event_dispatches(self):
+        data = load_fixture("user_updated.json")
+        event = _event_dispatch.parse_event(data)
+        assert type(event).__name__ == "UserUpdated"
+        assert event == EventSchema.from_dict(data)
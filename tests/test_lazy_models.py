@@ -0,0 +1,136 @@
+# @oagen-ignore-file
+
+"""Lazy model deserialization: ``lazy_from_dict`` and the ``lazy_models`` option."""
+
+import copy
+import dataclasses
+import pickle
+
+import pytest
+
+from tests.generated_helpers import load_fixture, round_trip_cases
+from workos import RequestOptions, WorkOSClient, WorkOSError, _lazy, lazy_from_dict
+from workos.api_keys.models import ApiKey
+from workos.directory_sync.models import DirectoryUserWithGroups
+from workos.directory_sync.models import directory_user_with_groups
+from workos.events.models import EventSchema, EventSchemaUnknown
+from workos.organizations.models import Organization
+
+CASES = round_trip_cases()
+DIRECTORY_USER = load_fixture("directory_user_with_groups.json")
+ORGANIZATION = load_fixture("organization.json")
+
+
+@pytest.mark.parametrize("model, fixture", CASES, ids=[fixture for _, fixture in CASES])
+def test_lazy_matches_eager_on_round_trip_fixtures(model, fixture):
+    data = load_fixture(fixture)
+    eager = model.from_dict(data)
+    lazy = lazy_from_dict(model, data)
+    assert isinstance(lazy, type(eager))
+    assert lazy.to_dict() == eager.to_dict()
+    assert lazy == eager and eager == lazy
+    assert repr(lazy) == repr(eager)
+
+
+class TestLazyModel:
+    def test_fields_are_converted_on_first_access_only(self, monkeypatch):
+        calls = []
+        parse = directory_user_with_groups._parse_datetime
+        monkeypatch.setattr(
+            directory_user_with_groups,
+            "_parse_datetime",
+            lambda value: calls.append(value) or parse(value),
+        )
+        monkeypatch.setattr(_lazy, "_loaders", {})
+        user = lazy_from_dict(DirectoryUserWithGroups, DIRECTORY_USER)
+        assert user.id == DIRECTORY_USER["id"]
+        assert calls == []
+        created_at = user.created_at
+        assert user.created_at is created_at
+        assert calls == [DIRECTORY_USER["created_at"]]
+
+    def test_assignment_and_replace(self):
+        user = lazy_from_dict(DirectoryUserWithGroups, DIRECTORY_USER)
+        user.email = "new@example.com"
+        assert user.email == "new@example.com"
+        renamed = dataclasses.replace(user, first_name="Ada")
+        assert renamed.first_name == "Ada"
+        assert renamed.email == "new@example.com"
+
+    def test_pickles_and_copies_as_the_eager_model(self):
+        user = lazy_from_dict(DirectoryUserWithGroups, DIRECTORY_USER)
+        for clone in (pickle.loads(pickle.dumps(user)), copy.copy(user)):
+            assert type(clone) is DirectoryUserWithGroups
+            assert clone == DirectoryUserWithGroups.from_dict(DIRECTORY_USER)
+
+    @pytest.mark.parametrize(
+        "field, value",
+        [("created_at", "not a date"), ("state", ["unhashable"]), ("groups", 5)],
+    )
+    def test_malformed_fields_raise_the_eager_error(self, field, value):
+        data = {**DIRECTORY_USER, field: value}
+        with pytest.raises(Exception) as eager:
+            DirectoryUserWithGroups.from_dict(data)
+        user = lazy_from_dict(DirectoryUserWithGroups, data)
+        with pytest.raises(eager.type) as lazy:
+            getattr(user, field)
+        assert str(lazy.value) == str(eager.value)
+
+    def test_malformed_fields_are_converted_once(self, monkeypatch):
+        calls = []
+
+        def parse(value):
+            calls.append(value)
+            raise ValueError("bad date")
+
+        monkeypatch.setattr(directory_user_with_groups, "_parse_datetime", parse)
+        monkeypatch.setattr(_lazy, "_loaders", {})
+        user = lazy_from_dict(DirectoryUserWithGroups, DIRECTORY_USER)
+        with pytest.raises(WorkOSError, match="bad date"):
+            user.created_at
+        assert calls == [DIRECTORY_USER["created_at"]]
+
+    def test_missing_required_field_raises_up_front(self):
+        data = {k: v for k, v in DIRECTORY_USER.items() if k != "directory_id"}
+        with pytest.raises(WorkOSError, match="DirectoryUserWithGroups"):
+            lazy_from_dict(DirectoryUserWithGroups, data)
+
+    def test_events_dispatch_to_lazy_variants(self):
+        data = load_fixture("user_created.json")
+        event = lazy_from_dict(EventSchema, data)
+        assert type(event).__name__ == "UserCreated"
+        assert type(event) is not type(EventSchema.from_dict(data))
+        assert event == EventSchema.from_dict(data)
+        unknown = lazy_from_dict(EventSchema, {"event": "something.new", "data": {}})
+        assert isinstance(unknown, EventSchemaUnknown)
+
+    def test_models_without_generated_loaders_are_eager(self):
+        data = load_fixture("api_key.json")
+        assert type(lazy_from_dict(ApiKey, data)) is ApiKey
+
+
+class TestLazyModelsOption:
+    def test_client_option(self, httpx_mock):
+        httpx_mock.add_response(json=ORGANIZATION)
+        httpx_mock.add_response(json=ORGANIZATION)
+        client = WorkOSClient(api_key="sk_test_123", lazy_models=True)
+        try:
+            lazy = client.organizations.get_organization(ORGANIZATION["id"])
+            eager = client.organizations.get_organization(
+                ORGANIZATION["id"], request_options=RequestOptions(lazy=False)
+            )
+        finally:
+            client.close()
+        assert isinstance(lazy, Organization) and type(lazy) is not Organization
+        assert type(eager) is Organization
+        assert lazy == eager
+
+    def test_per_call_option_on_list_pages(self, workos, httpx_mock):
+        httpx_mock.add_response(
+            json={"data": [ORGANIZATION], "list_metadata": {"after": None}}
+        )
+        page = workos.organizations.list_organizations(
+            request_options=RequestOptions(lazy=True)
+        )
+        assert type(page.data[0]) is not Organization
+        assert page.data[0].id == ORGANIZATION["id"]
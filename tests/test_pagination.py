@@ -2,11 +2,17 @@
 
 """Pagination tests: auto_paging_iter, before cursor stripping, and HTTP integration."""
 
+import asyncio
+import contextlib
+import threading
+import time
+
 import pytest
 
+from workos import MAX_PAGE_SIZE, AsyncWorkOSClient, RequestOptions, WorkOSClient
 from workos._pagination import SyncPage, AsyncPage, ListMetadata
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 
 @dataclass
@@ -108,6 +114,164 @@ class TestAsyncPage:
         assert [i.id for i in items] == ["1", "2", "3"]
 
 
+def _sync_chain(pages: int, fetched: List[str], fail_at: int = -1) -> SyncPage:
+    """Page 0 of ``pages`` two-item pages; ``fetched`` records each follow-up fetch."""
+
+    def fetch(after: str = ""):
+        index = int(after)
+        fetched.append(after)
+        if index == fail_at:
+            raise RuntimeError(f"page {index} failed")
+        return page(index)
+
+    def page(index: int) -> SyncPage:
+        return SyncPage(
+            data=[FakeItem(id=f"{index}.{i}") for i in range(2)],
+            list_metadata=ListMetadata(
+                after=str(index + 1) if index + 1 < pages else None
+            ),
+            _fetch_page=fetch,
+        )
+
+    return page(0)
+
+
+def _async_chain(
+    pages: int, fetched: List[str], fail_at: int = -1, block_at: int = -1
+) -> AsyncPage:
+    async def fetch(after: str = ""):
+        index = int(after)
+        fetched.append(after)
+        if index == fail_at:
+            raise RuntimeError(f"page {index} failed")
+        if index == block_at:
+            await asyncio.Event().wait()
+        return page(index)
+
+    def page(index: int) -> AsyncPage:
+        return AsyncPage(
+            data=[FakeItem(id=f"{index}.{i}") for i in range(2)],
+            list_metadata=ListMetadata(
+                after=str(index + 1) if index + 1 < pages else None
+            ),
+            _fetch_page=fetch,
+        )
+
+    return page(0)
+
+
+def _wait_for(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def _prefetch_threads() -> List[threading.Thread]:
+    return [t for t in threading.enumerate() if t.name == "workos-page-prefetch"]
+
+
+class TestSyncPrefetch:
+    def test_yields_the_same_items_in_order(self):
+        serial = [i.id for i in _sync_chain(5, []).auto_paging_iter()]
+        fetched: List[str] = []
+        prefetched = [
+            i.id for i in _sync_chain(5, fetched).auto_paging_iter(prefetch=2)
+        ]
+        assert prefetched == serial
+        assert fetched == ["1", "2", "3", "4"]
+
+    def test_fetches_ahead_while_the_caller_holds_a_page(self):
+        fetched: List[str] = []
+        items = _sync_chain(10, fetched).auto_paging_iter(prefetch=2)
+        next(items)
+        _wait_for(lambda: len(fetched) == 2)
+        time.sleep(0.02)
+        # Bounded: nothing beyond ``prefetch`` pages is fetched until consumed.
+        assert fetched == ["1", "2"]
+        next(items)
+        next(items)  # finish page 0 and take the first item of page 1
+        _wait_for(lambda: len(fetched) == 3)
+        items.close()
+
+    def test_errors_surface_after_earlier_pages(self):
+        items = _sync_chain(5, [], fail_at=2).auto_paging_iter(prefetch=3)
+        seen = []
+        with pytest.raises(RuntimeError, match="page 2 failed"):
+            for item in items:
+                seen.append(item.id)
+        assert seen == ["0.0", "0.1", "1.0", "1.1"]
+
+    def test_closing_early_stops_the_worker(self):
+        fetched: List[str] = []
+        items = _sync_chain(100, fetched).auto_paging_iter(prefetch=1)
+        next(items)
+        items.close()
+        _wait_for(lambda: not _prefetch_threads())
+        assert len(fetched) <= 2
+
+    def test_single_page_starts_no_worker(self):
+        page = SyncPage(data=[FakeItem(id="1")], list_metadata=ListMetadata())
+        assert [i.id for i in page.auto_paging_iter(prefetch=4)] == ["1"]
+        assert not _prefetch_threads()
+
+    def test_rejects_negative_depth(self):
+        with pytest.raises(ValueError):
+            next(_sync_chain(2, []).auto_paging_iter(prefetch=-1))
+
+
+@pytest.mark.asyncio
+class TestAsyncPrefetch:
+    async def test_yields_the_same_items_in_order(self):
+        serial = [i.id async for i in _async_chain(5, []).auto_paging_iter()]
+        fetched: List[str] = []
+        prefetched = [
+            i.id async for i in _async_chain(5, fetched).auto_paging_iter(prefetch=2)
+        ]
+        assert prefetched == serial
+        assert fetched == ["1", "2", "3", "4"]
+
+    async def test_fetches_ahead_while_the_caller_holds_a_page(self):
+        fetched: List[str] = []
+        items = _async_chain(10, fetched).auto_paging_iter(prefetch=2)
+        await items.__anext__()
+        for _ in range(20):
+            await asyncio.sleep(0)
+        assert fetched == ["1", "2"]
+        await items.aclose()
+
+    async def test_errors_surface_after_earlier_pages(self):
+        seen = []
+        with pytest.raises(RuntimeError, match="page 2 failed"):
+            async for item in _async_chain(5, [], fail_at=2).auto_paging_iter(
+                prefetch=3
+            ):
+                seen.append(item.id)
+        assert seen == ["0.0", "0.1", "1.0", "1.1"]
+
+    async def test_closing_early_cancels_the_pending_fetch(self):
+        fetched: List[str] = []
+        items = _async_chain(10, fetched, block_at=1).auto_paging_iter(prefetch=1)
+        async with contextlib.aclosing(items):
+            await items.__anext__()
+            await asyncio.sleep(0)
+        assert fetched == ["1"]
+        pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        assert not pending
+
+    async def test_cancelling_the_consumer_cancels_the_producer(self):
+        async def consume():
+            page = _async_chain(10, [], block_at=1)
+            return [i async for i in page.auto_paging_iter(prefetch=1)]
+
+        consumer = asyncio.ensure_future(consume())
+        await asyncio.sleep(0.01)
+        consumer.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await consumer
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
 class TestPaginationHTTPIntegration:
     """Integration test verifying auto_paging_iter fetches multiple pages via httpx."""
 
@@ -140,3 +304,163 @@ class TestPaginationHTTPIntegration:
         requests = httpx_mock.get_requests()
         assert len(requests) == 2
         assert "after=cursor_page2" in str(requests[1].url)
+
+    def test_prefetch_fetches_all_pages(self, workos, httpx_mock):
+        for i in range(3):
+            httpx_mock.add_response(
+                json={
+                    "data": [
+                        {
+                            "id": f"org_{i}",
+                            "name": f"Org {i}",
+                            "object": "organization",
+                            "domains": [],
+                            "metadata": {},
+                            "external_id": None,
+                            "created_at": "2024-01-01T00:00:00Z",
+                            "updated_at": "2024-01-01T00:00:00Z",
+                        }
+                    ],
+                    "list_metadata": {"after": f"cursor_{i + 1}"} if i < 2 else {},
+                }
+            )
+
+        page = workos.organizations.list_organizations()
+        items = list(page.auto_paging_iter(prefetch=2))
+        assert [item.id for item in items] == ["org_0", "org_1", "org_2"]
+        urls = [str(r.url) for r in httpx_mock.get_requests()]
+        assert "after=cursor_2" in urls[2]
+
+
+def _org_page(ids: List[str], after=None) -> Dict[str, Any]:
+    return {
+        "data": [
+            {
+                "id": org_id,
+                "name": org_id,
+                "object": "organization",
+                "domains": [],
+                "metadata": {},
+                "external_id": None,
+                "created_at": "2024-01-01T00:00:00Z",
+                "updated_at": "2024-01-01T00:00:00Z",
+            }
+            for org_id in ids
+        ],
+        "list_metadata": {"after": after} if after else {},
+    }
+
+
+def _limits(httpx_mock) -> List[Any]:
+    return [r.url.params.get("limit") for r in httpx_mock.get_requests()]
+
+
+class TestAutoPagingPageSize:
+    def test_follow_up_pages_use_the_configured_limit(self, httpx_mock):
+        httpx_mock.add_response(json=_org_page(["org_1"], after="c2"))
+        httpx_mock.add_response(json=_org_page(["org_2"], after="c3"))
+        httpx_mock.add_response(json=_org_page(["org_3"]))
+        client = WorkOSClient(
+            api_key="sk_test_123", auto_paging_page_size=MAX_PAGE_SIZE
+        )
+        try:
+            page = client.organizations.list_organizations(limit=5)
+            ids = [org.id for org in page.auto_paging_iter()]
+        finally:
+            client.close()
+        assert ids == ["org_1", "org_2", "org_3"]
+        assert _limits(httpx_mock) == ["5", "100", "100"]
+
+    def test_first_page_without_limit_is_left_alone(self, httpx_mock):
+        httpx_mock.add_response(json=_org_page(["org_1"], after="c2"))
+        httpx_mock.add_response(json=_org_page(["org_2"]))
+        client = WorkOSClient(api_key="sk_test_123", auto_paging_page_size=50)
+        try:
+            list(client.organizations.list_organizations().auto_paging_iter())
+        finally:
+            client.close()
+        assert _limits(httpx_mock) == [None, "50"]
+
+    def test_larger_caller_limit_is_kept(self, httpx_mock):
+        httpx_mock.add_response(json=_org_page(["org_1"], after="c2"))
+        httpx_mock.add_response(json=_org_page(["org_2"]))
+        client = WorkOSClient(api_key="sk_test_123", auto_paging_page_size=50)
+        try:
+            page = client.organizations.list_organizations(limit=100)
+            list(page.auto_paging_iter())
+        finally:
+            client.close()
+        assert _limits(httpx_mock) == ["100", "100"]
+
+    def test_disabled_by_default(self, workos, httpx_mock):
+        httpx_mock.add_response(json=_org_page(["org_1"], after="c2"))
+        httpx_mock.add_response(json=_org_page(["org_2"]))
+        list(workos.organizations.list_organizations(limit=5).auto_paging_iter())
+        assert workos.auto_paging_page_size is None
+        assert _limits(httpx_mock) == ["5", "5"]
+
+    @pytest.mark.parametrize("size", [0, MAX_PAGE_SIZE + 1])
+    def test_rejects_out_of_range_sizes(self, size):
+        with pytest.raises(ValueError):
+            WorkOSClient(api_key="sk_test_123", auto_paging_page_size=size)
+
+    @pytest.mark.asyncio
+    async def test_async_client(self, httpx_mock):
+        httpx_mock.add_response(json=_org_page(["org_1"], after="c2"))
+        httpx_mock.add_response(json=_org_page(["org_2"]))
+        client = AsyncWorkOSClient(
+            api_key="sk_test_123", auto_paging_page_size=MAX_PAGE_SIZE
+        )
+        try:
+            page = await client.organizations.list_organizations()
+            ids = [org.id async for org in page.auto_paging_iter()]
+        finally:
+            await client.close()
+        assert ids == ["org_1", "org_2"]
+        assert _limits(httpx_mock) == [None, "100"]
+
+
+class TestRawItems:
+    def test_raw_items_skip_deserialization(self, workos, httpx_mock, monkeypatch):
+        from workos.organizations.models import Organization
+
+        httpx_mock.add_response(json=_org_page(["org_1"], after="c2"))
+        httpx_mock.add_response(json=_org_page(["org_2"]))
+
+        def fail(data):
+            raise AssertionError("from_dict should not be called")
+
+        monkeypatch.setattr(Organization, "from_dict", fail)
+        page = workos.organizations.list_organizations(
+            request_options=RequestOptions(raw=True)
+        )
+        items: List[Any] = list(page.auto_paging_iter())
+        assert items == _org_page(["org_1"])["data"] + _org_page(["org_2"])["data"]
+
+    def test_fields_projects_every_page(self, workos, httpx_mock):
+        httpx_mock.add_response(json=_org_page(["org_1"], after="c2"))
+        httpx_mock.add_response(json=_org_page(["org_2"]))
+        page = workos.organizations.list_organizations(
+            request_options=RequestOptions(fields=("id", "name", "missing"))
+        )
+        items: List[Any] = list(page.auto_paging_iter(prefetch=1))
+        assert items == [
+            {"id": "org_1", "name": "org_1", "missing": None},
+            {"id": "org_2", "name": "org_2", "missing": None},
+        ]
+
+    def test_fields_must_not_be_a_string(self, workos):
+        with pytest.raises(TypeError):
+            workos.organizations.list_organizations(
+                request_options=RequestOptions(fields="id")
+            )
+
+    @pytest.mark.asyncio
+    async def test_async_client(self, async_workos, httpx_mock):
+        httpx_mock.add_response(json=_org_page(["org_1"], after="c2"))
+        httpx_mock.add_response(json=_org_page(["org_2"]))
+        page = await async_workos.organizations.list_organizations(
+            request_options=RequestOptions(fields=("id",))
+        )
+        items: List[Any] = [item async for item in page.auto_paging_iter()]
+        assert items == [{"id": "org_1"}, {"id": "org_2"}]
@@ -0,0 +1,174 @@
+# @oagen-ignore-file
+
+"""Client-side rate limiter tests: token buckets, endpoint families, server pauses."""
+
+import threading
+
+import pytest
+
+from workos import AsyncWorkOSClient, RateLimit, RateLimiter, WorkOSClient
+from workos import _base_client as base_client_module
+from workos import _rate_limit as rate_limit_module
+
+
+@pytest.fixture
+def clock_module():
+    return rate_limit_module
+
+
+class TestRateLimit:
+    def test_burst_defaults_to_rate(self):
+        assert RateLimit(rate=2.5).capacity == 3
+        assert RateLimit(rate=0.5).capacity == 1
+        assert RateLimit(rate=10, burst=4).capacity == 4
+
+    def test_invalid_values_rejected(self):
+        with pytest.raises(ValueError):
+            RateLimit(rate=0)
+        with pytest.raises(ValueError):
+            RateLimit(rate=1, burst=0)
+
+
+class TestRateLimiter:
+    def test_burst_then_spaced(self, clock):
+        limiter = RateLimiter(RateLimit(rate=2, burst=2))
+        assert limiter.reserve("organizations") == 0
+        assert limiter.reserve("organizations") == 0
+        assert limiter.reserve("organizations") == pytest.approx(0.5)
+        assert limiter.reserve("organizations") == pytest.approx(1.0)
+        assert limiter.throttled == 2
+        assert limiter.total_delay == pytest.approx(1.5)
+
+    def test_refills_over_time(self, clock):
+        limiter = RateLimiter(RateLimit(rate=1, burst=1))
+        assert limiter.reserve("organizations") == 0
+        clock.now += 1
+        assert limiter.reserve("organizations") == 0
+
+    def test_endpoint_family_has_its_own_bucket(self, clock):
+        limiter = RateLimiter(
+            endpoints={
+                "user_management/authenticate": RateLimit(rate=1, burst=1),
+                "user_management": RateLimit(rate=100),
+            }
+        )
+        assert limiter.reserve("user_management/authenticate") == 0
+        assert limiter.reserve("user_management/authenticate") == pytest.approx(1.0)
+        # Other user_management endpoints use the broader family.
+        assert limiter.reserve("user_management/users/user_123") == 0
+        # Unmatched paths are unlimited without a default budget.
+        assert limiter.reserve("audit_logs/events") == 0
+
+    def test_endpoint_and_default_both_apply(self, clock):
+        limiter = RateLimiter(
+            RateLimit(rate=1, burst=1),
+            endpoints={"audit_logs/events": RateLimit(rate=100)},
+        )
+        assert limiter.reserve("audit_logs/events") == 0
+        assert limiter.reserve("audit_logs/events") == pytest.approx(1.0)
+
+    def test_retry_after_pauses_every_caller(self, clock):
+        limiter = RateLimiter()
+        assert limiter.observe(429, {"Retry-After": "3"}) == 3
+        assert limiter.pauses == 1
+        assert limiter.paused_for == pytest.approx(3)
+        assert limiter.reserve("organizations") == pytest.approx(3)
+        assert limiter.reserve("directories") == pytest.approx(3)
+
+    def test_exhausted_rate_limit_headers_pause(self, clock):
+        limiter = RateLimiter()
+        assert (
+            limiter.observe(
+                200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2"}
+            )
+            == 2
+        )
+        assert limiter.observe(200, {"X-RateLimit-Remaining": "5"}) == 0
+
+    @pytest.mark.parametrize(
+        "value", ["3", " 2.5 ", "-4", "Wed, 21 Oct 2015 07:28:00 GMT", "soon", ""]
+    )
+    def test_retry_after_is_parsed_like_the_client(self, value):
+        expected = base_client_module._BaseWorkOSClient._parse_retry_after(value)
+        assert rate_limit_module.parse_retry_after(value) == expected
+        assert RateLimiter().observe(429, {"Retry-After": value}) == (expected or 0.0)
+
+    def test_concurrent_reservations_are_serialized(self, clock):
+        limiter = RateLimiter(RateLimit(rate=10, burst=1))
+        delays = []
+        lock = threading.Lock()
+
+        def worker():
+            delay = limiter.reserve("organizations")
+            with lock:
+                delays.append(delay)
+
+        threads = [threading.Thread(target=worker) for _ in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # Each caller is queued 100ms behind the previous one.
+        assert sorted(delays) == [pytest.approx(i / 10) for i in range(20)]
+
+
+class TestWorkOSClientRateLimiting:
+    def test_waits_before_sending(self, httpx_mock, monkeypatch, clock):
+        sleeps = []
+        monkeypatch.setattr(base_client_module.time, "sleep", sleeps.append)
+        httpx_mock.add_response(json={})
+        httpx_mock.add_response(json={})
+        limiter = RateLimiter(RateLimit(rate=4, burst=1))
+        client = WorkOSClient(api_key="sk_test_123", rate_limiter=limiter)
+        try:
+            client.request("GET", ("organizations",))
+            client.request("GET", ("organizations",))
+        finally:
+            client.close()
+        assert sleeps == [pytest.approx(0.25)]
+        assert client.rate_limiter is limiter
+
+    def test_retry_after_pauses_shared_limiter(self, httpx_mock, monkeypatch, clock):
+        sleeps = []
+        monkeypatch.setattr(base_client_module.time, "sleep", sleeps.append)
+        httpx_mock.add_response(status_code=429, headers={"Retry-After": "2"})
+        httpx_mock.add_response(json={"id": "org_123"})
+        limiter = RateLimiter()
+        client = WorkOSClient(api_key="sk_test_123", rate_limiter=limiter)
+        try:
+            assert client.request("GET", ("organizations", "org_123")) == {
+                "id": "org_123"
+            }
+        finally:
+            client.close()
+        # The retry waits once, through the limiter, not twice.
+        assert sleeps == [pytest.approx(2)]
+        assert limiter.pauses == 1
+
+
+@pytest.mark.asyncio
+class TestAsyncWorkOSClientRateLimiting:
+    async def test_waits_with_asyncio_sleep(self, httpx_mock, monkeypatch, clock):
+        sleeps = []
+
+        async def _sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        monkeypatch.setattr(base_client_module.asyncio, "sleep", _sleep)
+        monkeypatch.setattr(
+            base_client_module.time,
+            "sleep",
+            lambda _: pytest.fail("blocking sleep in async client"),
+        )
+        httpx_mock.add_response(json={})
+        httpx_mock.add_response(json={})
+        client = AsyncWorkOSClient(
+            api_key="sk_test_123",
+            rate_limiter=RateLimiter(RateLimit(rate=2, burst=1)),
+        )
+        try:
+            await client.request("GET", ("organizations",))
+            await client.request("GET", ("organizations",))
+        finally:
+            await client.close()
+        assert sleeps == [pytest.approx(0.5)]
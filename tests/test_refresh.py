@@ -0,0 +1,351 @@
+# @oagen-ignore-file
+
+"""Single-flight session refresh with ``RefreshCoordinator``."""
+
+import asyncio
+import contextlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+import pytest
+from cryptography.fernet import Fernet
+
+from tests.conftest import JWKS, sign_access_token
+from workos import (
+    AsyncWorkOSClient,
+    InMemoryRefreshStore,
+    RefreshCoordinator,
+    RefreshStore,
+    TransportConfig,
+    WorkOSClient,
+)
+from workos import _refresh
+from workos._jwks import AsyncJWKSKeyStore, JWKSKeyStore
+from workos.session import (
+    AsyncSession,
+    RefreshWithSessionCookieErrorResponse,
+    RefreshWithSessionCookieSuccessResponse,
+    Session,
+    seal_data,
+    unseal_data,
+)
+
+PASSWORD = Fernet.generate_key().decode()
+COOKIE = seal_data(
+    {"access_token": "expired", "refresh_token": "rt_old", "user": {"id": "user_01"}},
+    PASSWORD,
+)
+
+
+def _access_token(organization_id: Optional[str] = None) -> str:
+    claims = {"sid": "session_01", "exp": int(time.time()) + 3600}
+    if organization_id is not None:
+        claims["org_id"] = organization_id
+    return sign_access_token(**claims)
+
+
+class _AuthEndpoint:
+    """Records refresh requests and rotates the refresh token like the API."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.bodies: List[Dict[str, Any]] = []
+        self.status = 200
+        self.arrived = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def _response(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        self.bodies.append(body)
+        if self.status != 200:
+            return httpx.Response(self.status, json={"message": "Invalid grant"})
+        return httpx.Response(
+            200,
+            json={
+                "access_token": _access_token(body.get("organization_id")),
+                "refresh_token": f"rt_{len(self.bodies)}",
+                "user": {"id": "user_01"},
+            },
+        )
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        time.sleep(self.delay)
+        self.arrived.set()
+        self.release.wait(5)
+        return self._response(request)
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(self.delay)
+        return self._response(request)
+
+
+def _client(
+    endpoint: _AuthEndpoint, coordinator: Optional[RefreshCoordinator]
+) -> WorkOSClient:
+    return WorkOSClient(
+        api_key="sk_test_123",
+        client_id="client_123",
+        max_retries=0,
+        transport_config=TransportConfig(transport=httpx.MockTransport(endpoint)),
+        refresh_coordinator=coordinator,
+    )
+
+
+@contextlib.asynccontextmanager
+async def _async_client(
+    endpoint: _AuthEndpoint, coordinator: RefreshCoordinator
+) -> AsyncIterator[AsyncWorkOSClient]:
+    client = AsyncWorkOSClient(
+        api_key="sk_test_123",
+        client_id="client_123",
+        max_retries=0,
+        transport_config=TransportConfig(
+            transport=httpx.MockTransport(endpoint.handle_async)
+        ),
+        refresh_coordinator=coordinator,
+    )
+    try:
+        yield client
+    finally:
+        await client.close()
+
+
+def _session(client: WorkOSClient) -> Session:
+    session = Session(client=client, session_data=COOKIE, cookie_password=PASSWORD)
+    session.jwks = JWKSKeyStore("https://example.com/jwks", fetch=lambda: JWKS)
+    return session
+
+
+class TestInMemoryRefreshStore:
+    def test_add_only_stores_missing_or_expired_keys(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(_refresh, "_now", lambda: now[0])
+        store = InMemoryRefreshStore()
+        assert isinstance(store, RefreshStore)
+        assert store.add("lock", b"1", 5) is True
+        assert store.add("lock", b"2", 5) is False
+        now[0] += 5
+        assert store.get("lock") is None
+        assert store.add("lock", b"3", 5) is True
+        assert store.delete_if("lock", b"1") is False
+        assert store.get("lock") == b"3"
+        assert store.delete_if("lock", b"3") is True
+        assert store.get("lock") is None
+        assert store.delete_if("lock", b"3") is False
+
+    def test_evicts_the_oldest_entries_beyond_maxsize(self):
+        store = InMemoryRefreshStore(maxsize=2)
+        for key in ("a", "b", "c"):
+            store.set(key, key.encode(), 60)
+        assert len(store) == 2
+        assert store.get("a") is None
+        assert store.get("c") == b"c"
+
+    def test_rejects_invalid_settings(self):
+        with pytest.raises(ValueError):
+            InMemoryRefreshStore(maxsize=0)
+        with pytest.raises(ValueError):
+            RefreshCoordinator(result_ttl=0)
+        with pytest.raises(ValueError):
+            RefreshCoordinator(lock_ttl=0)
+
+
+class TestRefreshLock:
+    KEY = "workos:refresh:test"
+    LOCK = "workos:refresh:test:lock"
+
+    def _expire_lock_and_take_it(self, store, now):
+        now[0] += 31
+        assert store.add(self.LOCK, b"other", 30) is True
+        return "result"
+
+    def test_an_expired_lock_taken_by_another_holder_is_kept(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(_refresh, "_now", lambda: now[0])
+        coordinator = RefreshCoordinator(lock_ttl=30)
+        result = coordinator.run(
+            self.KEY,
+            lambda: self._expire_lock_and_take_it(coordinator.store, now),
+            encode=str.encode,
+            decode=bytes.decode,
+        )
+        assert result == "result"
+        assert coordinator.store.get(self.LOCK) == b"other"
+
+    @pytest.mark.asyncio
+    async def test_an_expired_lock_is_kept_async(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(_refresh, "_now", lambda: now[0])
+        coordinator = RefreshCoordinator(lock_ttl=30)
+
+        async def refresh() -> str:
+            return self._expire_lock_and_take_it(coordinator.store, now)
+
+        result = await coordinator.arun(
+            self.KEY, refresh, encode=str.encode, decode=bytes.decode
+        )
+        assert result == "result"
+        assert coordinator.store.get(self.LOCK) == b"other"
+
+    def test_the_lock_is_released_with_its_own_token(self):
+        coordinator = RefreshCoordinator()
+        coordinator.run(
+            self.KEY, lambda: "result", encode=str.encode, decode=bytes.decode
+        )
+        assert coordinator.store.get(self.LOCK) is None
+
+
+class TestSessionRefreshCoordination:
+    def test_concurrent_refreshes_send_one_request(self):
+        endpoint = _AuthEndpoint(delay=0.1)
+        coordinator = RefreshCoordinator()
+        with contextlib.closing(_client(endpoint, coordinator)) as client:
+            sessions = [_session(client) for _ in range(8)]
+            with ThreadPoolExecutor(8) as pool:
+                results = list(pool.map(lambda s: s.refresh(), sessions))
+        assert len(endpoint.bodies) == 1
+        assert endpoint.bodies[0]["refresh_token"] == "rt_old"
+        sealed = {
+            r.sealed_session
+            for r in results
+            if isinstance(r, RefreshWithSessionCookieSuccessResponse)
+        }
+        assert len(sealed) == 1
+        assert all(s.session_data in sealed for s in sessions)
+        assert unseal_data(sealed.pop(), PASSWORD)["refresh_token"] == "rt_1"
+        stats = coordinator.stats()
+        assert stats.refreshes == 1
+        assert stats.coalesced + stats.reused == 7
+
+    def test_late_arrivals_reuse_the_result(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(_refresh, "_now", lambda: now[0])
+        endpoint = _AuthEndpoint()
+        coordinator = RefreshCoordinator(result_ttl=10)
+        with contextlib.closing(_client(endpoint, coordinator)) as client:
+            first = _session(client).refresh()
+            now[0] += 9
+            late = _session(client).refresh()
+            now[0] += 1
+            expired = _session(client).refresh()
+        assert isinstance(first, RefreshWithSessionCookieSuccessResponse)
+        assert isinstance(late, RefreshWithSessionCookieSuccessResponse)
+        assert late.sealed_session == first.sealed_session
+        assert late.user == first.user
+        assert len(endpoint.bodies) == 2
+        assert isinstance(expired, RefreshWithSessionCookieSuccessResponse)
+        assert coordinator.stats().reused == 1
+
+    def test_callers_with_other_passwords_get_their_own_session(self):
+        endpoint = _AuthEndpoint()
+        rotated = [Fernet.generate_key().decode(), PASSWORD]
+        with contextlib.closing(_client(endpoint, RefreshCoordinator())) as client:
+            first = _session(client).refresh()
+            other = _session(client)
+            result = other.refresh(cookie_password=rotated)
+        assert len(endpoint.bodies) == 2
+        assert isinstance(first, RefreshWithSessionCookieSuccessResponse)
+        assert isinstance(result, RefreshWithSessionCookieSuccessResponse)
+        assert result.sealed_session != first.sealed_session
+        assert unseal_data(other.session_data, rotated)["refresh_token"] == "rt_2"
+        assert RefreshCoordinator.key("rt", cookie_password=PASSWORD) != (
+            RefreshCoordinator.key("rt", cookie_password=rotated)
+        )
+
+    def test_organizations_are_refreshed_separately(self):
+        endpoint = _AuthEndpoint()
+        with contextlib.closing(_client(endpoint, RefreshCoordinator())) as client:
+            default = _session(client).refresh()
+            switched = _session(client).refresh(organization_id="org_02")
+        assert len(endpoint.bodies) == 2
+        assert isinstance(switched, RefreshWithSessionCookieSuccessResponse)
+        assert switched.organization_id == "org_02"
+        assert isinstance(default, RefreshWithSessionCookieSuccessResponse)
+        assert default.organization_id is None
+
+    def test_failures_are_shared_but_not_stored(self):
+        endpoint = _AuthEndpoint(delay=0.05)
+        endpoint.status = 401
+        with contextlib.closing(_client(endpoint, RefreshCoordinator())) as client:
+            with ThreadPoolExecutor(4) as pool:
+                results = list(
+                    pool.map(
+                        lambda s: s.refresh(), [_session(client) for _ in range(4)]
+                    )
+                )
+            assert len(endpoint.bodies) == 1
+            assert all(
+                isinstance(r, RefreshWithSessionCookieErrorResponse) for r in results
+            )
+            endpoint.status = 200
+            retried = _session(client).refresh()
+        assert isinstance(retried, RefreshWithSessionCookieSuccessResponse)
+        assert len(endpoint.bodies) == 2
+
+    def test_coordinators_sharing_a_store_wait_for_each_other(self):
+        # Two coordinators over one store stand in for two processes over Redis.
+        store = InMemoryRefreshStore()
+        endpoint = _AuthEndpoint()
+        endpoint.release.clear()
+        first = RefreshCoordinator(store)
+        second = RefreshCoordinator(store)
+        with (
+            contextlib.closing(_client(endpoint, first)) as a,
+            contextlib.closing(_client(endpoint, second)) as b,
+        ):
+            with ThreadPoolExecutor(2) as pool:
+                leader = pool.submit(_session(a).refresh)
+                assert endpoint.arrived.wait(5)
+                follower = pool.submit(_session(b).refresh)
+                time.sleep(0.1)
+                assert not follower.done()
+                endpoint.release.set()
+                results = [leader.result(), follower.result()]
+        assert len(endpoint.bodies) == 1
+        assert results[0] == results[1]
+        assert second.stats().reused == 1
+
+    def test_disabled_by_default(self):
+        endpoint = _AuthEndpoint()
+        with contextlib.closing(_client(endpoint, None)) as client:
+            assert client.refresh_coordinator is None
+            _session(client).refresh()
+            _session(client).refresh()
+        assert len(endpoint.bodies) == 2
+
+
+@pytest.mark.asyncio
+class TestAsyncSessionRefreshCoordination:
+    async def test_concurrent_refreshes_send_one_request(self):
+        endpoint = _AuthEndpoint(delay=0.05)
+        coordinator = RefreshCoordinator()
+
+        async def fetch() -> Dict[str, Any]:
+            return JWKS
+
+        async with _async_client(endpoint, coordinator) as client:
+            sessions = []
+            for _ in range(8):
+                session = AsyncSession(
+                    client=client, session_data=COOKIE, cookie_password=PASSWORD
+                )
+                session.async_jwks = AsyncJWKSKeyStore(
+                    "https://example.com/jwks", fetch=fetch
+                )
+                sessions.append(session)
+            # A caller that gives up does not cancel the shared refresh.
+            cancelled = asyncio.ensure_future(sessions[0].refresh())
+            await asyncio.sleep(0.01)
+            cancelled.cancel()
+            results = await asyncio.gather(*(s.refresh() for s in sessions[1:]))
+        assert len(endpoint.bodies) == 1
+        assert all(
+            isinstance(r, RefreshWithSessionCookieSuccessResponse) for r in results
+        )
+        assert len({s.session_data for s in sessions[1:]}) == 1
+        assert coordinator.stats().coalesced == 7
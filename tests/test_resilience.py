@@ -0,0 +1,244 @@
+# @oagen-ignore-file
+
+"""Circuit breaker and retry budget tests."""
+
+import httpx
+import pytest
+
+from workos import (
+    AsyncWorkOSClient,
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    NotFoundError,
+    RetryBudget,
+    ServerError,
+    WorkOSClient,
+)
+from workos import _base_client as base_client_module
+from workos import _resilience as resilience_module
+from workos._errors import WorkOSConnectionError
+
+
+@pytest.fixture
+def clock_module():
+    return resilience_module
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    async def _async_sleep(delay: float) -> None:
+        pass
+
+    monkeypatch.setattr(base_client_module.time, "sleep", lambda _: None)
+    monkeypatch.setattr(base_client_module.asyncio, "sleep", _async_sleep)
+
+
+class TestRetryBudget:
+    def test_floor_allows_retries_at_low_traffic(self, clock):
+        budget = RetryBudget(ratio=0.1, min_retries=2)
+        budget.record_request()
+        assert budget.try_acquire_retry()
+        assert budget.try_acquire_retry()
+        assert not budget.try_acquire_retry()
+        assert budget.exhausted == 1
+
+    def test_ratio_scales_with_requests(self, clock):
+        budget = RetryBudget(ratio=0.5, min_retries=0)
+        for _ in range(10):
+            budget.record_request()
+        granted = sum(budget.try_acquire_retry() for _ in range(10))
+        assert granted == 5
+        assert budget.retries == 5
+
+    def test_window_expires_old_events(self, clock):
+        budget = RetryBudget(ratio=0, min_retries=1, window=10)
+        budget.record_request()
+        assert budget.try_acquire_retry()
+        assert not budget.try_acquire_retry()
+        clock.now += 11
+        assert budget.requests == 0
+        assert budget.try_acquire_retry()
+
+    def test_invalid_values_rejected(self):
+        with pytest.raises(ValueError):
+            RetryBudget(ratio=-1)
+        with pytest.raises(ValueError):
+            RetryBudget(window=0)
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self, clock):
+        breaker = CircuitBreaker(failure_threshold=3)
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.times_opened == 1
+
+    def test_open_circuit_fails_fast(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30)
+        breaker.record_failure()
+        clock.now += 10
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_request()
+        assert exc_info.value.retry_after == pytest.approx(20)
+        assert breaker.rejected == 1
+
+    def test_half_open_allows_a_single_probe(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30)
+        breaker.record_failure()
+        clock.now += 30
+        assert breaker.state is CircuitState.HALF_OPEN
+        breaker.before_request()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+        breaker.before_request()
+
+    def test_failed_probe_reopens(self, clock):
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=5)
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now += 5
+        breaker.before_request()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.times_opened == 2
+
+    def test_state_change_callback(self, clock):
+        transitions = []
+        breaker = CircuitBreaker(
+            failure_threshold=1,
+            recovery_timeout=1,
+            on_state_change=lambda old, new: transitions.append((old, new)),
+        )
+        breaker.record_failure()
+        clock.now += 1
+        breaker.before_request()
+        breaker.record_success()
+        assert transitions == [
+            (CircuitState.CLOSED, CircuitState.OPEN),
+            (CircuitState.OPEN, CircuitState.HALF_OPEN),
+            (CircuitState.HALF_OPEN, CircuitState.CLOSED),
+        ]
+
+    def test_callback_may_read_state_and_reset(self, clock):
+        seen = []
+
+        def on_change(old, new):
+            seen.append(breaker.state)
+            if new is CircuitState.OPEN:
+                breaker.reset()
+
+        breaker = CircuitBreaker(failure_threshold=1, on_state_change=on_change)
+        breaker.record_failure()
+        assert seen == [CircuitState.OPEN, CircuitState.CLOSED]
+        assert breaker.state is CircuitState.CLOSED
+
+
+class TestWorkOSClientResilience:
+    def test_open_circuit_skips_the_network(self, httpx_mock, no_sleep, clock):
+        httpx_mock.add_response(status_code=500, json={"message": "boom"})
+        httpx_mock.add_response(status_code=500, json={"message": "boom"})
+        breaker = CircuitBreaker(failure_threshold=2)
+        client = WorkOSClient(api_key="sk_test_123", circuit_breaker=breaker)
+        try:
+            # The circuit opens mid-request, which stops further retries.
+            with pytest.raises(ServerError):
+                client.request("GET", ("organizations",))
+            with pytest.raises(CircuitOpenError):
+                client.request("GET", ("organizations",))
+        finally:
+            client.close()
+        assert len(httpx_mock.get_requests()) == 2
+        assert client.circuit_breaker is breaker
+        assert breaker.rejected == 1
+
+    def test_client_errors_do_not_trip_the_circuit(self, httpx_mock, clock):
+        for _ in range(3):
+            httpx_mock.add_response(status_code=404, json={"message": "missing"})
+        breaker = CircuitBreaker(failure_threshold=1)
+        client = WorkOSClient(api_key="sk_test_123", circuit_breaker=breaker)
+        try:
+            for _ in range(3):
+                with pytest.raises(NotFoundError):
+                    client.request("GET", ("organizations", "org_123"))
+        finally:
+            client.close()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_connection_errors_count_as_failures(self, httpx_mock, no_sleep, clock):
+        httpx_mock.add_exception(httpx.ConnectError("refused"))
+        breaker = CircuitBreaker(failure_threshold=1)
+        client = WorkOSClient(api_key="sk_test_123", circuit_breaker=breaker)
+        try:
+            with pytest.raises(WorkOSConnectionError):
+                client.request("GET", ("organizations",))
+        finally:
+            client.close()
+        assert breaker.state is CircuitState.OPEN
+
+    def test_recovers_through_half_open_probe(self, httpx_mock, clock):
+        httpx_mock.add_response(status_code=503, json={"message": "down"})
+        httpx_mock.add_response(json={"id": "org_123"})
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+        client = WorkOSClient(
+            api_key="sk_test_123", max_retries=0, circuit_breaker=breaker
+        )
+        try:
+            with pytest.raises(ServerError):
+                client.request("GET", ("organizations",))
+            clock.now += 10
+            assert client.request("GET", ("organizations",)) == {"id": "org_123"}
+        finally:
+            client.close()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_exhausted_budget_stops_retrying(self, httpx_mock, no_sleep, clock):
+        for _ in range(3):
+            httpx_mock.add_response(status_code=500, json={"message": "boom"})
+        budget = RetryBudget(ratio=0, min_retries=2)
+        client = WorkOSClient(api_key="sk_test_123", retry_budget=budget)
+        try:
+            with pytest.raises(ServerError):
+                client.request("GET", ("organizations",))
+        finally:
+            client.close()
+        # One attempt plus the two retries the budget allowed, not max_retries.
+        assert len(httpx_mock.get_requests()) == 3
+        assert budget.exhausted == 1
+        assert client.retry_budget is budget
+
+
+@pytest.mark.asyncio
+class TestAsyncWorkOSClientResilience:
+    async def test_open_circuit_fails_fast(self, httpx_mock, no_sleep, clock):
+        httpx_mock.add_response(status_code=502, json={"message": "bad gateway"})
+        breaker = CircuitBreaker(failure_threshold=1)
+        client = AsyncWorkOSClient(api_key="sk_test_123", circuit_breaker=breaker)
+        try:
+            with pytest.raises(ServerError):
+                await client.request("GET", ("organizations",))
+            with pytest.raises(CircuitOpenError):
+                await client.request("GET", ("organizations",))
+        finally:
+            await client.close()
+        assert len(httpx_mock.get_requests()) == 1
+
+    async def test_exhausted_budget_stops_retrying(self, httpx_mock, no_sleep, clock):
+        httpx_mock.add_response(status_code=500, json={"message": "boom"})
+        httpx_mock.add_response(status_code=500, json={"message": "boom"})
+        budget = RetryBudget(ratio=0, min_retries=1)
+        client = AsyncWorkOSClient(api_key="sk_test_123", retry_budget=budget)
+        try:
+            with pytest.raises(ServerError):
+                await client.request("GET", ("organizations",))
+        finally:
+            await client.close()
+        assert len(httpx_mock.get_requests()) == 2
@@ -28,7 +28,9 @@ from workos.session import (
     RefreshWithSessionCookieErrorResponse,
     RefreshWithSessionCookieSuccessResponse,
     Session,
+    _get_cipher,
     _map_refresh_exception_to_reason,
+    reseal_data,
     seal_data,
     seal_session_from_auth_response,
     unseal_data,
@@ -84,6 +86,33 @@ class TestSealUnseal:
         with pytest.raises(Exception):
             unseal_data("not-valid-fernet-data", COOKIE_PASSWORD)
 
+    def test_ciphers_are_reused_per_password(self):
+        assert _get_cipher(COOKIE_PASSWORD) is _get_cipher(COOKIE_PASSWORD)
+        rotated = [Fernet.generate_key().decode("utf-8"), COOKIE_PASSWORD]
+        assert _get_cipher(rotated) is _get_cipher(tuple(rotated))
+
+    def test_password_list_unseals_with_any_key_and_seals_with_the_newest(self):
+        new_key = Fernet.generate_key().decode("utf-8")
+        passwords = [new_key, COOKIE_PASSWORD]
+        old_sealed = seal_data({"key": "old"}, COOKIE_PASSWORD)
+        assert unseal_data(old_sealed, passwords) == {"key": "old"}
+        new_sealed = seal_data({"key": "new"}, passwords)
+        assert unseal_data(new_sealed, new_key) == {"key": "new"}
+        with pytest.raises(InvalidToken):
+            unseal_data(new_sealed, COOKIE_PASSWORD)
+
+    def test_reseal_moves_data_to_the_newest_key(self):
+        new_key = Fernet.generate_key().decode("utf-8")
+        old_sealed = seal_data({"key": "value"}, COOKIE_PASSWORD)
+        resealed = reseal_data(old_sealed, [new_key, COOKIE_PASSWORD])
+        assert unseal_data(resealed, new_key) == {"key": "value"}
+        with pytest.raises(InvalidToken):
+            reseal_data(old_sealed, new_key)
+
+    def test_empty_password_list_is_rejected(self):
+        with pytest.raises(ValueError):
+            seal_data({"key": "value"}, [])
+
 
 class TestSealSessionFromAuthResponse:
     def test_seal_and_unseal(self):
@@ -369,6 +398,33 @@ class TestSession:
         assert auth_result.session_id == "session_01"
         assert auth_result.user == {"id": "user_01", "email": "test@example.com"}
 
+    def test_session_refresh_reseals_with_the_newest_password(self):
+        new_password = Fernet.generate_key().decode("utf-8")
+        passwords = [new_password, COOKIE_PASSWORD]
+        sealed = self._make_sealed_session(
+            access_token=_make_jwt(self.private_key), user={"id": "user_01"}
+        )
+        session = Session(
+            client=self.workos, session_data=sealed, cookie_password=passwords
+        )
+        session.jwks = self._mock_jwks()
+        assert isinstance(
+            session.authenticate(), AuthenticateWithSessionCookieSuccessResponse
+        )
+        session._client.request_raw = MagicMock(
+            return_value={
+                "access_token": _make_jwt(self.private_key),
+                "refresh_token": "rt_new",
+                "user": {"id": "user_01"},
+            }
+        )
+
+        result = session.refresh()
+        assert isinstance(result, RefreshWithSessionCookieSuccessResponse)
+        assert unseal_data(result.sealed_session, new_password)["refresh_token"] == (
+            "rt_new"
+        )
+
     def test_session_refresh_maps_auth_error_to_refresh_denied(self):
         """AuthenticationError from request_raw maps to REFRESH_DENIED via except."""
         sealed = seal_data(
@@ -559,6 +615,15 @@ class TestAsyncSession:
         mock_jwks.get_signing_key_from_jwt.return_value = mock_signing_key
         return mock_jwks
 
+    def _mock_async_jwks(self, public_key):
+        from unittest.mock import AsyncMock
+
+        mock_jwks = MagicMock()
+        mock_signing_key = MagicMock()
+        mock_signing_key.key = public_key
+        mock_jwks.get_signing_key_from_jwt = AsyncMock(return_value=mock_signing_key)
+        return mock_jwks
+
     async def test_async_session_authenticate_no_data(self, async_workos):
         session = AsyncSession(
             client=async_workos, session_data="", cookie_password=COOKIE_PASSWORD
@@ -592,7 +657,7 @@ class TestAsyncSession:
         session = AsyncSession(
             client=async_workos, session_data=sealed, cookie_password=COOKIE_PASSWORD
         )
-        session.jwks = self._mock_jwks(public_key)
+        session.async_jwks = self._mock_async_jwks(public_key)
 
         api_response = {
             "access_token": new_token,
@@ -668,7 +733,7 @@ class TestAsyncSession:
             session_data=original_sealed,
             cookie_password=COOKIE_PASSWORD,
         )
-        session.jwks = self._mock_jwks(public_key)
+        session.async_jwks = self._mock_async_jwks(public_key)
 
         api_response = {
             "access_token": no_sid_token,
@@ -698,7 +763,7 @@ class TestAsyncSession:
             session_data=original_sealed,
             cookie_password=COOKIE_PASSWORD,
         )
-        session.jwks = self._mock_jwks(verify_public)
+        session.async_jwks = self._mock_async_jwks(verify_public)
 
         api_response = {
             "access_token": bad_token,
@@ -729,10 +794,12 @@ class TestAsyncSession:
             cookie_password=COOKIE_PASSWORD,
         )
         mock_jwks = MagicMock()
-        mock_jwks.get_signing_key_from_jwt.side_effect = (
-            pyjwt_lib.exceptions.PyJWKClientError("Unable to find a signing key")
+        mock_jwks.get_signing_key_from_jwt = AsyncMock(
+            side_effect=pyjwt_lib.exceptions.PyJWKClientError(
+                "Unable to find a signing key"
+            )
         )
-        session.jwks = mock_jwks
+        session.async_jwks = mock_jwks
 
         api_response = {
             "access_token": new_token,
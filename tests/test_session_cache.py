@@ -0,0 +1,210 @@
+# @oagen-ignore-file
+
+"""Verified-token cache for sealed session cookies."""
+
+import contextlib
+import time
+from typing import Any, Dict
+
+import jwt as pyjwt
+import pytest
+from cryptography.fernet import Fernet
+
+from tests.conftest import JWKS, sign_access_token
+from workos import AsyncWorkOSClient, SessionCache, WorkOSClient
+from workos import _session_cache
+from workos._jwks import AsyncJWKSKeyStore, JWKSKeyStore
+from workos.session import (
+    AsyncSession,
+    AuthenticateWithSessionCookieErrorResponse,
+    AuthenticateWithSessionCookieSuccessResponse,
+    Session,
+    seal_data,
+)
+
+PASSWORD = Fernet.generate_key().decode()
+
+
+def _token(**claims: Any) -> str:
+    return sign_access_token(**{"sid": "session_01", "org_id": "org_01", **claims})
+
+
+def _cookie(**claims: Any) -> str:
+    token = _token(exp=int(time.time()) + 3600, **claims)
+    return seal_data({"access_token": token, "user": {"id": "user_01"}}, PASSWORD)
+
+
+def _response(session_id: str = "session_01"):
+    return AuthenticateWithSessionCookieSuccessResponse(
+        authenticated=True, session_id=session_id
+    )
+
+
+class _Counter:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self) -> Dict[str, Any]:
+        self.calls += 1
+        return JWKS
+
+
+class TestSessionCache:
+    def test_serves_until_exp_minus_leeway(self, monkeypatch):
+        monkeypatch.setattr(_session_cache, "_now", lambda: 1000.0)
+        cache = SessionCache()
+        response = _response()
+        cache.store("cookie", PASSWORD, {"exp": 1100}, response, leeway=30)
+        entry = cache.get("cookie", PASSWORD)
+        assert entry is not None
+        assert entry.response is response
+        assert entry.claims == {"exp": 1100}
+        assert entry.expires_at == 1070
+        monkeypatch.setattr(_session_cache, "_now", lambda: 1070.0)
+        assert cache.get("cookie", PASSWORD) is None
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.expirations, stats.size) == (
+            1,
+            1,
+            1,
+            0,
+        )
+
+    @pytest.mark.parametrize("claims", [{}, {"exp": "soon"}, {"exp": 10}])
+    def test_skips_tokens_without_a_future_exp(self, claims):
+        cache = SessionCache()
+        cache.store("cookie", PASSWORD, claims, _response())
+        assert len(cache) == 0
+        assert cache.stats().stores == 0
+
+    def test_key_includes_the_cookie_password(self):
+        cache = SessionCache()
+        exp = time.time() + 60
+        cache.store("cookie", PASSWORD, {"exp": exp}, _response())
+        assert cache.get("cookie", PASSWORD) is not None
+        assert cache.get("cookie", Fernet.generate_key().decode()) is None
+        assert cache.get("other cookie", PASSWORD) is None
+
+    def test_evicts_the_least_recently_used_entry(self):
+        cache = SessionCache(maxsize=2)
+        exp = time.time() + 60
+        for cookie in ("a", "b"):
+            cache.store(cookie, PASSWORD, {"exp": exp}, _response(cookie))
+        assert cache.get("a", PASSWORD) is not None
+        cache.store("c", PASSWORD, {"exp": exp}, _response("c"))
+        assert cache.get("b", PASSWORD) is None
+        assert cache.get("a", PASSWORD) is not None
+        assert cache.get("c", PASSWORD) is not None
+        assert cache.stats().evictions == 1
+
+    def test_invalidate_and_clear(self):
+        cache = SessionCache()
+        exp = time.time() + 60
+        cache.store("a", PASSWORD, {"exp": exp}, _response())
+        cache.store("b", PASSWORD, {"exp": exp}, _response())
+        assert cache.invalidate("a", PASSWORD) is True
+        assert cache.invalidate("a", PASSWORD) is False
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_rejects_invalid_maxsize(self):
+        with pytest.raises(ValueError):
+            SessionCache(maxsize=0)
+
+
+class TestSessionAuthenticateWithCache:
+    def _session(self, client: WorkOSClient, cookie: str) -> Session:
+        session = Session(client=client, session_data=cookie, cookie_password=PASSWORD)
+        session.jwks = JWKSKeyStore("https://example.com/jwks", fetch=_Counter())
+        return session
+
+    def test_repeat_authentication_skips_unsealing_and_verification(self, monkeypatch):
+        client = WorkOSClient(
+            api_key="sk_test", client_id="client_01", session_cache=SessionCache()
+        )
+        cookie = _cookie()
+        with contextlib.closing(client):
+            first = self._session(client, cookie).authenticate()
+            assert isinstance(first, AuthenticateWithSessionCookieSuccessResponse)
+
+            def fail(*args, **kwargs):
+                raise AssertionError("cookie was verified again")
+
+            monkeypatch.setattr("workos.session.unseal_data", fail)
+            monkeypatch.setattr(pyjwt, "decode", fail)
+            again = self._session(client, cookie).authenticate()
+        assert again is first
+        assert isinstance(again, AuthenticateWithSessionCookieSuccessResponse)
+        assert again.organization_id == "org_01"
+        assert again.user == {"id": "user_01"}
+        cache = client.session_cache
+        assert cache is not None
+        assert (cache.stats().hits, cache.stats().misses) == (1, 1)
+
+    def test_expiry_honours_the_client_leeway(self):
+        cache = SessionCache()
+        client = WorkOSClient(
+            api_key="sk_test",
+            client_id="client_01",
+            jwt_leeway=30,
+            session_cache=cache,
+        )
+        exp = int(time.time()) + 3600
+        cookie = seal_data({"access_token": _token(exp=exp)}, PASSWORD)
+        with contextlib.closing(client):
+            self._session(client, cookie).authenticate()
+        entry = cache.get(cookie, PASSWORD)
+        assert entry is not None
+        assert entry.expires_at == exp - 30
+        assert entry.claims["sid"] == "session_01"
+
+    def test_failures_are_not_cached(self):
+        cache = SessionCache()
+        client = WorkOSClient(
+            api_key="sk_test", client_id="client_01", session_cache=cache
+        )
+        expired = seal_data(
+            {"access_token": _token(exp=int(time.time()) - 10)}, PASSWORD
+        )
+        with contextlib.closing(client):
+            for cookie in (expired, "not a cookie", ""):
+                result = self._session(client, cookie).authenticate()
+                assert isinstance(result, AuthenticateWithSessionCookieErrorResponse)
+        assert len(cache) == 0
+
+    def test_disabled_by_default(self):
+        client = WorkOSClient(api_key="sk_test", client_id="client_01")
+        with contextlib.closing(client):
+            assert client.session_cache is None
+            result = self._session(client, _cookie()).authenticate()
+        assert isinstance(result, AuthenticateWithSessionCookieSuccessResponse)
+
+
+@pytest.mark.asyncio
+class TestAsyncSessionAuthenticateWithCache:
+    async def test_aauthenticate_and_authenticate_share_entries(self):
+        cache = SessionCache()
+        client = AsyncWorkOSClient(
+            api_key="sk_test", client_id="client_01", session_cache=cache
+        )
+        fetch = _Counter()
+
+        async def fetch_async() -> Dict[str, Any]:
+            return fetch()
+
+        cookie = _cookie()
+        try:
+            session = AsyncSession(
+                client=client, session_data=cookie, cookie_password=PASSWORD
+            )
+            session.async_jwks = AsyncJWKSKeyStore(
+                "https://example.com/jwks", fetch=fetch_async
+            )
+            first = await session.aauthenticate()
+            assert isinstance(first, AuthenticateWithSessionCookieSuccessResponse)
+            assert session.authenticate() is first
+            assert await session.aauthenticate() is first
+        finally:
+            await client.close()
+        assert fetch.calls == 1
+        assert (cache.stats().hits, cache.stats().misses) == (2, 1)
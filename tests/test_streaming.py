@@ -0,0 +1,350 @@
+# @oagen-ignore-file
+
+"""Streaming list pages: the incremental parser and ``RequestOptions(stream=True)``."""
+
+import contextlib
+import dataclasses
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+import pytest
+
+from tests.generated_helpers import load_fixture
+from workos import (
+    AsyncPage,
+    AsyncWorkOSClient,
+    ListMetadata,
+    NotFoundError,
+    RequestOptions,
+    SyncPage,
+    TransportConfig,
+    WorkOSClient,
+    WorkOSError,
+)
+from workos import _streaming as streaming_module
+from workos._streaming import AsyncPageStream, ListStreamParser, SyncPageStream
+
+LIST_FIXTURES = [
+    path
+    for path in sorted((Path(__file__).parent / "fixtures").glob("*.json"))
+    if b'"list_metadata"' in path.read_bytes()
+]
+USER = load_fixture("list_directory_user_with_groups.json")["data"][0]
+STREAM = RequestOptions(stream=True)
+
+
+def _parse(body: bytes, chunk_size: int) -> Dict[str, Any]:
+    parser = ListStreamParser()
+    items: List[Any] = []
+    for start in range(0, len(body), chunk_size):
+        items.extend(parser.feed(body[start : start + chunk_size]))
+    items.extend(parser.close())
+    return {**parser.fields, "data": items}
+
+
+def _users_page(count: int, after: Optional[str] = None) -> Dict[str, Any]:
+    return {
+        "object": "list",
+        "data": [{**USER, "id": f"directory_user_{i}"} for i in range(count)],
+        "list_metadata": {"before": None, "after": after},
+    }
+
+
+class TestListStreamParser:
+    @pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+    def test_matches_json_loads_on_fixtures(self, chunk_size):
+        for path in LIST_FIXTURES:
+            body = path.read_bytes()
+            assert _parse(body, chunk_size) == json.loads(body), path.name
+
+    def test_multibyte_characters_split_across_chunks(self):
+        body = json.dumps(
+            {"data": [{"name": "Zoë 日本"}], "list_metadata": {}}, ensure_ascii=False
+        ).encode()
+        assert _parse(body, 1)["data"] == [{"name": "Zoë 日本"}]
+
+    def test_numbers_are_not_cut_at_chunk_boundaries(self):
+        body = b'{"data": [12345, 678], "list_metadata": {}, "total": 90}'
+        parsed = _parse(body, 2)
+        assert parsed["data"] == [12345, 678]
+        assert parsed["total"] == 90
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5])
+    def test_brackets_and_escapes_inside_strings(self, chunk_size):
+        data = [
+            {"a": "[{]}", "b": 'quote " and \\ backslash', "c": ["]", {"d": "}"}]},
+            "\\",
+            '"[',
+            [1.5e3, True, None],
+        ]
+        body = json.dumps({"data": data, "list_metadata": {}}).encode()
+        assert _parse(body, chunk_size)["data"] == data
+
+    def test_items_split_across_chunks_are_decoded_once(self, monkeypatch):
+        decoded: List[int] = []
+
+        class CountingDecoder(json.JSONDecoder):
+            def raw_decode(self, s, idx=0):
+                decoded.append(len(s) - idx)
+                return super().raw_decode(s, idx)
+
+        monkeypatch.setattr(streaming_module, "_DECODER", CountingDecoder())
+        item = {"id": "big", "tags": [f"tag {i} [x]" for i in range(2000)]}
+        body = json.dumps({"data": [item], "list_metadata": {}}).encode()
+        assert _parse(body, 64)["data"] == [item]
+        # Without scanning, every chunk would re-decode the item from its start.
+        assert sum(decoded) < 3 * len(body)
+
+    @pytest.mark.parametrize("chunk_size", [4, 4096])
+    def test_malformed_items_raise(self, chunk_size):
+        with pytest.raises(ValueError):
+            _parse(b'{"data": [{"id": tru}], "list_metadata": {}}', chunk_size)
+
+    def test_items_are_returned_as_soon_as_they_are_complete(self):
+        parser = ListStreamParser()
+        assert parser.feed(b'{"data": [{"id": "a"}, {"id"') == [{"id": "a"}]
+        assert parser.feed(b': "b"}]') == [{"id": "b"}]
+        assert parser.feed(b', "list_metadata": {"after": "b"}}') == []
+        assert parser.done
+        assert parser.fields["list_metadata"] == {"after": "b"}
+
+    def test_metadata_before_data(self):
+        body = b'{"list_metadata": {"after": "x"}, "data": [1, 2]}'
+        assert _parse(body, 3) == {"list_metadata": {"after": "x"}, "data": [1, 2]}
+
+    def test_empty_body_is_an_empty_page(self):
+        assert _parse(b"", 1) == {"data": []}
+
+    @pytest.mark.parametrize(
+        "body", [b'{"data": [1, 2', b'[{"id": 1}]', b'{"data": []} extra']
+    )
+    def test_malformed_bodies_raise(self, body):
+        with pytest.raises(ValueError):
+            _parse(body, 4)
+
+
+def _transport(handler, max_retries: int = 0) -> Dict[str, Any]:
+    return {
+        "api_key": "sk_test_123",
+        "transport_config": TransportConfig(transport=httpx.MockTransport(handler)),
+        "max_retries": max_retries,
+    }
+
+
+def _client(handler, max_retries: int = 0) -> WorkOSClient:
+    return WorkOSClient(**_transport(handler, max_retries))
+
+
+def _async_client(handler) -> AsyncWorkOSClient:
+    return AsyncWorkOSClient(**_transport(handler))
+
+
+def _json_response(body: Dict[str, Any], status_code: int = 200) -> httpx.Response:
+    return httpx.Response(status_code, content=json.dumps(body).encode())
+
+
+class TestStreamingSyncPage:
+    def test_yields_items_before_the_body_has_arrived(self):
+        body = json.dumps(_users_page(3)).encode()
+        sent: List[int] = []
+
+        def chunks():
+            for start in range(0, len(body), 256):
+                sent.append(start)
+                yield body[start : start + 256]
+
+        client = _client(lambda request: httpx.Response(200, content=chunks()))
+        try:
+            page = client.directory_sync.list_users(request_options=STREAM)
+            assert isinstance(page, SyncPage)
+            assert isinstance(page._stream, SyncPageStream)
+            items = iter(page)
+            first = next(items)
+            assert first.id == "directory_user_0"
+            assert len(sent) < len(range(0, len(body), 256))
+            assert [user.id for user in items] == [
+                "directory_user_1",
+                "directory_user_2",
+            ]
+            assert page.list_metadata.after is None
+        finally:
+            client.close()
+
+    def test_follow_up_pages_are_streamed(self):
+        bodies = [_users_page(2, after="cursor_2"), _users_page(1)]
+        requests: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return _json_response(bodies[len(requests) - 1])
+
+        client = _client(handler)
+        try:
+            page = client.directory_sync.list_users(request_options=STREAM)
+            assert len(list(page.auto_paging_iter())) == 3
+        finally:
+            client.close()
+        assert requests[1].url.params["after"] == "cursor_2"
+
+    def test_read_fills_in_data(self):
+        client = _client(lambda request: _json_response(_users_page(2, after="c")))
+        try:
+            page = client.directory_sync.list_users(request_options=STREAM)
+            assert page.data == [] and not page.has_more()
+            assert page.read() is page
+            assert [user.id for user in page.data] == [
+                "directory_user_0",
+                "directory_user_1",
+            ]
+            assert page.has_more() and page.after == "c"
+        finally:
+            client.close()
+
+    def test_streamed_pages_are_ordinary_page_dataclasses(self):
+        client = _client(lambda request: _json_response(_users_page(2)))
+        try:
+            page = client.directory_sync.list_users(request_options=STREAM)
+            assert dataclasses.is_dataclass(page)
+            assert "_stream" not in repr(page)
+            page.read()
+            copy = dataclasses.replace(page, data=page.data[:1])
+            assert len(copy.data) == 1 and copy != page
+            page.list_metadata = ListMetadata(after="x")
+            assert page.after == "x"
+        finally:
+            client.close()
+
+    def test_items_are_not_kept_after_streaming(self):
+        client = _client(lambda request: _json_response(_users_page(2)))
+        try:
+            page = client.directory_sync.list_users(request_options=STREAM)
+            list(page)
+            assert not page.has_more()
+            assert page.data == []
+            with pytest.raises(WorkOSError):
+                page.read()
+        finally:
+            client.close()
+
+    def test_stopping_early_closes_the_response(self):
+        client = _client(lambda request: _json_response(_users_page(5)))
+        try:
+            page = client.directory_sync.list_users(request_options=STREAM)
+            assert isinstance(page._stream, SyncPageStream)
+            for _ in page:
+                break
+            assert page._stream._response.is_closed
+        finally:
+            client.close()
+
+    def test_errors_are_raised_with_their_body(self):
+        client = _client(lambda request: _json_response({"message": "Not found"}, 404))
+        try:
+            with pytest.raises(NotFoundError, match="Not found"):
+                client.directory_sync.list_users(request_options=STREAM)
+        finally:
+            client.close()
+
+    def test_retries_before_streaming(self, monkeypatch):
+        from workos import _base_client
+
+        monkeypatch.setattr(_base_client.time, "sleep", lambda _: None)
+        responses = [_json_response({}, 503), _json_response(_users_page(1))]
+        client = _client(lambda request: responses.pop(0), max_retries=1)
+        try:
+            page = client.directory_sync.list_users(request_options=STREAM)
+            assert [user.id for user in page] == ["directory_user_0"]
+        finally:
+            client.close()
+
+    def test_truncated_body_raises(self):
+        body = json.dumps(_users_page(2)).encode()[:-40]
+        client = _client(lambda request: httpx.Response(200, content=body))
+        try:
+            page = client.directory_sync.list_users(request_options=STREAM)
+            with pytest.raises(WorkOSError, match="Malformed list response"):
+                list(page)
+        finally:
+            client.close()
+
+    def test_prefetch(self):
+        bodies = [_users_page(2, after=f"c{i + 1}") for i in range(3)]
+        bodies.append(_users_page(1))
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            index = int(request.url.params.get("after", "c0")[1:])
+            return _json_response(bodies[index])
+
+        client = _client(handler)
+        try:
+            page = client.directory_sync.list_users(request_options=STREAM)
+            assert len(list(page.auto_paging_iter(prefetch=2))) == 7
+        finally:
+            client.close()
+
+
+@pytest.mark.asyncio
+class TestStreamingAsyncPage:
+    async def test_streams_items_and_follow_up_pages(self):
+        bodies = [_users_page(2, after="cursor_2"), _users_page(1)]
+        requests: List[httpx.Request] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return _json_response(bodies[len(requests) - 1])
+
+        client = _async_client(handler)
+        try:
+            page = await client.directory_sync.list_users(request_options=STREAM)
+            assert isinstance(page, AsyncPage)
+            assert isinstance(page._stream, AsyncPageStream)
+            ids = [user.id async for user in page]
+        finally:
+            await client.close()
+        assert ids == ["directory_user_0", "directory_user_1", "directory_user_0"]
+        assert requests[1].url.params["after"] == "cursor_2"
+
+    async def test_aread_fills_in_data(self):
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return _json_response(_users_page(2, after="c"))
+
+        client = _async_client(handler)
+        try:
+            page = await client.directory_sync.list_users(request_options=STREAM)
+            assert isinstance(page._stream, AsyncPageStream)
+            assert page.data == [] and page.after is None
+            await page.aread()
+            assert len(page.data) == 2 and page.after == "c"
+        finally:
+            await client.close()
+
+    async def test_stopping_early_closes_the_response(self):
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return _json_response(_users_page(5))
+
+        client = _async_client(handler)
+        try:
+            page = await client.directory_sync.list_users(request_options=STREAM)
+            assert isinstance(page._stream, AsyncPageStream)
+            async with contextlib.aclosing(page.auto_paging_iter()) as users:
+                async for _ in users:
+                    break
+            assert page._stream._response.is_closed
+        finally:
+            await client.close()
+
+    async def test_prefetch(self):
+        bodies = [_users_page(2, after="c1"), _users_page(2)]
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return _json_response(bodies[1 if "after" in request.url.params else 0])
+
+        client = _async_client(handler)
+        try:
+            page = await client.directory_sync.list_users(request_options=STREAM)
+            users = [user async for user in page.auto_paging_iter(prefetch=1)]
+        finally:
+            await client.close()
+        assert len(users) == 4
@@ -0,0 +1,226 @@
+# @oagen-ignore-file
+
+"""Transport configuration tests: pool limits, split timeouts, injected clients."""
+
+import sys
+
+import httpx
+import pytest
+
+from workos import AsyncWorkOSClient, TransportConfig, WorkOSClient
+from workos._errors import ConfigurationError
+from workos.public_client import create_public_client
+
+
+class _TracingTransport(httpx.BaseTransport):
+    """Emits an httpcore-style trace event before answering, like a real pool."""
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        trace = request.extensions.get("trace")
+        if trace is not None:
+            trace("connection.connect_tcp.started", {})
+        return httpx.Response(200, json={"ok": True})
+
+
+class _AsyncTracingTransport(httpx.AsyncBaseTransport):
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        trace = request.extensions.get("trace")
+        if trace is not None:
+            await trace("connection.connect_tcp.started", {})
+        return httpx.Response(200, json={"ok": True})
+
+
+class TestTransportConfig:
+    def test_build_limits(self):
+        limits = TransportConfig(
+            max_connections=250, max_keepalive_connections=50, keepalive_expiry=30
+        ).build_limits()
+        assert limits.max_connections == 250
+        assert limits.max_keepalive_connections == 50
+        assert limits.keepalive_expiry == 30
+
+    def test_build_timeout_falls_back_per_phase(self):
+        timeout = TransportConfig(connect_timeout=2, pool_timeout=0.5).build_timeout(45)
+        assert timeout.connect == 2
+        assert timeout.pool == 0.5
+        assert timeout.read == 45
+        assert timeout.write == 45
+
+
+class TestWorkOSClientTransport:
+    def test_default_timeout_uses_request_timeout(self):
+        client = WorkOSClient(api_key="sk_test_123", request_timeout=12)
+        try:
+            assert client._client.timeout == httpx.Timeout(12)
+        finally:
+            client.close()
+
+    def test_split_timeouts_applied(self):
+        client = WorkOSClient(
+            api_key="sk_test_123",
+            request_timeout=30,
+            transport_config=TransportConfig(connect_timeout=1, read_timeout=20),
+        )
+        try:
+            assert client._client.timeout.connect == 1
+            assert client._client.timeout.read == 20
+            assert client._client.timeout.pool == 30
+        finally:
+            client.close()
+
+    def test_request_timeout_option_overrides_all_phases(self):
+        client = WorkOSClient(
+            api_key="sk_test_123",
+            transport_config=TransportConfig(connect_timeout=1),
+        )
+        try:
+            assert client._resolve_timeout({"timeout": 5}) == httpx.Timeout(5)
+        finally:
+            client.close()
+
+    def test_injected_client_is_used_and_left_open(self):
+        http_client = httpx.Client(transport=_TracingTransport(), timeout=7)
+        client = WorkOSClient(
+            api_key="sk_test_123",
+            max_retries=0,
+            transport_config=TransportConfig(http_client=http_client),
+        )
+        assert client._client is http_client
+        assert client.request("GET", ("test",)) == {"ok": True}
+        assert client._resolve_timeout(None) == httpx.Timeout(7)
+        client.close()
+        assert not http_client.is_closed
+        http_client.close()
+
+    def test_injected_async_client_rejected(self):
+        with pytest.raises(ConfigurationError):
+            WorkOSClient(
+                api_key="sk_test_123",
+                transport_config=TransportConfig(http_client=httpx.AsyncClient()),
+            )
+
+    def test_custom_transport_records_pool_wait(self):
+        client = WorkOSClient(
+            api_key="sk_test_123",
+            max_retries=0,
+            transport_config=TransportConfig(transport=_TracingTransport()),
+        )
+        try:
+            client.request("GET", ("test",))
+            client.request("GET", ("test",))
+            assert client.transport_stats.requests == 2
+            assert client.transport_stats.total_pool_wait >= 0
+            assert (
+                client.transport_stats.max_pool_wait
+                >= client.transport_stats.average_pool_wait
+            )
+            client.transport_stats.reset()
+            assert client.transport_stats.requests == 0
+        finally:
+            client.close()
+
+    def test_records_negotiated_http_version(self, httpx_mock):
+        httpx_mock.add_response(json={"ok": True})
+        client = WorkOSClient(api_key="sk_test_123", max_retries=0)
+        try:
+            client.request("GET", ("test",))
+            assert client.transport_stats.http_versions == {"HTTP/1.1": 1}
+            assert client.transport_stats.last_http_version == "HTTP/1.1"
+            assert client.transport_stats.negotiated_http2 is False
+        finally:
+            client.close()
+
+    def test_http2_requires_h2(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "h2", None)
+        with pytest.raises(ConfigurationError, match=r"workos\[http2\]"):
+            WorkOSClient(
+                api_key="sk_test_123", transport_config=TransportConfig(http2=True)
+            )
+        with pytest.raises(ConfigurationError, match=r"workos\[http2\]"):
+            WorkOSClient(api_key="sk_test_123", http2=True)
+
+    def test_http2_argument_enables_http2(self):
+        pytest.importorskip("h2")
+        config = TransportConfig(max_connections=5)
+        client = WorkOSClient(
+            api_key="sk_test_123", transport_config=config, http2=True
+        )
+        try:
+            assert client.transport_config.http2 is True
+            assert client.transport_config.max_connections == 5
+            assert config.http2 is False
+            transport = client._client._transport
+            assert isinstance(transport, httpx.HTTPTransport)
+            assert transport._pool._http2 is True
+        finally:
+            client.close()
+
+    def test_public_client_accepts_transport_config(self):
+        client = create_public_client(
+            client_id="client_test_123",
+            transport_config=TransportConfig(max_connections=5),
+        )
+        try:
+            assert client.transport_config.max_connections == 5
+        finally:
+            client.close()
+
+
+@pytest.mark.asyncio
+class TestAsyncWorkOSClientTransport:
+    async def test_split_timeouts_applied(self):
+        client = AsyncWorkOSClient(
+            api_key="sk_test_123",
+            transport_config=TransportConfig(write_timeout=3),
+        )
+        try:
+            assert client._client.timeout.write == 3
+        finally:
+            await client.close()
+
+    async def test_http2_enabled_on_built_client(self):
+        pytest.importorskip("h2")
+        client = AsyncWorkOSClient(
+            api_key="sk_test_123", transport_config=TransportConfig(http2=True)
+        )
+        try:
+            transport = client._client._transport
+            assert isinstance(transport, httpx.AsyncHTTPTransport)
+            assert transport._pool._http2 is True
+        finally:
+            await client.close()
+
+    async def test_http2_argument_enables_http2(self):
+        pytest.importorskip("h2")
+        client = AsyncWorkOSClient(api_key="sk_test_123", http2=True)
+        try:
+            assert client.transport_config.http2 is True
+            transport = client._client._transport
+            assert isinstance(transport, httpx.AsyncHTTPTransport)
+            assert transport._pool._http2 is True
+        finally:
+            await client.close()
+
+    async def test_http2_argument_requires_h2(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "h2", None)
+        with pytest.raises(ConfigurationError, match=r"workos\[http2\]"):
+            AsyncWorkOSClient(api_key="sk_test_123", http2=True)
+
+    async def test_injected_sync_client_rejected(self):
+        with pytest.raises(ConfigurationError):
+            AsyncWorkOSClient(
+                api_key="sk_test_123",
+                transport_config=TransportConfig(http_client=httpx.Client()),
+            )
+
+    async def test_custom_transport_records_pool_wait(self):
+        client = AsyncWorkOSClient(
+            api_key="sk_test_123",
+            max_retries=0,
+            transport_config=TransportConfig(transport=_AsyncTracingTransport()),
+        )
+        try:
+            assert await client.request("GET", ("test",)) == {"ok": True}
+            assert client.transport_stats.requests == 1
+        finally:
+            await client.close()
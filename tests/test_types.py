@@ -1,4 +1,8 @@
-from workos._types import NOT_GIVEN, NotGiven
+from datetime import datetime, timezone
+
+import pytest
+
+from workos._types import NOT_GIVEN, NotGiven, _parse_datetime
 
 
 class TestNotGiven:
@@ -22,3 +26,21 @@ class TestNotGiven:
 
         assert workos.NOT_GIVEN is NOT_GIVEN
         assert workos.NotGiven is NotGiven
+
+
+class TestParseDatetime:
+    def test_equal_strings_share_one_value(self):
+        first = _parse_datetime("2026-01-15T12:00:00.000Z")
+        assert first == datetime(2026, 1, 15, 12, tzinfo=timezone.utc)
+        assert _parse_datetime("2026-01-15T12:00:00.000Z") is first
+
+    def test_cache_is_bounded(self):
+        maxsize = _parse_datetime.cache_info().maxsize
+        assert maxsize is not None
+        for day in range(maxsize + 10):
+            _parse_datetime(f"2000-01-01T00:00:00.{day:06d}Z")
+        assert _parse_datetime.cache_info().currsize == maxsize
+
+    def test_invalid_strings_still_raise(self):
+        with pytest.raises(ValueError):
+            _parse_datetime("not a date")